@@ -19,7 +19,7 @@ from threading import Event, Lock
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, UploadFile, File, Body, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel, ValidationError, Field
 import os
 import tempfile
@@ -74,6 +74,8 @@ from src.services.context_resolution_service import ContextResolutionService
 from src.services.chat_storage import MongoChatStorage
 from src.services.youtube_context_service import YouTubeContextService
 from src.utils.performance_monitor import get_performance_monitor
+from src.utils.offload import EventLoopLagMonitor, OffloadRejected, configure_offload, offload, run_in_pool
+from src.utils.thumbnails import get_thumbnail_service
 from src.utils.startup_profiler import get_startup_profiler
 from src.utils.trajectory_logger import get_trajectory_logger
 from src.utils.error_logger import log_error_with_context
@@ -290,10 +292,34 @@ chat_cache = LocalChatCache(
     max_messages_per_session=_cache_cfg.get("max_messages_per_session", 75),
     disk_path=_cache_cfg.get("disk_path", "data/cache/chat_sessions"),
     flush_enabled=chat_storage.enabled,
+    write_behind=bool(_cache_cfg.get("write_behind", False)),
+    durability=_cache_cfg.get("durability", "batch"),
+    flush_max_messages=int(_cache_cfg.get("flush_max_messages", 64)),
+    flush_interval_ms=float(_cache_cfg.get("flush_interval_ms", 250)),
+    rehydrate=bool(_cache_cfg.get("rehydrate", False)),
 )
 chat_worker = ChatPersistenceWorker(chat_cache, chat_storage)
 query_trace_store = QueryTraceStore()
 
+# Executor offload for blocking handler work + event-loop lag monitoring
+offload_registry = configure_offload(_app_config_snapshot)
+thumbnail_service = get_thumbnail_service(_app_config_snapshot)
+MIN_THUMBNAIL_SIZE = 16
+MAX_THUMBNAIL_SIZE = 2048
+_loop_lag_cfg = ((_app_config_snapshot.get("performance") or {}).get("offload") or {}).get("loop_lag") or {}
+loop_lag_monitor: Optional[EventLoopLagMonitor] = None
+if _loop_lag_cfg.get("enabled", True):
+    loop_lag_monitor = EventLoopLagMonitor(
+        interval_ms=float(_loop_lag_cfg.get("interval_ms", 100)),
+        threshold_ms=float(_loop_lag_cfg.get("threshold_ms", 250)),
+    )
+
+
+@app.exception_handler(OffloadRejected)
+async def _offload_rejected_handler(request: Request, exc: OffloadRejected):
+    logger.warning("[OFFLOAD] Rejected %s %s: %s", request.method, request.url.path, exc)
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"})
+
 # Traceability store (optional)
 _traceability_cfg = _app_config_snapshot.get("traceability", {}) or {}
 _traceability_flag_env = os.getenv("TRACEABILITY_ENABLED", "true").lower()
@@ -2764,11 +2790,13 @@ async def storage_status():
         "mongo": mongo_status,
         "cache": cache_status,
         "startup_cache": startup_cache_status,
+        "thumbnails": thumbnail_service.describe(),
     }
 
 
 @app.get("/api/ingest/status", tags=["ingest"])
-async def ingest_status():
+@offload("io")
+def ingest_status():
     """
     Return last-ingest metadata for Slack, Git, and doc-issues pipelines so the dashboard can
     show whether the current dataset is fresh (live) or fixture-based (demo).
@@ -2823,7 +2851,8 @@ async def get_chat_history(session_id: str, limit: int = 50):
 
 
 @app.get("/api/activity-graph/activity-level")
-async def get_activity_graph_activity_level(
+@offload("activity")
+def get_activity_graph_activity_level(
     component_id: str,
     window_hours: int = 168,
     limit: int = 15,
@@ -2846,7 +2875,8 @@ async def get_activity_graph_activity_level(
 
 
 @app.get("/api/activity-graph/dissatisfaction")
-async def get_activity_graph_dissatisfaction(
+@offload("activity")
+def get_activity_graph_dissatisfaction(
     window_hours: int = 168,
     limit: int = 5,
     components: Optional[List[str]] = None,
@@ -2870,7 +2900,8 @@ async def get_activity_graph_dissatisfaction(
 
 
 @app.get("/api/activity/component/{component_id}")
-async def get_activity_component(component_id: str, window_days: int = 14):
+@offload("activity")
+def get_activity_component(component_id: str, window_days: int = 14):
     """
     Return aggregated Git/Slack/doc-drift metrics for a component.
     """
@@ -2882,7 +2913,8 @@ async def get_activity_component(component_id: str, window_days: int = 14):
 
 
 @app.get("/api/activity/top-components")
-async def get_activity_top_components(limit: int = 5, window_days: int = 14):
+@offload("activity")
+def get_activity_top_components(limit: int = 5, window_days: int = 14):
     """
     Return the noisiest components ranked by doc-drift intensity.
     """
@@ -2898,7 +2930,8 @@ async def get_activity_top_components(limit: int = 5, window_days: int = 14):
 
 
 @app.get("/activity/snapshot")
-async def get_activity_snapshot(limit: int = 15, window: str = "7d"):
+@offload("activity")
+def get_activity_snapshot(limit: int = 15, window: str = "7d"):
     """
     Return a lightweight snapshot of Git + Slack signals for dashboard visualizations.
     """
@@ -2926,7 +2959,8 @@ async def get_activity_snapshot(limit: int = 15, window: str = "7d"):
 
 
 @app.get("/activity/quadrant")
-async def get_activity_quadrant(limit: int = 25, window: str = "7d"):
+@offload("activity")
+def get_activity_quadrant(limit: int = 25, window: str = "7d"):
     """
     Return component points for the activity vs dissatisfaction quadrant.
     """
@@ -2942,7 +2976,8 @@ async def get_activity_quadrant(limit: int = 25, window: str = "7d"):
 
 
 @app.get("/activity-graph/component")
-async def get_component_activity_graph(component_id: str, window: str = "7d", debug: Optional[str] = None):
+@offload("activity")
+def get_component_activity_graph(component_id: str, window: str = "7d", debug: Optional[str] = None):
     """
     Return the combined Git/Slack/doc activity snapshot for a component.
     """
@@ -2963,7 +2998,8 @@ async def get_component_activity_graph(component_id: str, window: str = "7d", de
 
 
 @app.get("/activity-graph/top-dissatisfied")
-async def get_top_dissatisfied_components(limit: int = 5, window: str = "7d", n: Optional[int] = None, debug: Optional[str] = None):
+@offload("activity")
+def get_top_dissatisfied_components(limit: int = 5, window: str = "7d", n: Optional[int] = None, debug: Optional[str] = None):
     """
     Return the most dissatisfied components based on Slack complaints + doc issues.
     """
@@ -2988,6 +3024,17 @@ async def get_top_dissatisfied_components(limit: int = 5, window: str = "7d", n:
     }
 
 
+@app.get("/api/performance/offload")
+async def get_offload_metrics():
+    """
+    Return per-pool queue depth / wait times and event-loop lag (with recent stalls).
+    """
+    return {
+        "pools": offload_registry.stats(),
+        "event_loop": loop_lag_monitor.stats() if loop_lag_monitor else {"running": False},
+    }
+
+
 @app.get("/activity-graph/metrics")
 async def get_activity_graph_metrics():
     """
@@ -2997,7 +3044,8 @@ async def get_activity_graph_metrics():
 
 
 @app.get("/api/graph/snapshot")
-async def get_graph_snapshot(
+@offload("graph")
+def get_graph_snapshot(
     project_id: Optional[str] = Query(None, alias="projectId"),
     window_hours: int = 168,
     limit: int = 150,
@@ -3017,7 +3065,8 @@ async def get_graph_snapshot(
 
 
 @app.get("/api/graph/metrics")
-async def get_graph_metrics(
+@offload("graph")
+def get_graph_metrics(
     project_id: Optional[str] = Query(None, alias="projectId"),
     window_hours: int = 168,
     limit: int = 200,
@@ -3270,12 +3319,16 @@ async def run_graph_reasoner_query(payload: GraphQueryRequest = Body(..., embed=
         invoke_graph_params["issueId"] = issue_id
 
     try:
-        reasoner_result = run_cerebros_reasoner(
+        reasoner_result = await run_in_pool(
+            "graph",
+            run_cerebros_reasoner,
             config=config_snapshot,
             query=query,
             graph_params=invoke_graph_params,
             sources=sources,
         )
+    except OffloadRejected:
+        raise
     except Exception as exc:  # pragma: no cover - upstream failures logged
         logger.exception("[GRAPH REASONER] Query failed")
         raise HTTPException(status_code=502, detail="Graph reasoner request failed") from exc
@@ -3410,7 +3463,8 @@ async def run_graph_reasoner_query(payload: GraphQueryRequest = Body(..., embed=
 
 
 @app.get("/api/context-resolution/impacts")
-async def get_context_resolution_impacts(
+@offload("graph")
+def get_context_resolution_impacts(
     api_id: Optional[str] = None,
     component_id: Optional[str] = None,
     max_depth: Optional[int] = None,
@@ -3446,7 +3500,8 @@ async def get_context_resolution_impacts(
 
 
 @app.post("/api/context-resolution/changes")
-async def post_context_resolution_changes(request: ContextChangeRequest):
+@offload("graph")
+def post_context_resolution_changes(request: ContextChangeRequest):
     """
     Given changed code artifacts (and optional component), return docs/components to update.
     """
@@ -3500,7 +3555,8 @@ class SlackComplaintImpactRequest(BaseModel):
 
 
 @app.post("/impact/git-pr")
-async def run_impact_git_pr(payload: ImpactGitPRRequest = Body(...)):
+@offload("graph")
+def run_impact_git_pr(payload: ImpactGitPRRequest = Body(...)):
     try:
         report = impact_service.analyze_git_pr(payload.repo, payload.pr_number)
     except ValueError as exc:
@@ -3511,7 +3567,8 @@ async def run_impact_git_pr(payload: ImpactGitPRRequest = Body(...)):
 
 
 @app.post("/impact/git-change")
-async def run_impact_git_change(payload: ImpactGitChangeRequest = Body(...)):
+@offload("graph")
+def run_impact_git_change(payload: ImpactGitChangeRequest = Body(...)):
     manual_files: Optional[List[GitFileChange]] = None
     if payload.files:
         manual_files = [
@@ -3534,7 +3591,8 @@ async def run_impact_git_change(payload: ImpactGitChangeRequest = Body(...)):
 
 
 @app.post("/impact/slack-complaint")
-async def run_impact_slack_complaint(request: SlackComplaintImpactRequest):
+@offload("graph")
+def run_impact_slack_complaint(request: SlackComplaintImpactRequest):
     complaint = SlackComplaintInput(
         channel=request.channel,
         message=request.message,
@@ -3553,7 +3611,8 @@ async def run_impact_slack_complaint(request: SlackComplaintImpactRequest):
 
 
 @app.get("/impact/doc-issues")
-async def list_impact_doc_issues(
+@offload("graph")
+def list_impact_doc_issues(
     source: Optional[str] = Query("impact-report", description="Filter by issue source"),
     component_id: Optional[str] = Query(None, description="Filter by component ID"),
     service_id: Optional[str] = Query(None, description="Filter by service ID"),
@@ -3569,12 +3628,14 @@ async def list_impact_doc_issues(
 
 
 @app.get("/health/impact")
-async def get_impact_health(limit: int = Query(10, ge=1, le=100)):
+@offload("graph")
+def get_impact_health(limit: int = Query(10, ge=1, le=100)):
     return impact_service.get_impact_health(max_events=limit)
 
 
 @app.get("/traceability/investigations")
-async def list_traceability_investigations(
+@offload("io")
+def list_traceability_investigations(
     limit: int = Query(25, ge=1, le=200),
     component_id: Optional[str] = Query(None),
     session_id: Optional[str] = Query(None),
@@ -3611,7 +3672,8 @@ async def list_traceability_investigations(
 
 
 @app.get("/traceability/investigations/{investigation_id}")
-async def get_traceability_investigation(investigation_id: str):
+@offload("io")
+def get_traceability_investigation(investigation_id: str):
     if not _traceability_enabled():
         raise HTTPException(status_code=404, detail="Traceability store disabled")
     record = traceability_store.get(investigation_id)  # type: ignore[union-attr]
@@ -3621,7 +3683,8 @@ async def get_traceability_investigation(investigation_id: str):
 
 
 @app.get("/api/incidents")
-async def list_incidents(
+@offload("io")
+def list_incidents(
     limit: int = Query(25, ge=1, le=200),
     project_id: Optional[str] = Query(None),
     component_id: Optional[str] = Query(None),
@@ -3663,7 +3726,8 @@ async def list_incidents(
 
 
 @app.get("/api/incidents/{incident_id}")
-async def get_incident(incident_id: str):
+@offload("io")
+def get_incident(incident_id: str):
     if not _traceability_enabled():
         raise HTTPException(status_code=404, detail="Traceability store disabled")
     record = traceability_store.get(incident_id)  # type: ignore[union-attr]
@@ -3681,7 +3745,8 @@ async def get_incident(incident_id: str):
 
 
 @app.post("/api/incidents")
-async def create_incident(request: IncidentCreateRequest):
+@offload("io")
+def create_incident(request: IncidentCreateRequest):
     if not _traceability_enabled():
         raise HTTPException(status_code=503, detail="Traceability store disabled")
     if traceability_store is None:
@@ -3848,7 +3913,8 @@ def _apply_severity_payload(record: Dict[str, Any], payload: Dict[str, Any]) ->
 
 
 @app.post("/traceability/doc-issues")
-async def create_traceability_doc_issue(request: TraceabilityDocIssueRequest):
+@offload("io")
+def create_traceability_doc_issue(request: TraceabilityDocIssueRequest):
     if not _traceability_enabled():
         raise HTTPException(status_code=503, detail="Traceability store disabled")
     doc_issue_service = getattr(impact_service, "doc_issue_service", None)
@@ -3924,7 +3990,8 @@ async def create_traceability_doc_issue(request: TraceabilityDocIssueRequest):
 
 
 @app.get("/traceability/investigations/export")
-async def export_traceability_investigations(
+@offload("io")
+def export_traceability_investigations(
     format: str = Query("json", pattern="^(json|csv)$"),
     project_id: Optional[str] = Query(None),
     component_id: Optional[str] = Query(None),
@@ -3969,7 +4036,8 @@ async def export_traceability_investigations(
 
 
 @app.get("/traceability/graph-trace")
-async def traceability_graph_trace(
+@offload("graph")
+def traceability_graph_trace(
     component_id: str = Query(..., description="Component id to trace"),
     limit: int = Query(3, ge=1, le=10),
 ):
@@ -4004,7 +4072,8 @@ async def traceability_graph_trace(
     return {"traces": traces}
 
 @app.get("/api/graph/validation")
-async def get_graph_validation():
+@offload("graph")
+def get_graph_validation():
     """
     Run lightweight graph validation checks.
     """
@@ -4095,7 +4164,8 @@ class ContextChangeRequest(BaseModel):
     activity_window_hours: Optional[int] = None
 
 @app.post("/api/logs")
-async def receive_frontend_log(log_entry: FrontendLogEntry):
+@offload("io")
+def receive_frontend_log(log_entry: FrontendLogEntry):
     """Receive and store frontend logs for unified logging"""
     try:
         # Sanitize log entry
@@ -4269,7 +4339,8 @@ async def github_webhook(request: Request):
 
 
 @app.post("/api/chat", response_model=ChatResponse)
-async def chat(message: ChatMessage):
+@offload("default")
+def chat(message: ChatMessage):
     """Synchronous chat endpoint (for simple requests)"""
     try:
         logger.info(f"Received chat message: {message.message}")
@@ -4625,7 +4696,8 @@ async def search_help(q: str, limit: int = 10):
 
 
 @app.get("/api/universal-search")
-async def universal_search(
+@offload("default")
+def universal_search(
     q: str,
     limit: int = 10,
     types: str = "document,image",
@@ -4973,7 +5045,7 @@ def _generate_breadcrumb(file_path: str) -> str:
 async def get_conversation_history(session_id: str):
     """Return stored conversation history for a given session."""
     try:
-        memory = session_manager.get_session(session_id)
+        memory = await run_in_pool("io", session_manager.get_session, session_id)
         if not memory:
             return {
                 "session_id": session_id,
@@ -4989,6 +5061,8 @@ async def get_conversation_history(session_id: str):
             "messages": interactions,
             "last_active_at": memory.last_active_at,
         }
+    except OffloadRejected:
+        raise
     except Exception as exc:
         logger.error(f"Error loading conversation history for session {session_id}: {exc}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to load conversation history")
@@ -5268,7 +5342,7 @@ async def websocket_chat(websocket: WebSocket, session_id: Optional[str] = None)
 
     # Get session memory
     try:
-        memory = session_manager.get_or_create_session(session_id)
+        memory = await run_in_pool("io", session_manager.get_or_create_session, session_id)
         is_new_session = memory.is_new_session()
     except Exception as e:
         logger.error(f"Error getting session memory: {e}", exc_info=True)
@@ -5506,7 +5580,8 @@ async def websocket_chat(websocket: WebSocket, session_id: Optional[str] = None)
                 _session_response_acks[session_id].set()
 
 @app.post("/api/reindex")
-async def reindex_documents():
+@offload("default")
+def reindex_documents():
     """Trigger document and image reindexing"""
     try:
         logger.info("Starting document and image reindexing")
@@ -5550,7 +5625,8 @@ class RevealFileRequest(BaseModel):
     path: str
 
 @app.post("/api/reveal-file")
-async def reveal_file(request: RevealFileRequest):
+@offload("io")
+def reveal_file(request: RevealFileRequest):
     """
     Reveal a file in Finder (macOS only).
     
@@ -5770,7 +5846,8 @@ async def preview_file(path: str, request: Request):
 
 
 @app.get("/api/files/metadata")
-async def get_file_metadata(path: str):
+@offload("io")
+def get_file_metadata(path: str):
     """
     Get file metadata (size, modified date, etc.) for a file.
     """
@@ -5834,7 +5911,8 @@ def _resolve_query_value(query: str = "", legacy: str = "") -> str:
 
 
 @app.get("/api/metadata/slack/channels")
-async def list_slack_channels(
+@offload("io")
+def list_slack_channels(
     query: str = Query("", max_length=120),
     legacy_prefix: str = Query("", alias="prefix", max_length=120),
     limit: int = Query(10, ge=1, le=100),
@@ -5857,7 +5935,8 @@ async def list_slack_channels(
 
 
 @app.get("/api/metadata/slack/users")
-async def list_slack_users(
+@offload("io")
+def list_slack_users(
     query: str = Query("", max_length=120),
     legacy_prefix: str = Query("", alias="prefix", max_length=120),
     limit: int = Query(10, ge=1, le=100),
@@ -5879,7 +5958,8 @@ async def list_slack_users(
 
 
 @app.get("/api/metadata/git/repos")
-async def list_git_repos(
+@offload("io")
+def list_git_repos(
     query: str = Query("", max_length=120),
     legacy_prefix: str = Query("", alias="prefix", max_length=120),
     limit: int = Query(10, ge=1, le=100),
@@ -5904,7 +5984,8 @@ async def list_git_repos(
 
 
 @app.get("/api/metadata/git/repos/{repo_id}/branches")
-async def list_git_branches(
+@offload("io")
+def list_git_branches(
     repo_id: str,
     query: str = Query("", max_length=120),
     legacy_prefix: str = Query("", alias="prefix", max_length=120),
@@ -5927,12 +6008,23 @@ async def list_git_branches(
 
 
 @app.get("/api/metadata/sources")
-async def suggest_sources(query: str = Query(..., min_length=1, max_length=500)):
+@offload("graph")
+def suggest_sources(query: str = Query(..., min_length=1, max_length=500)):
     reasoner = MultiSourceReasoner(config_manager.get_config())
     sources = reasoner.infer_sources(query)
     return {"query": query, "sources": sources}
 
 
+class _PinnedThumbnailResponse(FileResponse):
+    """FileResponse that releases its thumbnail cache pin once sent (or aborted)."""
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            thumbnail_service.release(self.path)
+
+
 @app.get("/api/files/thumbnail")
 async def get_thumbnail(path: str, max_size: int = 256):
     """
@@ -5947,9 +6039,7 @@ async def get_thumbnail(path: str, max_size: int = 256):
     """
     try:
         from pathlib import Path
-        from PIL import Image
         from fastapi.responses import FileResponse
-        import hashlib
         import os
 
         file_path = Path(path)
@@ -6003,40 +6093,24 @@ async def get_thumbnail(path: str, max_size: int = 256):
         if ext not in supported_image_types:
             raise HTTPException(status_code=400, detail=f"Not a supported image type: {ext}")
 
-        # Thumbnail cache settings
-        thumbnail_config = config.get('images', {}).get('thumbnail', {})
-        cache_dir = Path(thumbnail_config.get('cache_dir', 'data/cache/thumbnails'))
-        quality = thumbnail_config.get('quality', 85)
-
-        # Create cache directory
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate thumbnail filename
-        file_hash = hashlib.md5(str(file_path).encode()).hexdigest()[:8]
-        thumbnail_filename = f"{file_hash}_{max_size}x{max_size}.jpg"
-        thumbnail_path = cache_dir / thumbnail_filename
-
-        # Generate thumbnail if it doesn't exist
-        if not thumbnail_path.exists():
-            try:
-                with Image.open(file_path) as img:
-                    # Create thumbnail
-                    img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-
-                    # Save thumbnail
-                    img.save(thumbnail_path, 'JPEG', quality=quality)
-            except Exception as e:
-                logger.error(f"Error generating thumbnail for {file_path}: {e}")
-                raise HTTPException(status_code=500, detail=f"Failed to generate thumbnail: {e}")
+        # Content-addressed (path + mtime + size + dimensions), LRU-bounded, rendered in the cpu pool
+        max_size = max(MIN_THUMBNAIL_SIZE, min(int(max_size), MAX_THUMBNAIL_SIZE))
+        try:
+            thumbnail_path = await thumbnail_service.get(file_path, max_size, pin=True)
+        except OffloadRejected:
+            raise
+        except Exception as e:
+            logger.error(f"Error generating thumbnail for {file_path}: {e}")
+            raise HTTPException(status_code=500, detail=f"Failed to generate thumbnail: {e}")
 
-        # Return thumbnail
-        return FileResponse(
+        # Return thumbnail; it stays pinned against LRU eviction until the response is done
+        return _PinnedThumbnailResponse(
             str(thumbnail_path),
             media_type='image/jpeg',
-            filename=thumbnail_filename
+            filename=thumbnail_path.name
         )
 
-    except HTTPException:
+    except (HTTPException, OffloadRejected):
         raise
     except Exception as e:
         logger.error(f"Error serving thumbnail: {e}")
@@ -6133,7 +6207,8 @@ async def transcribe_audio(audio: UploadFile = File(...)):
 
 
 @app.post("/api/text-to-speech")
-async def text_to_speech_api(
+@offload("io")
+def text_to_speech_api(
     text: str = Body(..., embed=True),
     voice: str = Body(default="alloy", embed=True),
     speed: float = Body(default=1.0, embed=True)
@@ -6268,6 +6343,10 @@ async def startup_event():
 
     startup_profiler.mark("fastapi_startup_event")
 
+    if loop_lag_monitor:
+        loop_lag_monitor.register_routes(app.routes)
+        await loop_lag_monitor.start()
+
     if FAST_STARTUP_MODE:
         logger.info("[FAST-STARTUP] Enabled – deferring heavy service startup to background task")
         if _background_services_task and not _background_services_task.done():
@@ -6310,6 +6389,11 @@ async def shutdown_event():
 
     logger.info("Stopping chat persistence worker...")
     await chat_worker.stop()
+    chat_cache.close()
+
+    if loop_lag_monitor:
+        await loop_lag_monitor.stop()
+    offload_registry.shutdown()
 
 
 # API endpoint for managing recurring tasks
@@ -7080,7 +7164,8 @@ async def spotify_shuffle(request: SpotifyShuffleRequest):
 # ============================================================================
 
 @app.get("/api/apidocs/spec")
-async def get_api_spec():
+@offload("io")
+def get_api_spec():
     """
     Get the current API specification from docs/api-spec.yaml.
     
@@ -7107,7 +7192,8 @@ async def get_api_spec():
 
 
 @app.get("/api/apidocs/code")
-async def get_api_code():
+@offload("io")
+def get_api_code():
     """
     Get extracted endpoint definitions from api_server.py.
     
@@ -7140,7 +7226,8 @@ class ApidocsCheckRequest(BaseModel):
 
 
 @app.post("/api/apidocs/check-drift")
-async def check_api_drift(request: ApidocsCheckRequest = ApidocsCheckRequest()):
+@offload("io")
+def check_api_drift(request: ApidocsCheckRequest = ApidocsCheckRequest()):
     """
     Check for drift between API code and documentation.
     
@@ -7198,7 +7285,8 @@ class ApidocsApplyRequest(BaseModel):
 
 
 @app.post("/api/apidocs/apply")
-async def apply_api_spec_update(request: ApidocsApplyRequest):
+@offload("io")
+def apply_api_spec_update(request: ApidocsApplyRequest):
     """
     Apply a proposed spec update to docs/api-spec.yaml.
     
@@ -7252,7 +7340,8 @@ class ApidocsBranchCheckRequest(BaseModel):
 
 
 @app.post("/api/apidocs/check-branch")
-async def check_branch_for_drift(request: ApidocsBranchCheckRequest):
+@offload("io")
+def check_branch_for_drift(request: ApidocsBranchCheckRequest):
     """
     Check if a GitHub branch has API changes that cause documentation drift.
     
@@ -6,6 +6,7 @@ Usage:
     python scripts/analyze_trajectories.py --session-id <session_id>
     python scripts/analyze_trajectories.py --decision-type model_selection
     python scripts/analyze_trajectories.py --stats
+    python scripts/analyze_trajectories.py --by-model
     python scripts/analyze_trajectories.py --list-sessions
 """
 
@@ -67,6 +68,7 @@ def main():
     parser.add_argument("--success-only", action="store_true", help="Only show successful trajectories")
     parser.add_argument("--failed-only", action="store_true", help="Only show failed trajectories")
     parser.add_argument("--stats", action="store_true", help="Show statistics")
+    parser.add_argument("--by-model", action="store_true", help="Show per-model usage and latency percentiles")
     parser.add_argument("--list-sessions", action="store_true", help="List all sessions")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--limit", type=int, default=100, help="Limit number of results")
@@ -109,6 +111,22 @@ def main():
                 print(f"  {model}: {count}")
         return
     
+    if args.by_model:
+        models = query.aggregate_by_model()
+        if args.json:
+            print(json.dumps(models, indent=2))
+        else:
+            print("By Model:")
+            for model, summary in sorted(models.items(), key=lambda item: -item[1]["count"]):
+                latency = ", ".join(
+                    f"{name}={value:.0f}ms" for name, value in summary["latency_ms"].items() if value is not None
+                )
+                print(
+                    f"  {model}: {summary['count']} calls, {summary['success_rate']:.1%} success, "
+                    f"{summary['total_tokens']:,} tokens" + (f", latency {latency}" if latency else "")
+                )
+        return
+    
     # Query trajectories
     if args.session_id:
         trajectories = query.query_by_session(
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
-Backfill `incident_entities` for incidents stored in JSON (data/live/investigations.jsonl by default).
+Backfill `incident_entities` for incidents in the traceability store (data/live/investigations.jsonl by default).
+
+The store is opened with the retention budgets from config.yaml so a rewrite keeps
+exactly what the API server would keep.
 
 Usage:
     python scripts/backfill_incident_entities.py --input data/live/investigations.jsonl --write
@@ -19,6 +22,8 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.traceability.incidents import summarize_incident_entities
+from src.traceability.store import TraceabilityStore
+from src.utils import load_config
 
 
 def _compute_entities(record: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -59,13 +64,23 @@ def _compute_entities(record: Dict[str, Any]) -> List[Dict[str, Any]]:
     )
 
 
+def _open_store(path: Path) -> TraceabilityStore:
+    traceability_cfg = load_config(use_global_manager=False).get("traceability") or {}
+    return TraceabilityStore(
+        path,
+        max_entries=int(traceability_cfg.get("max_entries", 500)),
+        retention_days=int(traceability_cfg.get("retention_days", 30)),
+        max_bytes=int(traceability_cfg.get("max_file_bytes", 5 * 1024 * 1024)),
+    )
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Backfill incident_entities for stored incidents.")
     parser.add_argument("--input", type=Path, default=Path("data/live/investigations.jsonl"))
     parser.add_argument(
         "--output",
         type=Path,
-        help="Optional output path. If omitted, --write controls in-place updates.",
+        help="Optional JSON export path. If omitted, --write controls in-place updates.",
     )
     parser.add_argument(
         "--write",
@@ -74,10 +89,11 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    if not args.input.exists():
-        raise SystemExit(f"Input file {args.input} does not exist.")
+    store = _open_store(args.input)
+    payload = store.records()
+    if not payload:
+        raise SystemExit(f"No investigations found in {args.input}.")
 
-    payload = json.loads(args.input.read_text(encoding="utf-8")) or []
     updated = 0
     for record in payload:
         if not isinstance(record, dict):
@@ -89,10 +105,12 @@ def main() -> None:
             del record["incident_entities"]
         updated += 1 if entities else 0
 
-    target_path = args.output or args.input
-    if args.output or args.write:
-        target_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-        print(f"Wrote updated incidents to {target_path} (entities computed for {updated} records).")
+    if args.output:
+        args.output.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"Wrote updated incidents to {args.output} (entities computed for {updated} records).")
+    elif args.write:
+        store.rewrite(payload)
+        print(f"Rewrote {args.input} segments (entities computed for {updated} records).")
     else:
         print(f"(dry run) Computed incident_entities for {updated} records. Use --write to persist changes.")
 
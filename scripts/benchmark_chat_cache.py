@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Benchmark LocalChatCache appends.
+
+Appends messages round-robin across sessions from several threads (like
+concurrent request handlers) and reports throughput and append latency
+percentiles for the synchronous path and each write-behind durability mode.
+Also times a cold start (rehydration) over the files written.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.memory.local_chat_cache import LocalChatCache
+
+MODES = {
+    "sync (open/append/close)": {},
+    "write-behind durability=none": {"write_behind": True, "durability": "none"},
+    "write-behind durability=batch": {"write_behind": True, "durability": "batch"},
+    "write-behind durability=fsync": {"write_behind": True, "durability": "fsync"},
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark chat cache append throughput.")
+    parser.add_argument("--messages", type=int, default=20_000, help="Messages per mode.")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=8)
+    return parser.parse_args()
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run_mode(options: Dict[str, Any], args: argparse.Namespace) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LocalChatCache(disk_path=tmp, flush_enabled=False, **options)
+        per_thread = args.messages // args.threads
+        latencies: List[List[float]] = [[] for _ in range(args.threads)]
+
+        def worker(slot: int) -> None:
+            samples = latencies[slot]
+            for idx in range(per_thread):
+                message = {
+                    "session_id": f"session-{(slot * per_thread + idx) % args.sessions}",
+                    "role": "user",
+                    "text": f"message {idx} " + "x" * 200,
+                    "metadata": {},
+                    "created_at": "2025-11-28T00:00:00+00:00",
+                }
+                start = time.perf_counter()
+                cache.append_message(message)
+                samples.append(time.perf_counter() - start)
+
+        threads = [threading.Thread(target=worker, args=(slot,)) for slot in range(args.threads)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        cache.close()
+
+        start = time.perf_counter()
+        LocalChatCache(disk_path=tmp, flush_enabled=False, rehydrate=True)
+        rehydrate_ms = (time.perf_counter() - start) * 1000
+
+    samples = [value * 1e6 for chunk in latencies for value in chunk]
+    return {
+        "msgs_per_sec": len(samples) / elapsed,
+        "p50_us": statistics.median(samples),
+        "p99_us": _percentile(samples, 99),
+        "rehydrate_ms": rehydrate_ms,
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    print(f"messages: {args.messages}  sessions: {args.sessions}  threads: {args.threads}")
+    print(f"{'mode':32} {'msgs/sec':>10} {'p50 us':>9} {'p99 us':>9} {'cold start ms':>14}")
+    for name, options in MODES.items():
+        result = run_mode(options, args)
+        print(
+            f"{name:32} {result['msgs_per_sec']:10.0f} {result['p50_us']:9.1f} "
+            f"{result['p99_us']:9.1f} {result['rehydrate_ms']:14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
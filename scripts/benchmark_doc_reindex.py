@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+Benchmark DocumentIndexer re-indexing after a single file changes.
+
+Builds a synthetic corpus (default: 1,000 files x 10 chunks = 10k chunks), indexes it
+with a fake embedding client, touches one file and re-indexes. Reports wall time and
+the number of texts sent for embedding in each phase.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.documents import indexer as indexer_module
+from src.documents.indexer import DocumentIndexer
+
+CHUNK_CHARS = 4000  # DocumentIndexer._create_chunks max_chunk_size
+
+
+class FakeEmbeddingClient:
+    """Offline embedding client returning deterministic unit vectors."""
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self.texts_embedded = 0
+        self.embeddings = SimpleNamespace(create=self._create)
+
+    def _create(self, model, input):
+        texts = [input] if isinstance(input, str) else list(input)
+        self.texts_embedded += len(texts)
+        data = []
+        for text in texts:
+            seed = int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+            vector = np.random.default_rng(seed).standard_normal(self.dimension, dtype=np.float32)
+            data.append(SimpleNamespace(embedding=vector))
+        return SimpleNamespace(data=data)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark single-file re-indexing.")
+    parser.add_argument("--files", type=int, default=1000, help="Number of synthetic files.")
+    parser.add_argument("--chunks-per-file", type=int, default=10, help="Chunks per file.")
+    return parser.parse_args()
+
+
+def write_corpus(docs_dir: Path, files: int, chunks_per_file: int) -> None:
+    docs_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(files):
+        body = "".join(
+            f"file {i} chunk {c} ".ljust(CHUNK_CHARS, ".") for c in range(chunks_per_file)
+        )
+        (docs_dir / f"doc_{i:05d}.txt").write_text(body)
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        docs_dir = workdir / "docs"
+        write_corpus(docs_dir, args.files, args.chunks_per_file)
+        os.chdir(workdir)
+
+        client = FakeEmbeddingClient(dimension=1536)
+        indexer_module.PooledOpenAIClient.get_client = classmethod(lambda cls, config: client)
+        config = {
+            "openai": {"api_key": "benchmark", "embedding_model": "text-embedding-3-small"},
+            "documents": {"folders": [str(docs_dir)], "supported_types": [".txt"]},
+            "performance": {"batch_embeddings": {"enabled": True, "batch_size": 500}},
+        }
+        indexer = DocumentIndexer(config)
+
+        start = time.perf_counter()
+        indexer.index_documents()
+        full_seconds = time.perf_counter() - start
+        full_calls = client.texts_embedded
+
+        changed = docs_dir / "doc_00000.txt"
+        changed.write_text(changed.read_text().replace("chunk", "section"))
+        mtime = changed.stat().st_mtime + 10
+        os.utime(changed, (mtime, mtime))
+
+        client.texts_embedded = 0
+        start = time.perf_counter()
+        indexer.index_documents()
+        reindex_seconds = time.perf_counter() - start
+
+        print(f"corpus: {args.files} files, {indexer.index.ntotal} chunks")
+        print(f"full index:       {full_seconds:8.2f}s  texts embedded: {full_calls}")
+        print(f"1-file re-index:  {reindex_seconds:8.2f}s  texts embedded: {client.texts_embedded}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Benchmark LocalVectorStore upsert and filtered top-k search on synthetic events.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.vector.local_vector_store import LocalVectorStore
+from src.vector.vector_event import VectorEvent
+
+
+class RandomEmbeddingProvider:
+    def __init__(self, dimension: int):
+        self.rng = np.random.default_rng(7)
+        self.dimension = dimension
+
+    def embed(self, text: str):
+        return self.rng.standard_normal(self.dimension).tolist()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the local vector store.")
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--dimension", type=int, default=1536)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=50)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    rng = np.random.default_rng(0)
+    apis = [f"/v1/api_{i}" for i in range(50)]
+    start_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = LocalVectorStore(Path(tmp) / "bench_index.json")
+        upsert_seconds = 0.0
+        for offset in range(0, args.events, args.batch):
+            count = min(args.batch, args.events - offset)
+            vectors = rng.standard_normal((count, args.dimension), dtype=np.float32)
+            events = [
+                VectorEvent(
+                    event_id=f"evt:{offset + i}",
+                    source_type="slack_message",
+                    text="synthetic",
+                    timestamp=start_time + timedelta(minutes=offset + i),
+                    apis=[random.choice(apis)],
+                    embedding=vectors[i],
+                )
+                for i in range(count)
+            ]
+            begin = time.perf_counter()
+            store.upsert(events)
+            upsert_seconds += time.perf_counter() - begin
+
+        provider = RandomEmbeddingProvider(args.dimension)
+        since = start_time + timedelta(minutes=args.events // 2)
+        for label, kwargs in (
+            ("unfiltered", {}),
+            ("api filter", {"filters": {"apis": [apis[0]]}}),
+            ("since filter", {"since": since}),
+        ):
+            begin = time.perf_counter()
+            for _ in range(args.queries):
+                store.search("q", embedding_provider=provider, top_k=10, **kwargs)
+            elapsed_ms = (time.perf_counter() - begin) * 1000 / args.queries
+            print(f"search ({label}): {elapsed_ms:8.2f} ms/query")
+
+        begin = time.perf_counter()
+        reloaded = LocalVectorStore(Path(tmp) / "bench_index.json")
+        load_seconds = time.perf_counter() - begin
+
+    print(f"events: {args.events}  dimension: {args.dimension}")
+    print(f"upsert total: {upsert_seconds:.2f}s  cold load: {load_seconds:.2f}s ({reloaded.live_rows} rows)")
+
+
+if __name__ == "__main__":
+    main()
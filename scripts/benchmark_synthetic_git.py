@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""
+Benchmark SyntheticGitDataSource queries.
+
+Writes a synthetic dataset (default: 100,000 commits and 20,000 PRs) to a temp
+directory and runs a dashboard-style sweep — every component of every repo,
+over several time windows — against the indexed data source, comparing with
+the previous linear scan over every event.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.slash_git.data_source import (
+    SyntheticGitDataSource,
+    _matches_paths,
+    _within_window,
+)
+from src.slash_git.models import GitTargetComponent, GitTargetRepo, TimeWindow
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark synthetic git queries.")
+    parser.add_argument("--events", type=int, default=100_000, help="Synthetic commits.")
+    parser.add_argument("--prs", type=int, default=20_000, help="Synthetic PRs.")
+    parser.add_argument("--repos", type=int, default=10)
+    parser.add_argument("--components", type=int, default=8, help="Components per repo.")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def build_records(count: int, repos: int, components: int, rng: random.Random, *, prs: bool) -> List[Dict[str, Any]]:
+    records: List[Dict[str, Any]] = []
+    for idx in range(count):
+        repo = rng.randrange(repos)
+        files = [f"svc{rng.randrange(components)}/mod{rng.randrange(20)}/file{rng.randrange(50)}.py" for _ in range(3)]
+        record: Dict[str, Any] = {
+            "repo": f"repo-{repo}",
+            "author": f"dev{rng.randrange(200)}",
+            "timestamp": (NOW - timedelta(minutes=rng.randrange(60 * 24 * 90))).isoformat(),
+            "labels": [f"label{rng.randrange(10)}"],
+            "files_changed": files,
+        }
+        if prs:
+            record["pr_number"] = idx
+        records.append(record)
+    return records
+
+
+def linear_scan(records: List[Dict[str, Any]], repo_id: str, paths: List[str], window: TimeWindow) -> int:
+    return sum(
+        1
+        for record in records
+        if record.get("repo") == repo_id
+        and _within_window(record.get("timestamp"), window)
+        and _matches_paths(record.get("files_changed") or [], paths)
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    rng = random.Random(args.seed)
+    events = build_records(args.events, args.repos, args.components, rng, prs=False)
+    prs = build_records(args.prs, args.repos, args.components, rng, prs=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        events_path = Path(tmp) / "git_events.json"
+        prs_path = Path(tmp) / "git_prs.json"
+        events_path.write_text(json.dumps(events))
+        prs_path.write_text(json.dumps(prs))
+
+        start = time.perf_counter()
+        source = SyntheticGitDataSource(
+            {"slash_git": {"synthetic_data": {"events_path": str(events_path), "prs_path": str(prs_path)}}}
+        )
+        load_seconds = time.perf_counter() - start
+
+        windows = [TimeWindow(start=NOW - timedelta(days=days), end=NOW) for days in (1, 7, 30, 90)]
+        queries = []
+        for repo_idx in range(args.repos):
+            repo = GitTargetRepo(
+                id=f"repo-{repo_idx}",
+                name=f"repo-{repo_idx}",
+                repo_owner="acme",
+                repo_name=f"repo-{repo_idx}",
+                default_branch="main",
+            )
+            for comp_idx in range(args.components):
+                component = GitTargetComponent(
+                    id=f"comp-{repo_idx}-{comp_idx}",
+                    name=f"comp-{comp_idx}",
+                    repo_id=repo.id,
+                    paths=[f"svc{comp_idx}/"],
+                )
+                queries.extend((repo, component, window) for window in windows)
+
+        start = time.perf_counter()
+        indexed = [
+            len(source.get_commits(repo, component, window)) + len(source.get_prs(repo, component, window))
+            for repo, component, window in queries
+        ]
+        indexed_seconds = time.perf_counter() - start
+
+        sample = queries[: max(1, len(queries) // 20)]
+        start = time.perf_counter()
+        scanned = [
+            linear_scan(events, repo.id, component.paths, window) + linear_scan(prs, repo.id, component.paths, window)
+            for repo, component, window in sample
+        ]
+        scan_seconds = (time.perf_counter() - start) * len(queries) / len(sample)
+
+    assert indexed[: len(sample)] == scanned, "indexed and linear results disagree"
+    print(f"events: {args.events}  prs: {args.prs}  queries: {len(queries)}")
+    print(f"load + index:  {load_seconds * 1000:9.1f} ms")
+    print(
+        f"indexed sweep: {indexed_seconds * 1000:9.1f} ms  "
+        f"({indexed_seconds * 1000 / len(queries):.2f} ms/query, {sum(indexed) / len(queries):.0f} records/query)"
+    )
+    print(f"linear sweep:  {scan_seconds * 1000:9.1f} ms  (extrapolated, {scan_seconds / max(indexed_seconds, 1e-9):.0f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,10 @@ Quick alignment check for investigations.jsonl.
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
-from typing import Any, List
 
 from src.traceability.eval import evaluate_investigation_alignment
+from src.traceability.store import TraceabilityStore
 
 
 def main() -> None:
@@ -18,18 +17,14 @@ def main() -> None:
     parser.add_argument(
         "--path",
         default="data/live/investigations.jsonl",
-        help="Path to investigations store (JSON array).",
+        help="Path to investigations store (segments are read from alongside it).",
     )
     args = parser.parse_args()
 
     path = Path(args.path)
-    if not path.exists():
-        raise SystemExit(f"Store file not found: {path}")
-
-    try:
-        records: List[dict[str, Any]] = json.loads(path.read_text(encoding="utf-8") or "[]")
-    except json.JSONDecodeError as exc:
-        raise SystemExit(f"Invalid JSON: {exc}") from exc
+    records = TraceabilityStore(path, retention_days=0, max_entries=1_000_000, max_bytes=1 << 40).records()
+    if not records:
+        raise SystemExit(f"No investigations found at {path}")
 
     issues = evaluate_investigation_alignment(records)
     if not issues:
@@ -20,7 +20,7 @@ project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.config_manager import get_config
-from src.ingestion import DocIssueIngestor, GitActivityIngestor, SlackActivityIngestor
+from src.ingestion import DocIssueIngestor, GitActivityIngestor, IngestionScheduler, SlackActivityIngestor
 from src.settings.runtime_mode import build_runtime_flags
 
 
@@ -75,29 +75,57 @@ def main() -> int:
     )
     print(mode_summary)
 
+    # Live Slack channels and Git repos share one scheduler run so the refresh
+    # takes about as long as the slowest single source.
+    live_units = []
+    live_ingestors = []
+
     if "slack" in sources:
         if not slack_cfg.get("enabled", False):
             print("[SLACK] Skipped (activity_ingest.slack.enabled is false)")
         else:
             slack_ingestor = SlackActivityIngestor(config)
-            result = _run_slack_ingest(slack_ingestor, slack_cfg, runtime_flags, args.force_live)
-            slack_ingestor.close()
-            print(f"[SLACK] {result}")
+            if runtime_flags.enable_live_slack or args.force_live:
+                live_units.extend(slack_ingestor.ingest_units())
+                live_ingestors.append(slack_ingestor)
+            else:
+                result = _run_slack_fixtures(slack_ingestor, slack_cfg, runtime_flags)
+                slack_ingestor.close()
+                print(f"[SLACK] {result}")
 
     if "git" in sources:
         if not git_cfg.get("enabled", False):
             print("[GIT] Skipped (activity_ingest.git.enabled is false)")
         else:
             git_ingestor = GitActivityIngestor(config)
-            result = _run_git_ingest(
-                git_ingestor,
-                git_cfg,
-                runtime_flags,
-                args.force_live,
-                repo_identifier=args.fixture_repo_id,
-            )
-            git_ingestor.close()
-            print(f"[GIT] {result}")
+            if runtime_flags.enable_live_git or args.force_live:
+                live_units.extend(git_ingestor.ingest_units())
+                live_ingestors.append(git_ingestor)
+            else:
+                result = _run_git_fixtures(
+                    git_ingestor,
+                    git_cfg,
+                    runtime_flags,
+                    repo_identifier=args.fixture_repo_id,
+                )
+                git_ingestor.close()
+                print(f"[GIT] {result}")
+
+    if live_units:
+        report = IngestionScheduler.from_config(config).run(
+            live_units,
+            on_progress=lambda result, done, total: print(
+                f"[INGEST] {done}/{total} {result.source}:{result.key} {result.status} "
+                f"({result.duration_seconds:.1f}s) {result.items or result.error or ''}"
+            ),
+        )
+        for ingestor in live_ingestors:
+            ingestor.close()
+        summary = report.to_dict()
+        for source, stats in summary["sources"].items():
+            print(f"[{source.upper()}] {stats['items']} ok={stats['ok']} failed={stats['failed']} "
+                  f"backoff={stats['backoff']} ({stats['items_per_second']}/s)")
+        print(f"[INGEST] Finished {len(live_units)} units in {summary['wall_seconds']}s")
 
     if "doc_issues" in sources:
         if not doc_cfg.get("enabled", False):
@@ -111,15 +139,12 @@ def main() -> int:
     return exit_code
 
 
-def _run_slack_ingest(
+def _run_slack_fixtures(
     ingestor: SlackActivityIngestor,
     slack_cfg: Dict[str, Any],
     runtime_flags,
-    force_live: bool,
 ) -> Dict[str, Any]:
-    if runtime_flags.enable_live_slack or force_live:
-        return ingestor.ingest()
-
+    """Ingest Slack fixtures when live ingestion is off (live runs go through the scheduler)."""
     if not runtime_flags.enable_fixtures:
         print("[SLACK] Live ingestion disabled in this mode and fixtures are unavailable; skipping.")
         return {"ingested": 0}
@@ -143,17 +168,14 @@ def _run_slack_ingest(
     return ingestor.ingest_fixture_messages(payload)
 
 
-def _run_git_ingest(
+def _run_git_fixtures(
     ingestor: GitActivityIngestor,
     git_cfg: Dict[str, Any],
     runtime_flags,
-    force_live: bool,
     *,
     repo_identifier: str,
 ) -> Dict[str, Any]:
-    if runtime_flags.enable_live_git or force_live:
-        return ingestor.ingest()
-
+    """Ingest Git fixtures when live ingestion is off (live runs go through the scheduler)."""
     if not runtime_flags.enable_fixtures:
         print("[GIT] Live ingestion disabled in this mode and fixtures are unavailable; skipping.")
         return {"prs": 0, "commits": 0, "issues": 0}
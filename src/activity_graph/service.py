@@ -12,6 +12,7 @@ from .cache import ActivityGraphCache, build_cache
 from .metrics import activity_graph_metrics
 from .models import ComponentActivity, TimeWindow
 from .prioritization import DOC_SEVERITY_WEIGHTS
+from .signal_index import DEFAULT_BUCKET_SECONDS
 from .signals import DocIssueSignalsExtractor, GitSignalsExtractor, SlackSignalsExtractor
 
 logger = logging.getLogger(__name__)
@@ -81,14 +82,14 @@ class ActivityScoringEngine:
         for event in events:
             if event.kind != kind:
                 continue
-            total += base_weight * self._decay_multiplier(event.timestamp)
+            total += base_weight * self._decay_multiplier(event.timestamp) * event.count
         return total
 
     def _score_slack(self, events) -> Tuple[float, float]:
         activity_total = 0.0
         dissatisfaction_total = 0.0
         for event in events:
-            decay = self._decay_multiplier(event.timestamp)
+            decay = self._decay_multiplier(event.timestamp) * event.count
             activity_total += self.slack_conversation_weight * decay
             if event.kind == "complaint":
                 dissatisfaction_total += self.slack_complaint_weight * decay
@@ -170,7 +171,12 @@ class ActivityGraphService:
 
         git_log_path = ag_cfg.get("git_graph_path") or slash_git_cfg.get("graph_log_path")
         git_log_path = Path(git_log_path) if git_log_path else None
-        self.git_signals = git_signals or GitSignalsExtractor(git_source, log_path=git_log_path)
+        bucket_seconds = float((ag_cfg.get("signal_index") or {}).get("bucket_seconds", DEFAULT_BUCKET_SECONDS))
+        self.git_signals = git_signals or GitSignalsExtractor(
+            git_source,
+            log_path=git_log_path,
+            bucket_seconds=bucket_seconds,
+        )
         slack_path = Path(ag_cfg.get("slack_graph_path", "data/logs/slash/slack_graph.jsonl"))
         impact_cfg = self.config.get("impact") or {}
         data_mode = (impact_cfg.get("data_mode") or "live").lower()
@@ -178,7 +184,7 @@ class ActivityGraphService:
         doc_ingest_cfg = (self.config.get("activity_ingest") or {}).get("doc_issues") or {}
         doc_path_value = ag_cfg.get("doc_issues_path") or doc_ingest_cfg.get("path") or doc_default
         doc_path = Path(doc_path_value)
-        self.slack_signals = slack_signals or SlackSignalsExtractor(slack_path)
+        self.slack_signals = slack_signals or SlackSignalsExtractor(slack_path, bucket_seconds=bucket_seconds)
         self.doc_issue_signals = doc_issue_signals or DocIssueSignalsExtractor(doc_path)
         self.cache = cache or build_cache(self.config)
         scoring_cfg = ag_cfg.get("scoring") or {}
@@ -240,7 +246,7 @@ class ActivityGraphService:
         debug_breakdown = scoring_result.breakdown if include_debug else None
 
         recent_slack_events = []
-        for event in slack_counts.events[:3]:
+        for event in (slack_counts.recent_events or slack_counts.events)[:3]:
             metadata = event.metadata or {}
             recent_slack_events.append(
                 {
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import math
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import logging
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 try:  # Neo4j is optional in some environments
     from neo4j import Session  # type: ignore
@@ -76,6 +77,11 @@ SEMANTIC_SOURCE_TYPES: Dict[str, List[str]] = {
     "doc_vs_api": ["doc"],
 }
 
+# Issues per UNWIND query in the bulk feature extractors.
+SEVERITY_QUERY_BATCH_SIZE = 500
+# Concurrent vector lookups for bulk semantic scoring.
+SEMANTIC_SEARCH_WORKERS = 8
+
 
 def severity_label_from_score(score: float) -> str:
     if score >= 85:
@@ -165,23 +171,84 @@ def compute_issue_severity(
 ) -> Dict[str, Any]:
     """Compute the blended severity score for an Issue node."""
 
+    return compute_issue_severities(
+        [issue_id],
+        graph_service=graph_service,
+        session=session,
+        now=now,
+        weights=weights,
+    )[issue_id]
+
+
+def compute_issue_severities(
+    issue_ids: Iterable[str],
+    *,
+    graph_service: Optional[GraphService] = None,
+    session: Optional[Session] = None,
+    now: Optional[datetime] = None,
+    weights: Optional[Dict[str, float]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Bulk variant of `compute_issue_severity`, keyed by issue id.
+
+    Features for all issues come from a fixed set of ``UNWIND``-parameterized
+    queries (per ``SEVERITY_QUERY_BATCH_SIZE`` issues), each issue text is
+    embedded once for all semantic pairs, and the vector lookups run
+    concurrently.
+    """
+
     if not graph_service and not session:
         raise ValueError("Either graph_service or session must be provided")
 
     now = now or datetime.now(timezone.utc)
     weight_map = weights or DEFAULT_WEIGHTS
+    ids = list(dict.fromkeys(issue_id for issue_id in issue_ids if issue_id))
+    if not ids:
+        return {}
 
     runner = _QueryRunner(graph_service=graph_service, session=session)
 
-    slack_features = extract_slack_features(runner, issue_id, now)
-    git_features = extract_git_features(runner, issue_id, now)
-    doc_features = extract_doc_issue_features(runner, issue_id)
-    graph_features = extract_graph_features(runner, issue_id, now)
+    slack_by_issue: Dict[str, SlackFeatures] = {}
+    git_by_issue: Dict[str, GitFeatures] = {}
+    doc_by_issue: Dict[str, DocIssueFeatures] = {}
+    graph_by_issue: Dict[str, GraphFeatures] = {}
+    for start in range(0, len(ids), SEVERITY_QUERY_BATCH_SIZE):
+        chunk = ids[start : start + SEVERITY_QUERY_BATCH_SIZE]
+        slack_by_issue.update(extract_slack_features_batch(runner, chunk, now))
+        git_by_issue.update(extract_git_features_batch(runner, chunk, now))
+        doc_by_issue.update(extract_doc_issue_features_batch(runner, chunk))
+        graph_by_issue.update(extract_graph_features_batch(runner, chunk, now))
+    semantic_by_issue = _semantic_severity_batch(ids, runner=runner)
+
+    return {
+        issue_id: _score_issue(
+            issue_id,
+            slack_features=slack_by_issue.get(issue_id) or SlackFeatures(),
+            git_features=git_by_issue.get(issue_id) or GitFeatures(),
+            doc_features=doc_by_issue.get(issue_id) or DocIssueFeatures(),
+            graph_features=graph_by_issue.get(issue_id) or GraphFeatures(),
+            semantic_detail=semantic_by_issue.get(issue_id) or _empty_semantic_payload(),
+            now=now,
+            weight_map=weight_map,
+        )
+        for issue_id in ids
+    }
 
+
+def _score_issue(
+    issue_id: str,
+    *,
+    slack_features: SlackFeatures,
+    git_features: GitFeatures,
+    doc_features: DocIssueFeatures,
+    graph_features: GraphFeatures,
+    semantic_detail: Dict[str, Any],
+    now: datetime,
+    weight_map: Dict[str, float],
+) -> Dict[str, Any]:
     slack_eval = _evaluate_slack_signals(slack_features)
     git_eval = _evaluate_git_activity(git_features)
     doc_eval = _evaluate_doc_issue(doc_features, now)
-    semantic_detail = _semantic_severity_detailed(issue_id, runner=runner)
     graph_eval = _evaluate_graph_activity(graph_features)
 
     slack_score = float(slack_eval["score"])
@@ -383,12 +450,24 @@ def extract_slack_features(
 ) -> SlackFeatures:
     """Aggregate Slack-derived ActivitySignal metrics for an issue."""
 
+    return extract_slack_features_batch(runner, [issue_id], now).get(issue_id, SlackFeatures())
+
+
+def extract_slack_features_batch(
+    runner: _QueryRunner, issue_ids: Sequence[str], now: datetime
+) -> Dict[str, SlackFeatures]:
+    """Slack ActivitySignal metrics for several issues in one query."""
+
+    # OPTIONAL MATCH keeps one (possibly all-zero) row per issue, matching the
+    # single-issue aggregate; a missing row means the query did not run.
     query = """
-    MATCH (i:Issue {id: $issue_id})-[:AFFECTS_COMPONENT]->(c:Component)
-    MATCH (sig:ActivitySignal)-[rel:SIGNALS_COMPONENT]->(c)
+    UNWIND $issue_ids AS issue_id
+    OPTIONAL MATCH (i:Issue {id: issue_id})-[:AFFECTS_COMPONENT]->(c:Component)
+    OPTIONAL MATCH (sig:ActivitySignal)-[rel:SIGNALS_COMPONENT]->(c)
     WHERE toLower(sig.source) IN $slack_sources
       AND (rel.last_seen IS NULL OR datetime(rel.last_seen) >= datetime() - duration('P7D'))
     RETURN
+        issue_id,
         count(DISTINCT sig) AS msg_count,
         count(DISTINCT sig.thread_ts) AS thread_count,
         count(DISTINCT sig.user) AS author_count,
@@ -398,16 +477,18 @@ def extract_slack_features(
         collect(DISTINCT coalesce(sig.channel_name, sig.channel_id)) AS channels,
         reduce(acc = 0, labels IN collect(coalesce(sig.labels, [])) | acc + size(labels)) AS label_count
     """
-    record = (
-        runner.run(
-            query,
-            {"issue_id": issue_id, "slack_sources": [src.lower() for src in SLACK_ACTIVITY_SOURCES]},
-        )
-        or [None]
-    )[0]
-    if not record:
-        return SlackFeatures()
+    rows = runner.run(
+        query,
+        {"issue_ids": list(issue_ids), "slack_sources": [src.lower() for src in SLACK_ACTIVITY_SOURCES]},
+    )
+    return {
+        row["issue_id"]: _slack_features_from_record(row, now)
+        for row in rows
+        if row and row.get("issue_id") is not None
+    }
 
+
+def _slack_features_from_record(record: Dict[str, Any], now: datetime) -> SlackFeatures:
     min_last_seen = _coerce_datetime(record.get("min_last_seen"), now)
     hours_since = (now - min_last_seen).total_seconds() / 3600.0 if min_last_seen else 1e9
     channels: Sequence[str] = [ch for ch in (record.get("channels") or []) if ch]
@@ -467,12 +548,20 @@ def _evaluate_slack_signals(features: SlackFeatures) -> Dict[str, Any]:
 def extract_git_features(
     runner: _QueryRunner, issue_id: str, now: datetime
 ) -> GitFeatures:
+    return extract_git_features_batch(runner, [issue_id], now).get(issue_id, GitFeatures())
+
+
+def extract_git_features_batch(
+    runner: _QueryRunner, issue_ids: Sequence[str], now: datetime
+) -> Dict[str, GitFeatures]:
     query = """
-    MATCH (i:Issue {id: $issue_id})-[:AFFECTS_COMPONENT]->(c:Component)
-    MATCH (sig:ActivitySignal)-[rel:SIGNALS_COMPONENT]->(c)
+    UNWIND $issue_ids AS issue_id
+    OPTIONAL MATCH (i:Issue {id: issue_id})-[:AFFECTS_COMPONENT]->(c:Component)
+    OPTIONAL MATCH (sig:ActivitySignal)-[rel:SIGNALS_COMPONENT]->(c)
     WHERE sig.source IN ["github_pr", "github_commit"]
       AND (rel.last_seen IS NULL OR datetime(rel.last_seen) >= datetime() - duration('P7D'))
     RETURN
+        issue_id,
         count(DISTINCT CASE WHEN sig.source = "github_pr" THEN sig END) AS pr_count,
         count(DISTINCT CASE WHEN sig.source = "github_commit" THEN sig END) AS commit_count,
         count(DISTINCT CASE WHEN sig.is_doc_change = true THEN sig END) AS doc_changes,
@@ -480,10 +569,15 @@ def extract_git_features(
         max(rel.signal_weight) AS max_weight,
         min(rel.last_seen) AS min_last_seen
     """
-    record = (runner.run(query, {"issue_id": issue_id}) or [None])[0]
-    if not record:
-        return GitFeatures()
+    rows = runner.run(query, {"issue_ids": list(issue_ids)})
+    return {
+        row["issue_id"]: _git_features_from_record(row, now)
+        for row in rows
+        if row and row.get("issue_id") is not None
+    }
 
+
+def _git_features_from_record(record: Dict[str, Any], now: datetime) -> GitFeatures:
     min_last_seen = _coerce_datetime(record.get("min_last_seen"), now)
     hours_since = (now - min_last_seen).total_seconds() / 3600.0 if min_last_seen else 1e9
 
@@ -536,10 +630,18 @@ def _evaluate_git_activity(features: GitFeatures) -> Dict[str, Any]:
 def extract_doc_issue_features(
     runner: _QueryRunner, issue_id: str
 ) -> DocIssueFeatures:
+    return extract_doc_issue_features_batch(runner, [issue_id]).get(issue_id, DocIssueFeatures())
+
+
+def extract_doc_issue_features_batch(
+    runner: _QueryRunner, issue_ids: Sequence[str]
+) -> Dict[str, DocIssueFeatures]:
     query = """
-    MATCH (i:Issue {id: $issue_id})
+    UNWIND $issue_ids AS issue_id
+    MATCH (i:Issue {id: issue_id})
     OPTIONAL MATCH (i)-[:AFFECTS_COMPONENT]->(c:Component)
     RETURN
+        issue_id,
         coalesce(toLower(i.severity), 'medium') AS severity,
         coalesce(toLower(i.impact_level), toLower(i.severity), 'medium') AS impact_level,
         i.updated_at AS updated_at,
@@ -548,23 +650,24 @@ def extract_doc_issue_features(
         i.doc_path AS doc_path,
         count(DISTINCT c) AS component_count
     """
-    record = (runner.run(query, {"issue_id": issue_id}) or [None])[0]
-    if not record:
-        return DocIssueFeatures()
-
-    updated_at = _coerce_datetime(record.get("updated_at"), datetime.now(timezone.utc))
-    severity = record.get("severity", "medium")
-    impact_level = record.get("impact_level", severity)
-
-    return DocIssueFeatures(
-        base_severity_score=SEVERITY_BASE.get(severity, 0.6),
-        impact_level_score=IMPACT_LEVEL_BASE.get(impact_level, 0.6),
-        updated_at=updated_at,
-        labels=record.get("labels") or [],
-        repo_id=record.get("repo_id") or "",
-        doc_path=record.get("doc_path") or "",
-        component_count=record.get("component_count", 0) or 0,
-    )
+    features: Dict[str, DocIssueFeatures] = {}
+    for record in runner.run(query, {"issue_ids": list(issue_ids)}):
+        if not record or record.get("issue_id") is None:
+            continue
+        updated_at = _coerce_datetime(record.get("updated_at"), datetime.now(timezone.utc))
+        severity = record.get("severity", "medium")
+        impact_level = record.get("impact_level", severity)
+
+        features[record["issue_id"]] = DocIssueFeatures(
+            base_severity_score=SEVERITY_BASE.get(severity, 0.6),
+            impact_level_score=IMPACT_LEVEL_BASE.get(impact_level, 0.6),
+            updated_at=updated_at,
+            labels=record.get("labels") or [],
+            repo_id=record.get("repo_id") or "",
+            doc_path=record.get("doc_path") or "",
+            component_count=record.get("component_count", 0) or 0,
+        )
+    return features
 
 
 def doc_issue_severity(features: DocIssueFeatures, now: datetime) -> float:
@@ -600,60 +703,118 @@ def semantic_severity(issue_id: str) -> float:
         return 0.0
 
 
-def _semantic_severity_detailed(
-    issue_id: str,
-    runner: Optional[_QueryRunner],
-) -> Dict[str, Any]:
-    empty_payload: Dict[str, Any] = {
+def _empty_semantic_payload() -> Dict[str, Any]:
+    return {
         "score": 0.0,
         "pairs": {},
         "weight_sum": 0.0,
         "weighted_drift": 0.0,
         "pair_weights": dict(SEMANTIC_PAIR_WEIGHTS),
     }
+
+
+def _semantic_severity_detailed(
+    issue_id: str,
+    runner: Optional[_QueryRunner],
+) -> Dict[str, Any]:
     if runner is None:
-        return empty_payload
+        return _empty_semantic_payload()
+    return _semantic_severity_batch([issue_id], runner=runner).get(issue_id) or _empty_semantic_payload()
 
-    context = _extract_issue_semantic_context(runner, issue_id)
-    if not context or not context.issue_text.strip():
-        return empty_payload
+
+def _semantic_severity_batch(
+    issue_ids: Sequence[str],
+    runner: _QueryRunner,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Semantic drift payloads for several issues.
+
+    Issue contexts come from one query per ``SEVERITY_QUERY_BATCH_SIZE`` issues,
+    each issue text is embedded once and reused for every pair, and the
+    (issue, pair) vector searches run on a small thread pool.
+    """
+    contexts: Dict[str, IssueSemanticContext] = {}
+    for start in range(0, len(issue_ids), SEVERITY_QUERY_BATCH_SIZE):
+        contexts.update(
+            _extract_issue_semantic_context_batch(
+                runner, issue_ids[start : start + SEVERITY_QUERY_BATCH_SIZE]
+            )
+        )
+    contexts = {
+        issue_id: context
+        for issue_id, context in contexts.items()
+        if context.issue_text.strip()
+    }
+    if not contexts:
+        return {}
 
     vector_service = _get_vector_service()
     if not vector_service:
-        return empty_payload
+        return {}
+
+    issue_order = list(contexts)
+    embeddings: Dict[str, Optional[List[float]]] = {}
+    embed_queries = getattr(vector_service, "embed_queries", None)
+    if callable(embed_queries):
+        try:
+            vectors = embed_queries([contexts[issue_id].issue_text for issue_id in issue_order])
+            embeddings = dict(zip(issue_order, vectors))
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.debug("[SEVERITY][SEM] Batch embedding failed: %s", exc)
+
+    tasks: List[Tuple[str, str]] = [
+        (issue_id, pair_name)
+        for issue_id in issue_order
+        for pair_name in SEMANTIC_PAIR_WEIGHTS
+    ]
 
-    pairs: Dict[str, Dict[str, Any]] = {}
-    weight_sum = 0.0
-    weighted_drift = 0.0
+    def run_pair(task: Tuple[str, str]) -> Optional[Dict[str, float]]:
+        issue_id, pair_name = task
+        return _semantic_pair_similarity(
+            vector_service,
+            contexts[issue_id],
+            pair_name,
+            embedding=embeddings.get(issue_id),
+        )
 
-    for pair_name, weight in SEMANTIC_PAIR_WEIGHTS.items():
-        pair_result = _semantic_pair_similarity(vector_service, context, pair_name)
+    workers = max(1, min(SEMANTIC_SEARCH_WORKERS, len(tasks)))
+    if workers == 1:
+        pair_results = [run_pair(task) for task in tasks]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="severity-sem") as pool:
+            pair_results = list(pool.map(run_pair, tasks))
+
+    payloads: Dict[str, Dict[str, Any]] = {}
+    for (issue_id, pair_name), pair_result in zip(tasks, pair_results):
+        payload = payloads.setdefault(issue_id, _empty_semantic_payload())
         if not pair_result:
             continue
+        weight = SEMANTIC_PAIR_WEIGHTS[pair_name]
         similarity = max(0.0, min(pair_result["similarity"], 1.0))
         drift = max(0.0, min(1.0 - similarity, 1.0))
-        pairs[pair_name] = {
+        payload["pairs"][pair_name] = {
             "cosine": round(similarity, 4),
             "drift": round(drift, 4),
             "matches": pair_result.get("matches", 0),
         }
-        weight_sum += weight
-        weighted_drift += weight * drift
+        payload["weight_sum"] += weight
+        payload["weighted_drift"] += weight * drift
 
-    score = round(weighted_drift / weight_sum, 4) if weight_sum else 0.0
-    return {
-        "score": score,
-        "pairs": pairs,
-        "weight_sum": round(weight_sum, 4),
-        "weighted_drift": round(weighted_drift, 4),
-        "pair_weights": dict(SEMANTIC_PAIR_WEIGHTS),
-    }
+    for payload in payloads.values():
+        weight_sum = payload["weight_sum"]
+        weighted_drift = payload["weighted_drift"]
+        payload["score"] = round(weighted_drift / weight_sum, 4) if weight_sum else 0.0
+        payload["weight_sum"] = round(weight_sum, 4)
+        payload["weighted_drift"] = round(weighted_drift, 4)
+    return payloads
 
 
 def _semantic_pair_similarity(
     service: VectorSearchService,
     context: IssueSemanticContext,
     pair_name: str,
+    *,
+    embedding: Optional[List[float]] = None,
 ) -> Optional[Dict[str, float]]:
     source_types = SEMANTIC_SOURCE_TYPES.get(pair_name)
     if not source_types:
@@ -668,7 +829,16 @@ def _semantic_pair_similarity(
         metadata_filters=metadata_filters,
     )
     try:
-        results = service.semantic_search(context.issue_text, options)
+        results = None
+        if embedding:
+            try:
+                results = service.semantic_search_vector(
+                    embedding, options, query_label=context.issue_text
+                )
+            except (AttributeError, NotImplementedError):
+                results = None
+        if results is None:
+            results = service.semantic_search(context.issue_text, options)
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.debug("[SEVERITY][SEM] Vector query failed for %s: %s", pair_name, exc)
         return None
@@ -728,13 +898,22 @@ def _extract_issue_semantic_context(
     runner: _QueryRunner,
     issue_id: str,
 ) -> Optional[IssueSemanticContext]:
+    return _extract_issue_semantic_context_batch(runner, [issue_id]).get(issue_id)
+
+
+def _extract_issue_semantic_context_batch(
+    runner: _QueryRunner,
+    issue_ids: Sequence[str],
+) -> Dict[str, IssueSemanticContext]:
     query = """
-    MATCH (i:Issue {id: $issue_id})
+    UNWIND $issue_ids AS issue_id
+    MATCH (i:Issue {id: issue_id})
     OPTIONAL MATCH (i)-[:AFFECTS_COMPONENT]->(c:Component)
     OPTIONAL MATCH (i)-[:IMPACTS_DOC]->(doc:Doc)
     OPTIONAL MATCH (doc)-[:DOC_DOCUMENTS_API]->(doc_api:APIEndpoint)
     OPTIONAL MATCH (i)-[:MODIFIES_API|:MODIFIES_ENDPOINT]->(api:APIEndpoint)
     RETURN
+        issue_id,
         i.title AS title,
         i.summary AS summary,
         i.description AS description,
@@ -751,10 +930,14 @@ def _extract_issue_semantic_context(
         collect(DISTINCT coalesce(doc_api.id, doc_api.name)) AS doc_api_ids,
         collect(DISTINCT coalesce(api.id, api.name)) AS direct_api_ids
     """
-    record = (runner.run(query, {"issue_id": issue_id}) or [None])[0]
-    if not record:
-        return None
+    return {
+        record["issue_id"]: _semantic_context_from_record(record["issue_id"], record)
+        for record in runner.run(query, {"issue_ids": list(issue_ids)})
+        if record and record.get("issue_id") is not None
+    }
 
+
+def _semantic_context_from_record(issue_id: str, record: Dict[str, Any]) -> IssueSemanticContext:
     component_ids = [str(cid) for cid in (record.get("component_ids") or []) if cid]
     doc_paths = [str(path) for path in (record.get("doc_paths") or []) if path]
     api_ids = [
@@ -822,89 +1005,107 @@ def _get_vector_service() -> Optional[VectorSearchService]:
 def extract_graph_features(
     runner: _QueryRunner, issue_id: str, now: datetime
 ) -> GraphFeatures:
+    return extract_graph_features_batch(runner, [issue_id], now).get(issue_id, GraphFeatures())
+
+
+def extract_graph_features_batch(
+    runner: _QueryRunner, issue_ids: Sequence[str], now: datetime
+) -> Dict[str, GraphFeatures]:
     base_query = """
-    MATCH (i:Issue {id: $issue_id})
+    UNWIND $issue_ids AS issue_id
+    MATCH (i:Issue {id: issue_id})
     OPTIONAL MATCH (i)-[:AFFECTS_COMPONENT]->(c:Component)
-    WITH i, collect(DISTINCT c.id) AS component_ids
+    WITH issue_id, i, collect(DISTINCT c.id) AS component_ids
     OPTIONAL MATCH (i)-[:IMPACTS_DOC]->(d:Doc)
-    WITH i, component_ids, count(DISTINCT d) AS num_docs
+    WITH issue_id, i, component_ids, count(DISTINCT d) AS num_docs
     OPTIONAL MATCH (svc:Service)-[:HAS_COMPONENT]->(c:Component)
     WHERE c.id IN component_ids
-    WITH i, component_ids, num_docs, count(DISTINCT svc) AS num_services
+    WITH issue_id, i, component_ids, num_docs, count(DISTINCT svc) AS num_services
     OPTIONAL MATCH (other:Issue)-[:AFFECTS_COMPONENT]->(c2:Component)
     WHERE c2.id IN component_ids AND other.id <> i.id
-    RETURN component_ids,
+    RETURN issue_id,
+           component_ids,
            size(component_ids) AS num_components,
            num_docs,
            num_services,
            count(DISTINCT other) AS num_related_doc_issues
     """
 
-    base_record = (runner.run(base_query, {"issue_id": issue_id}) or [None])[0]
-    if not base_record:
-        return GraphFeatures()
-
-    component_ids: List[str] = base_record.get("component_ids") or []
-    if not component_ids:
-        return GraphFeatures()
-
-    counts = {
-        "num_components": base_record.get("num_components", 0) or 0,
-        "num_docs": base_record.get("num_docs", 0) or 0,
-        "num_services": base_record.get("num_services", 0) or 0,
-        "num_related_doc_issues": base_record.get("num_related_doc_issues", 0) or 0,
-    }
+    base_records: Dict[str, Dict[str, Any]] = {}
+    for record in runner.run(base_query, {"issue_ids": list(issue_ids)}):
+        if record and record.get("issue_id") is not None and record.get("component_ids"):
+            base_records[record["issue_id"]] = record
+    if not base_records:
+        return {}
 
-    signal_params = {
-        "component_ids": component_ids,
-        "cutoff": now.isoformat(),
-    }
+    issues_param = [
+        {"issue_id": issue_id, "component_ids": record["component_ids"]}
+        for issue_id, record in base_records.items()
+    ]
+    signal_params = {"issues": issues_param, "cutoff": now.isoformat()}
 
     slack_query = """
+    UNWIND $issues AS issue
     MATCH (sig:ActivitySignal)-[rel:SIGNALS_COMPONENT]->(c:Component)
-    WHERE c.id IN $component_ids
+    WHERE c.id IN issue.component_ids
       AND toLower(sig.source) IN $slack_sources
       AND (rel.last_seen IS NULL OR datetime(rel.last_seen) >= datetime($cutoff) - duration('P7D'))
-    RETURN count(DISTINCT sig) AS slack_count
+    RETURN issue.issue_id AS issue_id, count(DISTINCT sig) AS slack_count
     """
     git_query = """
+    UNWIND $issues AS issue
     MATCH (sig:ActivitySignal)-[rel:SIGNALS_COMPONENT]->(c:Component)
-    WHERE c.id IN $component_ids
+    WHERE c.id IN issue.component_ids
       AND sig.source IN ["github_pr", "github_commit"]
       AND (rel.last_seen IS NULL OR datetime(rel.last_seen) >= datetime($cutoff) - duration('P7D'))
-    RETURN count(DISTINCT sig) AS git_count
+    RETURN issue.issue_id AS issue_id, count(DISTINCT sig) AS git_count
     """
     support_query = """
+    UNWIND $issues AS issue
     MATCH (case:SupportCase)-[rel:SUPPORTS_COMPONENT]->(c:Component)
-    WHERE c.id IN $component_ids
+    WHERE c.id IN issue.component_ids
       AND (rel.last_seen IS NULL OR datetime(rel.last_seen) >= datetime($cutoff) - duration('P7D'))
-    RETURN count(DISTINCT case) AS support_count
+    RETURN issue.issue_id AS issue_id, count(DISTINCT case) AS support_count
     """
     downstream_query = """
+    UNWIND $issues AS issue
     MATCH (c:Component)
-    WHERE c.id IN $component_ids
+    WHERE c.id IN issue.component_ids
     MATCH (c)-[:COMPONENT_USES_COMPONENT|DEPENDS_ON*1..2]->(down:Component)
-    RETURN count(DISTINCT down) AS downstream_count
+    RETURN issue.issue_id AS issue_id, count(DISTINCT down) AS downstream_count
     """
 
     slack_params = dict(signal_params)
     slack_params["slack_sources"] = [src.lower() for src in SLACK_ACTIVITY_SOURCES]
-    slack_record = (runner.run(slack_query, slack_params) or [None])[0] or {}
-    git_record = (runner.run(git_query, signal_params) or [None])[0] or {}
-    support_record = (runner.run(support_query, signal_params) or [None])[0] or {}
-    downstream_record = (runner.run(downstream_query, {"component_ids": component_ids}) or [None])[0] or {}
-
-    return GraphFeatures(
-        num_components=counts["num_components"],
-        num_docs=counts["num_docs"],
-        num_services=counts["num_services"],
-        num_related_doc_issues=counts["num_related_doc_issues"],
-        num_activity_signals_7d_slack=slack_record.get("slack_count", 0) or 0,
-        num_activity_signals_7d_git=git_record.get("git_count", 0) or 0,
-        num_support_cases=support_record.get("support_count", 0) or 0,
-        downstream_components_depth2=downstream_record.get("downstream_count", 0) or 0,
+    slack_counts = _counts_by_issue(runner.run(slack_query, slack_params), "slack_count")
+    git_counts = _counts_by_issue(runner.run(git_query, signal_params), "git_count")
+    support_counts = _counts_by_issue(runner.run(support_query, signal_params), "support_count")
+    downstream_counts = _counts_by_issue(
+        runner.run(downstream_query, {"issues": issues_param}), "downstream_count"
     )
 
+    return {
+        issue_id: GraphFeatures(
+            num_components=record.get("num_components", 0) or 0,
+            num_docs=record.get("num_docs", 0) or 0,
+            num_services=record.get("num_services", 0) or 0,
+            num_related_doc_issues=record.get("num_related_doc_issues", 0) or 0,
+            num_activity_signals_7d_slack=slack_counts.get(issue_id, 0),
+            num_activity_signals_7d_git=git_counts.get(issue_id, 0),
+            num_support_cases=support_counts.get(issue_id, 0),
+            downstream_components_depth2=downstream_counts.get(issue_id, 0),
+        )
+        for issue_id, record in base_records.items()
+    }
+
+
+def _counts_by_issue(rows: Iterable[Dict[str, Any]], field_name: str) -> Dict[str, int]:
+    return {
+        row["issue_id"]: row.get(field_name, 0) or 0
+        for row in rows
+        if row and row.get("issue_id") is not None
+    }
+
 
 def graph_severity(features: GraphFeatures) -> float:
     return float(_evaluate_graph_activity(features)["score"])
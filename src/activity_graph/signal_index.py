@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# (component_ids, timestamp, kind) for an indexable record, or None to skip it.
+SignalClassifier = Callable[[Dict[str, Any]], Optional[Tuple[Iterable[str], Optional[datetime], str]]]
+
+DEFAULT_BUCKET_SECONDS = 300.0
+
+
+class _Column:
+    """Append-friendly timestamp/offset arrays for one (component, kind) pair."""
+
+    __slots__ = ("timestamps", "offsets", "_sorted_timestamps", "_sorted_offsets")
+
+    def __init__(self) -> None:
+        self.timestamps = array("d")
+        self.offsets = array("q")
+        self._sorted_timestamps: Optional[np.ndarray] = None
+        self._sorted_offsets: Optional[np.ndarray] = None
+
+    def append(self, timestamp: float, offset: int) -> None:
+        self.timestamps.append(timestamp)
+        self.offsets.append(offset)
+        self._sorted_timestamps = None
+        self._sorted_offsets = None
+
+    def frozen(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._sorted_timestamps is None:
+            timestamps = np.array(self.timestamps, dtype=np.float64)
+            offsets = np.array(self.offsets, dtype=np.int64)
+            if timestamps.size > 1 and np.any(timestamps[1:] < timestamps[:-1]):
+                order = np.argsort(timestamps, kind="stable")
+                timestamps = timestamps[order]
+                offsets = offsets[order]
+            self._sorted_timestamps = timestamps
+            self._sorted_offsets = offsets
+        return self._sorted_timestamps, self._sorted_offsets
+
+
+class SignalWindow:
+    """Events for one (component, kind) inside a time window, pre-bucketed."""
+
+    __slots__ = ("count", "bucket_timestamps", "bucket_counts", "offsets")
+
+    def __init__(self, timestamps: np.ndarray, offsets: np.ndarray, bucket_seconds: float):
+        self.count = int(timestamps.size)
+        self.offsets = offsets
+        if not self.count:
+            self.bucket_timestamps: List[float] = []
+            self.bucket_counts: List[int] = []
+            return
+        keys = np.floor(timestamps / bucket_seconds)
+        # Timestamps are sorted, so each bucket is a contiguous run; represent it by its newest event.
+        ends = np.append(np.flatnonzero(np.diff(keys)), timestamps.size - 1)
+        starts = np.concatenate(([0], ends[:-1] + 1))
+        self.bucket_timestamps = timestamps[ends].tolist()
+        self.bucket_counts = (ends - starts + 1).tolist()
+
+
+class JsonlSignalIndex:
+    """
+    Incrementally maintained index over an append-only JSONL signal log.
+
+    Each refresh resumes from the byte offset reached by the previous one, so a
+    log is parsed once no matter how many components or windows are queried.
+    Events are kept as sorted per-(component, kind) timestamp arrays; window
+    queries are a bisect plus a vectorized bucket count. A truncated or replaced
+    file triggers a full rebuild.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        classify: SignalClassifier,
+        *,
+        bucket_seconds: float = DEFAULT_BUCKET_SECONDS,
+    ):
+        self.path = Path(path)
+        self.classify = classify
+        self.bucket_seconds = float(bucket_seconds) if bucket_seconds and bucket_seconds > 0 else DEFAULT_BUCKET_SECONDS
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._columns: Dict[Tuple[str, str], _Column] = {}
+        self._offset = 0
+        self._file_id: Optional[Tuple[int, int]] = None
+        self.lines_indexed = 0
+
+    def refresh(self) -> None:
+        with self._lock:
+            try:
+                stat = self.path.stat()
+            except FileNotFoundError:
+                if self._offset:
+                    self._reset()
+                return
+            file_id = (stat.st_dev, stat.st_ino)
+            if self._file_id != file_id or stat.st_size < self._offset:
+                if self._offset:
+                    logger.info("[ACTIVITY GRAPH] %s was replaced or truncated; rebuilding signal index", self.path)
+                self._reset()
+                self._file_id = file_id
+            if stat.st_size == self._offset:
+                return
+            self._consume(stat.st_size)
+
+    def _consume(self, size: int) -> None:
+        offset = self._offset
+        with self.path.open("rb") as handle:
+            handle.seek(offset)
+            for raw in handle:
+                line_offset = offset
+                complete = raw.endswith(b"\n")
+                line = raw.strip()
+                if line:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        if not complete:
+                            # Writer is mid-line; pick it up on the next refresh.
+                            break
+                        record = None
+                    if isinstance(record, dict):
+                        self._add(record, line_offset)
+                    self.lines_indexed += 1
+                offset += len(raw)
+        self._offset = offset
+
+    def _add(self, record: Dict[str, Any], offset: int) -> None:
+        classified = self.classify(record)
+        if not classified:
+            return
+        component_ids, timestamp, kind = classified
+        if timestamp is None:
+            return
+        epoch = timestamp.timestamp()
+        for component_id in component_ids or []:
+            key = (component_id, kind)
+            column = self._columns.get(key)
+            if column is None:
+                column = self._columns[key] = _Column()
+            column.append(epoch, offset)
+
+    def window(self, component_id: str, kind: str, start: datetime, end: datetime) -> SignalWindow:
+        """Return events of ``kind`` for ``component_id`` with ``start <= ts <= end``."""
+        with self._lock:
+            column = self._columns.get((component_id, kind))
+            if column is None:
+                empty = np.empty(0, dtype=np.float64)
+                return SignalWindow(empty, np.empty(0, dtype=np.int64), self.bucket_seconds)
+            timestamps, offsets = column.frozen()
+        lo = int(np.searchsorted(timestamps, start.timestamp(), side="left"))
+        hi = int(np.searchsorted(timestamps, end.timestamp(), side="right"))
+        return SignalWindow(timestamps[lo:hi], offsets[lo:hi], self.bucket_seconds)
+
+    def read_records(self, offsets: Iterable[int]) -> List[Dict[str, Any]]:
+        """Re-read the raw log records stored at ``offsets``."""
+        records: List[Dict[str, Any]] = []
+        with self._lock:
+            try:
+                handle = self.path.open("rb")
+            except OSError:
+                return records
+            with handle:
+                for offset in offsets:
+                    handle.seek(int(offset), os.SEEK_SET)
+                    try:
+                        record = json.loads(handle.readline())
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(record, dict):
+                        records.append(record)
+        return records
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from .models import TimeWindow
+from .signal_index import DEFAULT_BUCKET_SECONDS, JsonlSignalIndex, SignalWindow
 from ..slash_git.data_source import BaseGitDataSource
 from ..slash_git.models import GitTargetComponent, GitTargetRepo
 from ..utils.component_ids import resolve_component_id
@@ -20,6 +21,8 @@ class SignalEvent:
     kind: str
     timestamp: Optional[datetime]
     metadata: Optional[Dict[str, Any]] = None
+    # Number of events this entry stands for; indexed extractors emit one entry per time bucket.
+    count: int = 1
 
 
 RECENCY_BUCKETS: Tuple[Tuple[str, float], ...] = (
@@ -52,20 +55,32 @@ def _bucketize_events(events: Sequence[SignalEvent]) -> Dict[str, int]:
     counts[RECENCY_BUCKET_DEFAULT_LABEL] = 0
     for event in events:
         if not event.timestamp:
-            counts[RECENCY_BUCKET_DEFAULT_LABEL] += 1
+            counts[RECENCY_BUCKET_DEFAULT_LABEL] += event.count
             continue
         age_seconds = max(0.0, (now - event.timestamp).total_seconds())
         bucket_found = False
         for label, threshold in RECENCY_BUCKETS:
             if age_seconds <= threshold:
-                counts[label] += 1
+                counts[label] += event.count
                 bucket_found = True
                 break
         if not bucket_found:
-            counts[RECENCY_BUCKET_DEFAULT_LABEL] += 1
+            counts[RECENCY_BUCKET_DEFAULT_LABEL] += event.count
     return counts
 
 
+def _windowed_events(window: SignalWindow, kind: str, metadata: Optional[Dict[str, Any]] = None) -> List[SignalEvent]:
+    return [
+        SignalEvent(
+            kind=kind,
+            timestamp=datetime.fromtimestamp(timestamp, tz=timezone.utc),
+            metadata=metadata,
+            count=count,
+        )
+        for timestamp, count in zip(window.bucket_timestamps, window.bucket_counts)
+    ]
+
+
 @dataclass
 class GitSignalCounts:
     commits: int
@@ -86,6 +101,8 @@ class SlackSignalCounts:
     conversations: int
     complaints: int
     events: List[SignalEvent] = field(default_factory=list)
+    # Oldest few in-window messages with full metadata, for UI previews.
+    recent_events: List[SignalEvent] = field(default_factory=list)
 
     @property
     def recency_buckets(self) -> Dict[str, int]:
@@ -100,9 +117,18 @@ class DocIssueCounts:
 
 
 class GitSignalsExtractor:
-    def __init__(self, data_source: BaseGitDataSource, log_path: Optional[Path] = None):
+    def __init__(
+        self,
+        data_source: BaseGitDataSource,
+        log_path: Optional[Path] = None,
+        *,
+        bucket_seconds: float = DEFAULT_BUCKET_SECONDS,
+    ):
         self.data_source = data_source
         self.log_path = Path(log_path) if log_path else None
+        self._index = (
+            JsonlSignalIndex(self.log_path, self._classify, bucket_seconds=bucket_seconds) if self.log_path else None
+        )
 
     def count_events(
         self,
@@ -141,89 +167,60 @@ class GitSignalsExtractor:
         return GitSignalCounts(commits=len(commits), prs=len(prs), events=events)
 
     def _count_from_log(self, component_id: Optional[str], window: TimeWindow) -> Optional[GitSignalCounts]:
-        if not component_id:
+        if not component_id or not self._index:
             return None
         component_id = resolve_component_id(component_id)
         if not component_id:
             return None
-        commits = 0
-        prs = 0
-        events: List[SignalEvent] = []
-        found = False
-        for event in self._read_log_events():
-            components = event.get("component_ids") or []
-            if component_id not in components:
-                continue
-            ts = event.get("timestamp") or (event.get("properties") or {}).get("timestamp")
-            if not self._within_window(ts, window):
-                continue
-            event_type = (event.get("event_type") or event.get("type") or "").lower()
-            timestamp = _parse_timestamp(ts)
-            if event_type == "pr":
-                prs += 1
-                events.append(SignalEvent(kind="pr", timestamp=timestamp, metadata={"source": "log"}))
-            else:
-                commits += 1
-                events.append(SignalEvent(kind="commit", timestamp=timestamp, metadata={"source": "log"}))
-            found = True
-        if not found:
+        self._index.refresh()
+        commits = self._index.window(component_id, "commit", window.start, window.end)
+        prs = self._index.window(component_id, "pr", window.start, window.end)
+        if not commits.count and not prs.count:
             return None
-        return GitSignalCounts(commits=commits, prs=prs, events=events)
-
-    def _read_log_events(self) -> Iterable[Dict[str, Any]]:
-        if not self.log_path or not self.log_path.exists():
-            return []
-        with self.log_path.open(encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    yield json.loads(line)
-                except json.JSONDecodeError:
-                    continue
+        metadata = {"source": "log"}
+        events = _windowed_events(prs, "pr", metadata) + _windowed_events(commits, "commit", metadata)
+        return GitSignalCounts(commits=commits.count, prs=prs.count, events=events)
 
     @staticmethod
-    def _within_window(timestamp: Optional[str], window: TimeWindow) -> bool:
-        if not timestamp:
-            return False
-        ts_value = timestamp
-        if ts_value.endswith("Z"):
-            ts_value = ts_value.replace("Z", "+00:00")
-        try:
-            dt = datetime.fromisoformat(ts_value)
-        except ValueError:
-            return False
-        return window.start <= dt <= window.end
+    def _classify(event: Dict[str, Any]) -> Optional[Tuple[Iterable[str], Optional[datetime], str]]:
+        components = event.get("component_ids") or []
+        if not components:
+            return None
+        ts = event.get("timestamp") or (event.get("properties") or {}).get("timestamp")
+        event_type = (event.get("event_type") or event.get("type") or "").lower()
+        return components, _parse_timestamp(ts), "pr" if event_type == "pr" else "commit"
 
 
 class SlackSignalsExtractor:
-    def __init__(self, path: Path):
+    RECENT_EVENT_LIMIT = 3
+
+    def __init__(self, path: Path, *, bucket_seconds: float = DEFAULT_BUCKET_SECONDS):
         self.path = path
+        self._index = JsonlSignalIndex(path, self._classify, bucket_seconds=bucket_seconds)
 
     def count(self, component_id: str, window: TimeWindow) -> SlackSignalCounts:
         component_id = resolve_component_id(component_id) or component_id
-        conversations = 0
-        complaints = 0
+        self._index.refresh()
+        conversations = self._index.window(component_id, "conversation", window.start, window.end)
+        complaints = self._index.window(component_id, "complaint", window.start, window.end)
+        events = _windowed_events(complaints, "complaint") + _windowed_events(conversations, "conversation")
+        return SlackSignalCounts(
+            conversations=conversations.count + complaints.count,
+            complaints=complaints.count,
+            events=events,
+            recent_events=self._recent_events(conversations, complaints),
+        )
+
+    def _recent_events(self, *windows: SignalWindow) -> List[SignalEvent]:
+        limit = self.RECENT_EVENT_LIMIT
+        offsets = sorted(int(offset) for window in windows for offset in window.offsets[:limit])[:limit]
         events: List[SignalEvent] = []
-        for event in self._read_events():
-            if component_id not in event.get("component_ids", []):
-                continue
-            ts = (event.get("properties") or {}).get("timestamp")
-            if not self._within_window(ts, window):
-                continue
-            properties = event.get("properties") or {}
-            conversations += 1
-            labels = properties.get("labels", [])
-            if any(label.lower() == "complaint" for label in labels):
-                complaints += 1
-                kind = "complaint"
-            else:
-                kind = "conversation"
+        for record in self._index.read_records(offsets):
+            properties = record.get("properties") or {}
             events.append(
                 SignalEvent(
-                    kind=kind,
-                    timestamp=_parse_timestamp(ts),
+                    kind=self._kind(properties),
+                    timestamp=_parse_timestamp(properties.get("timestamp")),
                     metadata={
                         "channel_id": properties.get("channel_id"),
                         "channel_name": properties.get("channel_name"),
@@ -233,66 +230,82 @@ class SlackSignalsExtractor:
                     },
                 )
             )
-        return SlackSignalCounts(conversations=conversations, complaints=complaints, events=events)
+        return events
 
-    def _read_events(self) -> Iterable[Dict[str, any]]:
-        if not self.path.exists():
-            return []
-        with self.path.open() as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    yield json.loads(line)
-                except json.JSONDecodeError:
-                    continue
+    @classmethod
+    def _classify(cls, event: Dict[str, Any]) -> Optional[Tuple[Iterable[str], Optional[datetime], str]]:
+        components = event.get("component_ids") or []
+        if not components:
+            return None
+        properties = event.get("properties") or {}
+        return components, _parse_timestamp(properties.get("timestamp")), cls._kind(properties)
 
     @staticmethod
-    def _within_window(ts: Optional[str], window: TimeWindow) -> bool:
-        if not ts:
-            return False
-        try:
-            if ts.endswith("Z"):
-                ts = ts.replace("Z", "+00:00")
-            from datetime import datetime
-
-            dt = datetime.fromisoformat(ts)
-        except ValueError:
-            return False
-        return window.start <= dt <= window.end
+    def _kind(properties: Dict[str, Any]) -> str:
+        labels = properties.get("labels") or []
+        if any(str(label).lower() == "complaint" for label in labels):
+            return "complaint"
+        return "conversation"
 
 
 class DocIssueSignalsExtractor:
     def __init__(self, path: Path):
         self.path = path
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._by_component: Dict[str, DocIssueCounts] = {}
 
     def count(self, component_id: str) -> DocIssueCounts:
         component_id = resolve_component_id(component_id) or component_id
-        open_count = 0
-        severity_weight = 0.0
-        severity_breakdown: Dict[str, int] = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+        self._refresh()
+        cached = self._by_component.get(component_id)
+        if cached is None:
+            return self._empty_counts()
+        return DocIssueCounts(
+            open_issues=cached.open_issues,
+            severity_weight=cached.severity_weight,
+            severity_breakdown=dict(cached.severity_breakdown),
+        )
+
+    def _refresh(self) -> None:
+        """Re-aggregate open issues per component only when the file changes."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            self._stamp = None
+            self._by_component = {}
+            return
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._stamp:
+            return
+        by_component: Dict[str, DocIssueCounts] = {}
         for issue in self._read_issues():
-            if component_id not in issue.get("component_ids", []):
-                continue
             if issue.get("state") != "open":
                 continue
-            open_count += 1
             severity = (issue.get("severity") or "medium").lower()
-            normalized_severity = severity if severity in severity_breakdown else "medium"
-            severity_breakdown[normalized_severity] += 1
-            if normalized_severity == "critical":
-                severity_weight += 2.0
-            elif normalized_severity == "high":
-                severity_weight += 1.5
-            elif normalized_severity == "low":
-                severity_weight += 0.5
-            else:
-                severity_weight += 1.0
+            for component_id in set(issue.get("component_ids", [])):
+                counts = by_component.get(component_id)
+                if counts is None:
+                    counts = by_component[component_id] = self._empty_counts()
+                normalized_severity = severity if severity in counts.severity_breakdown else "medium"
+                counts.open_issues += 1
+                counts.severity_breakdown[normalized_severity] += 1
+                if normalized_severity == "critical":
+                    counts.severity_weight += 2.0
+                elif normalized_severity == "high":
+                    counts.severity_weight += 1.5
+                elif normalized_severity == "low":
+                    counts.severity_weight += 0.5
+                else:
+                    counts.severity_weight += 1.0
+        self._by_component = by_component
+        self._stamp = stamp
+
+    @staticmethod
+    def _empty_counts() -> DocIssueCounts:
         return DocIssueCounts(
-            open_issues=open_count,
-            severity_weight=severity_weight,
-            severity_breakdown=severity_breakdown,
+            open_issues=0,
+            severity_weight=0.0,
+            severity_breakdown={"critical": 0, "high": 0, "medium": 0, "low": 0},
         )
 
     def _read_issues(self) -> Iterable[Dict[str, any]]:
@@ -305,4 +318,3 @@ class DocIssueSignalsExtractor:
         if isinstance(data, list):
             return data
         return []
-
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from dataclasses import asdict
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from langchain_core.tools import tool
 
@@ -75,6 +75,11 @@ def _target_catalog():
     return GitQueryPlanner(_config()).catalog
 
 
+def mentioned_component_aliases(text: Optional[str]) -> Set[str]:
+    """Catalog component aliases that occur in ``text`` (single matcher pass)."""
+    return _target_catalog().mentioned_component_aliases(text)
+
+
 def _error(message: str) -> Dict[str, Any]:
     return {"error": message}
 
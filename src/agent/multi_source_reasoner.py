@@ -13,9 +13,12 @@ from __future__ import annotations
 
 import logging
 from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 import re
-from typing import Any, Dict, List, Optional, Set
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from .evidence import Evidence, EvidenceCollection
 from src.activity_graph.prioritization import DOC_SEVERITY_WEIGHTS, get_activity_signal_weights
@@ -61,6 +64,15 @@ VERSION_PATTERN = re.compile(r"(?:/v(?P<path_version>\d+))|\bv(?P<token_version>
 OPTIONAL_PATTERN = re.compile(r"\boptional\b", re.IGNORECASE)
 REQUIRED_PATTERN = re.compile(r"\brequired\b", re.IGNORECASE)
 
+# Concurrency defaults (overridable via activity.reasoner in config.yaml)
+DEFAULT_MAX_WORKERS = 6
+DEFAULT_RETRIEVER_TIMEOUT_SECONDS = 0.0  # No deadline unless configured
+_QUEUED_POLL_SECONDS = 0.05
+
+EvidenceCallback = Callable[[str, EvidenceCollection], None]
+
+_LLM_INIT_LOCK = threading.Lock()
+
 
 def _priority_mapping() -> Dict[str, int]:
     try:
@@ -80,6 +92,10 @@ def _priority_mapping() -> Dict[str, int]:
     return mapping
 
 
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
 class MultiSourceReasoner:
     """
     Orchestrates evidence gathering and analysis across multiple sources.
@@ -92,16 +108,24 @@ class MultiSourceReasoner:
     - Generates a comprehensive summary with source attribution
     """
 
-    def __init__(self, config: Dict[str, Any], llm_client: Optional[Any] = None):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        llm_client: Optional[Any] = None,
+        *,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
         """
         Initialize the reasoning engine.
 
         Args:
             config: Configuration dictionary
             llm_client: Optional LLM client for analysis (if None, will be created)
+            clock: Time source for retriever deadlines (injectable for tests)
         """
         self.config = config
         self.llm_client = llm_client
+        self._clock = clock
         self.enabled_sources = self.determine_enabled_sources(config)
 
         # Initialize retrievers for enabled sources only
@@ -111,10 +135,22 @@ class MultiSourceReasoner:
             if retriever:
                 self.retrievers[source_type] = retriever
 
+        reasoner_cfg = ((config or {}).get("activity") or {}).get("reasoner") or {}
+        self.concurrent = bool(reasoner_cfg.get("concurrent", True))
+        self.max_workers = max(1, int(reasoner_cfg.get("max_workers", DEFAULT_MAX_WORKERS)))
+        self.retriever_timeout_seconds = float(
+            reasoner_cfg.get("retriever_timeout_seconds", DEFAULT_RETRIEVER_TIMEOUT_SECONDS) or 0
+        )
+        self.retriever_timeouts = {
+            str(source): float(seconds or 0)
+            for source, seconds in (reasoner_cfg.get("retriever_timeouts") or {}).items()
+        }
+
         logger.info(
-            "[REASONER] Initialized with %s retrievers (enabled sources=%s)",
+            "[REASONER] Initialized with %s retrievers (enabled sources=%s, concurrent=%s)",
             len(self.retrievers),
             self.enabled_sources,
+            self.concurrent,
         )
 
     def query(
@@ -123,20 +159,28 @@ class MultiSourceReasoner:
         sources: Optional[List[str]] = None,
         git_limit: int = 10,
         slack_limit: int = 20,
+        on_evidence: Optional[EvidenceCallback] = None,
     ) -> Dict[str, Any]:
         """
         Execute a multi-source query with reasoning.
 
+        Retrievers run concurrently, each bounded by its own deadline; conflict
+        and gap detection then run in parallel before the summary call.
+
         Args:
             query: User's question or search query
             sources: Optional list of sources to query (if None, will be inferred)
             git_limit: Max PRs to retrieve from Git
             slack_limit: Max messages to retrieve from Slack
+            on_evidence: Optional callback invoked with ``(source, evidence)`` as
+                each retriever finishes, before analysis starts
 
         Returns:
-            Dictionary with evidence, analysis, and summary
+            Dictionary with evidence, analysis, summary and per-phase timings
         """
         logger.info(f"[REASONER] Processing query: {query}")
+        query_started = time.perf_counter()
+        timings: Dict[str, Any] = {}
 
         # Step 1: Infer relevant sources if not provided
         if not sources:
@@ -154,30 +198,17 @@ class MultiSourceReasoner:
                 logger.info(f"[REASONER] Using provided sources: {sources}")
 
         # Step 2: Gather evidence from each source
-        all_evidence = EvidenceCollection(query=query)
-
-        for source_type in sources:
-            retriever = self.retrievers.get(source_type)
-            if not retriever:
-                logger.warning(f"[REASONER] No retriever available for: {source_type}")
-                continue
-
-            try:
-                if source_type == "git":
-                    evidence = retriever.retrieve(query, limit=git_limit)
-                elif source_type == "slack":
-                    evidence = retriever.retrieve(query, limit=slack_limit)
-                else:
-                    evidence = retriever.retrieve(query)
-
-                # Merge into main collection
-                for e in evidence.evidence_list:
-                    all_evidence.add(e)
-
-                logger.info(f"[REASONER] Gathered {len(evidence)} evidence from {source_type}")
-
-            except Exception as exc:
-                logger.exception(f"[REASONER] Error retrieving from {source_type}: {exc}")
+        phase_started = time.perf_counter()
+        all_evidence, retriever_timings, dropped_sources = self._gather_evidence(
+            query,
+            sources,
+            git_limit=git_limit,
+            slack_limit=slack_limit,
+            on_evidence=on_evidence,
+        )
+        timings["retrieval_ms"] = _elapsed_ms(phase_started)
+        timings["retrievers_ms"] = retriever_timings
+        timings["timed_out_sources"] = [entry["source"] for entry in dropped_sources]
 
         # Step 3: Build per-source stats and simple relevance signals
         stats_by_source = all_evidence.stats_by_source()
@@ -213,6 +244,7 @@ class MultiSourceReasoner:
                 sources=sources,
                 counts_by_source=counts_by_source,
             )
+            timings["total_ms"] = _elapsed_ms(query_started)
             return {
                 "query": query,
                 "sources_queried": sources,
@@ -223,19 +255,23 @@ class MultiSourceReasoner:
                     "latest_timestamp_by_source": latest_timestamp_by_source,
                 },
                 "sources_without_evidence": sources_without_evidence,
+                "dropped_sources": dropped_sources,
                 "drift_hints": {},
                 "conflicts": [],
                 "gaps": gaps,
                 "summary": summary,
                 "relevant_sources": sorted(relevant_sources),
+                "timings": timings,
             }
 
         # Step 4: Analyze evidence for conflicts, gaps, and drift when we have relevant hits
-        conflicts = self._detect_conflicts(all_evidence)
-        gaps = self._detect_gaps(all_evidence, query)
-        drift_hints = self._detect_drift(all_evidence)
+        phase_started = time.perf_counter()
+        conflicts, gaps, drift_hints, analysis_timings = self._analyze_evidence(all_evidence, query)
+        timings["analysis_ms"] = _elapsed_ms(phase_started)
+        timings.update(analysis_timings)
 
         # Step 5: Generate summary via LLM
+        phase_started = time.perf_counter()
         summary = self._generate_summary(
             all_evidence,
             conflicts,
@@ -247,6 +283,15 @@ class MultiSourceReasoner:
             drift_hints=drift_hints,
             sources_without_evidence=sources_without_evidence,
         )
+        timings["summary_ms"] = _elapsed_ms(phase_started)
+        timings["total_ms"] = _elapsed_ms(query_started)
+        logger.info(
+            "[REASONER] Timings retrieval=%.0fms analysis=%.0fms summary=%.0fms total=%.0fms",
+            timings["retrieval_ms"],
+            timings["analysis_ms"],
+            timings["summary_ms"],
+            timings["total_ms"],
+        )
 
         return {
             "query": query,
@@ -258,10 +303,188 @@ class MultiSourceReasoner:
                 "latest_timestamp_by_source": latest_timestamp_by_source,
             },
             "sources_without_evidence": sources_without_evidence,
+            "dropped_sources": dropped_sources,
             "drift_hints": drift_hints,
             "conflicts": conflicts,
             "gaps": gaps,
             "summary": summary,
+            "timings": timings,
+        }
+
+    def _gather_evidence(
+        self,
+        query: str,
+        sources: List[str],
+        *,
+        git_limit: int,
+        slack_limit: int,
+        on_evidence: Optional[EvidenceCallback] = None,
+    ) -> Tuple[EvidenceCollection, Dict[str, float], List[Dict[str, str]]]:
+        """
+        Fan out to the retrievers for ``sources`` and merge their evidence.
+
+        Deadlines are opt-in (``retriever_timeout_seconds`` / ``retriever_timeouts``).
+        When set, each retriever's deadline is measured from when it starts
+        running (not when it was queued); a source that misses it is logged,
+        reported in the returned ``dropped`` list and left out of the merged
+        collection so one slow backend cannot hold up the whole answer. Evidence
+        is merged in ``sources`` order regardless of completion order.
+
+        Returns:
+            (merged evidence, elapsed ms per source, dropped sources as
+            ``{"source", "reason"}`` dicts)
+        """
+        tasks: List[Tuple[str, Any]] = []
+        for source_type in sources:
+            retriever = self.retrievers.get(source_type)
+            if not retriever:
+                logger.warning(f"[REASONER] No retriever available for: {source_type}")
+                continue
+            tasks.append((source_type, retriever))
+
+        limits = {"git": git_limit, "slack": slack_limit}
+        results: Dict[str, EvidenceCollection] = {}
+        timings: Dict[str, float] = {}
+        dropped: List[Dict[str, str]] = []
+
+        def _collect(source_type: str, evidence: Optional[EvidenceCollection], elapsed_ms: float) -> None:
+            timings[source_type] = elapsed_ms
+            if evidence is None:
+                return
+            results[source_type] = evidence
+            logger.info(f"[REASONER] Gathered {len(evidence)} evidence from {source_type}")
+            if on_evidence is not None:
+                try:
+                    on_evidence(source_type, evidence)
+                except Exception as exc:
+                    logger.warning("[REASONER] Evidence callback failed for %s: %s", source_type, exc)
+
+        if not self.concurrent or len(tasks) <= 1:
+            for source_type, retriever in tasks:
+                _collect(source_type, *self._retrieve(source_type, retriever, query, limits.get(source_type)))
+        else:
+            workers = min(self.max_workers, len(tasks))
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="reasoner-retrieve")
+            # Deadlines run from when a retriever actually starts, not from submission,
+            # so a source queued behind ``max_workers`` still gets its full budget.
+            started_at: Dict[str, float] = {}
+
+            def _run(source_type: str, retriever: Any) -> Tuple[Optional[EvidenceCollection], float]:
+                started_at[source_type] = self._clock()
+                return self._retrieve(source_type, retriever, query, limits.get(source_type))
+
+            futures: Dict[Future, str] = {
+                executor.submit(_run, source_type, retriever): source_type for source_type, retriever in tasks
+            }
+            deadlines = {source_type: self._retriever_deadline(source_type) for source_type, _ in tasks}
+            pending = set(futures)
+            abandoned: List[Future] = []
+
+            def _drop(future: Future, reason: str, elapsed_ms: float) -> None:
+                source_type = futures[future]
+                pending.discard(future)
+                future.cancel()
+                dropped.append({"source": source_type, "reason": reason})
+                timings[source_type] = elapsed_ms
+                logger.warning("[REASONER] Dropping %s retriever (%s); continuing without it", source_type, reason)
+
+            try:
+                while pending:
+                    now = self._clock()
+                    waits = [
+                        started_at[futures[future]] + deadlines[futures[future]] - now
+                        for future in pending
+                        if deadlines[futures[future]] and futures[future] in started_at
+                    ]
+                    if any(futures[future] not in started_at for future in pending):
+                        # Re-check soon so queued sources get their deadline once they start.
+                        waits.append(_QUEUED_POLL_SECONDS)
+                    timeout = max(0.0, min(waits)) if waits else None
+                    done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.discard(future)
+                        _collect(futures[future], *future.result())
+                    now = self._clock()
+                    for future in list(pending):
+                        source_type = futures[future]
+                        deadline = deadlines[source_type]
+                        started = started_at.get(source_type)
+                        if deadline and started is not None and now - started >= deadline:
+                            abandoned.append(future)
+                            _drop(future, f"missed its {deadline:.1f}s deadline", round((now - started) * 1000, 1))
+                    if sum(not future.done() for future in abandoned) >= workers:
+                        # Every worker is stuck on an abandoned retriever; queued sources would never start.
+                        for future in [f for f in pending if futures[f] not in started_at]:
+                            _drop(future, "no free worker after earlier sources timed out", 0.0)
+            finally:
+                # Do not block on stragglers; their results are discarded.
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        collection = EvidenceCollection(query=query)
+        for source_type, _ in tasks:
+            evidence = results.get(source_type)
+            if evidence is None:
+                continue
+            for e in evidence.evidence_list:
+                collection.add(e)
+        return collection, timings, dropped
+
+    @staticmethod
+    def _retrieve(
+        source_type: str,
+        retriever: Any,
+        query: str,
+        limit: Optional[int],
+    ) -> Tuple[Optional[EvidenceCollection], float]:
+        started = time.perf_counter()
+        try:
+            if limit is not None:
+                evidence = retriever.retrieve(query, limit=limit)
+            else:
+                evidence = retriever.retrieve(query)
+        except Exception as exc:
+            logger.exception(f"[REASONER] Error retrieving from {source_type}: {exc}")
+            evidence = None
+        return evidence, _elapsed_ms(started)
+
+    def _retriever_deadline(self, source_type: str) -> float:
+        """Seconds allowed for ``source_type`` (0 disables the deadline)."""
+        return self.retriever_timeouts.get(source_type, self.retriever_timeout_seconds)
+
+    def _analyze_evidence(
+        self,
+        evidence: EvidenceCollection,
+        query: str,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any], Dict[str, float]]:
+        """
+        Run conflict and gap detection (independent LLM calls) side by side.
+
+        Drift detection is local and runs on the calling thread meanwhile.
+
+        Returns:
+            (conflicts, gaps, drift hints, per-call timings)
+        """
+
+        def _timed(fn: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+            started = time.perf_counter()
+            return fn(*args), _elapsed_ms(started)
+
+        if not self.concurrent:
+            conflicts, conflicts_ms = _timed(self._detect_conflicts, evidence)
+            gaps, gaps_ms = _timed(self._detect_gaps, evidence, query)
+            drift_hints, drift_ms = _timed(self._detect_drift, evidence)
+        else:
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="reasoner-analyze") as executor:
+                conflicts_future = executor.submit(_timed, self._detect_conflicts, evidence)
+                gaps_future = executor.submit(_timed, self._detect_gaps, evidence, query)
+                drift_hints, drift_ms = _timed(self._detect_drift, evidence)
+                conflicts, conflicts_ms = conflicts_future.result()
+                gaps, gaps_ms = gaps_future.result()
+
+        return conflicts, gaps, drift_hints, {
+            "conflicts_ms": conflicts_ms,
+            "gaps_ms": gaps_ms,
+            "drift_ms": drift_ms,
         }
 
     def infer_sources(self, query: str) -> List[str]:
@@ -1233,16 +1456,19 @@ Your structured summary:"""
             LLM response
         """
         if not self.llm_client:
-            # Initialize LLM client if not provided
-            try:
-                from langchain_openai import ChatOpenAI
-                self.llm_client = ChatOpenAI(
-                    model=self.config.get("llm", {}).get("model", "gpt-4"),
-                    temperature=0.0,
-                )
-            except Exception as exc:
-                logger.error(f"[REASONER] Failed to initialize LLM: {exc}")
-                raise
+            # Initialize LLM client if not provided; analysis calls run in
+            # parallel, so only one thread may create it.
+            with _LLM_INIT_LOCK:
+                if not self.llm_client:
+                    try:
+                        from langchain_openai import ChatOpenAI
+                        self.llm_client = ChatOpenAI(
+                            model=self.config.get("llm", {}).get("model", "gpt-4"),
+                            temperature=0.0,
+                        )
+                    except Exception as exc:
+                        logger.error(f"[REASONER] Failed to initialize LLM: {exc}")
+                        raise
 
         try:
             response = self.llm_client.invoke(prompt)
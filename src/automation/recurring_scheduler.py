@@ -11,13 +11,19 @@ import logging
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Literal
+from typing import Optional, List, Dict, Any, Literal, Callable, Set, Tuple
 from zoneinfo import ZoneInfo
+import heapq
 import uuid
 from contextlib import asynccontextmanager
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENT = 3
+# Upper bound on one sleep, so wall-clock jumps (e.g. after system sleep)
+# are noticed even when the next deadline is days away.
+MAX_SLEEP_SECONDS = 300.0
+
 
 @dataclass
 class ScheduleSpec:
@@ -171,11 +177,23 @@ class RecurringTaskScheduler:
     """
     Scheduler that runs recurring tasks at specified intervals.
 
-    Runs an async loop that checks for due tasks every 60 seconds and
-    executes them via the agent system.
+    Active tasks are kept in an in-memory min-heap keyed by ``next_run_at``.
+    The loop sleeps until the earliest deadline (or until a task is
+    registered, paused, resumed or deleted), dispatches every due task that
+    is not already in flight, and never runs more than ``max_concurrent``
+    tasks at once. Heap entries are invalidated lazily: each (re)schedule
+    bumps the task's generation and stale entries are discarded when popped.
     """
 
-    def __init__(self, agent_registry, agent, session_manager, store: RecurringTaskStore = None):
+    def __init__(
+        self,
+        agent_registry,
+        agent,
+        session_manager,
+        store: RecurringTaskStore = None,
+        max_concurrent: Optional[int] = None,
+        clock: Optional[Callable[[], datetime]] = None,
+    ):
         """
         Initialize scheduler.
 
@@ -184,6 +202,9 @@ class RecurringTaskScheduler:
             agent: Main orchestrator agent
             session_manager: Session manager for tracking executions
             store: Task store (creates default if None)
+            max_concurrent: Max tasks executing at once (defaults to
+                ``recurring_tasks.max_concurrent`` in config, then 3)
+            clock: Returns the current aware datetime (injectable for tests)
         """
         self.agent_registry = agent_registry
         self.agent = agent
@@ -195,11 +216,24 @@ class RecurringTaskScheduler:
         else:
             from src.config_manager import get_global_config_manager
             self.config = get_global_config_manager().get_config()
+        if max_concurrent is None:
+            settings = (self.config or {}).get("recurring_tasks") or {}
+            max_concurrent = settings.get("max_concurrent", DEFAULT_MAX_CONCURRENT)
+        self.max_concurrent = max(1, int(max_concurrent))
+        self._clock = clock or (lambda: datetime.now(ZoneInfo("UTC")))
         self._task: Optional[asyncio.Task] = None
         self._running = False
-        self._execution_lock = asyncio.Semaphore(3)  # Max 3 concurrent executions
         self._debug_force_run = False  # For testing
 
+        # Schedule state (only touched from the event loop)
+        self._tasks: Dict[str, RecurringTask] = {}
+        self._heap: List[Tuple[float, int, str]] = []  # (deadline ts, generation, task id)
+        self._generations: Dict[str, int] = {}
+        self._next_generation = 0
+        self._in_flight: Set[str] = set()
+        self._executions: Set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+
     def _calculate_next_run(self, schedule: ScheduleSpec, from_time: datetime = None) -> datetime:
         """
         Calculate the next run time based on schedule spec.
@@ -212,7 +246,9 @@ class RecurringTaskScheduler:
             Next run datetime in the schedule's timezone
         """
         if from_time is None:
-            from_time = datetime.now(ZoneInfo(schedule.tz))
+            from_time = self._clock()
+        # Resolve the target wall-clock time in the schedule's own timezone
+        from_time = from_time.astimezone(ZoneInfo(schedule.tz))
 
         # Parse target time
         hour, minute = map(int, schedule.time.split(':'))
@@ -261,47 +297,48 @@ class RecurringTaskScheduler:
         Args:
             task: Task to execute
         """
-        async with self._execution_lock:
-            logger.info(f"Executing recurring task: {task.name} (ID: {task.id})")
-            start_time = datetime.now(ZoneInfo("UTC"))
-
-            try:
-                # Execute based on action kind
-                if task.action.kind == "screen_time_report":
-                    await self._execute_screen_time_report(task)
-                else:
-                    logger.warning(f"Unknown action kind: {task.action.kind}")
-                    raise ValueError(f"Unknown action kind: {task.action.kind}")
+        logger.info(f"Executing recurring task: {task.name} (ID: {task.id})")
+        start_time = self._clock()
 
-                # Record success
-                task.last_run_at = start_time.isoformat()
-                task.next_run_at = self._calculate_next_run(task.schedule, start_time).isoformat()
+        try:
+            # Execute based on action kind
+            if task.action.kind == "screen_time_report":
+                await self._execute_screen_time_report(task)
+            else:
+                logger.warning(f"Unknown action kind: {task.action.kind}")
+                raise ValueError(f"Unknown action kind: {task.action.kind}")
+
+            # Record success
+            task.last_run_at = start_time.isoformat()
+            # Schedule from the finish time so a long run does not trigger catch-up runs
+            task.next_run_at = self._calculate_next_run(task.schedule, self._clock()).isoformat()
+            if task.status != "paused":  # a pause issued mid-run wins
                 task.status = "active"
 
-                task.history.append({
-                    "timestamp": start_time.isoformat(),
-                    "status": "success",
-                    "duration_ms": int((datetime.now(ZoneInfo("UTC")) - start_time).total_seconds() * 1000)
-                })
+            task.history.append({
+                "timestamp": start_time.isoformat(),
+                "status": "success",
+                "duration_ms": int((self._clock() - start_time).total_seconds() * 1000)
+            })
 
-                logger.info(f"Task {task.name} completed successfully")
+            logger.info(f"Task {task.name} completed successfully")
 
-            except Exception as e:
-                logger.error(f"Task {task.name} failed: {e}", exc_info=True)
+        except Exception as e:
+            logger.error(f"Task {task.name} failed: {e}", exc_info=True)
 
-                task.last_run_at = start_time.isoformat()
-                task.status = "error"
+            task.last_run_at = start_time.isoformat()
+            task.status = "error"
 
-                task.history.append({
-                    "timestamp": start_time.isoformat(),
-                    "status": "error",
-                    "error": str(e),
-                    "duration_ms": int((datetime.now(ZoneInfo("UTC")) - start_time).total_seconds() * 1000)
-                })
+            task.history.append({
+                "timestamp": start_time.isoformat(),
+                "status": "error",
+                "error": str(e),
+                "duration_ms": int((self._clock() - start_time).total_seconds() * 1000)
+            })
 
-            finally:
-                # Save updated task state
-                await self.store.update_task(task)
+        finally:
+            # Save updated task state
+            await self.store.update_task(task)
 
     async def _execute_screen_time_report(self, task: RecurringTask):
         """
@@ -397,37 +434,133 @@ class RecurringTaskScheduler:
 
             logger.info(f"Screen time report sent to {recipient}")
 
+    # ------------------------------------------------------------------
+    # Schedule heap
+
+    async def _load_schedule(self):
+        """Build the in-memory schedule from the store (once per start)."""
+        tasks = await self.store.load_tasks()
+        initialized = False
+        self._tasks = {}
+        self._heap = []
+        self._generations = {}
+        for task in tasks:
+            if task.status == "active" and task.next_run_at is None:
+                task.next_run_at = self._calculate_next_run(task.schedule).isoformat()
+                initialized = True
+            self._tasks[task.id] = task
+            entry = self._make_entry(task)
+            if entry is not None:
+                self._heap.append(entry)
+        heapq.heapify(self._heap)
+        if initialized:
+            await self.store.save_tasks(tasks)
+        logger.info(f"Loaded {len(self._heap)} active recurring tasks")
+
+    def _make_entry(self, task: RecurringTask) -> Optional[Tuple[float, int, str]]:
+        """Invalidate any queued entry for ``task`` and return a fresh one if it should run."""
+        self._next_generation += 1
+        self._generations[task.id] = self._next_generation
+        if task.status != "active" or task.next_run_at is None or task.id in self._in_flight:
+            # In-flight tasks are rescheduled when their run finishes
+            return None
+        deadline = datetime.fromisoformat(task.next_run_at).timestamp()
+        return (deadline, self._next_generation, task.id)
+
+    def _schedule(self, task: RecurringTask):
+        """(Re)queue a task after it was registered, resumed or finished running."""
+        self._tasks[task.id] = task
+        entry = self._make_entry(task)
+        if entry is not None:
+            heapq.heappush(self._heap, entry)
+        self._wakeup.set()
+
+    def _unschedule(self, task_id: str, forget: bool = False):
+        """Drop a task's queued entry; the stale heap item is discarded lazily."""
+        self._next_generation += 1
+        self._generations[task_id] = self._next_generation
+        if forget:
+            self._tasks.pop(task_id, None)
+            self._generations.pop(task_id, None)
+        self._wakeup.set()
+
+    def _peek_deadline(self) -> Optional[float]:
+        """Return the earliest valid deadline, discarding invalidated entries."""
+        while self._heap:
+            deadline, generation, task_id = self._heap[0]
+            if self._generations.get(task_id) == generation:
+                return deadline
+            heapq.heappop(self._heap)
+        return None
+
+    def _seconds_until_next_run(self) -> float:
+        """How long the loop may sleep before something can be dispatched."""
+        if len(self._in_flight) >= self.max_concurrent:
+            return MAX_SLEEP_SECONDS  # a finishing task wakes the loop
+        deadline = self._peek_deadline()
+        if deadline is None:
+            return MAX_SLEEP_SECONDS
+        return min(max(0.0, deadline - self._clock().timestamp()), MAX_SLEEP_SECONDS)
+
+    def _dispatch_due(self) -> List[str]:
+        """
+        Start every due task, up to the concurrency cap.
+
+        Returns:
+            IDs of the tasks that were started
+        """
+        now = float("inf") if self._debug_force_run else self._clock().timestamp()
+        started = []
+        while len(self._in_flight) < self.max_concurrent:
+            deadline = self._peek_deadline()
+            if deadline is None or deadline > now:
+                break
+            _, _, task_id = heapq.heappop(self._heap)
+            self._generations[task_id] = None
+            if task_id in self._in_flight:
+                continue
+            task = self._tasks[task_id]
+            self._in_flight.add(task_id)
+            execution = asyncio.create_task(self._run_task(task))
+            self._executions.add(execution)
+            execution.add_done_callback(self._executions.discard)
+            started.append(task_id)
+        return started
+
+    async def _run_task(self, task: RecurringTask):
+        """Execute a dispatched task and requeue it for its next run."""
+        try:
+            await self._execute_task(task)
+        finally:
+            self._in_flight.discard(task.id)
+            current = self._tasks.get(task.id)
+            if current is None:  # deleted while running
+                self._wakeup.set()
+            else:
+                if current is not task:  # schedule was reloaded while running
+                    task.status = current.status
+                self._schedule(task)
+
     async def _scheduler_loop(self):
-        """Main scheduler loop that checks for due tasks."""
+        """Main scheduler loop: sleep until the next deadline, then dispatch due tasks."""
         logger.info("Recurring task scheduler started")
 
+        try:
+            await self._load_schedule()
+        except Exception as e:
+            logger.error(f"Failed to load recurring tasks: {e}", exc_info=True)
+
         while self._running:
+            self._wakeup.clear()
             try:
-                tasks = await self.store.load_tasks()
-                now = datetime.now(ZoneInfo("UTC"))
-
-                for task in tasks:
-                    # Skip inactive tasks
-                    if task.status != "active":
-                        continue
-
-                    # Initialize next_run_at if not set
-                    if task.next_run_at is None:
-                        task.next_run_at = self._calculate_next_run(task.schedule).isoformat()
-                        await self.store.update_task(task)
-                        continue
-
-                    # Check if due
-                    next_run = datetime.fromisoformat(task.next_run_at)
-                    if self._debug_force_run or next_run <= now:
-                        # Execute in background
-                        asyncio.create_task(self._execute_task(task))
-
+                self._dispatch_due()
             except Exception as e:
                 logger.error(f"Scheduler loop error: {e}", exc_info=True)
 
-            # Wait 60 seconds before next check
-            await asyncio.sleep(60)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._seconds_until_next_run())
+            except asyncio.TimeoutError:
+                pass
 
         logger.info("Recurring task scheduler stopped")
 
@@ -488,6 +621,7 @@ class RecurringTaskScheduler:
         task.next_run_at = self._calculate_next_run(schedule).isoformat()
 
         await self.store.add_task(task)
+        self._schedule(task)
         logger.info(f"Registered recurring task: {name} (ID: {task.id})")
 
         return task
@@ -496,20 +630,27 @@ class RecurringTaskScheduler:
         """Get all registered tasks."""
         return await self.store.load_tasks()
 
+    async def _get_task(self, task_id: str) -> Optional[RecurringTask]:
+        """Prefer the scheduled instance so a running task sees status changes."""
+        return self._tasks.get(task_id) or await self.store.get_task(task_id)
+
     async def pause_task(self, task_id: str):
         """Pause a task."""
-        task = await self.store.get_task(task_id)
+        task = await self._get_task(task_id)
         if task:
             task.status = "paused"
             await self.store.update_task(task)
+            self._unschedule(task_id)
 
     async def resume_task(self, task_id: str):
         """Resume a paused task."""
-        task = await self.store.get_task(task_id)
+        task = await self._get_task(task_id)
         if task:
             task.status = "active"
             await self.store.update_task(task)
+            self._schedule(task)
 
     async def delete_task(self, task_id: str):
         """Delete a task."""
         await self.store.remove_task(task_id)
+        self._unschedule(task_id, forget=True)
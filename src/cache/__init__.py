@@ -1,11 +1,13 @@
 """
 Cache utilities for speeding up launcher + backend startup.
 
-This package currently exposes `StartupCacheManager`, a lightweight helper that
+This package exposes `StartupCacheManager`, a lightweight helper that
 persists warm artifacts (prompt bundles, tool manifests, config snapshots) to
-disk so the app can hydrate instantly on the next launch.
+disk so the app can hydrate instantly on the next launch, `EmbeddingCache`,
+the shared content-addressed store used by every embedding call site, and
+`ImpactResultCache`, the event-invalidated severity/impact result cache.
 """
 
 from .startup_cache import StartupCacheManager  # noqa: F401
-
-
+from .embedding_cache import EmbeddingCache, get_embedding_cache  # noqa: F401
+from .impact_cache import ImpactResultCache, notify_activity  # noqa: F401
@@ -0,0 +1,330 @@
+"""
+Persistent, content-addressed embedding cache.
+
+Every embedding call site (document indexer, vector indexers, vector search,
+user memory, image indexer) used to re-embed identical text on every run. The
+`EmbeddingCache` below sits in front of those calls and stores vectors on disk
+keyed by ``(model, sha256(text))``, so re-indexing unchanged data makes zero
+embedding API calls.
+
+Design goals:
+-------------
+1. **Compact** — Vectors are stored as raw float32 blobs in SQLite (WAL mode),
+   not JSON floats.
+2. **Bounded** — The cache keeps a byte budget and evicts least-recently-used
+   entries when it is exceeded.
+3. **Observable** — Hits and misses are reported to `PerformanceMonitor` under
+   the ``embeddings`` cache name.
+4. **Opt-in** — Only enabled when ``performance.caching.embeddings`` is true;
+   otherwise `embed()` is a pass-through.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = "~/.cache/cerebros/embeddings.sqlite"
+DEFAULT_MAX_MB = 512
+CACHE_NAME = "embeddings"
+
+FetchEmbeddings = Callable[[List[str]], Sequence[Optional[Sequence[float]]]]
+
+
+class EmbeddingCache:
+    """
+    Disk-backed LRU cache for embedding vectors.
+
+    Typical usage:
+
+    >>> cache = get_embedding_cache(config)
+    >>> vectors = cache.embed(model, texts, fetch_missing)
+
+    ``fetch_missing`` receives only the (deduplicated) texts that were not
+    cached and must return one vector (or None on failure) per text. Failed
+    embeddings are never cached.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        *,
+        max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+        enabled: bool = True,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.max_bytes = max(0, int(max_bytes))
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.enabled:
+            try:
+                self._open()
+            except Exception as exc:
+                logger.warning("[EMBEDDING CACHE] Disabled (failed to open %s: %s)", self.path, exc)
+                self.enabled = False
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+    def embed(self, model: str, texts: Sequence[str], fetch: FetchEmbeddings) -> List[Optional[np.ndarray]]:
+        """
+        Return embeddings for ``texts``, calling ``fetch`` only for cache misses.
+
+        Vectors are returned as float32 arrays in input order; entries are None
+        where ``fetch`` failed to produce an embedding.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        if not self.enabled:
+            return [_as_vector(vector) for vector in fetch(texts)]
+
+        results = self.get_many(model, texts)
+        missing: Dict[str, List[int]] = {}
+        for idx, (text, vector) in enumerate(zip(texts, results)):
+            if vector is None:
+                missing.setdefault(text, []).append(idx)
+
+        # Counted per input text, so one batch of N and N single-text calls report the same totals.
+        missed = sum(len(positions) for positions in missing.values())
+        self._record(hits=len(texts) - missed, misses=missed)
+        if not missing:
+            return results
+
+        missing_texts = list(missing)
+        fetched = [_as_vector(vector) for vector in fetch(missing_texts)]
+        for text, vector in zip(missing_texts, fetched):
+            for idx in missing[text]:
+                results[idx] = vector
+        self.put_many(model, missing_texts, fetched)
+        return results
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Look up cached vectors (None for misses) and refresh their LRU stamp."""
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        if not self.enabled or not texts:
+            return results
+
+        keys = [_text_key(text) for text in texts]
+        found: Dict[bytes, np.ndarray] = {}
+        now = time.time()
+        with self._lock:
+            unique_keys = list(dict.fromkeys(keys))
+            for start in range(0, len(unique_keys), 500):
+                batch = unique_keys[start : start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                    (model, *batch),
+                ).fetchall()
+                hit_keys = []
+                for text_hash, blob in rows:
+                    found[bytes(text_hash)] = np.frombuffer(blob, dtype=np.float32)
+                    hit_keys.append(text_hash)
+                if hit_keys:
+                    self._conn.execute(
+                        f"UPDATE embeddings SET last_access = ? WHERE model = ? AND text_hash IN ({','.join('?' * len(hit_keys))})",
+                        (now, model, *hit_keys),
+                    )
+            if found:
+                self._conn.commit()
+
+        for idx, key in enumerate(keys):
+            vector = found.get(key)
+            if vector is not None:
+                results[idx] = vector.copy()
+        return results
+
+    def put_many(self, model: str, texts: Sequence[str], vectors: Sequence[Optional[Sequence[float]]]) -> None:
+        """Store vectors for texts, skipping failed (None) embeddings."""
+        if not self.enabled:
+            return
+        now = time.time()
+        by_key: Dict[bytes, Tuple[str, bytes, int, bytes, float]] = {}
+        for text, vector in zip(texts, vectors):
+            array = _as_vector(vector)
+            if array is None:
+                continue
+            key = _text_key(text)
+            by_key[key] = (model, key, int(array.shape[0]), array.tobytes(), now)
+        if not by_key:
+            return
+        rows = list(by_key.values())
+
+        with self._lock:
+            # Replaced entries give their old bytes back so the budget does not drift.
+            replaced = 0
+            keys = list(by_key)
+            for start in range(0, len(keys), 500):
+                batch = keys[start : start + 500]
+                placeholders = ",".join("?" * len(batch))
+                replaced += self._conn.execute(
+                    f"SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                    (model, *batch),
+                ).fetchone()[0]
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, dim, vector, last_access) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+            self._total_bytes += sum(len(row[3]) for row in rows) - replaced
+            if self.max_bytes and self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        total = self.hits + self.misses
+        entries = 0
+        if self.enabled:
+            with self._lock:
+                entries = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        return {
+            "enabled": self.enabled,
+            "path": str(self.path),
+            "entries": entries,
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached vector."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self.enabled = False
+
+    # ------------------------------------------------------------------ #
+    # Internal helpers
+    # ------------------------------------------------------------------ #
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                text_hash BLOB NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_last_access ON embeddings(last_access)")
+        self._conn.commit()
+        self._total_bytes = self._stored_bytes()
+        logger.info("[EMBEDDING CACHE] Opened %s (%.1f MB)", self.path, self._total_bytes / (1024 * 1024))
+
+    def _stored_bytes(self) -> int:
+        row = self._conn.execute("SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings").fetchone()
+        return int(row[0])
+
+    def _evict(self) -> None:
+        """Evict least-recently-used entries until the cache is under 90% of its budget."""
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute(
+            "SELECT model, text_hash, LENGTH(vector) FROM embeddings ORDER BY last_access ASC"
+        )
+        victims = []
+        freed = 0
+        for model, text_hash, size in rows:
+            if self._total_bytes - freed <= target:
+                break
+            victims.append((model, text_hash))
+            freed += size
+        self._conn.executemany("DELETE FROM embeddings WHERE model = ? AND text_hash = ?", victims)
+        self._conn.commit()
+        self._total_bytes -= freed
+        self.evictions += len(victims)
+        logger.debug("[EMBEDDING CACHE] Evicted %s entries (%.1f KB)", len(victims), freed / 1024)
+
+    def _record(self, *, hits: int, misses: int) -> None:
+        self.hits += hits
+        self.misses += misses
+        try:
+            from src.utils.performance_monitor import get_performance_monitor
+
+            monitor = get_performance_monitor()
+            if hits:
+                monitor.record_cache_hit(CACHE_NAME, hits)
+            if misses:
+                monitor.record_cache_miss(CACHE_NAME, misses)
+        except Exception:
+            pass
+
+
+def _text_key(text: str) -> bytes:
+    return hashlib.sha256((text or "").encode("utf-8")).digest()
+
+
+def _as_vector(vector: Optional[Sequence[float]]) -> Optional[np.ndarray]:
+    if vector is None:
+        return None
+    array = np.asarray(vector, dtype=np.float32).reshape(-1)
+    return array if array.size else None
+
+
+_caches: Dict[Tuple[str, int], EmbeddingCache] = {}
+_disabled_cache: Optional[EmbeddingCache] = None
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(config: Optional[Dict[str, Any]]) -> EmbeddingCache:
+    """
+    Return the shared embedding cache for a config.
+
+    The cache is enabled only when ``performance.caching.embeddings`` is true.
+    Location and size come from ``performance.caching.embeddings_path`` and
+    ``performance.caching.embeddings_max_mb``. Call sites sharing a path share
+    one instance (and one SQLite connection).
+    """
+    global _disabled_cache
+
+    caching = ((config or {}).get("performance") or {}).get("caching") or {}
+    if not caching.get("embeddings", False):
+        with _caches_lock:
+            if _disabled_cache is None:
+                _disabled_cache = EmbeddingCache(enabled=False)
+            return _disabled_cache
+
+    path = str(Path(caching.get("embeddings_path") or DEFAULT_CACHE_PATH).expanduser())
+    max_bytes = int(float(caching.get("embeddings_max_mb", DEFAULT_MAX_MB)) * 1024 * 1024)
+    key = (path, max_bytes)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = EmbeddingCache(path, max_bytes=max_bytes)
+            _caches[key] = cache
+        return cache
@@ -0,0 +1,243 @@
+"""
+Bounded, event-invalidated cache for impact and severity results.
+
+`ImpactService` used to memoize severity scores in a plain dict that grew
+forever and never noticed new Slack or Git activity. `ImpactResultCache`
+replaces it:
+
+1. **Bounded** — at most ``max_entries`` results, least-recently-used first out.
+2. **Fresh** — entries expire after ``ttl_seconds`` and are dropped as soon as
+   new activity is written for their issue or any of their components.
+3. **Decoupled** — writers (the impact pipeline, the ingestion signal loggers)
+   call the module-level `notify_activity()`; every live cache in the process
+   drops the affected entries without the writer holding a cache handle.
+4. **Observable** — `stats()` reports hit rate, evictions, invalidations and
+   the age of the results being served.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Set
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_TTL_SECONDS = 900.0
+CACHE_NAME = "impact_severity"
+
+
+@dataclass
+class _Entry:
+    value: Any
+    components: FrozenSet[str]
+    stored_at: float
+
+
+class ImpactResultCache:
+    """
+    Thread-safe LRU + TTL cache of per-issue results tagged with component ids.
+
+    >>> cache = ImpactResultCache(max_entries=1024, ttl_seconds=600)
+    >>> cache.put("issue-1", result, component_ids=["core-api"])
+    >>> notify_activity(component_ids=["core-api"])  # drops issue-1
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        name: str = CACHE_NAME,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.name = name
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._by_component: Dict[str, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.invalidation_events = 0
+        self._hit_age_total = 0.0
+        self._hit_age_max = 0.0
+        self._last_invalidated_at: Optional[float] = None
+        _register(self)
+
+    # ------------------------------------------------------------------ #
+    # Reads / writes
+    # ------------------------------------------------------------------ #
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key`` (None on miss or expiry)."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return cached values for the keys that are present and fresh."""
+        found: Dict[str, Any] = {}
+        hits = misses = 0
+        with self._lock:
+            now = self._clock()
+            for key in keys:
+                if key in found:
+                    continue
+                entry = self._entries.get(key)
+                if entry is not None and self.ttl_seconds and now - entry.stored_at >= self.ttl_seconds:
+                    self._drop(key)
+                    self.expirations += 1
+                    entry = None
+                if entry is None:
+                    misses += 1
+                    continue
+                self._entries.move_to_end(key)
+                age = now - entry.stored_at
+                self._hit_age_total += age
+                self._hit_age_max = max(self._hit_age_max, age)
+                found[key] = entry.value
+                hits += 1
+            self.hits += hits
+            self.misses += misses
+        _record(hits=hits, misses=misses, name=self.name)
+        return found
+
+    def put(self, key: str, value: Any, *, component_ids: Iterable[str] = ()) -> None:
+        """Store ``value`` for ``key``, tagged with the components it depends on."""
+        components = frozenset(_normalize(component_ids))
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = _Entry(value, components, self._clock())
+            for component in components:
+                self._by_component.setdefault(component, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    # ------------------------------------------------------------------ #
+    # Invalidation
+    # ------------------------------------------------------------------ #
+    def invalidate(
+        self,
+        *,
+        issue_ids: Iterable[str] = (),
+        component_ids: Iterable[str] = (),
+    ) -> int:
+        """Drop entries for ``issue_ids`` and entries tagged with any of ``component_ids``."""
+        keys = set(issue_ids or ())
+        components = _normalize(component_ids)
+        with self._lock:
+            for component in components:
+                keys.update(self._by_component.get(component, ()))
+            dropped = sum(1 for key in keys if self._drop(key))
+            if keys or components:
+                self.invalidation_events += 1
+                self._last_invalidated_at = time.time()
+            self.invalidations += dropped
+        return dropped
+
+    def invalidate_issues(self, issue_ids: Iterable[str]) -> int:
+        return self.invalidate(issue_ids=issue_ids)
+
+    def invalidate_components(self, component_ids: Iterable[str]) -> int:
+        return self.invalidate(component_ids=component_ids)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_component.clear()
+
+    # ------------------------------------------------------------------ #
+    # Metrics
+    # ------------------------------------------------------------------ #
+    def stats(self) -> Dict[str, Any]:
+        """Return size, hit/miss counters and staleness of served results."""
+        with self._lock:
+            now = self._clock()
+            oldest = min((entry.stored_at for entry in self._entries.values()), default=None)
+            total = self.hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "invalidation_events": self.invalidation_events,
+                "last_invalidated_at": self._last_invalidated_at,
+                "avg_hit_age_seconds": self._hit_age_total / self.hits if self.hits else 0.0,
+                "max_hit_age_seconds": self._hit_age_max,
+                "oldest_entry_age_seconds": (now - oldest) if oldest is not None else 0.0,
+            }
+
+    # ------------------------------------------------------------------ #
+    # Internal helpers
+    # ------------------------------------------------------------------ #
+    def _drop(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        for component in entry.components:
+            keys = self._by_component.get(component)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_component[component]
+        return True
+
+
+_caches: "weakref.WeakSet[ImpactResultCache]" = weakref.WeakSet()
+_caches_lock = threading.Lock()
+
+
+def _register(cache: ImpactResultCache) -> None:
+    with _caches_lock:
+        _caches.add(cache)
+
+
+def notify_activity(
+    *,
+    issue_ids: Iterable[str] = (),
+    component_ids: Iterable[str] = (),
+) -> int:
+    """
+    Invalidate cached results affected by new activity in every live cache.
+
+    Returns the number of entries dropped. Cheap when nothing is cached, so
+    writers can call it for every signal they persist.
+    """
+    issue_ids = [issue_id for issue_id in issue_ids or () if issue_id]
+    component_ids = [component_id for component_id in component_ids or () if component_id]
+    if not issue_ids and not component_ids:
+        return 0
+    with _caches_lock:
+        caches = list(_caches)
+    return sum(
+        cache.invalidate(issue_ids=issue_ids, component_ids=component_ids) for cache in caches
+    )
+
+
+def _normalize(component_ids: Iterable[str]) -> Set[str]:
+    return {str(component_id).strip().lower() for component_id in component_ids or () if component_id}
+
+
+def _record(*, hits: int, misses: int, name: str) -> None:
+    try:
+        from src.utils.performance_monitor import get_performance_monitor
+
+        monitor = get_performance_monitor()
+        if hits:
+            monitor.record_cache_hit(name, hits)
+        if misses:
+            monitor.record_cache_miss(name, misses)
+    except Exception:
+        pass
@@ -8,7 +8,7 @@ import re
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from src.activity_graph.prioritization import (
     compute_doc_priorities,
@@ -19,9 +19,11 @@ from src.agent.doc_insights_agent import (
     get_component_activity as get_component_activity_tool,
     get_context_impacts as get_context_impacts_tool,
     list_doc_issues as list_doc_issues_tool,
+    mentioned_component_aliases,
     resolve_component_id as resolve_component_id_tool,
 )
 from src.agent.multi_source_reasoner import MultiSourceReasoner
+from src.slash_git.models import normalize_alias_token
 from src.utils.git_urls import determine_repo_owner_override, rewrite_github_url
 
 logger = logging.getLogger(__name__)
@@ -133,6 +135,7 @@ class CerebrosReasonerResult:
     project_id: Optional[str] = None
     conflicts: Optional[List[Dict[str, Any]]] = None
     information_gaps: Optional[List[Dict[str, Any]]] = None
+    timings: Optional[Dict[str, Any]] = None
 
 
 def get_enabled_reasoner_sources(config: Dict[str, Any]) -> List[str]:
@@ -149,9 +152,13 @@ def run_cerebros_reasoner(
     query: str,
     graph_params: Optional[Dict[str, Any]] = None,
     sources: Optional[Sequence[str]] = None,
+    on_evidence: Optional[Callable[[str, Any], None]] = None,
 ) -> CerebrosReasonerResult:
     """
     Execute the multi-source Cerebros reasoning pipeline and return a normalized payload.
+
+    ``on_evidence`` is forwarded to `MultiSourceReasoner.query` to stream each
+    source's evidence as soon as its retriever finishes.
     """
     if not query or not query.strip():
         raise ValueError("Query is required for Cerebros reasoner")
@@ -183,7 +190,8 @@ def run_cerebros_reasoner(
         sources = enabled_sources
 
     reasoner = MultiSourceReasoner(config)
-    result = reasoner.query(query=query, sources=list(sources))
+    query_kwargs: Dict[str, Any] = {"on_evidence": on_evidence} if on_evidence else {}
+    result = reasoner.query(query=query, sources=list(sources), **query_kwargs)
 
     summary = result.get("summary") or "Graph reasoning completed."
     sources_queried = result.get("sources_queried") or list(sources)
@@ -192,6 +200,7 @@ def run_cerebros_reasoner(
     drift_hints = result.get("drift_hints") or {}
     conflicts = result.get("conflicts") or []
     information_gaps = result.get("gaps") or []
+    timings = result.get("timings") or {}
 
     evidence_payload = result.get("evidence") or {}
     if not isinstance(evidence_payload, dict):
@@ -391,6 +400,8 @@ def run_cerebros_reasoner(
         response_payload["conflicts"] = conflicts
     if information_gaps:
         response_payload["gaps"] = information_gaps
+    if timings:
+        response_payload["timings"] = timings
 
     component_ids_out = component_ids or None
     return CerebrosReasonerResult(
@@ -409,6 +420,7 @@ def run_cerebros_reasoner(
         project_id=project_id,
         conflicts=conflicts or None,
         information_gaps=information_gaps or None,
+        timings=timings or None,
     )
 
 
@@ -1057,7 +1069,13 @@ def _guess_component_from_query(query: Optional[str]) -> Optional[Dict[str, Any]
             seen.add(cand)
             ordered_candidates.append(cand)
 
+    # Only candidates the catalog can resolve are worth a tool round trip.
+    mentioned = _mentioned_component_aliases(query)
     for candidate in ordered_candidates:
+        if mentioned is not None and not (
+            candidate in mentioned or normalize_alias_token(candidate) in mentioned
+        ):
+            continue
         resolved = _invoke_tool_safely(resolve_component_id_tool, {"name": candidate})
         if resolved and not resolved.get("error"):
             return resolved
@@ -1083,6 +1101,14 @@ _COMPONENT_STOPWORDS = {
 }
 
 
+def _mentioned_component_aliases(query: str) -> Optional[set[str]]:
+    try:
+        return mentioned_component_aliases(query)
+    except Exception as exc:  # catalog missing or invalid; fall back to probing every candidate
+        logger.debug("[CEREBROS] Component alias matcher unavailable: %s", exc)
+        return None
+
+
 def _extract_component_tokens(query: str) -> List[str]:
     lowered = query.lower()
     tokens: List[str] = []
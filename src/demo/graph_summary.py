@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from ..graph.service import GraphService
 from ..synthetic.mappings import API_COMPONENT_MAP, DOC_API_MAP, DOC_COMPONENT_MAP, services_for_components
+from ..vector.local_vector_store import LocalVectorStore
 from .scenario_classifier import DemoScenario
 
 DEFAULT_STORE_PATHS = {
@@ -110,8 +110,8 @@ class GraphNeighborhoodSummarizer:
         if not path or not path.exists():
             return []
         try:
-            records = json.loads(path.read_text())
-        except json.JSONDecodeError:
+            records = LocalVectorStore(path).records()
+        except (OSError, ValueError):
             return []
 
         matching = []
@@ -122,4 +122,3 @@ class GraphNeighborhoodSummarizer:
             if len(matching) >= max_events:
                 break
         return [event_id for event_id in matching if event_id]
-
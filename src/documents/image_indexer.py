@@ -11,7 +11,6 @@ from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 import faiss
 from PIL import Image
-import hashlib
 import time
 import json
 import re
@@ -19,7 +18,9 @@ from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
 
 from src.utils.openai_client import PooledOpenAIClient
+from src.cache.embedding_cache import get_embedding_cache
 from src.utils import get_temperature_for_model
+from src.utils.thumbnails import get_thumbnail_service
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +45,8 @@ class ImageIndexer:
         # Index storage paths
         self.index_path = Path("data/embeddings/image_faiss.index")
         self.metadata_path = Path("data/embeddings/image_metadata.pkl")
-        self.thumbnail_dir = Path(self.images_config.get('thumbnail', {}).get('cache_dir', 'data/cache/thumbnails'))
+        self.thumbnails = get_thumbnail_service(config)
+        self.thumbnail_dir = self.thumbnails.cache_dir
 
         # Configuration
         self.supported_types = set(self.documents_config.get('supported_image_types', []))
@@ -53,6 +55,7 @@ class ImageIndexer:
         # Initialize OpenAI client for embeddings and LLM reasoning
         self.client = PooledOpenAIClient.get_client(config)
         self.embedding_model = openai_config.get('embedding_model', 'text-embedding-3-small')
+        self.embedding_cache = get_embedding_cache(config)
         self.dimension = 1536  # text-embedding-3-small dimension
         
         # Initialize LLM for caption generation and query enhancement
@@ -171,10 +174,12 @@ class ImageIndexer:
             return 0
 
         indexed_count = 0
+        image_paths = []
         logger.info(f"Indexing images in: {folder_path}")
 
         for file_path in folder.rglob('*'):
             if file_path.is_file() and file_path.suffix.lower() in self.supported_types:
+                image_paths.append(file_path)
                 try:
                     if self._index_image(file_path):
                         indexed_count += 1
@@ -182,6 +187,10 @@ class ImageIndexer:
                     logger.error(f"Error indexing {file_path}: {e}")
 
         logger.info(f"Indexed {indexed_count} images from {folder_path}")
+
+        # Warm the shared thumbnail cache so browsing the folder only hits cached files
+        if image_paths and self.images_config.get('thumbnail', {}).get('pregenerate', False):
+            self.thumbnails.pregenerate_in_background(image_paths)
         return indexed_count
 
     def _index_image(self, file_path: Path) -> bool:
@@ -334,12 +343,9 @@ Respond with ONLY the caption text, no additional explanation."""
                 caption = caption[:max_chars]
                 logger.debug(f"[IMAGE INDEXER] Truncated caption to {max_chars} characters")
 
-            response = self.client.embeddings.create(
-                model=self.embedding_model,
-                input=caption
-            )
-
-            embedding = np.array(response.data[0].embedding, dtype=np.float32)
+            embedding = self.embedding_cache.embed(
+                self.embedding_model, [caption], self._request_embeddings
+            )[0]
 
             # Normalize for cosine similarity
             embedding = embedding / np.linalg.norm(embedding)
@@ -351,6 +357,14 @@ Respond with ONLY the caption text, no additional explanation."""
             logger.error(f"[IMAGE INDEXER] Error generating embedding: {e}")
             raise
 
+    def _request_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """Call the OpenAI embeddings API for captions that missed the cache."""
+        response = self.client.embeddings.create(
+            model=self.embedding_model,
+            input=texts[0] if len(texts) == 1 else texts
+        )
+        return [np.array(item.embedding, dtype=np.float32) for item in response.data]
+
     def _generate_thumbnail(self, file_path: Path) -> Path:
         """
         Generate and save thumbnail for image.
@@ -361,23 +375,9 @@ Respond with ONLY the caption text, no additional explanation."""
         Returns:
             Path to thumbnail
         """
-        max_size = self.images_config.get('thumbnail', {}).get('max_size', 256)
-        quality = self.images_config.get('thumbnail', {}).get('quality', 85)
-
-        # Create thumbnail filename
-        file_hash = hashlib.md5(str(file_path).encode()).hexdigest()[:8]
-        thumbnail_filename = f"{file_hash}_{max_size}x{max_size}.jpg"
-        thumbnail_path = self.thumbnail_dir / thumbnail_filename
-
         try:
-            with Image.open(file_path) as img:
-                # Create thumbnail
-                img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-
-                # Save thumbnail
-                img.save(thumbnail_path, 'JPEG', quality=quality)
-
-                return thumbnail_path
+            # Same content-addressed cache the /api/files/thumbnail endpoint serves from
+            return self.thumbnails.get_sync(file_path)
         except Exception as e:
             logger.error(f"Error generating thumbnail for {file_path}: {e}")
             # Return original file as fallback
@@ -572,12 +572,9 @@ Respond with ONLY the caption text, no additional explanation."""
                 query = query[:max_chars]
                 logger.debug(f"[IMAGE INDEXER] Truncated query to {max_chars} characters")
 
-            response = self.client.embeddings.create(
-                model=self.embedding_model,
-                input=query
-            )
-
-            embedding = np.array(response.data[0].embedding, dtype=np.float32)
+            embedding = self.embedding_cache.embed(
+                self.embedding_model, [query], self._request_embeddings
+            )[0]
 
             # Normalize for cosine similarity
             embedding = embedding / np.linalg.norm(embedding)
@@ -16,6 +16,7 @@ from tqdm import tqdm
 from .parser import DocumentParser
 from .image_indexer import ImageIndexer
 from src.utils.openai_client import PooledOpenAIClient
+from src.cache.embedding_cache import get_embedding_cache
 
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,7 @@ class DocumentIndexer:
         # Use pooled client for connection reuse (20-40% faster)
         self.client = PooledOpenAIClient.get_client(config)
         self.embedding_model = config['openai']['embedding_model']
+        self.embedding_cache = get_embedding_cache(config)
         logger.info("[DOCUMENT INDEXER] Using pooled OpenAI client for connection reuse")
 
         # Read batch embeddings config
@@ -47,10 +49,12 @@ class DocumentIndexer:
         else:
             self.batch_size = 1  # Disable batching if disabled
 
-        # FAISS index
+        # FAISS index (ID-mapped so chunks can be removed without re-embedding)
         self.index: Optional[faiss.Index] = None
         self.documents: List[Dict[str, Any]] = []
         self.dimension = 1536  # text-embedding-3-small dimension
+        self._documents_by_id: Dict[int, Dict[str, Any]] = {}
+        self._next_chunk_id = 0
 
         # Paths
         self.index_path = Path("data/embeddings/faiss.index")
@@ -78,13 +82,51 @@ class DocumentIndexer:
             self.load_index()
         else:
             logger.info("Creating new FAISS index")
-            # Using IndexFlatIP for inner product (cosine similarity with normalized vectors)
-            self.index = faiss.IndexFlatIP(self.dimension)
+            self.index = self._create_index()
             self.documents = []
+            self._rebuild_id_lookup()
+
+    def _create_index(self) -> faiss.Index:
+        """
+        Create an empty ID-mapped FAISS index.
+
+        IndexFlatIP gives inner product (cosine similarity with normalized vectors);
+        the IDMap2 wrapper keys every vector by its stable chunk ID so a file's
+        chunks can be dropped with remove_ids() instead of rebuilding the index.
+        """
+        return faiss.IndexIDMap2(faiss.IndexFlatIP(self.dimension))
+
+    def _rebuild_id_lookup(self):
+        """Rebuild the chunk_id -> chunk metadata map and the next free chunk ID."""
+        self._documents_by_id = {
+            doc['chunk_id']: doc for doc in self.documents if 'chunk_id' in doc
+        }
+        self._next_chunk_id = max(self._documents_by_id, default=-1) + 1
+
+    def _assign_chunk_ids(self, chunks: List[Dict[str, Any]]) -> np.ndarray:
+        """Assign stable chunk IDs to new chunks and register them for lookup."""
+        ids = np.arange(self._next_chunk_id, self._next_chunk_id + len(chunks), dtype=np.int64)
+        for chunk_id, chunk in zip(ids.tolist(), chunks):
+            chunk['chunk_id'] = chunk_id
+            self._documents_by_id[chunk_id] = chunk
+        self._next_chunk_id += len(chunks)
+        return ids
+
+    def get_document(self, chunk_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a FAISS search result ID to its chunk metadata.
+
+        Args:
+            chunk_id: ID returned by index.search()
+
+        Returns:
+            Chunk metadata, or None if the chunk is no longer indexed
+        """
+        return self._documents_by_id.get(int(chunk_id))
 
     def get_embedding(self, text: str) -> np.ndarray:
         """
-        Get embedding for text using OpenAI API.
+        Get embedding for text using OpenAI API (served from the embedding cache when possible).
 
         Args:
             text: Text to embed
@@ -98,12 +140,9 @@ class DocumentIndexer:
             if len(text) > max_chars:
                 text = text[:max_chars]
 
-            response = self.client.embeddings.create(
-                model=self.embedding_model,
-                input=text
-            )
-
-            embedding = np.array(response.data[0].embedding, dtype=np.float32)
+            embedding = self.embedding_cache.embed(
+                self.embedding_model, [text], self._request_embeddings
+            )[0]
 
             # Normalize for cosine similarity
             embedding = embedding / np.linalg.norm(embedding)
@@ -113,13 +152,22 @@ class DocumentIndexer:
         except Exception as e:
             logger.error(f"Error getting embedding: {e}")
             raise
+
+    def _request_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """Call the OpenAI embeddings API for a list of texts (raw, unnormalized vectors)."""
+        response = self.client.embeddings.create(
+            model=self.embedding_model,
+            input=texts if len(texts) > 1 else texts[0]
+        )
+        return [np.array(item.embedding, dtype=np.float32) for item in response.data]
     
     def get_embeddings_batch(self, texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
         """
         Generate embeddings for multiple texts in batches (10-20x faster).
         
         OpenAI supports up to 2048 inputs per request. We use configurable
-        batch size from performance.batch_embeddings.batch_size.
+        batch size from performance.batch_embeddings.batch_size. Texts already
+        in the embedding cache are not sent to the API.
         
         Args:
             texts: List of texts to embed
@@ -133,34 +181,37 @@ class DocumentIndexer:
             batch_size = self.batch_size
         if not texts:
             return np.array([])
-        
-        logger.info(f"[BATCH EMBEDDINGS] Processing {len(texts)} texts in batches of {batch_size}")
+
+        # Truncate each text
+        texts = [text[:30000] if len(text) > 30000 else text for text in texts]
+
+        embeddings = self.embedding_cache.embed(
+            self.embedding_model,
+            texts,
+            lambda missing: self._request_embeddings_batched(missing, batch_size),
+        )
+
         all_embeddings = []
+        for embedding in embeddings:
+            if embedding is None:
+                # Use zero vector as fallback
+                all_embeddings.append(np.zeros(self.dimension, dtype=np.float32))
+            else:
+                # Normalize each embedding
+                all_embeddings.append(embedding / np.linalg.norm(embedding))
+
+        return np.array(all_embeddings)
+
+    def _request_embeddings_batched(self, texts: List[str], batch_size: int) -> List[Optional[np.ndarray]]:
+        """Embed texts through the API in batches, falling back to single calls for failed batches."""
+        logger.info(f"[BATCH EMBEDDINGS] Processing {len(texts)} texts in batches of {batch_size}")
+        all_embeddings: List[Optional[np.ndarray]] = []
         
         for i in range(0, len(texts), batch_size):
             batch = texts[i:i+batch_size]
             
-            # Truncate each text
-            batch = [text[:30000] if len(text) > 30000 else text for text in batch]
-            
             try:
-                response = self.client.embeddings.create(
-                    model=self.embedding_model,
-                    input=batch  # List of texts
-                )
-                
-                # Extract embeddings in order
-                batch_embeddings = [
-                    np.array(item.embedding, dtype=np.float32) 
-                    for item in response.data
-                ]
-                
-                # Normalize each embedding
-                batch_embeddings = [
-                    emb / np.linalg.norm(emb) for emb in batch_embeddings
-                ]
-                
-                all_embeddings.extend(batch_embeddings)
+                all_embeddings.extend(self._request_embeddings(batch))
                 
                 logger.debug(f"[BATCH EMBEDDINGS] Processed batch {i//batch_size + 1}/{(len(texts)-1)//batch_size + 1}")
                 
@@ -170,14 +221,12 @@ class DocumentIndexer:
                 logger.info(f"[BATCH EMBEDDINGS] Falling back to individual calls for batch {i//batch_size + 1}")
                 for text in batch:
                     try:
-                        embedding = self.get_embedding(text)
-                        all_embeddings.append(embedding)
+                        all_embeddings.extend(self._request_embeddings([text]))
                     except Exception as e2:
                         logger.error(f"[BATCH EMBEDDINGS] Individual embedding failed: {e2}")
-                        # Use zero vector as fallback
-                        all_embeddings.append(np.zeros(self.dimension, dtype=np.float32))
+                        all_embeddings.append(None)
         
-        return np.array(all_embeddings)
+        return all_embeddings
 
     def index_documents(self, folders: Optional[List[str]] = None, cancel_event=None) -> int:
         """
@@ -235,6 +284,15 @@ class DocumentIndexer:
 
         logger.info(f"Already indexed: {len(indexed_files)} files")
 
+        # Files that were indexed from these folders but no longer exist on disk
+        discovered_files = {str(file_path) for file_path in all_files}
+        stale_files = [
+            file_path for file_path in indexed_files
+            if file_path not in discovered_files and self._is_under_folders(file_path, folders)
+        ]
+        if stale_files:
+            logger.info(f"Removing {len(stale_files)} deleted file(s) from index")
+
         # PHASE 1: Parse all documents and collect chunks (without embeddings)
         all_chunks = []
         skipped_count = 0
@@ -260,9 +318,9 @@ class DocumentIndexer:
                         skipped_count += 1
                         continue
                     else:
-                        # File modified - remove old chunks
+                        # File modified - old chunks are removed before the new ones are added
                         logger.info(f"File modified, re-indexing: {file_path.name}")
-                        self._remove_file_from_index(file_path_str)
+                        stale_files.append(file_path_str)
                         updated_count += 1
                 except OSError:
                     skipped_count += 1
@@ -294,7 +352,11 @@ class DocumentIndexer:
             except Exception as e:
                 logger.error(f"Error parsing {file_path}: {e}")
                 continue
-        
+
+        # Drop chunks of modified/deleted files in one pass (keeps stored vectors of everything else)
+        if stale_files:
+            self._remove_files_from_index(stale_files)
+
         # PHASE 2: Generate embeddings in batch (10-20x faster!)
         logger.info(f"Phase 2: Generating embeddings for {len(all_chunks)} chunks (batch mode)...")
         if all_chunks:
@@ -319,7 +381,8 @@ class DocumentIndexer:
             # PHASE 3: Add to FAISS index
             logger.info(f"Phase 3: Adding {len(embeddings)} embeddings to FAISS index...")
             if len(embeddings) > 0:
-                self.index.add(embeddings)
+                chunk_ids = self._assign_chunk_ids(all_chunks)
+                self.index.add_with_ids(np.ascontiguousarray(embeddings, dtype=np.float32), chunk_ids)
                 self.documents.extend(all_chunks)
             
             indexed_count = len(all_chunks)
@@ -448,44 +511,76 @@ class DocumentIndexer:
         with open(self.metadata_path, 'rb') as f:
             self.documents = pickle.load(f)
 
+        if not isinstance(self.index, faiss.IndexIDMap2):
+            self._migrate_positional_index()
+        self._rebuild_id_lookup()
+
         logger.info(f"Loaded {len(self.documents)} document chunks")
 
+    def _migrate_positional_index(self):
+        """
+        Convert a legacy positional IndexFlatIP into the ID-mapped layout.
+
+        Stored vectors are reused via reconstruct_n(); only an index whose size no
+        longer matches the metadata is re-embedded.
+        """
+        legacy_index = self.index
+        ids = np.arange(len(self.documents), dtype=np.int64)
+        for chunk_id, doc in zip(ids.tolist(), self.documents):
+            doc['chunk_id'] = chunk_id
+
+        if legacy_index is not None and legacy_index.ntotal == len(self.documents):
+            logger.info(f"Migrating {len(ids)} vectors to ID-mapped FAISS index")
+            vectors = legacy_index.reconstruct_n(0, legacy_index.ntotal) if len(ids) else None
+        else:
+            logger.warning("FAISS index and metadata are out of sync; re-embedding chunks once")
+            vectors = self.get_embeddings_batch([doc['content'] for doc in self.documents])
+
+        self.index = self._create_index()
+        if len(ids):
+            self.index.add_with_ids(np.ascontiguousarray(vectors, dtype=np.float32), ids)
+
+    @staticmethod
+    def _is_under_folders(file_path: str, folders: List[str]) -> bool:
+        """Check whether a file path lives under one of the given folders."""
+        path = Path(file_path)
+        return any(path.is_relative_to(folder) for folder in folders)
+
     def _remove_file_from_index(self, file_path: str):
         """Remove all chunks for a specific file from the index."""
-        # Find indices of chunks to remove
-        indices_to_remove = []
-        for i, doc in enumerate(self.documents):
-            if doc.get('file_path') == file_path:
-                indices_to_remove.append(i)
-        
-        if not indices_to_remove:
-            return
-        
-        # Remove from documents list (in reverse order to maintain indices)
-        for i in reversed(indices_to_remove):
-            self.documents.pop(i)
-        
-        # Rebuild FAISS index (FAISS doesn't support removal, so we rebuild)
-        logger.info(f"Rebuilding index after removing {len(indices_to_remove)} chunks for {Path(file_path).name}")
-        
-        # Create new index
-        new_index = faiss.IndexFlatIP(self.dimension)
-        new_documents = []
-        
-        # Re-add all remaining documents
-        for doc in self.documents:
-            try:
-                embedding = self.get_embedding(doc['content'])
-                new_index.add(embedding.reshape(1, -1))
-                new_documents.append(doc)
-            except Exception as e:
-                logger.warning(f"Error re-indexing chunk: {e}")
-                continue
-        
-        self.index = new_index
-        self.documents = new_documents
-        
-        logger.info(f"Index rebuilt: {len(self.documents)} chunks remaining")
+        self._remove_files_from_index([file_path])
+
+    def _remove_files_from_index(self, file_paths: List[str]) -> int:
+        """
+        Remove all chunks for the given files from the index.
+
+        Vectors are dropped by chunk ID, so the remaining chunks keep their
+        stored embeddings and no embedding calls are made.
+
+        Args:
+            file_paths: File paths whose chunks should be removed
+
+        Returns:
+            Number of chunks removed
+        """
+        targets = set(file_paths)
+        removed_ids = [
+            doc['chunk_id'] for doc in self.documents
+            if doc.get('file_path') in targets
+        ]
+        if not removed_ids:
+            return 0
+
+        self.index.remove_ids(np.asarray(removed_ids, dtype=np.int64))
+        self.documents = [doc for doc in self.documents if doc.get('file_path') not in targets]
+        for chunk_id in removed_ids:
+            self._documents_by_id.pop(chunk_id, None)
+
+        logger.info(
+            f"Removed {len(removed_ids)} chunks for {len(targets)} file(s); "
+            f"{len(self.documents)} chunks remaining"
+        )
+        return len(removed_ids)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get indexing statistics."""
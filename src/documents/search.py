@@ -69,7 +69,9 @@ class SemanticSearch:
                     continue
 
                 # Get document metadata
-                doc_metadata = self.indexer.documents[idx]
+                doc_metadata = self.indexer.get_document(idx)
+                if doc_metadata is None:
+                    continue
 
                 results.append({
                     'rank': i + 1,
@@ -184,7 +186,9 @@ class SemanticSearch:
                 if idx == -1:
                     continue
 
-                doc_metadata = self.indexer.documents[idx]
+                doc_metadata = self.indexer.get_document(idx)
+                if doc_metadata is None:
+                    continue
 
                 # Only include pages from the target document
                 if doc_metadata['file_path'] != doc_path:
@@ -9,6 +9,7 @@ from .schema import (
     GraphApiImpactSummary,
 )
 from .service import GraphService
+from .bulk_writer import GraphWriteBuffer
 from .ingestor import GraphIngestor
 from .analytics_service import GraphAnalyticsService
 from .activity_service import ActivityService
@@ -17,6 +18,7 @@ from .dependency_graph import DependencyGraphBuilder, DependencyGraph
 
 __all__ = [
     "GraphService",
+    "GraphWriteBuffer",
     "GraphAnalyticsService",
     "GraphDashboardService",
     "ActivityService",
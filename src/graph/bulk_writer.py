@@ -0,0 +1,184 @@
+"""
+GraphWriteBuffer - buffered UNWIND upserts for Neo4j ingestion runs.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle guard
+    from .service import GraphService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL_SECONDS = 2.0
+
+NodeKey = Tuple[str, bool]
+RelationshipKey = Tuple[str, str, str]
+
+
+class GraphWriteBuffer:
+    """
+    Collects node/relationship upserts and writes them as grouped UNWIND statements.
+
+    Nodes are grouped by label and relationships by (source label, type, target
+    label), so each group becomes one parameterized ``UNWIND $rows`` MERGE. A
+    flush sends every pending group in a single transaction. Flushes happen when
+    ``batch_size`` rows are pending, when ``flush_interval_seconds`` have passed
+    since the previous flush (checked on enqueue), and when the owning
+    ``GraphService.bulk_write`` block exits.
+    """
+
+    def __init__(
+        self,
+        graph_service: "GraphService",
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ):
+        self.graph_service = graph_service
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval_seconds = float(flush_interval_seconds)
+        self._lock = threading.RLock()
+        self._nodes: Dict[NodeKey, Dict[str, Dict[str, Any]]] = {}
+        self._relationships: Dict[RelationshipKey, Dict[Tuple[str, str], Dict[str, Any]]] = {}
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self.flushes = 0
+        self.statements = 0
+        self.rows_written = 0
+        self.failed_batches = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def add_node(
+        self,
+        label: str,
+        node_id: str,
+        properties: Optional[Dict[str, Any]] = None,
+        *,
+        track_created_at: bool = False,
+    ) -> None:
+        if not node_id:
+            return
+        with self._lock:
+            rows = self._nodes.setdefault((label, track_created_at), {})
+            row = rows.get(node_id)
+            if row is None:
+                rows[node_id] = {"id": node_id, "props": dict(properties or {})}
+                self._pending += 1
+            else:
+                # Same semantics as two sequential `SET n += $props` writes.
+                row["props"].update(properties or {})
+            self._maybe_flush()
+
+    def add_relationship(
+        self,
+        source_label: str,
+        source_id: str,
+        rel_type: str,
+        target_label: str,
+        target_id: str,
+        properties: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if not source_id or not target_id:
+            return
+        with self._lock:
+            rows = self._relationships.setdefault((source_label, rel_type, target_label), {})
+            key = (source_id, target_id)
+            row = rows.get(key)
+            if row is None:
+                rows[key] = {"source_id": source_id, "target_id": target_id, "props": dict(properties or {})}
+                self._pending += 1
+            else:
+                row["props"].update(properties or {})
+            self._maybe_flush()
+
+    def flush(self) -> int:
+        """Write every pending row in one transaction; returns the number of rows sent."""
+        with self._lock:
+            statements = self._drain_statements()
+            self._last_flush = time.monotonic()
+            if not statements:
+                return 0
+            rows = sum(len(params["rows"]) for _, params in statements)
+            self.flushes += 1
+            self.statements += len(statements)
+            if self.graph_service.run_write_batch(statements):
+                self.rows_written += rows
+            else:
+                self.failed_batches += 1
+            return rows
+
+    def _maybe_flush(self) -> None:
+        if self._pending >= self.batch_size:
+            self.flush()
+        elif self.flush_interval_seconds > 0 and time.monotonic() - self._last_flush >= self.flush_interval_seconds:
+            self.flush()
+
+    def _drain_statements(self) -> List[Tuple[str, Dict[str, Any]]]:
+        statements: List[Tuple[str, Dict[str, Any]]] = []
+        # Nodes go first so their properties are set before relationship MERGEs touch them.
+        for (label, track_created_at), rows in self._nodes.items():
+            if rows:
+                statements.append((node_upsert_statement(label, track_created_at), {"rows": list(rows.values())}))
+        for (source_label, rel_type, target_label), rows in self._relationships.items():
+            if rows:
+                statements.append(
+                    (
+                        relationship_upsert_statement(source_label, rel_type, target_label),
+                        {"rows": list(rows.values())},
+                    )
+                )
+        self._nodes = {}
+        self._relationships = {}
+        self._pending = 0
+        return statements
+
+
+def node_upsert_statement(label: str, track_created_at: bool = False) -> str:
+    created = "\n        ON CREATE SET n.created_at = timestamp()" if track_created_at else ""
+    return f"""
+        UNWIND $rows AS row
+        MERGE (n:{label} {{id: row.id}}){created}
+        SET n += row.props
+        """
+
+
+def relationship_upsert_statement(source_label: str, rel_type: str, target_label: str) -> str:
+    return f"""
+        UNWIND $rows AS row
+        MERGE (source:{source_label} {{id: row.source_id}})
+        MERGE (target:{target_label} {{id: row.target_id}})
+        MERGE (source)-[rel:{rel_type}]->(target)
+        SET rel += row.props
+        """
+
+
+def active_write_buffer(graph_service: Any) -> Optional[GraphWriteBuffer]:
+    """Return the buffer of an open ``bulk_write`` block on ``graph_service``, if any."""
+    current = getattr(graph_service, "_write_buffer", None)
+    buffer = current.get() if isinstance(current, ContextVar) else None
+    return buffer if isinstance(buffer, GraphWriteBuffer) else None
+
+
+def bulk_graph_writes(graph_service: Any) -> ContextManager[Optional[GraphWriteBuffer]]:
+    """
+    ``graph_service.bulk_write()`` when supported, otherwise a no-op context.
+
+    Lets ingestors wrap their runs unconditionally even when handed a stub
+    service that only implements ``run_write``.
+    """
+    from .service import GraphService
+
+    if not isinstance(graph_service, GraphService):
+        return nullcontext(None)
+    return graph_service.bulk_write()
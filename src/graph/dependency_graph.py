@@ -8,19 +8,23 @@ import logging
 from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 import yaml
 
 from ..config_validator import ConfigAccessor
 from ..config.models import ContextResolutionSettings
 from ..utils import load_config
+from ..utils.alias_matcher import AliasMatcher
 from .ingestor import GraphIngestor
 from .schema import NodeLabels, RelationshipTypes
 from .service import GraphService
 
 logger = logging.getLogger(__name__)
 
+# Distinct multi-seed dependent queries memoized per graph.
+_MAX_CACHED_DEPENDENT_QUERIES = 1024
+
 
 def _normalize_path(value: str) -> str:
     value = value.strip()
@@ -29,6 +33,69 @@ def _normalize_path(value: str) -> str:
     return value.replace("\\", "/").lstrip("./")
 
 
+class _PathTrie:
+    """
+    Path-segment trie over registered file patterns for one repo.
+
+    A pattern matches a file when the file equals it or lives under it; among
+    matches the longest pattern wins and equal-length matches are merged,
+    mirroring the original linear ``startswith`` scan.
+    """
+
+    __slots__ = ("children", "entries")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_PathTrie"] = {}
+        # (pattern length, component id, pattern has no trailing slash)
+        self.entries: List[Tuple[int, str, bool]] = []
+
+    def insert(self, pattern: str, component_id: str) -> None:
+        node = self
+        for segment in pattern.rstrip("/").split("/"):
+            node = node.children.setdefault(segment, _PathTrie())
+        node.entries.append((len(pattern), component_id, not pattern.endswith("/")))
+
+    def collect(self, segments: List[str], best: List[int], matches: Set[str]) -> None:
+        """Fold this trie's matches for ``segments`` into ``best[0]``/``matches``."""
+        node: Optional[_PathTrie] = self
+        depth = 0
+        total = len(segments)
+        for segment in segments:
+            node = node.children.get(segment)
+            if node is None:
+                return
+            depth += 1
+            for length, component_id, exact_ok in node.entries:
+                if depth == total and not exact_ok:
+                    continue
+                if length > best[0]:
+                    best[0] = length
+                    matches.clear()
+                    matches.add(component_id)
+                elif length == best[0]:
+                    matches.add(component_id)
+
+
+def _entity_terms(
+    entity_id: str,
+    metadata: Dict[str, object],
+    *,
+    split_prefix: bool = False,
+    extra_fields: Tuple[str, ...] = (),
+) -> Set[str]:
+    terms: Set[str] = {entity_id.lower()}
+    if split_prefix and ":" in entity_id:
+        terms.add(entity_id.split(":", 1)[-1].lower())
+    for key in ("name",) + extra_fields:
+        value = metadata.get(key)
+        if isinstance(value, str):
+            terms.add(value.lower())
+    for alias in metadata.get("aliases", []) or []:
+        if isinstance(alias, str):
+            terms.add(alias.lower())
+    return {term for term in terms if term}
+
+
 @dataclass
 class DependencyGraph:
     """In-memory representation of services, components, and docs."""
@@ -52,6 +119,10 @@ class DependencyGraph:
     file_component_index: Dict[str, List[Tuple[str, str]]] = field(default_factory=lambda: defaultdict(list))
     artifact_to_component: Dict[str, str] = field(default_factory=dict)
     _pending_artifact_edges: List[Tuple[str, str]] = field(default_factory=list)
+    _file_tries: Optional[Dict[str, _PathTrie]] = field(default=None, repr=False)
+    _dependent_closures: Dict[Tuple[str, int], Dict[str, int]] = field(default_factory=dict, repr=False)
+    _dependent_queries: Dict[Tuple[FrozenSet[str], int], Dict[str, int]] = field(default_factory=dict, repr=False)
+    _entity_matcher: Optional[AliasMatcher[Tuple[str, str]]] = field(default=None, repr=False)
 
     def finalize(self) -> None:
         """Resolve pending dependency edges and prepare reverse lookups."""
@@ -65,6 +136,10 @@ class DependencyGraph:
             for target in targets:
                 self.reverse_component_dependencies[target].add(src)
         self._pending_artifact_edges.clear()
+        self._build_file_tries()
+        self._dependent_closures.clear()
+        self._dependent_queries.clear()
+        self._entity_matcher = None
 
     def register_file_mapping(self, repo: str, path: str, component_id: str) -> None:
         for repo_key in self._repo_lookup_keys(repo):
@@ -72,25 +147,48 @@ class DependencyGraph:
             if not normalized:
                 continue
             self.file_component_index[repo_key].append((normalized, component_id))
+        # Mappings added after finalize() are picked up by a lazy rebuild.
+        self._file_tries = None
 
     def components_for_file(self, repo: str, file_path: str) -> Set[str]:
+        """Components owning ``file_path`` (longest registered prefix wins)."""
+        tries = self._tries_for_repo(repo)
+        return self._match_file(tries, file_path) if tries else set()
+
+    def components_for_files(self, repo: str, file_paths: Iterable[str]) -> Dict[str, Set[str]]:
+        """Batch `components_for_file` for one repo, keyed by the given path."""
+        tries = self._tries_for_repo(repo)
+        results: Dict[str, Set[str]] = {}
+        for file_path in file_paths:
+            if file_path not in results:
+                results[file_path] = self._match_file(tries, file_path) if tries else set()
+        return results
+
+    def _tries_for_repo(self, repo: str) -> List[_PathTrie]:
+        if self._file_tries is None:
+            self._build_file_tries()
+        tries = self._file_tries or {}
+        return [tries[key] for key in self._repo_lookup_keys(repo) if key in tries]
+
+    @staticmethod
+    def _match_file(tries: List[_PathTrie], file_path: str) -> Set[str]:
         normalized = _normalize_path(file_path)
         if not normalized:
             return set()
+        segments = normalized.split("/")
+        best = [-1]
         matches: Set[str] = set()
-        best_length = -1
+        for trie in tries:
+            trie.collect(segments, best, matches)
+        return matches
 
-        for repo_key in self._repo_lookup_keys(repo):
-            patterns = self.file_component_index.get(repo_key, [])
+    def _build_file_tries(self) -> None:
+        tries: Dict[str, _PathTrie] = {}
+        for repo_key, patterns in self.file_component_index.items():
+            trie = tries.setdefault(repo_key, _PathTrie())
             for pattern, component_id in patterns:
-                if normalized == pattern or normalized.startswith(f"{pattern.rstrip('/')}/"):
-                    pattern_length = len(pattern)
-                    if pattern_length > best_length:
-                        matches = {component_id}
-                        best_length = pattern_length
-                    elif pattern_length == best_length:
-                        matches.add(component_id)
-        return matches
+                trie.insert(pattern, component_id)
+        self._file_tries = tries
 
     @staticmethod
     def _repo_lookup_keys(repo: str) -> List[str]:
@@ -114,6 +212,79 @@ class DependencyGraph:
             unique_keys.append(key)
         return unique_keys
 
+    def dependent_closure(self, component_id: str, max_depth: Optional[int] = None) -> Dict[str, int]:
+        """
+        Transitive dependents of ``component_id`` mapped to their shortest depth.
+
+        Level-synchronous BFS over ``reverse_component_dependencies``, capped
+        at ``max_depth`` levels when given. Results are memoized per
+        ``(component, depth)`` until the next `finalize()`; treat them as
+        read-only.
+        """
+        key = (component_id, max_depth or 0)
+        closure = self._dependent_closures.get(key)
+        if closure is None:
+            closure = {}
+            frontier = [component_id]
+            depth = 0
+            while frontier and (not max_depth or depth < max_depth):
+                depth += 1
+                next_frontier: List[str] = []
+                for current in frontier:
+                    for dependent in self.reverse_component_dependencies.get(current, ()):
+                        if dependent != component_id and dependent not in closure:
+                            closure[dependent] = depth
+                            next_frontier.append(dependent)
+                frontier = next_frontier
+            self._dependent_closures[key] = closure
+        return closure
+
+    def dependents_of(self, seeds: Iterable[str], max_depth: Optional[int] = None) -> Dict[str, int]:
+        """
+        Union of `dependent_closure` over ``seeds`` (shortest depth wins, seeds
+        excluded). Memoized like `dependent_closure`.
+        """
+        seed_set = frozenset(seeds)
+        key = (seed_set, max_depth or 0)
+        cached = self._dependent_queries.get(key)
+        if cached is not None:
+            return cached
+        merged: Dict[str, int] = {}
+        for seed in seed_set:
+            for dependent, depth in self.dependent_closure(seed, max_depth).items():
+                if dependent in seed_set:
+                    continue
+                current = merged.get(dependent)
+                if current is None or depth < current:
+                    merged[dependent] = depth
+        if len(self._dependent_queries) >= _MAX_CACHED_DEPENDENT_QUERIES:
+            self._dependent_queries.clear()
+        self._dependent_queries[key] = merged
+        return merged
+
+    def entity_matcher(self) -> AliasMatcher[Tuple[str, str]]:
+        """
+        Shared alias matcher over components, services and APIs.
+
+        Values are ``(kind, entity_id)`` with kind ``component``, ``service`` or
+        ``api``. Compiled on first use and again after the next `finalize()`.
+        """
+        matcher = self._entity_matcher
+        if matcher is None:
+            aliases: List[Tuple[str, Tuple[str, str]]] = []
+            for component_id, metadata in self.components.items():
+                for term in _entity_terms(component_id, metadata, split_prefix=True):
+                    aliases.append((term, ("component", component_id)))
+            for service_id, metadata in self.services.items():
+                for term in _entity_terms(service_id, metadata, split_prefix=True):
+                    aliases.append((term, ("service", service_id)))
+            for api_id, metadata in self.apis.items():
+                for term in _entity_terms(api_id, metadata, extra_fields=("path",)):
+                    aliases.append((term, ("api", api_id)))
+            matcher = AliasMatcher(aliases)
+            self._entity_matcher = matcher
+        return matcher
+
     def service_for_component(self, component_id: str) -> Optional[str]:
         return self.component_to_service.get(component_id)
 
@@ -7,6 +7,7 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, Iterable, Optional
 
+from .bulk_writer import active_write_buffer
 from .schema import NodeLabels, RelationshipTypes
 from .service import GraphService
 
@@ -495,6 +496,10 @@ class GraphIngestor:
         if not (self.graph_service.is_available() and node_id):
             return
         props = properties or {}
+        buffer = active_write_buffer(self.graph_service)
+        if buffer is not None:
+            buffer.add_node(label.value, node_id, props)
+            return
         query = f"""
         MERGE (n:{label.value} {{id: $id}})
         SET n += $props
@@ -515,6 +520,18 @@ class GraphIngestor:
         if not source_id or not target_id:
             return
 
+        buffer = active_write_buffer(self.graph_service)
+        if buffer is not None:
+            buffer.add_relationship(
+                source_label.value,
+                source_id,
+                rel_type.value,
+                target_label.value,
+                target_id,
+                properties,
+            )
+            return
+
         query = f"""
         MERGE (source:{source_label.value} {{id: $source_id}})
         MERGE (target:{target_label.value} {{id: $target_id}})
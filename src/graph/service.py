@@ -6,7 +6,9 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Any, Dict, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
 
 try:
     from neo4j import GraphDatabase, Driver  # type: ignore
@@ -14,6 +16,7 @@ except Exception:  # pragma: no cover - optional dependency until installed
     GraphDatabase = None  # type: ignore
     Driver = None  # type: ignore
 
+from .bulk_writer import DEFAULT_BATCH_SIZE, DEFAULT_FLUSH_INTERVAL_SECONDS, GraphWriteBuffer
 from .schema import (
     GraphApiImpactSummary,
     GraphComponentSummary,
@@ -50,9 +53,17 @@ class GraphService:
         self.username: Optional[str] = graph_cfg.get("username")
         self.password: Optional[str] = graph_cfg.get("password")
         self.database: Optional[str] = graph_cfg.get("database")
+        self.ingest_batch_size: int = int(graph_cfg.get("ingest_batch_size", DEFAULT_BATCH_SIZE))
+        self.ingest_flush_interval_seconds: float = float(
+            graph_cfg.get("ingest_flush_interval_seconds", DEFAULT_FLUSH_INTERVAL_SECONDS)
+        )
 
         self._driver: Optional[Driver] = None
         self._last_query: Optional[Dict[str, Any]] = None
+        # Per thread / asyncio task, so concurrent ingests never share a buffer.
+        self._write_buffer: ContextVar[Optional[GraphWriteBuffer]] = ContextVar(
+            f"graph_write_buffer_{id(self)}", default=None
+        )
         if self.is_available():
             self._connect()
 
@@ -200,6 +211,69 @@ class GraphService:
             self._record_query_metadata(query, params, error=str(exc))
             return None
 
+    def run_write_batch(self, statements: Sequence[Tuple[str, Dict[str, Any]]]) -> bool:
+        """Run several write statements in a single transaction; all-or-nothing."""
+        if not statements:
+            return True
+        combined = "\n".join(query.strip() for query, _ in statements)
+        rows = sum(len((params or {}).get("rows") or []) for _, params in statements)
+        batch_params = {"statements": len(statements), "rows": rows}
+        if not self._driver:
+            self._record_query_metadata(combined, batch_params, error="driver_unavailable")
+            return False
+        try:
+            with self._driver.session(database=self.database or None) as session:
+                with session.begin_transaction() as tx:
+                    for query, params in statements:
+                        tx.run(query, params or {}).consume()
+                    tx.commit()
+            self._record_query_metadata(combined, batch_params, row_count=rows)
+            return True
+        except Exception as exc:
+            logger.error("[GRAPH] Batched write failed (%s statements, %s rows): %s", len(statements), rows, exc)
+            self._record_query_metadata(combined, batch_params, error=str(exc))
+            return False
+
+    @contextmanager
+    def bulk_write(
+        self,
+        *,
+        batch_size: Optional[int] = None,
+        flush_interval_seconds: Optional[float] = None,
+    ) -> Iterator[GraphWriteBuffer]:
+        """
+        Buffer GraphIngestor/UniversalNodeWriter upserts for the duration of an ingest run.
+
+        Nested blocks share the outermost buffer, which is flushed when that block exits.
+        The buffer is scoped to the calling thread or asyncio task; concurrent
+        callers each get their own.
+        """
+        current = self._write_buffer.get()
+        if current is not None:
+            yield current
+            return
+
+        buffer = GraphWriteBuffer(
+            self,
+            batch_size=batch_size or self.ingest_batch_size,
+            flush_interval_seconds=(
+                self.ingest_flush_interval_seconds if flush_interval_seconds is None else flush_interval_seconds
+            ),
+        )
+        token = self._write_buffer.set(buffer)
+        try:
+            yield buffer
+        finally:
+            self._write_buffer.reset(token)
+            buffer.flush()
+            logger.info(
+                "[GRAPH] Bulk write complete (rows=%s statements=%s transactions=%s failed=%s)",
+                buffer.rows_written,
+                buffer.statements,
+                buffer.flushes,
+                buffer.failed_batches,
+            )
+
     def last_query_metadata(self) -> Optional[Dict[str, Any]]:
         if not self._last_query:
             return None
@@ -4,6 +4,7 @@ import logging
 from typing import Iterable, Optional, Dict, Any
 
 from ..vector.context_chunk import ContextChunk
+from .bulk_writer import active_write_buffer, bulk_graph_writes
 from .schema import NodeLabels, RelationshipTypes
 from .service import GraphService
 
@@ -24,11 +25,12 @@ class UniversalNodeWriter:
     def ingest_chunks(self, chunks: Iterable[ContextChunk]) -> None:
         if not self.available():
             return
-        for chunk in chunks:
-            try:
-                self._upsert_chunk(chunk)
-            except Exception as exc:  # pragma: no cover - defensive log
-                logger.warning("[GRAPH][CHUNK] Failed to upsert chunk %s: %s", chunk.chunk_id, exc)
+        with bulk_graph_writes(self.graph_service):
+            for chunk in chunks:
+                try:
+                    self._upsert_chunk(chunk)
+                except Exception as exc:  # pragma: no cover - defensive log
+                    logger.warning("[GRAPH][CHUNK] Failed to upsert chunk %s: %s", chunk.chunk_id, exc)
 
     # ------------------------------------------------------------------ #
     def _upsert_chunk(self, chunk: ContextChunk) -> None:
@@ -62,6 +64,19 @@ class UniversalNodeWriter:
             }
         )
 
+        buffer = active_write_buffer(self.graph_service)
+        if buffer is not None:
+            buffer.add_node(NodeLabels.SOURCE.value, source_id, source_props, track_created_at=True)
+            buffer.add_node(NodeLabels.CHUNK.value, chunk.chunk_id, chunk_props, track_created_at=True)
+            buffer.add_relationship(
+                NodeLabels.CHUNK.value,
+                chunk.chunk_id,
+                RelationshipTypes.BELONGS_TO.value,
+                NodeLabels.SOURCE.value,
+                source_id,
+            )
+            return
+
         params = {
             "source_id": source_id,
             "source_props": source_props,
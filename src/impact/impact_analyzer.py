@@ -39,11 +39,14 @@ def _group_files_by_component(
     default_repo: str,
 ) -> Dict[str, List[GitFileChange]]:
     grouped: Dict[str, List[GitFileChange]] = defaultdict(list)
+    files_by_repo: Dict[str, List[GitFileChange]] = defaultdict(list)
     for file_change in files:
-        repo = file_change.repo or default_repo
-        candidates = graph.components_for_file(repo, file_change.path)
-        for component_id in candidates:
-            grouped[component_id].append(file_change)
+        files_by_repo[file_change.repo or default_repo].append(file_change)
+    for repo, repo_files in files_by_repo.items():
+        resolved = graph.components_for_files(repo, [file_change.path for file_change in repo_files])
+        for file_change in repo_files:
+            for component_id in resolved[file_change.path]:
+                grouped[component_id].append(file_change)
     return grouped
 
 
@@ -154,36 +157,18 @@ class ImpactAnalyzer:
 
     def _walk_component_dependencies(self, seeds: Set[str]) -> Dict[str, ComponentDependencyInfo]:
         """
-        Traverse reverse component edges so we surface downstream dependents when an upstream component changes.
-        Adds confidence scoring, relation metadata, and guards against cycles.
+        Surface downstream dependents of changed components via reverse component edges.
+        Shortest depth wins; per-component closures are memoized on the dependency graph.
         """
         max_depth = max(1, self.impact_settings.default_max_depth)
-        dependency_map: Dict[str, ComponentDependencyInfo] = {}
-
-        def traverse(component_id: str, depth: int, chain: Set[str]) -> None:
-            if depth >= max_depth:
-                return
-            dependents = self.dependency_graph.reverse_component_dependencies.get(component_id, set())
-            for dependent in dependents:
-                if dependent in seeds or dependent in chain:
-                    continue
-                next_depth = depth + 1
-                relation = "direct" if next_depth == 1 else "indirect"
-                confidence = self._dependency_confidence(next_depth)
-                existing = dependency_map.get(dependent)
-                if existing and existing.depth <= next_depth:
-                    continue
-                dependency_map[dependent] = ComponentDependencyInfo(
-                    depth=next_depth,
-                    relation=relation,
-                    confidence=confidence,
-                )
-                traverse(dependent, next_depth, chain | {dependent})
-
-        for seed in seeds:
-            traverse(seed, 0, {seed})
-
-        return dependency_map
+        return {
+            dependent: ComponentDependencyInfo(
+                depth=depth,
+                relation="direct" if depth == 1 else "indirect",
+                confidence=self._dependency_confidence(depth),
+            )
+            for dependent, depth in self.dependency_graph.dependents_of(seeds, max_depth).items()
+        }
 
     @staticmethod
     def _dependency_confidence(depth: int) -> float:
@@ -8,6 +8,7 @@ import logging
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Set
 
+from ..cache.impact_cache import notify_activity
 from ..config.context import ConfigContext, get_config_context
 from ..graph import DependencyGraph, DependencyGraphBuilder, GraphIngestor, GraphService
 from ..utils.component_ids import normalize_component_ids
@@ -88,6 +89,7 @@ class ImpactPipeline:
         report = self.evidence_formatter.annotate(report)
         self._attach_reasoning_context(report)
         doc_issues = self._publish_report(report)
+        self._invalidate_cached_results(report, doc_issues)
         self._notify(report, doc_issues)
         return report
 
@@ -128,6 +130,7 @@ class ImpactPipeline:
         report = self.evidence_formatter.annotate(report)
         self._attach_reasoning_context(report)
         doc_issues = self._publish_report(report)
+        self._invalidate_cached_results(report, doc_issues, extra_components=seed_components)
         self._notify(report, doc_issues)
         return report
 
@@ -179,6 +182,26 @@ class ImpactPipeline:
             logger.warning("[IMPACT PIPELINE] Failed to persist impact graph event: %s", exc)
         return doc_issues
 
+    def _invalidate_cached_results(
+        self,
+        report: ImpactReport,
+        doc_issues: List[Dict[str, Any]],
+        *,
+        extra_components: Optional[Set[str]] = None,
+    ) -> None:
+        """Drop cached severity/impact results for everything this event touched."""
+        component_ids: Set[str] = set(extra_components or ())
+        for entity in report.changed_components + report.impacted_components:
+            component_ids.add(entity.entity_id)
+        issue_ids = [issue.get("id") for issue in doc_issues if isinstance(issue, dict)]
+        for issue in doc_issues:
+            if isinstance(issue, dict):
+                component_ids.update(issue.get("component_ids") or [])
+        try:
+            notify_activity(issue_ids=issue_ids, component_ids=component_ids)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.debug("[IMPACT PIPELINE] Cache invalidation failed: %s", exc)
+
     def _attach_reasoning_context(self, report: ImpactReport) -> None:
         context = {
             "impact_chain": self._format_impact_chain(report),
@@ -11,12 +11,13 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
 
+from ..cache.impact_cache import DEFAULT_MAX_ENTRIES, DEFAULT_TTL_SECONDS, ImpactResultCache
 from ..config.context import ConfigContext
 from ..graph import DependencyGraph, GraphService
 from ..services.github_pr_service import GitHubAPIError, GitHubPRService
 from ..utils.component_ids import resolve_component_id
 from ..utils.slack_links import build_slack_permalink
-from ..activity_graph.severity import compute_issue_severity
+from ..activity_graph.severity import compute_issue_severities, compute_issue_severity
 from .impact_analyzer import ImpactAnalyzer
 from .models import (
     GitChangePayload,
@@ -144,18 +145,17 @@ class GitIntegration:
         payloads: List[GitChangePayload] = []
         for commit in commits:
             sha = commit.get("sha")
-            files = []
-            matches: Set[str] = set()
-            for file_info in commit.get("files", []):
-                path = file_info.get("filename") or ""
-                files.append(
-                    GitFileChange(
-                        path=path,
-                        repo=repo_key,
-                        change_type=file_info.get("status", "modified"),
-                    )
+            files = [
+                GitFileChange(
+                    path=file_info.get("filename") or "",
+                    repo=repo_key,
+                    change_type=file_info.get("status", "modified"),
                 )
-                matched = graph.components_for_file(repo_key, path)
+                for file_info in commit.get("files", [])
+            ]
+            matches: Set[str] = set()
+            resolved = graph.components_for_files(repo_key, [file_change.path for file_change in files])
+            for matched in resolved.values():
                 matches.update(matched & target_components)
             if not matches:
                 continue
@@ -245,7 +245,11 @@ class ImpactService:
             or os.getenv("SLACK_TEAM_ID")
             or os.getenv("SLACK_WORKSPACE_ID")
         )
-        self._severity_cache: Dict[str, Dict[str, Any]] = {}
+        cache_cfg = impact_cfg.get("severity_cache") or {}
+        self._severity_cache = ImpactResultCache(
+            max_entries=cache_cfg.get("max_entries", DEFAULT_MAX_ENTRIES),
+            ttl_seconds=cache_cfg.get("ttl_seconds", DEFAULT_TTL_SECONDS),
+        )
 
     # ------------------------------------------------------------------
     # Public API helpers
@@ -333,14 +337,16 @@ class ImpactService:
             return True
 
         should_filter = any([source, component_id, service_id, repo_id])
-        enriched: List[Dict[str, Any]] = []
-        for raw_issue in issues:
-            if not isinstance(raw_issue, dict):
-                continue
-            if should_filter and not _matches(raw_issue):
-                continue
-            enriched.append(self._with_severity_metadata(raw_issue))
-        return enriched
+        selected = [
+            raw_issue
+            for raw_issue in issues
+            if isinstance(raw_issue, dict) and (not should_filter or _matches(raw_issue))
+        ]
+        severities = self._issue_severities(selected)
+        return [
+            self._with_severity_metadata(raw_issue, severities.get(raw_issue.get("id")))
+            for raw_issue in selected
+        ]
 
     # ------------------------------------------------------------------
     # Slack helpers
@@ -353,29 +359,21 @@ class ImpactService:
                 result.add(canonical)
         if not text:
             return result
-        lower_text = text.lower()
-        for component_id, metadata in self.graph.components.items():
-            candidate_terms = self._component_terms(component_id, metadata)
-            if any(term and term in lower_text for term in candidate_terms):
-                canonical = resolve_component_id(component_id)
-                if canonical:
-                    result.add(canonical)
+        for kind, component_id in self.graph.entity_matcher().find_values(text):
+            if kind != "component":
+                continue
+            canonical = resolve_component_id(component_id)
+            if canonical:
+                result.add(canonical)
         return result
 
     def _infer_apis(self, text: str, seeds: Optional[List[str]]) -> Set[str]:
         result: Set[str] = set(seeds or [])
         if not text:
             return result
-        lower_text = text.lower()
-        for api_id, metadata in self.graph.apis.items():
-            aliases = {
-                api_id.lower(),
-                str(metadata.get("path", "")).lower(),
-                str(metadata.get("name", "")).lower(),
-            }
-            aliases.update(str(alias).lower() for alias in metadata.get("aliases", []) or [])
-            if any(alias and alias in lower_text for alias in aliases):
-                result.add(api_id)
+        result.update(
+            api_id for kind, api_id in self.graph.entity_matcher().find_values(text) if kind == "api"
+        )
         return result
 
     def _collect_recent_changes(
@@ -427,19 +425,6 @@ class ImpactService:
     # ------------------------------------------------------------------
     # Utility helpers
 
-    @staticmethod
-    def _component_terms(component_id: str, metadata: Dict[str, object]) -> Set[str]:
-        terms: Set[str] = {component_id.lower()}
-        if ":" in component_id:
-            terms.add(component_id.split(":", 1)[-1].lower())
-        name = metadata.get("name")
-        if isinstance(name, str):
-            terms.add(name.lower())
-        for alias in metadata.get("aliases", []) or []:
-            if isinstance(alias, str):
-                terms.add(alias.lower())
-        return {term for term in terms if term}
-
     @staticmethod
     def _repo_key(repo_full: str) -> str:
         if not repo_full:
@@ -459,10 +444,14 @@ class ImpactService:
     # ------------------------------------------------------------------
     # Severity helpers
 
-    def _with_severity_metadata(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+    def _with_severity_metadata(
+        self,
+        issue: Dict[str, Any],
+        severity: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         enriched = dict(issue)
-        issue_id = issue.get("id")
-        severity = self._issue_severity(issue_id)
+        if severity is None:
+            severity = self._issue_severity(issue.get("id"), issue.get("component_ids"))
         if severity:
             enriched["severity_score"] = severity.get("score_0_10")
             enriched["severity_score_100"] = severity.get("score")
@@ -478,7 +467,11 @@ class ImpactService:
                 enriched["severity_semantic_pairs"] = severity["semantic_pairs"]
         return enriched
 
-    def _issue_severity(self, issue_id: Optional[str]) -> Optional[Dict[str, Any]]:
+    def _issue_severity(
+        self,
+        issue_id: Optional[str],
+        component_ids: Optional[Iterable[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
         if not issue_id:
             return None
         cached = self._severity_cache.get(issue_id)
@@ -495,9 +488,30 @@ class ImpactService:
             return None
         except Exception:
             return None
-        self._severity_cache[issue_id] = result
+        self._severity_cache.put(issue_id, result, component_ids=component_ids or ())
         return result
 
+    def _issue_severities(self, issues: Sequence[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Severity for many issues with one bulk computation for the cache misses."""
+        components_by_id = {
+            issue["id"]: issue.get("component_ids") or ()
+            for issue in issues
+            if issue.get("id")
+        }
+        results = self._severity_cache.get_many(components_by_id)
+        missing = [issue_id for issue_id in components_by_id if issue_id not in results]
+        if not missing or not self.graph_service or not self.graph_service.is_available():
+            return results
+        try:
+            computed = compute_issue_severities(missing, graph_service=self.graph_service)
+        except Exception as exc:
+            logger.debug("[IMPACT] Bulk severity computation failed: %s", exc)
+            return results
+        for issue_id, result in computed.items():
+            self._severity_cache.put(issue_id, result, component_ids=components_by_id.get(issue_id, ()))
+        results.update(computed)
+        return results
+
     # ------------------------------------------------------------------
     # Health reporting
 
@@ -531,6 +545,7 @@ class ImpactService:
             },
             "repos": repo_health,
             "recent_events": events,
+            "severity_cache": self._severity_cache.stats(),
         }
 
     def _recent_impact_events(self, *, limit: int) -> List[Dict[str, Any]]:
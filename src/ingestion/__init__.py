@@ -7,6 +7,7 @@ from .slack_activity_ingestor import SlackActivityIngestor
 from .git_activity_ingestor import GitActivityIngestor
 from .doc_issue_ingestor import DocIssueIngestor
 from .dependency_mapper import DependencyMapper
+from .scheduler import IngestionScheduler, IngestRunReport, IngestUnit
 
 __all__ = [
     "ActivityIngestState",
@@ -14,5 +15,8 @@ __all__ = [
     "GitActivityIngestor",
     "DocIssueIngestor",
     "DependencyMapper",
+    "IngestionScheduler",
+    "IngestRunReport",
+    "IngestUnit",
 ]
 
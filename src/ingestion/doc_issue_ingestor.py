@@ -9,6 +9,7 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
+from ..cache.impact_cache import notify_activity
 from ..graph import GraphIngestor, GraphService
 from ..utils.component_ids import normalize_component_ids
 
@@ -147,6 +148,7 @@ class DocIssueIngestor:
             sentiment_weight=sentiment_weight,
             last_seen=props.get("updated_at"),
         )
+        notify_activity(issue_ids=[str(issue_id)], component_ids=component_ids)
 
     @staticmethod
     def _coerce_ids(value: Any) -> List[str]:
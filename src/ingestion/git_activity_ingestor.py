@@ -10,6 +10,7 @@ from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 import time
 
 from ..graph import GraphIngestor, GraphService
+from ..graph.bulk_writer import bulk_graph_writes
 from ..graph.universal_nodes import UniversalNodeWriter
 from ..vector import ContextChunk, get_vector_search_service
 from ..vector.context_chunk import (
@@ -21,6 +22,7 @@ from ..services.github_pr_service import GitHubAPIError, GitHubPRService
 from ..settings.git import resolve_repo_branch
 from ..utils.component_ids import normalize_component_ids
 from .loggers import SignalLogWriter
+from .scheduler import IngestionScheduler, IngestUnit
 from .state import ActivityIngestState
 
 logger = logging.getLogger(__name__)
@@ -77,25 +79,34 @@ class GitActivityIngestor:
             logger.info("[GIT INGEST] Git ingestion disabled via config.")
             return {"prs": 0, "commits": 0, "issues": 0}
 
-        total_prs = 0
-        total_commits = 0
-        total_issues = 0
-        for repo_cfg in self.repos:
-            try:
-                repo_result = self._ingest_repo(repo_cfg)
-                total_prs += repo_result.get("prs", 0)
-                total_commits += repo_result.get("commits", 0)
-                total_issues += repo_result.get("issues", 0)
-            except GitHubAPIError as exc:
-                logger.error("[GIT INGEST] GitHub API error for repo %s/%s: %s",
-                             repo_cfg.get("owner"), repo_cfg.get("name"), exc)
-            except Exception:
-                logger.exception("[GIT INGEST] Unexpected error for repo %s/%s",
-                                 repo_cfg.get("owner"), repo_cfg.get("name"))
+        report = IngestionScheduler.from_config(self._config, self.state_store).run(self.ingest_units())
+        totals = report.totals("git")
+        total_prs = totals.get("prs", 0)
+        total_commits = totals.get("commits", 0)
+        total_issues = totals.get("issues", 0)
 
         logger.info("[GIT INGEST] Completed ingestion (PRs=%s, commits=%s, issues=%s)", total_prs, total_commits, total_issues)
         return {"prs": total_prs, "commits": total_commits, "issues": total_issues}
 
+    def ingest_units(self) -> List[IngestUnit]:
+        """One schedulable unit per configured repo (see `IngestionScheduler`)."""
+        if not self.enabled:
+            return []
+        units: List[IngestUnit] = []
+        for repo_cfg in self.repos:
+            key = f"{repo_cfg.get('owner')}/{repo_cfg.get('name')}"
+            units.append(IngestUnit("git", key, lambda repo_cfg=repo_cfg: self._run_repo_unit(repo_cfg)))
+        return units
+
+    def _run_repo_unit(self, repo_cfg: Dict[str, Any]) -> Dict[str, int]:
+        try:
+            with bulk_graph_writes(self.graph_service):
+                return self._ingest_repo(repo_cfg)
+        except GitHubAPIError as exc:
+            logger.error("[GIT INGEST] GitHub API error for repo %s/%s: %s",
+                         repo_cfg.get("owner"), repo_cfg.get("name"), exc)
+            raise
+
     def close(self) -> None:
         if self.graph_service:
             self.graph_service.close()
@@ -394,16 +405,21 @@ class GitActivityIngestor:
         latest_time = last_pr_updated
         vector_chunks: List[ContextChunk] = []
 
+        pending_prs = []
         for pr in sorted(prs, key=lambda item: item.get("updated_at") or "", reverse=False):
             updated_at = pr.get("updated_at") or pr.get("created_at")
             updated_dt = self._parse_datetime(updated_at)
             if updated_dt and cutoff_dt and updated_dt <= cutoff_dt:
                 continue
+            pending_prs.append(pr)
 
+        # Details and diffs for every new PR are fetched concurrently up front.
+        snapshots = service.fetch_pr_snapshots([pr["number"] for pr in pending_prs])
+
+        for pr, (pr_details, diff_summary) in zip(pending_prs, snapshots):
+            updated_at = pr.get("updated_at") or pr.get("created_at")
             number = pr["number"]
             pr_entity_id = generate_pr_entity_id(number, repo_identifier)
-            pr_details = service.fetch_pr_details(number)
-            diff_summary = service.fetch_pr_diff_summary(number)
             component_ids, endpoint_ids, artifact_paths = self._resolve_artifacts(diff_summary.get("files", []), repo_cfg)
 
             self._upsert_artifacts(repo_identifier, artifact_paths, component_ids)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from ..cache.impact_cache import notify_activity
 from ..utils.component_ids import normalize_component_ids
 
 
@@ -17,27 +19,36 @@ class SignalLogWriter:
         self.path = Path(path) if path else None
         if self.path:
             self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Repos/channels are ingested concurrently; keep each line intact.
+        self._lock = threading.Lock()
 
     def write(self, record: Dict[str, Any]) -> None:
         if not self.path:
+            notify_activity(component_ids=_as_list(record.get("component_ids")))
             return
         payload = self._prepare_record(record)
         serialized = json.dumps(payload, ensure_ascii=False)
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(serialized)
-            handle.write("\n")
+        with self._lock, self.path.open("a", encoding="utf-8") as handle:
+            handle.write(serialized + "\n")
+        # New activity makes cached severity/impact results for these components stale.
+        notify_activity(component_ids=payload.get("component_ids") or ())
 
     @staticmethod
     def _prepare_record(record: Dict[str, Any]) -> Dict[str, Any]:
         payload = dict(record)
         component_ids = payload.get("component_ids")
         if component_ids:
-            if isinstance(component_ids, Iterable) and not isinstance(component_ids, (str, bytes)):
-                payload["component_ids"] = normalize_component_ids(component_ids)
-            else:
-                payload["component_ids"] = normalize_component_ids([component_ids])
+            payload["component_ids"] = normalize_component_ids(_as_list(component_ids))
         return payload
 
 
+def _as_list(component_ids: Any) -> List[Any]:
+    if not component_ids:
+        return []
+    if isinstance(component_ids, Iterable) and not isinstance(component_ids, (str, bytes)):
+        return list(component_ids)
+    return [component_ids]
+
+
 __all__ = ["SignalLogWriter"]
 
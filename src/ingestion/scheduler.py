@@ -0,0 +1,301 @@
+"""
+Parallel scheduler for per-repo / per-channel activity ingestion.
+
+`GitActivityIngestor` and `SlackActivityIngestor` expose their work as
+`IngestUnit`s (one per repo or channel). The scheduler runs them on a worker
+pool per source, so a refresh takes about as long as its slowest unit instead
+of the sum of all of them.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+from .state import ActivityIngestState
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+DEFAULT_BACKOFF_BASE_SECONDS = 60.0
+DEFAULT_BACKOFF_MAX_SECONDS = 3600.0
+
+
+@dataclass
+class IngestUnit:
+    """One independently schedulable slice of ingestion (a repo, a channel)."""
+
+    source: str
+    key: str
+    run: Callable[[], Mapping[str, int]]
+
+    @property
+    def state_key(self) -> str:
+        return f"scheduler_{self.source}_{self.key}"
+
+
+@dataclass
+class IngestUnitResult:
+    source: str
+    key: str
+    status: str  # ok | failed | backoff
+    items: Dict[str, int] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+    error: Optional[str] = None
+    retry_at: Optional[float] = None
+
+
+@dataclass
+class IngestRunReport:
+    """Combined progress/throughput report for one scheduler run."""
+
+    results: List[IngestUnitResult] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    def totals(self, source: Optional[str] = None) -> Dict[str, int]:
+        totals: Dict[str, int] = {}
+        for result in self.results:
+            if source and result.source != source:
+                continue
+            for name, count in result.items.items():
+                totals[name] = totals.get(name, 0) + int(count or 0)
+        return totals
+
+    def to_dict(self) -> Dict[str, Any]:
+        sources: Dict[str, Dict[str, Any]] = {}
+        for result in self.results:
+            summary = sources.setdefault(
+                result.source,
+                {"units": 0, "ok": 0, "failed": 0, "backoff": 0, "busy_seconds": 0.0, "slowest": None},
+            )
+            summary["units"] += 1
+            summary[result.status] += 1
+            summary["busy_seconds"] += result.duration_seconds
+            slowest = summary["slowest"]
+            if result.status != "backoff" and (slowest is None or result.duration_seconds > slowest["seconds"]):
+                summary["slowest"] = {"key": result.key, "seconds": round(result.duration_seconds, 3)}
+        for source, summary in sources.items():
+            items = self.totals(source)
+            summary["items"] = items
+            summary["busy_seconds"] = round(summary["busy_seconds"], 3)
+            summary["items_per_second"] = (
+                round(sum(items.values()) / self.wall_seconds, 2) if self.wall_seconds > 0 else 0.0
+            )
+        return {
+            "wall_seconds": round(self.wall_seconds, 3),
+            "sources": sources,
+            "units": [
+                {
+                    "source": result.source,
+                    "key": result.key,
+                    "status": result.status,
+                    "items": result.items,
+                    "seconds": round(result.duration_seconds, 3),
+                    "error": result.error,
+                }
+                for result in self.results
+            ],
+        }
+
+
+class IngestionScheduler:
+    """
+    Runs `IngestUnit`s on per-source worker pools with per-unit failure backoff.
+
+    - Each source (``git``, ``slack``) gets its own pool of
+      ``activity_ingest.scheduler.workers.<source>`` threads, so a slow source
+      never holds up another.
+    - Within a source, units that have waited longest since their last success
+      go first, and each unit occupies a single worker, so one large repo
+      cannot starve the rest.
+    - A failing unit is isolated: its error is recorded, the other units keep
+      running, and it is skipped with exponential backoff on later runs.
+      Scheduling state lives in `ActivityIngestState` next to the ingestors'
+      own cursors.
+    """
+
+    def __init__(
+        self,
+        state_store: ActivityIngestState,
+        *,
+        workers: Optional[Mapping[str, int]] = None,
+        default_workers: int = DEFAULT_WORKERS,
+        backoff_base_seconds: float = DEFAULT_BACKOFF_BASE_SECONDS,
+        backoff_max_seconds: float = DEFAULT_BACKOFF_MAX_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.state_store = state_store
+        self.workers = dict(workers or {})
+        self.default_workers = max(1, int(default_workers))
+        self.backoff_base_seconds = float(backoff_base_seconds)
+        self.backoff_max_seconds = float(backoff_max_seconds)
+        self.clock = clock
+        self._state_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], state_store: Optional[ActivityIngestState] = None) -> "IngestionScheduler":
+        activity_cfg = config.get("activity_ingest") or {}
+        scheduler_cfg = activity_cfg.get("scheduler") or {}
+        return cls(
+            state_store or ActivityIngestState(activity_cfg.get("state_dir", "data/state/activity_ingest")),
+            workers=scheduler_cfg.get("workers") or {},
+            default_workers=scheduler_cfg.get("default_workers", DEFAULT_WORKERS),
+            backoff_base_seconds=scheduler_cfg.get("backoff_base_seconds", DEFAULT_BACKOFF_BASE_SECONDS),
+            backoff_max_seconds=scheduler_cfg.get("backoff_max_seconds", DEFAULT_BACKOFF_MAX_SECONDS),
+        )
+
+    def run(
+        self,
+        units: Iterable[IngestUnit],
+        *,
+        force: bool = False,
+        on_progress: Optional[Callable[[IngestUnitResult, int, int], None]] = None,
+    ) -> IngestRunReport:
+        """
+        Run every unit once and return the combined report.
+
+        ``force`` ignores backoff windows. ``on_progress(result, done, total)``
+        is called as each unit finishes (from the calling thread).
+        """
+        units = list(units)
+        report = IngestRunReport()
+        started = time.perf_counter()
+        now = self.clock()
+
+        runnable: Dict[str, List[IngestUnit]] = {}
+        states: Dict[str, Dict[str, Any]] = {}
+        for unit in units:
+            state = self.state_store.load(unit.state_key)
+            states[unit.state_key] = state
+            retry_at = state.get("next_attempt_at")
+            if not force and retry_at and retry_at > now:
+                report.results.append(
+                    IngestUnitResult(unit.source, unit.key, "backoff", retry_at=retry_at, error=state.get("last_error"))
+                )
+                continue
+            runnable.setdefault(unit.source, []).append(unit)
+
+        total = len(units)
+        done = len(report.results)
+        for result in list(report.results):
+            self._notify(on_progress, result, done, total)
+
+        executors: Dict[str, ThreadPoolExecutor] = {}
+        futures: Dict[Future, IngestUnit] = {}
+        try:
+            for source, source_units in runnable.items():
+                # Least recently successful first; never-run units lead.
+                source_units.sort(key=lambda unit: states[unit.state_key].get("last_success_at") or 0.0)
+                workers = max(1, int(self.workers.get(source, self.default_workers)))
+                executor = ThreadPoolExecutor(
+                    max_workers=min(workers, len(source_units)),
+                    thread_name_prefix=f"ingest-{source}",
+                )
+                executors[source] = executor
+                for unit in source_units:
+                    futures[executor.submit(self._run_unit, unit, states[unit.state_key])] = unit
+
+            pending = set(futures)
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    result = future.result()
+                    report.results.append(result)
+                    done += 1
+                    self._notify(on_progress, result, done, total)
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True)
+
+        report.wall_seconds = time.perf_counter() - started
+        summary = report.to_dict()
+        for source, stats in summary["sources"].items():
+            logger.info(
+                "[INGEST SCHEDULER] %s: %s ok, %s failed, %s in backoff; items=%s (%.2f/s, busy %.1fs)",
+                source,
+                stats["ok"],
+                stats["failed"],
+                stats["backoff"],
+                stats["items"],
+                stats["items_per_second"],
+                stats["busy_seconds"],
+            )
+        logger.info("[INGEST SCHEDULER] Run finished in %.2fs across %s units", report.wall_seconds, total)
+        return report
+
+    def _run_unit(self, unit: IngestUnit, state: Dict[str, Any]) -> IngestUnitResult:
+        started = time.perf_counter()
+        attempted_at = self.clock()
+        try:
+            items = dict(unit.run() or {})
+        except Exception as exc:  # isolate failures to this unit
+            duration = time.perf_counter() - started
+            failures = int(state.get("consecutive_failures") or 0) + 1
+            delay = min(self.backoff_max_seconds, self.backoff_base_seconds * (2 ** (failures - 1)))
+            retry_at = attempted_at + delay
+            logger.warning(
+                "[INGEST SCHEDULER] %s %s failed (%s consecutive); retrying after %.0fs: %s",
+                unit.source,
+                unit.key,
+                failures,
+                delay,
+                exc,
+            )
+            self._save_state(
+                unit,
+                {
+                    **state,
+                    "last_attempt_at": attempted_at,
+                    "consecutive_failures": failures,
+                    "next_attempt_at": retry_at,
+                    "last_error": str(exc),
+                    "last_duration_seconds": duration,
+                },
+            )
+            return IngestUnitResult(unit.source, unit.key, "failed", {}, duration, str(exc), retry_at)
+
+        duration = time.perf_counter() - started
+        self._save_state(
+            unit,
+            {
+                "last_attempt_at": attempted_at,
+                "last_success_at": attempted_at,
+                "consecutive_failures": 0,
+                "next_attempt_at": None,
+                "last_error": None,
+                "last_duration_seconds": duration,
+                "last_items": items,
+            },
+        )
+        return IngestUnitResult(unit.source, unit.key, "ok", items, duration)
+
+    def _save_state(self, unit: IngestUnit, state: Dict[str, Any]) -> None:
+        try:
+            with self._state_lock:
+                self.state_store.save(unit.state_key, state)
+        except OSError as exc:  # pragma: no cover - disk issues should not fail the run
+            logger.warning("[INGEST SCHEDULER] Failed to persist state for %s: %s", unit.state_key, exc)
+
+    @staticmethod
+    def _notify(
+        on_progress: Optional[Callable[[IngestUnitResult, int, int], None]],
+        result: IngestUnitResult,
+        done: int,
+        total: int,
+    ) -> None:
+        logger.info(
+            "[INGEST SCHEDULER] %s/%s %s %s %s in %.2fs %s",
+            done,
+            total,
+            result.source,
+            result.key,
+            result.status,
+            result.duration_seconds,
+            result.items or "",
+        )
+        if on_progress:
+            on_progress(result, done, total)
@@ -12,6 +12,7 @@ import time
 import os
 
 from ..graph import GraphIngestor, GraphService
+from ..graph.bulk_writer import bulk_graph_writes
 from ..graph.universal_nodes import UniversalNodeWriter
 from ..vector import ContextChunk, get_vector_search_service
 from ..vector.context_chunk import generate_slack_entity_id
@@ -19,6 +20,7 @@ from ..integrations.slack_client import SlackAPIClient, SlackAPIError
 from ..utils.component_ids import normalize_component_ids, resolve_component_id
 from ..utils.slack_links import build_slack_permalink
 from .loggers import SignalLogWriter
+from .scheduler import IngestionScheduler, IngestUnit
 from .state import ActivityIngestState
 
 logger = logging.getLogger(__name__)
@@ -35,6 +37,7 @@ class SlackActivityIngestor:
         graph_service: Optional[GraphService] = None,
         vector_service=None,
     ):
+        self._config = config
         activity_cfg = config.get("activity_ingest", {})
         self.slack_cfg = activity_cfg.get("slack") or {}
         self.enabled = bool(self.slack_cfg.get("enabled", False))
@@ -82,20 +85,33 @@ class SlackActivityIngestor:
             logger.warning("[SLACK INGEST] Slack client unavailable, skipping ingestion.")
             return {"ingested": 0}
 
-        total_messages = 0
-        channels = self.slack_cfg.get("channels", [])
-        for channel_cfg in channels:
-            try:
-                ingested = self._ingest_channel(channel_cfg)
-                total_messages += ingested
-            except SlackAPIError as exc:
-                logger.error("[SLACK INGEST] Failed channel %s: %s", channel_cfg.get("id"), exc)
-            except Exception as exc:
-                logger.exception("[SLACK INGEST] Unexpected error for channel %s", channel_cfg.get("id"))
+        report = IngestionScheduler.from_config(self._config, self.state_store).run(self.ingest_units())
+        total_messages = report.totals("slack").get("messages", 0)
 
         logger.info("[SLACK INGEST] Completed ingestion (%s messages)", total_messages)
         return {"ingested": total_messages}
 
+    def ingest_units(self) -> List[IngestUnit]:
+        """One schedulable unit per configured channel (see `IngestionScheduler`)."""
+        if not self.enabled or not self.client:
+            return []
+        return [
+            IngestUnit(
+                "slack",
+                str(channel_cfg.get("id") or channel_cfg.get("name")),
+                lambda channel_cfg=channel_cfg: self._run_channel_unit(channel_cfg),
+            )
+            for channel_cfg in self.slack_cfg.get("channels", [])
+        ]
+
+    def _run_channel_unit(self, channel_cfg: Dict[str, Any]) -> Dict[str, int]:
+        try:
+            with bulk_graph_writes(self.graph_service):
+                return {"messages": self._ingest_channel(channel_cfg)}
+        except SlackAPIError as exc:
+            logger.error("[SLACK INGEST] Failed channel %s: %s", channel_cfg.get("id"), exc)
+            raise
+
     def ingest_fixture_messages(self, fixtures: Dict[str, Any]) -> Dict[str, int]:
         """
         Ingest synthetic Slack messages from a fixture dictionary.
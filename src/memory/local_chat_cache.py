@@ -1,18 +1,44 @@
 """
 In-memory chat cache with optional disk persistence and flush queue support.
+
+Disk persistence appends each message to ``<disk_path>/<session_id>.jsonl``.
+By default every append opens, writes and closes the file on the caller's
+thread. With ``write_behind=True`` messages are buffered per session instead
+and a background writer appends them in batches, once ``flush_max_messages``
+are buffered or ``flush_interval_ms`` has passed, keeping one open handle per
+active session. ``durability`` controls what a batch guarantees:
+
+- ``none``   written to the OS, never fsynced
+- ``batch``  one fsync per touched file per batch
+- ``fsync``  as ``batch``, and ``append_message`` waits until its batch is
+             fsynced (concurrent appends share the fsync)
+
+With ``rehydrate=True`` the most recent messages of every session are
+loaded back into memory on startup, so ``list_recent`` never reads disk.
+``tail_index.json`` records, per session, the file size and the offset of
+the oldest retained message, so rehydration seeks straight to the tail
+instead of reading whole files. Rehydration only reads: a torn trailing
+write found there is cut off just before the first append to that file.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
-from collections import deque
+import os
+import time
+from collections import OrderedDict, deque
 from pathlib import Path
-from threading import RLock
-from typing import Any, Deque, Dict, List
+from threading import Condition, RLock, Thread
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+DURABILITY_MODES = ("none", "batch", "fsync")
+TAIL_INDEX_FILENAME = "tail_index.json"
+MAX_OPEN_FILES = 128
+
 
 class LocalChatCache:
     """Stores recent chat messages per session and tracks pending flushes."""
@@ -22,6 +48,12 @@ class LocalChatCache:
         max_messages_per_session: int = 75,
         disk_path: str = "data/cache/chat_sessions",
         flush_enabled: bool = True,
+        *,
+        write_behind: bool = False,
+        durability: str = "batch",
+        flush_max_messages: int = 64,
+        flush_interval_ms: float = 250,
+        rehydrate: bool = False,
     ) -> None:
         self._max_messages = max(1, max_messages_per_session)
         self._disk_path = Path(disk_path)
@@ -30,6 +62,37 @@ class LocalChatCache:
         self._pending: Deque[Dict] = deque()
         self._lock = RLock()
         self._flush_enabled = flush_enabled
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {DURABILITY_MODES}, got {durability!r}")
+        self._durability = durability
+        self._flush_max_messages = max(1, int(flush_max_messages))
+        self._flush_interval = max(0.0, float(flush_interval_ms) / 1000.0)
+
+        # Write-behind state; buffers are guarded by _lock, file state is writer-only.
+        self._buffers: Dict[str, List[str]] = {}
+        self._buffered = 0
+        self._first_buffered_at = 0.0
+        self._enqueued = 0
+        self._durable = 0
+        self._flush_requested = False
+        self._stopping = False
+        self._wake = Condition(self._lock)
+        self._flushed = Condition(self._lock)
+        self._handles: "OrderedDict[str, Any]" = OrderedDict()
+        self._tail_offsets: Dict[str, Deque[int]] = {}
+        self._file_sizes: Dict[str, int] = {}
+        self._rehydrated_sessions = 0
+        # session -> (end of the last complete record, file size) for files whose last line is unterminated
+        self._torn_tails: Dict[str, Tuple[int, int]] = {}
+
+        if rehydrate:
+            self._rehydrate()
+
+        self._writer: Optional[Thread] = None
+        if write_behind:
+            self._writer = Thread(target=self._run_writer, name="chat-cache-writer", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
 
     def append_message(self, message: Dict, persist_to_disk: bool = True) -> None:
         """Add message to in-memory cache and queue it for persistence."""
@@ -39,8 +102,26 @@ class LocalChatCache:
             bucket.append(message)
             if self._flush_enabled:
                 self._pending.append(message)
-            if persist_to_disk:
+            if not persist_to_disk:
+                return
+            if self._writer is None:
                 self._append_to_disk(session_id, message)
+                return
+            try:
+                line = json.dumps(message) + "\n"
+            except Exception as exc:
+                logger.debug("[CHAT CACHE] Failed to serialize message: %s", exc)
+                return
+            if not self._buffered:
+                self._first_buffered_at = time.monotonic()
+            self._buffers.setdefault(session_id, []).append(line)
+            self._buffered += 1
+            self._enqueued += 1
+            if self._durability == "fsync":
+                self._wait_durable_locked(self._enqueued)
+            elif self._buffered == 1 or self._buffered >= self._flush_max_messages:
+                # Wake the writer to start the interval timer, or to flush a full batch.
+                self._wake.notify()
 
     def list_recent(self, session_id: str, limit: int = 20) -> List[Dict]:
         """Return cached messages for a session (most recent first)."""
@@ -63,21 +144,222 @@ class LocalChatCache:
                 batch.append(self._pending.popleft())
             return batch
 
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Write every buffered message to disk now (no-op without write-behind)."""
+        with self._lock:
+            if self._writer is None or self._durable >= self._enqueued:
+                return True
+            return self._wait_durable_locked(self._enqueued, timeout)
+
+    def close(self) -> None:
+        """Drain buffered messages and stop the writer; later appends are written synchronously."""
+        with self._lock:
+            writer, self._writer = self._writer, None
+            if writer is None:
+                return
+            self._stopping = True
+            self._wake.notify()
+        writer.join(timeout=10)
+        with self._lock:
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
+
     def describe(self) -> Dict[str, Any]:
         """Return cache configuration useful for health endpoints."""
         return {
             "max_messages_per_session": self._max_messages,
             "disk_path": str(self._disk_path),
             "flush_enabled": self._flush_enabled,
+            "write_behind": self._writer is not None,
+            "durability": self._durability,
+            "buffered_messages": self._buffered,
+            "rehydrated_sessions": self._rehydrated_sessions,
         }
 
     def _append_to_disk(self, session_id: str, message: Dict) -> None:
         """Persist message to JSONL file for offline recovery."""
         try:
             file_path = self._disk_path / f"{session_id}.jsonl"
+            self._repair_torn_tail(session_id, file_path)
             with file_path.open("a", encoding="utf-8") as handle:
                 json.dump(message, handle)
                 handle.write("\n")
         except Exception as exc:
             logger.debug("[CHAT CACHE] Failed to write disk cache: %s", exc)
 
+    # ------------------------------------------------------------------
+    # Write-behind
+
+    def _wait_durable_locked(self, ticket: int, timeout: Optional[float] = None) -> bool:
+        self._flush_requested = True
+        self._wake.notify()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._durable < ticket:
+            if self._stopping and self._writer is None and not self._buffered:
+                break
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._flushed.wait(remaining if remaining is not None else 1.0)
+        return True
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._lock:
+                while not self._buffered and not self._stopping:
+                    self._wake.wait()
+                while (
+                    self._buffered < self._flush_max_messages
+                    and not self._flush_requested
+                    and not self._stopping
+                ):
+                    remaining = self._first_buffered_at + self._flush_interval - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wake.wait(remaining)
+                buffers, self._buffers = self._buffers, {}
+                self._buffered = 0
+                self._flush_requested = False
+                ticket = self._enqueued
+                stopping = self._stopping
+            if buffers:
+                self._write_buffers(buffers)
+            with self._lock:
+                self._durable = ticket
+                self._flushed.notify_all()
+                if stopping and not self._buffered:
+                    return
+
+    def _write_buffers(self, buffers: Dict[str, List[str]]) -> None:
+        for session_id, lines in buffers.items():
+            try:
+                handle = self._handle(session_id)
+                offsets = self._tail_offsets.setdefault(session_id, deque(maxlen=self._max_messages))
+                offset = handle.tell()
+                for line in lines:
+                    data = line.encode("utf-8")
+                    offsets.append(offset)
+                    handle.write(data)
+                    offset += len(data)
+                handle.flush()
+                if self._durability != "none":
+                    os.fsync(handle.fileno())
+                self._file_sizes[session_id] = offset
+            except Exception as exc:
+                logger.debug("[CHAT CACHE] Failed to write disk cache for %s: %s", session_id, exc)
+        self._save_tail_index()
+
+    def _handle(self, session_id: str) -> Any:
+        handle = self._handles.get(session_id)
+        if handle is not None:
+            self._handles.move_to_end(session_id)
+            return handle
+        path = self._disk_path / f"{session_id}.jsonl"
+        self._repair_torn_tail(session_id, path)
+        handle = path.open("ab")
+        self._handles[session_id] = handle
+        while len(self._handles) > MAX_OPEN_FILES:
+            _, stale = self._handles.popitem(last=False)
+            stale.close()
+        return handle
+
+    # ------------------------------------------------------------------
+    # Tail index / rehydration
+
+    def _save_tail_index(self) -> None:
+        payload = {
+            session_id: [self._file_sizes[session_id], offsets[0]]
+            for session_id, offsets in self._tail_offsets.items()
+            if offsets and session_id in self._file_sizes
+        }
+        tmp_path = self._disk_path / f"{TAIL_INDEX_FILENAME}.tmp"
+        try:
+            tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp_path, self._disk_path / TAIL_INDEX_FILENAME)
+        except OSError as exc:
+            logger.debug("[CHAT CACHE] Failed to write tail index: %s", exc)
+
+    def _load_tail_index(self) -> Dict[str, Tuple[int, int]]:
+        try:
+            payload = json.loads((self._disk_path / TAIL_INDEX_FILENAME).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+        return {
+            session_id: (int(entry[0]), int(entry[1]))
+            for session_id, entry in payload.items()
+            if isinstance(entry, list) and len(entry) == 2
+        }
+
+    def _repair_torn_tail(self, session_id: str, path: Path) -> None:
+        """
+        Fix the unterminated last line seen during rehydration, unless the file changed since.
+
+        A torn write (``clean_end < size``) is cut off; a complete record that only
+        lacks its newline gets one, so the next append starts on a clean line.
+        """
+        torn = self._torn_tails.pop(session_id, None)
+        if torn is None:
+            return
+        clean_end, scanned_size = torn
+        try:
+            with path.open("r+b") as handle:
+                if os.fstat(handle.fileno()).st_size != scanned_size:
+                    return
+                if clean_end < scanned_size:
+                    handle.truncate(clean_end)
+                else:
+                    handle.seek(0, os.SEEK_END)
+                    handle.write(b"\n")
+        except OSError as exc:
+            logger.debug("[CHAT CACHE] Failed to repair the tail of %s: %s", path.name, exc)
+
+    def _rehydrate(self) -> None:
+        """Load the newest ``max_messages_per_session`` messages of every session file."""
+        tail_index = self._load_tail_index()
+        for path in self._disk_path.glob("*.jsonl"):
+            session_id = path.stem
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            recorded_size, tail_offset = tail_index.get(session_id, (0, 0))
+            if not (0 <= tail_offset <= recorded_size <= size):
+                tail_offset = 0  # file was replaced or truncated; read it all once
+            bucket: Deque[Dict] = deque(maxlen=self._max_messages)
+            offsets: Deque[int] = deque(maxlen=self._max_messages)
+            offset = tail_offset
+            unterminated = False
+            try:
+                with path.open("rb") as handle:
+                    handle.seek(tail_offset)
+                    for line in handle:
+                        try:
+                            message = json.loads(line)
+                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            message = None
+                        if not line.endswith(b"\n"):
+                            # Only the last line can lack a newline. If it does not parse it is a
+                            # torn write and is left out; a complete record just needs terminating.
+                            unterminated = True
+                            if message is None:
+                                break
+                        if isinstance(message, dict):
+                            bucket.append(message)
+                            offsets.append(offset)
+                        offset += len(line)
+            except OSError as exc:
+                logger.debug("[CHAT CACHE] Failed to rehydrate %s: %s", path.name, exc)
+                continue
+            if unterminated:
+                # Repaired before the next append to this file; rehydration itself never writes.
+                self._torn_tails[session_id] = (offset, size)
+            if bucket:
+                self._sessions[session_id] = bucket
+                self._tail_offsets[session_id] = offsets
+                self._file_sizes[session_id] = offset
+                self._rehydrated_sessions += 1
+        if self._rehydrated_sessions:
+            logger.info("[CHAT CACHE] Rehydrated %s chat sessions from %s", self._rehydrated_sessions, self._disk_path)
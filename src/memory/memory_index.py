@@ -0,0 +1,233 @@
+"""
+MemoryIndex - lookup and filter structures for UserMemoryStore.
+
+- ``memory_id -> MemoryEntry`` and ``memory_id -> FAISS row`` dicts for O(1) access
+- per-category and per-tag row bitmaps (plus liveness and expiry columns) that
+  are combined into a FAISS ``IDSelectorBitmap`` so filtering happens inside
+  the ANN search instead of after an over-fetch
+- cached lowercase content and word sets, plus a word -> memory_id inverted
+  index, so the text-search fallback only visits memories that can match
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle guard
+    from .user_memory_store import MemoryEntry
+
+_INITIAL_CAPACITY = 64
+
+
+class _RowBitmap:
+    """Growable boolean column indexed by FAISS row."""
+
+    __slots__ = ("bits", "count")
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY):
+        self.bits = np.zeros(capacity, dtype=bool)
+        self.count = 0
+
+    def set(self, row: int, value: bool) -> None:
+        if row >= self.bits.shape[0]:
+            grown = np.zeros(max(row + 1, self.bits.shape[0] * 2), dtype=bool)
+            grown[: self.bits.shape[0]] = self.bits
+            self.bits = grown
+        if self.bits[row] != value:
+            self.count += 1 if value else -1
+            self.bits[row] = value
+
+    def view(self, size: int) -> np.ndarray:
+        if size <= self.bits.shape[0]:
+            return self.bits[:size]
+        padded = np.zeros(size, dtype=bool)
+        padded[: self.bits.shape[0]] = self.bits
+        return padded
+
+
+class MemoryIndex:
+    """In-memory indexes over a user's memories, keyed by FAISS row."""
+
+    def __init__(self):
+        self.memories: Dict[str, "MemoryEntry"] = {}
+        self.row_ids: List[str] = []  # FAISS row -> memory_id
+        self.rows: Dict[str, int] = {}  # memory_id -> FAISS row
+        self._alive = _RowBitmap()
+        self._expires_at = np.full(_INITIAL_CAPACITY, np.inf, dtype=np.float64)
+        self._categories: Dict[str, _RowBitmap] = {}
+        self._tags: Dict[str, _RowBitmap] = {}
+        self._row_terms: Dict[int, Tuple[str, Tuple[str, ...]]] = {}
+        self._tokens: Dict[str, Tuple[str, str, FrozenSet[str]]] = {}
+        self._postings: Dict[str, Set[str]] = {}  # word -> memory_ids
+        self._order: Dict[str, int] = {}  # memory_id -> insertion sequence
+        self._next_order = 0
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def clear_rows(self) -> None:
+        """Forget FAISS row assignments (before the FAISS index is rebuilt)."""
+        self.row_ids = []
+        self.rows = {}
+        self._alive = _RowBitmap()
+        self._expires_at = np.full(_INITIAL_CAPACITY, np.inf, dtype=np.float64)
+        self._categories = {}
+        self._tags = {}
+        self._row_terms = {}
+
+    def add(self, memory: "MemoryEntry", *, indexed: bool) -> None:
+        """Register ``memory``; ``indexed`` means its embedding was appended to FAISS as the next row."""
+        self.memories[memory.memory_id] = memory
+        if memory.memory_id not in self._order:
+            self._order[memory.memory_id] = self._next_order
+            self._next_order += 1
+        self.terms(memory)
+        if not indexed:
+            return
+        row = len(self.row_ids)
+        self.row_ids.append(memory.memory_id)
+        self.rows[memory.memory_id] = row
+        self._alive.set(row, True)
+        self._index_row(row, memory)
+
+    def refresh(self, memory: "MemoryEntry") -> None:
+        """Re-derive filter bits after category/tags/ttl/content changed."""
+        self._index_terms(memory)
+        row = self.rows.get(memory.memory_id)
+        if row is not None:
+            self._unindex_row(row)
+            self._index_row(row, memory)
+
+    def remove(self, memory_id: str) -> Optional["MemoryEntry"]:
+        memory = self.memories.pop(memory_id, None)
+        self._unindex_terms(memory_id)
+        self._order.pop(memory_id, None)
+        row = self.rows.pop(memory_id, None)
+        if row is not None:
+            self._alive.set(row, False)
+            self._unindex_row(row)
+        return memory
+
+    @property
+    def dead_rows(self) -> int:
+        return len(self.row_ids) - self._alive.count
+
+    def _index_row(self, row: int, memory: "MemoryEntry") -> None:
+        tags = tuple(dict.fromkeys(memory.tags or []))
+        self._row_terms[row] = (memory.category, tags)
+        self._categories.setdefault(memory.category, _RowBitmap()).set(row, True)
+        for tag in tags:
+            self._tags.setdefault(tag, _RowBitmap()).set(row, True)
+        if row >= self._expires_at.shape[0]:
+            grown = np.full(max(row + 1, self._expires_at.shape[0] * 2), np.inf, dtype=np.float64)
+            grown[: self._expires_at.shape[0]] = self._expires_at
+            self._expires_at = grown
+        self._expires_at[row] = _expiry_timestamp(memory)
+
+    def _unindex_row(self, row: int) -> None:
+        category, tags = self._row_terms.pop(row, (None, ()))
+        if category in self._categories:
+            self._categories[category].set(row, False)
+        for tag in tags:
+            if tag in self._tags:
+                self._tags[tag].set(row, False)
+        self._expires_at[row] = np.inf
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def candidate_mask(
+        self,
+        category: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+        now: Optional[float] = None,
+    ) -> np.ndarray:
+        """Rows that are live, unexpired and match ``category`` and any of ``tags``."""
+        size = len(self.row_ids)
+        mask = self._alive.view(size).copy()
+        if category:
+            bitmap = self._categories.get(category)
+            if bitmap is None:
+                return np.zeros(size, dtype=bool)
+            mask &= bitmap.view(size)
+        if tags:
+            any_tag = np.zeros(size, dtype=bool)
+            for tag in tags:
+                bitmap = self._tags.get(tag)
+                if bitmap is not None:
+                    any_tag |= bitmap.view(size)
+            mask &= any_tag
+        mask &= self._expires_at[:size] > (time.time() if now is None else now)
+        return mask
+
+    def terms(self, memory: "MemoryEntry") -> Tuple[str, FrozenSet[str]]:
+        """Cached ``(content.lower(), set of words)`` for the text fallback."""
+        cached = self._tokens.get(memory.memory_id)
+        if cached is None or cached[0] != memory.content:
+            cached = self._index_terms(memory)
+        return cached[1], cached[2]
+
+    def text_candidates(self, query_lower: str) -> List["MemoryEntry"]:
+        """
+        Memories that share a word with ``query_lower`` or contain it verbatim, in insertion order.
+
+        A verbatim match pins the query's interior words to whole content
+        words, its first word to a word suffix and its last word to a word
+        prefix, so only the vocabulary (not every memory) is scanned for the
+        partial-word cases. Callers still verify the match.
+        """
+        words = query_lower.split()
+        if not words:
+            return list(self.memories.values())
+        ids: Set[str] = set()
+        for word in words:
+            ids |= self._postings.get(word, set())
+        if len(words) == 1:
+            ids |= self._postings_matching(lambda term: words[0] in term)
+        elif len(words) == 2:
+            ids |= self._postings_matching(lambda term: term.endswith(words[0])) & self._postings_matching(
+                lambda term: term.startswith(words[1])
+            )
+        # With three or more words the interior ones are whole words, already covered above.
+        return [self.memories[memory_id] for memory_id in sorted(ids, key=self._order.__getitem__)]
+
+    def _postings_matching(self, predicate) -> Set[str]:
+        ids: Set[str] = set()
+        for term, memory_ids in self._postings.items():
+            if predicate(term):
+                ids |= memory_ids
+        return ids
+
+    def _index_terms(self, memory: "MemoryEntry") -> Tuple[str, str, FrozenSet[str]]:
+        self._unindex_terms(memory.memory_id)
+        lowered = memory.content.lower()
+        cached = (memory.content, lowered, frozenset(lowered.split()))
+        self._tokens[memory.memory_id] = cached
+        for word in cached[2]:
+            self._postings.setdefault(word, set()).add(memory.memory_id)
+        return cached
+
+    def _unindex_terms(self, memory_id: str) -> None:
+        cached = self._tokens.pop(memory_id, None)
+        if cached is None:
+            return
+        for word in cached[2]:
+            memory_ids = self._postings.get(word)
+            if memory_ids is not None:
+                memory_ids.discard(memory_id)
+                if not memory_ids:
+                    del self._postings[word]
+
+def _expiry_timestamp(memory: "MemoryEntry") -> float:
+    if memory.ttl_days is None:
+        return np.inf
+    try:
+        created = datetime.fromisoformat(memory.created_at)
+    except (TypeError, ValueError):
+        return np.inf
+    # Mirrors MemoryEntry.is_expired (naive local time).
+    return (created + timedelta(days=memory.ttl_days)).timestamp()
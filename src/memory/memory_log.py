@@ -0,0 +1,369 @@
+"""
+MemoryLog - append-only persistence for UserMemoryStore.
+
+Layout inside a user's memory directory:
+
+- ``memories.manifest.json``   format, version, embedding dimension, active generation
+- ``memories.<gen>.jsonl``     one ``put``/``del`` operation per line (no embeddings)
+- ``memories.<gen>.f32``       contiguous float32 embedding matrix, one row per ``put``
+                               that carried a vector; memory-mapped on load
+
+Adding or updating a memory appends one line (and at most one matrix row), so
+the cost of a write no longer grows with the number of stored memories. Reads
+replay the log once and hand back a row-indexed matrix the FAISS index can be
+built from directly. Superseded lines are dropped by compaction, which writes
+the next generation on a background thread and switches the manifest
+atomically; operations appended while it runs are carried over before the
+switch.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+LOG_FORMAT = "memory-log"
+LOG_VERSION = 1
+DEFAULT_COMPACT_MIN_DEAD = 1024
+
+# (record without embedding, embedding or None)
+MemorySnapshot = List[Tuple[Dict[str, Any], Optional[Sequence[float]]]]
+
+
+class MemoryLog:
+    """Append-only memory record log with a float32 embedding matrix."""
+
+    def __init__(self, directory: Path, *, compact_min_dead: int = DEFAULT_COMPACT_MIN_DEAD):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.directory / "memories.manifest.json"
+        self.compact_min_dead = max(1, int(compact_min_dead))
+
+        self._lock = threading.RLock()
+        self.generation = 0
+        self.dimension: Optional[int] = None
+        self._row_count = 0
+        self._rows: Dict[str, Optional[int]] = {}
+        self._dead = 0
+        self._compaction: Optional[threading.Thread] = None
+        self._carry_over: Optional[List[Tuple[str, Any, Optional[np.ndarray]]]] = None
+
+    # ------------------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------------------
+    def exists(self) -> bool:
+        return self.manifest_path.exists()
+
+    def log_path(self, generation: Optional[int] = None) -> Path:
+        return self.directory / f"memories.{self.generation if generation is None else generation}.jsonl"
+
+    def vectors_path(self, generation: Optional[int] = None) -> Path:
+        return self.directory / f"memories.{self.generation if generation is None else generation}.f32"
+
+    @property
+    def live_count(self) -> int:
+        return len(self._rows)
+
+    @property
+    def dead_count(self) -> int:
+        return self._dead
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    def load(self) -> Tuple[List[Tuple[Dict[str, Any], Optional[int]]], Optional[np.ndarray]]:
+        """
+        Replay the active generation.
+
+        Returns ``(records, matrix)``: live records in first-insertion order,
+        each paired with its row in ``matrix`` (or None when it has no
+        embedding). ``matrix`` is a read-only memory map.
+        """
+        with self._lock:
+            manifest = self._read_manifest()
+            self.generation = int(manifest.get("generation", 0))
+            self.dimension = manifest.get("dimension")
+
+            matrix = self._map_vectors()
+            self._row_count = 0 if matrix is None else matrix.shape[0]
+
+            records: Dict[str, Tuple[Dict[str, Any], Optional[int]]] = {}
+            operations = 0
+            log_path = self.log_path()
+            if log_path.exists():
+                self._truncate_torn_tail(log_path)
+                with log_path.open("r", encoding="utf-8") as handle:
+                    for line in handle:
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            logger.warning("[USER MEMORY] Skipping unreadable memory log line in %s", log_path)
+                            continue
+                        operations += 1
+                        if entry.get("op") == "del":
+                            records.pop(entry.get("id"), None)
+                            continue
+                        record = entry.get("memory") or {}
+                        memory_id = record.get("memory_id")
+                        if not memory_id:
+                            continue
+                        row = entry.get("row")
+                        if row is None and memory_id in records:
+                            row = records[memory_id][1]
+                        if row is not None and row >= self._row_count:
+                            row = None
+                        records[memory_id] = (record, row)
+
+            self._rows = {memory_id: row for memory_id, (_, row) in records.items()}
+            self._dead = max(0, operations - len(records))
+            return list(records.values()), matrix
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def put_many(self, items: Iterable[Tuple[Dict[str, Any], Optional[Sequence[float]]]]) -> None:
+        """
+        Append ``put`` operations. An item without an embedding keeps the row
+        previously stored for that memory id.
+        """
+        with self._lock:
+            lines: List[str] = []
+            vectors: List[np.ndarray] = []
+            for record, embedding in items:
+                memory_id = record["memory_id"]
+                vector = self._as_vector(embedding)
+                if vector is not None:
+                    row: Optional[int] = self._row_count + len(vectors)
+                    vectors.append(vector)
+                else:
+                    row = self._rows.get(memory_id)
+                if memory_id in self._rows:
+                    self._dead += 1
+                self._rows[memory_id] = row
+                lines.append(json.dumps({"op": "put", "row": row, "memory": record}, ensure_ascii=False))
+                if self._carry_over is not None:
+                    self._carry_over.append(("put", record, vector))
+            if not lines:
+                return
+            # Vectors land before the lines that reference their rows.
+            if vectors:
+                self._append_vectors(vectors)
+            self._append_lines(lines)
+
+    def put(self, record: Dict[str, Any], embedding: Optional[Sequence[float]] = None) -> None:
+        self.put_many([(record, embedding)])
+
+    def delete_many(self, memory_ids: Iterable[str]) -> None:
+        with self._lock:
+            lines = []
+            for memory_id in memory_ids:
+                if memory_id not in self._rows:
+                    continue
+                del self._rows[memory_id]
+                # The deleted put and the tombstone itself are both dead weight.
+                self._dead += 2
+                lines.append(json.dumps({"op": "del", "id": memory_id}))
+                if self._carry_over is not None:
+                    self._carry_over.append(("del", memory_id, None))
+            if lines:
+                self._append_lines(lines)
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+    def needs_compaction(self) -> bool:
+        return self._dead >= max(self.compact_min_dead, len(self._rows))
+
+    def maybe_compact(self, snapshot: Callable[[], MemorySnapshot], *, background: bool = True) -> bool:
+        """
+        Start a compaction when dead operations outnumber live records.
+
+        ``snapshot`` must return the current live records and is called with
+        this log's lock held, so callers should invoke this while holding their
+        own lock to keep the snapshot and the log in step.
+        """
+        with self._lock:
+            if self._compaction is not None or not self.needs_compaction():
+                return False
+            items = snapshot()
+            self._carry_over = []
+            if not background:
+                self._compact(items)
+                return True
+            self._compaction = threading.Thread(
+                target=self._compact,
+                args=(items,),
+                name="user-memory-compaction",
+                daemon=True,
+            )
+            self._compaction.start()
+            return True
+
+    def rewrite(self, items: MemorySnapshot) -> None:
+        """Synchronously replace the log with ``items`` (used for full saves and migration)."""
+        self.wait_for_compaction()
+        with self._lock:
+            self._carry_over = []
+            self._compact(items)
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> None:
+        thread = self._compaction
+        if thread is not None:
+            thread.join(timeout)
+
+    def _compact(self, items: MemorySnapshot) -> None:
+        next_generation = self.generation + 1
+        log_tmp = self.log_path(next_generation)
+        vectors_tmp = self.vectors_path(next_generation)
+        try:
+            rows: Dict[str, Optional[int]] = {}
+            row_count = 0
+            dimension = self.dimension
+            with log_tmp.open("w", encoding="utf-8") as log_handle, vectors_tmp.open("wb") as vector_handle:
+                for record, embedding in items:
+                    vector = self._as_vector(embedding, dimension)
+                    if vector is not None:
+                        dimension = dimension or vector.shape[0]
+                        vector_handle.write(vector.tobytes())
+                        row: Optional[int] = row_count
+                        row_count += 1
+                    else:
+                        row = None
+                    rows[record["memory_id"]] = row
+                    log_handle.write(json.dumps({"op": "put", "row": row, "memory": record}, ensure_ascii=False))
+                    log_handle.write("\n")
+
+            with self._lock:
+                carry_over = self._carry_over or []
+                self._carry_over = None
+                previous = self.generation
+                self.generation = next_generation
+                self.dimension = dimension
+                self._rows = rows
+                self._row_count = row_count
+                self._dead = 0
+                for op, payload, vector in carry_over:
+                    if op == "put":
+                        self.put(payload, vector)
+                    else:
+                        self.delete_many([payload])
+                self._write_manifest()
+                for stale in (self.log_path(previous), self.vectors_path(previous)):
+                    try:
+                        stale.unlink()
+                    except FileNotFoundError:
+                        pass
+            logger.info(
+                "[USER MEMORY] Compacted memory log to generation %s (%s records)", next_generation, len(rows)
+            )
+        except Exception as exc:
+            logger.error("[USER MEMORY] Memory log compaction failed: %s", exc)
+            with self._lock:
+                self._carry_over = None
+            for partial in (log_tmp, vectors_tmp):
+                try:
+                    partial.unlink()
+                except FileNotFoundError:
+                    pass
+        finally:
+            self._compaction = None
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _as_vector(self, embedding: Optional[Sequence[float]], dimension: Optional[int] = None) -> Optional[np.ndarray]:
+        if embedding is None:
+            return None
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        expected = dimension or self.dimension
+        if expected is not None and vector.shape[0] != expected:
+            logger.warning(
+                "[USER MEMORY] Dropping embedding with dimension %s (store uses %s)", vector.shape[0], expected
+            )
+            return None
+        return vector
+
+    def _append_vectors(self, vectors: List[np.ndarray]) -> None:
+        if self.dimension is None:
+            self.dimension = int(vectors[0].shape[0])
+            self._write_manifest()
+        with self.vectors_path().open("ab") as handle:
+            handle.write(np.vstack(vectors).astype(np.float32, copy=False).tobytes())
+        self._row_count += len(vectors)
+
+    def _append_lines(self, lines: List[str]) -> None:
+        if not self.manifest_path.exists():
+            self._write_manifest()
+        with self.log_path().open("a", encoding="utf-8") as handle:
+            handle.write("\n".join(lines) + "\n")
+
+    @staticmethod
+    def _truncate_torn_tail(path: Path) -> None:
+        """Drop a partial final line left by an interrupted append so new lines start clean."""
+        with path.open("rb+") as handle:
+            size = handle.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            handle.seek(size - 1)
+            if handle.read(1) == b"\n":
+                return
+            block = min(size, 1 << 16)
+            while True:
+                handle.seek(size - block)
+                data = handle.read(block)
+                cut = data.rfind(b"\n")
+                if cut >= 0:
+                    handle.truncate(size - block + cut + 1)
+                    break
+                if block == size:
+                    handle.truncate(0)
+                    break
+                block = min(size, block * 2)
+            logger.warning("[USER MEMORY] Truncated a partial trailing line in %s", path)
+
+    def _map_vectors(self) -> Optional[np.ndarray]:
+        path = self.vectors_path()
+        if not self.dimension or not path.exists():
+            return None
+        row_bytes = int(self.dimension) * 4
+        size = path.stat().st_size
+        rows = size // row_bytes
+        if size != rows * row_bytes:
+            # Partial row from an interrupted append; later rows must stay aligned.
+            with path.open("rb+") as handle:
+                handle.truncate(rows * row_bytes)
+        if rows == 0:
+            return None
+        return np.memmap(path, dtype=np.float32, mode="r", shape=(rows, int(self.dimension)))
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.error("[USER MEMORY] Failed to read memory manifest: %s", exc)
+            return {}
+        if manifest.get("format") != LOG_FORMAT:
+            logger.warning("[USER MEMORY] Unknown memory manifest format: %s", manifest.get("format"))
+            return {}
+        return manifest
+
+    def _write_manifest(self) -> None:
+        payload = {
+            "format": LOG_FORMAT,
+            "version": LOG_VERSION,
+            "generation": self.generation,
+            "dimension": self.dimension,
+        }
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
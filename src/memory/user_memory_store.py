@@ -3,13 +3,15 @@ UserMemoryStore - Persistent user memory with semantic search.
 
 This module implements persistent memory storage for user preferences,
 conversation history, and learned patterns across sessions. Uses FAISS
-for semantic search over embeddings and JSON for structured data persistence.
+for semantic search over embeddings, an append-only MemoryLog (records plus a
+float32 embedding matrix) for memories, and JSON for profile/summary data.
 
 Architecture:
 - UserProfile: Static user information and preferences
 - MemoryEntry: Individual facts/patterns with metadata
 - ConversationSummary: Session-level summaries
-- Semantic search with cosine similarity scoring
+- Semantic search with cosine similarity scoring, pre-filtered by
+  category/tag/expiry row bitmaps (MemoryIndex)
 - Automatic deduplication and salience decay
 """
 
@@ -19,10 +21,14 @@ import uuid
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, fields
 from threading import RLock
 import numpy as np
 
+from src.cache.embedding_cache import get_embedding_cache
+from src.memory.memory_index import MemoryIndex
+from src.memory.memory_log import MemoryLog, MemorySnapshot
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -185,6 +191,7 @@ class UserMemoryStore:
         self.storage_dir = Path(storage_dir) / user_id
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.embedding_model = embedding_model
+        self.embedding_cache = get_embedding_cache(config)
 
         # Read batch embeddings config
         if config:
@@ -225,6 +232,10 @@ class UserMemoryStore:
         # FAISS index for semantic search
         self.faiss_index = None
         self.memory_ids: List[str] = []  # Maps FAISS index to memory_id
+        self._index = MemoryIndex()  # id lookups, filter bitmaps, token cache
+
+        # Append-only memory persistence
+        self._memory_log = MemoryLog(self.storage_dir)
 
         # Load existing data
         self._load_data()
@@ -242,14 +253,24 @@ class UserMemoryStore:
                     logger.error(f"[USER MEMORY] Failed to load profile: {e}")
 
             # Load memories
-            memories_path = self.storage_dir / "memories.json"
-            if memories_path.exists():
+            embeddings = None
+            if self._memory_log.exists():
                 try:
-                    with open(memories_path, 'r', encoding='utf-8') as f:
-                        memories_data = json.load(f)
-                        self.memories = [MemoryEntry.from_dict(m) for m in memories_data]
+                    records, matrix = self._memory_log.load()
+                    rows = []
+                    for record, row in records:
+                        memory = MemoryEntry.from_dict(record)
+                        if row is not None:
+                            # Row view into the memory-mapped matrix; no float parsing.
+                            memory.embedding = matrix[row]
+                            rows.append(row)
+                        self.memories.append(memory)
+                    if rows:
+                        embeddings = np.asarray(matrix[rows], dtype=np.float32)
                 except Exception as e:
                     logger.error(f"[USER MEMORY] Failed to load memories: {e}")
+            else:
+                self._migrate_legacy_memories()
 
             # Load summaries
             summaries_path = self.storage_dir / "summaries.json"
@@ -262,14 +283,37 @@ class UserMemoryStore:
                     logger.error(f"[USER MEMORY] Failed to load summaries: {e}")
 
             # Build FAISS index
-            self._rebuild_faiss_index()
+            self._rebuild_faiss_index(embeddings)
 
-    def _rebuild_faiss_index(self):
-        """Rebuild FAISS index from current memories."""
-        if not FAISS_AVAILABLE or not self.memories:
+    def _migrate_legacy_memories(self):
+        """Move a pre-MemoryLog ``memories.json`` into the append-only log."""
+        legacy_path = self.storage_dir / "memories.json"
+        if not legacy_path.exists():
             return
+        try:
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                self.memories = [MemoryEntry.from_dict(m) for m in json.load(f)]
+            self._memory_log.rewrite(self._memory_snapshot())
+            legacy_path.rename(legacy_path.with_suffix(".json.migrated"))
+            logger.info(f"[USER MEMORY] Migrated {len(self.memories)} memories to the append-only log")
+        except Exception as e:
+            logger.error(f"[USER MEMORY] Failed to migrate memories: {e}")
 
+    def _rebuild_faiss_index(self, embeddings: Optional[np.ndarray] = None):
+        """
+        Rebuild FAISS index from current memories.
+
+        ``embeddings`` may carry the already-stacked matrix rows (in memory
+        order) when loading, to skip re-gathering them per memory.
+        """
+        self.faiss_index = None
+        self._index.clear_rows()
+        self.memory_ids = self._index.row_ids
+        valid_memories: List[MemoryEntry] = []
         try:
+            if not FAISS_AVAILABLE or not self.memories:
+                return
+
             # Filter memories with embeddings
             valid_memories = [m for m in self.memories if m.embedding is not None]
             if not valid_memories:
@@ -280,57 +324,130 @@ class UserMemoryStore:
             self.faiss_index = faiss.IndexFlatIP(dimension)  # Inner product (cosine similarity)
 
             # Add embeddings
-            embeddings = np.array([m.embedding for m in valid_memories], dtype=np.float32)
+            if embeddings is None:
+                embeddings = np.stack([np.asarray(m.embedding, dtype=np.float32) for m in valid_memories])
+            else:
+                embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
             # Normalize for cosine similarity
             faiss.normalize_L2(embeddings)
             self.faiss_index.add(embeddings)
 
-            # Update ID mapping
-            self.memory_ids = [m.memory_id for m in valid_memories]
-
             logger.debug(f"[USER MEMORY] Rebuilt FAISS index with {len(valid_memories)} memories")
 
         except Exception as e:
             logger.error(f"[USER MEMORY] Failed to rebuild FAISS index: {e}")
             self.faiss_index = None
+            valid_memories = []
+        finally:
+            # FAISS rows follow memory order, so row ids line up with valid_memories.
+            indexed_ids = {m.memory_id for m in valid_memories}
+            for memory in self.memories:
+                self._index.add(memory, indexed=memory.memory_id in indexed_ids)
+
+    def _index_new_memories(self, memories: List[MemoryEntry]):
+        """Add freshly appended memories to FAISS and the lookup/filter indexes."""
+        embedded = [m for m in memories if m.embedding is not None] if FAISS_AVAILABLE else []
+        if embedded and self.faiss_index is None:
+            # Covers every memory in self.memories, including these.
+            self._rebuild_faiss_index()
+            return
+        if embedded:
+            embeddings = np.stack([np.asarray(m.embedding, dtype=np.float32) for m in embedded])
+            faiss.normalize_L2(embeddings)
+            self.faiss_index.add(embeddings)
+        embedded_ids = {m.memory_id for m in embedded}
+        for memory in memories:
+            self._index.add(memory, indexed=memory.memory_id in embedded_ids)
+
+    def _maybe_rebuild_faiss_index(self):
+        """Drop deleted rows from FAISS once they outnumber the live ones."""
+        if self._index.dead_rows > max(1024, len(self._index.rows)):
+            self._rebuild_faiss_index()
+
+    def _detach_memories(self, memory_ids: List[str]):
+        """Remove memories from the list and indexes; FAISS rows are masked, not rebuilt."""
+        removed = {id(memory) for memory in map(self._index.remove, memory_ids) if memory is not None}
+        if removed:
+            self.memories = [m for m in self.memories if id(m) not in removed]
+            self._maybe_rebuild_faiss_index()
 
     def _save_data(self):
-        """Persist all data to disk."""
+        """Persist all data to disk (full rewrite of the memory log)."""
         with self._lock:
+            self._save_profile()
+            self._save_summaries()
             try:
-                # Save profile
-                if self.profile:
-                    profile_path = self.storage_dir / "profile.json"
-                    with open(profile_path, 'w', encoding='utf-8') as f:
-                        json.dump(self.profile.to_dict(), f, indent=2, ensure_ascii=False)
-
-                # Save memories
-                memories_path = self.storage_dir / "memories.json"
-                with open(memories_path, 'w', encoding='utf-8') as f:
-                    json.dump([m.to_dict() for m in self.memories], f, indent=2, ensure_ascii=False)
-
-                # Save summaries
-                summaries_path = self.storage_dir / "summaries.json"
-                with open(summaries_path, 'w', encoding='utf-8') as f:
-                    json.dump([s.to_dict() for s in self.summaries], f, indent=2, ensure_ascii=False)
-
+                self._memory_log.rewrite(self._memory_snapshot())
             except Exception as e:
-                logger.error(f"[USER MEMORY] Failed to save data: {e}")
+                logger.error(f"[USER MEMORY] Failed to save memories: {e}")
 
-    def _get_embedding(self, text: str) -> Optional[List[float]]:
-        """Get embedding for text using OpenAI."""
-        if not FAISS_AVAILABLE:
-            return None
+    def _save_profile(self):
+        if not self.profile:
+            return
+        try:
+            profile_path = self.storage_dir / "profile.json"
+            with open(profile_path, 'w', encoding='utf-8') as f:
+                json.dump(self.profile.to_dict(), f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            logger.error(f"[USER MEMORY] Failed to save profile: {e}")
 
+    def _save_summaries(self):
         try:
-            response = self.openai_client.embeddings.create(
-                input=text,
-                model=self.embedding_model
+            summaries_path = self.storage_dir / "summaries.json"
+            with open(summaries_path, 'w', encoding='utf-8') as f:
+                json.dump([s.to_dict() for s in self.summaries], f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            logger.error(f"[USER MEMORY] Failed to save summaries: {e}")
+
+    @staticmethod
+    def _memory_record(memory: MemoryEntry) -> Dict[str, Any]:
+        """Serializable memory fields; the embedding is stored in the log's matrix."""
+        record = {f.name: getattr(memory, f.name) for f in fields(MemoryEntry) if f.name != "embedding"}
+        record["tags"] = list(record["tags"])
+        return record
+
+    def _memory_snapshot(self) -> MemorySnapshot:
+        return [(self._memory_record(m), m.embedding) for m in self.memories]
+
+    def _persist_memories(self, memories: List[MemoryEntry], with_embeddings: bool = False):
+        """Append memory records to the log (embeddings only for new memories)."""
+        try:
+            self._memory_log.put_many(
+                (self._memory_record(m), m.embedding if with_embeddings else None) for m in memories
             )
-            return response.data[0].embedding
+            self._memory_log.maybe_compact(self._memory_snapshot)
         except Exception as e:
-            logger.error(f"[USER MEMORY] Failed to get embedding: {e}")
+            logger.error(f"[USER MEMORY] Failed to persist memories: {e}")
+
+    def _persist_deletions(self, memory_ids: List[str]):
+        try:
+            self._memory_log.delete_many(memory_ids)
+            self._memory_log.maybe_compact(self._memory_snapshot)
+        except Exception as e:
+            logger.error(f"[USER MEMORY] Failed to persist memory deletions: {e}")
+
+    def _get_embedding(self, text: str) -> Optional[List[float]]:
+        """Get embedding for text using OpenAI (served from the embedding cache when possible)."""
+        if not FAISS_AVAILABLE:
             return None
+
+        vector = self.embedding_cache.embed(self.embedding_model, [text], self._request_single_embeddings)[0]
+        return vector.tolist() if vector is not None else None
+
+    def _request_single_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Embed each text with its own API call (None for failures)."""
+        embeddings = []
+        for text in texts:
+            try:
+                response = self.openai_client.embeddings.create(
+                    input=text,
+                    model=self.embedding_model
+                )
+                embeddings.append(response.data[0].embedding)
+            except Exception as e:
+                logger.error(f"[USER MEMORY] Failed to get embedding: {e}")
+                embeddings.append(None)
+        return embeddings
     
     def _get_embeddings_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[Optional[List[float]]]:
         """
@@ -348,7 +465,16 @@ class UserMemoryStore:
             batch_size = self.batch_size
         if not FAISS_AVAILABLE or not texts:
             return [None] * len(texts)
-        
+
+        vectors = self.embedding_cache.embed(
+            self.embedding_model,
+            texts,
+            lambda missing: self._request_embeddings_batched(missing, batch_size),
+        )
+        return [vector.tolist() if vector is not None else None for vector in vectors]
+
+    def _request_embeddings_batched(self, texts: List[str], batch_size: int) -> List[Optional[List[float]]]:
+        """Embed texts through the API in batches, falling back to single calls for failed batches."""
         all_embeddings = []
         
         for i in range(0, len(texts), batch_size):
@@ -367,9 +493,7 @@ class UserMemoryStore:
             except Exception as e:
                 logger.error(f"[USER MEMORY] Batch embedding failed: {e}")
                 # Fallback to individual calls
-                for text in batch:
-                    embedding = self._get_embedding(text)
-                    all_embeddings.append(embedding)
+                all_embeddings.extend(self._request_single_embeddings(batch))
         
         return all_embeddings
 
@@ -405,7 +529,7 @@ class UserMemoryStore:
                     location=location
                 )
 
-            self._save_data()
+            self._save_profile()
             return self.profile
 
     def get_profile(self) -> Optional[UserProfile]:
@@ -423,35 +547,25 @@ class UserMemoryStore:
         ttl_days: Optional[int] = None
     ) -> MemoryEntry:
         """Add a new memory entry."""
-        with self._lock:
-            # Create memory entry
-            memory = MemoryEntry(
-                content=content,
-                category=category,
-                tags=tags or [],
-                salience_score=salience_score,
-                source_interaction_id=source_interaction_id,
-                ttl_days=ttl_days
-            )
+        # Create memory entry
+        memory = MemoryEntry(
+            content=content,
+            category=category,
+            tags=tags or [],
+            salience_score=salience_score,
+            source_interaction_id=source_interaction_id,
+            ttl_days=ttl_days
+        )
 
-            # Get embedding
-            memory.embedding = self._get_embedding(content)
+        # Get embedding (network call; keep it outside the store lock)
+        memory.embedding = self._get_embedding(content)
 
+        with self._lock:
             # Add to collection
             self.memories.append(memory)
+            self._index_new_memories([memory])
 
-            # Update FAISS index
-            if FAISS_AVAILABLE and memory.embedding is not None:
-                if self.faiss_index is None:
-                    self._rebuild_faiss_index()
-                else:
-                    # Add single embedding
-                    embedding = np.array([memory.embedding], dtype=np.float32)
-                    faiss.normalize_L2(embedding)
-                    self.faiss_index.add(embedding)
-                    self.memory_ids.append(memory.memory_id)
-
-            self._save_data()
+            self._persist_memories([memory], with_embeddings=True)
             logger.debug(f"[USER MEMORY] Added memory: {memory.memory_id}")
             return memory
     
@@ -508,93 +622,78 @@ class UserMemoryStore:
         if not memory_data:
             return []
         
+        logger.info(f"[USER MEMORY] Batch adding {len(memory_data)} memories")
+
+        # Create memory entries
+        new_memories = []
+        texts_to_embed = []
+
+        for data in memory_data:
+            memory = MemoryEntry(
+                content=data.get("content", ""),
+                category=data.get("category", "general"),
+                tags=data.get("tags", []),
+                salience_score=data.get("salience_score", 1.0),
+                source_interaction_id=data.get("source_interaction_id"),
+                ttl_days=data.get("ttl_days")
+            )
+            new_memories.append(memory)
+            texts_to_embed.append(memory.content)
+
+        # Get embeddings in batch (outside the store lock)
+        batch_embeddings = self._get_embeddings_batch(texts_to_embed)
+
+        # Track batch operation
+        try:
+            from src.utils.performance_monitor import get_performance_monitor
+            get_performance_monitor().record_batch_operation("memory_embeddings", len(texts_to_embed))
+        except Exception:
+            pass
+
         with self._lock:
-            logger.info(f"[USER MEMORY] Batch adding {len(memory_data)} memories")
-            
-            # Create memory entries
-            new_memories = []
-            texts_to_embed = []
-            
-            for data in memory_data:
-                memory = MemoryEntry(
-                    content=data.get("content", ""),
-                    category=data.get("category", "general"),
-                    tags=data.get("tags", []),
-                    salience_score=data.get("salience_score", 1.0),
-                    source_interaction_id=data.get("source_interaction_id"),
-                    ttl_days=data.get("ttl_days")
-                )
-                new_memories.append(memory)
-                texts_to_embed.append(memory.content)
-            
-            # Get embeddings in batch
-            batch_embeddings = self._get_embeddings_batch(texts_to_embed)
-            
-            # Track batch operation
-            try:
-                from src.utils.performance_monitor import get_performance_monitor
-                get_performance_monitor().record_batch_operation("memory_embeddings", len(texts_to_embed))
-            except Exception:
-                pass
-            
             # Assign embeddings to memories
             for memory, embedding in zip(new_memories, batch_embeddings):
                 memory.embedding = embedding
                 self.memories.append(memory)
-            
+
             # Update FAISS index with all new embeddings at once
-            if FAISS_AVAILABLE and any(m.embedding is not None for m in new_memories):
-                valid_embeddings = [m.embedding for m in new_memories if m.embedding is not None]
-                valid_ids = [m.memory_id for m in new_memories if m.embedding is not None]
-                
-                if valid_embeddings:
-                    embeddings_array = np.array(valid_embeddings, dtype=np.float32)
-                    faiss.normalize_L2(embeddings_array)
-                    
-                    if self.faiss_index is None:
-                        self._rebuild_faiss_index()
-                    else:
-                        self.faiss_index.add(embeddings_array)
-                        self.memory_ids.extend(valid_ids)
+            self._index_new_memories(new_memories)
             
-            self._save_data()
+            self._persist_memories(new_memories, with_embeddings=True)
             logger.info(f"[USER MEMORY] Batch added {len(new_memories)} memories")
             return new_memories
 
     def update_memory(self, memory_id: str, **updates) -> Optional[MemoryEntry]:
         """Update an existing memory entry."""
         with self._lock:
-            for memory in self.memories:
-                if memory.memory_id == memory_id:
-                    for key, value in updates.items():
-                        if hasattr(memory, key):
-                            setattr(memory, key, value)
-                    memory.update_access()
-                    self._save_data()
-                    return memory
-            return None
+            memory = self._index.memories.get(memory_id)
+            if memory is None:
+                return None
+            for key, value in updates.items():
+                if hasattr(memory, key):
+                    setattr(memory, key, value)
+            memory.update_access()
+            self._index.refresh(memory)
+            self._persist_memories([memory])
+            return memory
 
     def delete_memory(self, memory_id: str) -> bool:
         """Delete a memory entry."""
         with self._lock:
-            for i, memory in enumerate(self.memories):
-                if memory.memory_id == memory_id:
-                    del self.memories[i]
-                    # Rebuild FAISS index
-                    self._rebuild_faiss_index()
-                    self._save_data()
-                    logger.debug(f"[USER MEMORY] Deleted memory: {memory_id}")
-                    return True
-            return False
+            if memory_id not in self._index.memories:
+                return False
+            self._detach_memories([memory_id])
+            self._persist_deletions([memory_id])
+            logger.debug(f"[USER MEMORY] Deleted memory: {memory_id}")
+            return True
 
     def get_memory(self, memory_id: str) -> Optional[MemoryEntry]:
         """Get a specific memory entry."""
         with self._lock:
-            for memory in self.memories:
-                if memory.memory_id == memory_id:
-                    memory.update_access()
-                    return memory
-            return None
+            memory = self._index.memories.get(memory_id)
+            if memory is not None:
+                memory.update_access()
+            return memory
 
     def list_memories(
         self,
@@ -646,7 +745,7 @@ class UserMemoryStore:
             )
 
             self.summaries.append(summary_obj)
-            self._save_data()
+            self._save_summaries()
             return summary_obj
 
     def get_recent_summaries(self, limit: int = 5) -> List[ConversationSummary]:
@@ -682,45 +781,63 @@ class UserMemoryStore:
             # Fallback to simple text search
             return self._text_search(text, top_k, min_score, category, tags)
 
+        # The query embedding may be an API round-trip; don't hold the lock for it.
+        try:
+            query_embedding = self._get_embedding(text)
+        except Exception as e:
+            logger.error(f"[USER MEMORY] Query embedding failed: {e}")
+            query_embedding = None
+        if query_embedding is None:
+            return self._text_search(text, top_k, min_score, category, tags)
+
         with self._lock:
             try:
-                # Get query embedding
-                query_embedding = self._get_embedding(text)
-                if query_embedding is None:
+                if self.faiss_index is None:
                     return self._text_search(text, top_k, min_score, category, tags)
 
-                # Search FAISS index
+                # Search FAISS index, restricted to live rows matching the filters
                 query_vector = np.array([query_embedding], dtype=np.float32)
                 faiss.normalize_L2(query_vector)
 
-                scores, indices = self.faiss_index.search(query_vector, top_k * 2)  # Get more candidates
+                candidates = self._index.candidate_mask(category, tags)
+                candidate_count = int(candidates.sum())
+                if candidate_count == 0:
+                    return []
+                scores, indices = self._search_faiss(query_vector, min(top_k, candidate_count), candidates)
 
-                # Convert to similarity scores and filter
+                # Results arrive sorted by score
                 results = []
-                for score, idx in zip(scores[0], indices[0]):
-                    if idx < len(self.memory_ids):
-                        memory_id = self.memory_ids[idx]
-                        memory = next((m for m in self.memories if m.memory_id == memory_id), None)
-                        if memory and not memory.is_expired():
-                            # Apply filters
-                            if category and memory.category != category:
-                                continue
-                            if tags and not any(tag in memory.tags for tag in tags):
-                                continue
-
-                            similarity = float(score)
-                            if similarity >= min_score:
-                                memory.update_access()
-                                results.append((memory, similarity))
-
-                # Sort by score and return top_k
-                results.sort(key=lambda x: x[1], reverse=True)
+                for score, idx in zip(scores, indices):
+                    memory = self._index.memories.get(self._index.row_ids[idx])
+                    if memory is None or memory.is_expired():
+                        continue
+                    similarity = float(score)
+                    if similarity < min_score:
+                        break
+                    memory.update_access()
+                    results.append((memory, similarity))
                 return results[:top_k]
 
             except Exception as e:
                 logger.error(f"[USER MEMORY] Semantic search failed: {e}")
                 return self._text_search(text, top_k, min_score, category, tags)
 
+    def _search_faiss(self, query_vector: np.ndarray, k: int, candidates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Top-``k`` FAISS rows among ``candidates`` (a boolean row mask)."""
+        if hasattr(faiss, "IDSelectorBitmap") and hasattr(faiss, "SearchParameters"):
+            bitmap = np.packbits(candidates, bitorder="little")
+            selector = faiss.IDSelectorBitmap(len(candidates), faiss.swig_ptr(bitmap))
+            scores, indices = self.faiss_index.search(
+                query_vector, k, params=faiss.SearchParameters(sel=selector)
+            )
+        else:  # Older FAISS builds: exhaustive search, then mask
+            scores, indices = self.faiss_index.search(query_vector, self.faiss_index.ntotal)
+        keep = (indices[0] >= 0) & (indices[0] < len(candidates))
+        rows = indices[0][keep]
+        scores = scores[0][keep]
+        allowed = candidates[rows]
+        return scores[allowed][:k], rows[allowed][:k]
+
     def _text_search(
         self,
         text: str,
@@ -732,9 +849,11 @@ class UserMemoryStore:
         """Fallback text-based search when embeddings unavailable."""
         with self._lock:
             query_lower = text.lower()
+            query_words = set(query_lower.split())
             results = []
 
-            for memory in self.memories:
+            # Only memories sharing a word with (or containing) the query can score.
+            for memory in self._index.text_candidates(query_lower):
                 if memory.is_expired():
                     continue
 
@@ -744,14 +863,12 @@ class UserMemoryStore:
                 if tags and not any(tag in memory.tags for tag in tags):
                     continue
 
-                # Simple text similarity
-                content_lower = memory.content.lower()
+                # Simple text similarity (tokens cached per memory)
+                content_lower, content_words = self._index.terms(memory)
                 if query_lower in content_lower:
                     score = 0.9  # High score for exact matches
                 else:
                     # Count word overlaps
-                    query_words = set(query_lower.split())
-                    content_words = set(content_lower.split())
                     overlap = len(query_words.intersection(content_words))
                     if overlap > 0:
                         score = min(0.8, overlap / len(query_words))
@@ -770,13 +887,12 @@ class UserMemoryStore:
     def cleanup_expired_memories(self) -> int:
         """Remove expired memories and return count deleted."""
         with self._lock:
-            original_count = len(self.memories)
-            self.memories = [m for m in self.memories if not m.is_expired()]
+            expired_ids = [m.memory_id for m in self.memories if m.is_expired()]
 
-            deleted_count = original_count - len(self.memories)
+            deleted_count = len(expired_ids)
             if deleted_count > 0:
-                self._rebuild_faiss_index()
-                self._save_data()
+                self._detach_memories(expired_ids)
+                self._persist_deletions(expired_ids)
                 logger.info(f"[USER MEMORY] Cleaned up {deleted_count} expired memories")
 
             return deleted_count
@@ -786,7 +902,7 @@ class UserMemoryStore:
         with self._lock:
             for memory in self.memories:
                 memory.decay_salience()
-            self._save_data()
+            self._persist_memories(self.memories)
             logger.debug("[USER MEMORY] Applied salience decay")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_TRACE_STORE_PATH = Path(os.getenv("QUERY_TRACE_PATH", "data/state/query_traces.jsonl"))
+# The active file is rotated once it reaches this size; at most this many
+# rotated segments are kept by compaction.
+DEFAULT_TRACE_MAX_FILE_BYTES = int(os.getenv("QUERY_TRACE_MAX_FILE_BYTES", str(32 * 1024 * 1024)))
+DEFAULT_TRACE_MAX_SEGMENTS = int(os.getenv("QUERY_TRACE_MAX_SEGMENTS", "8"))
+
+_ACTIVE = 0  # segment key of the file being appended to; rotated segments use seq >= 1
+_TAIL_CHUNK_BYTES = 64 * 1024
 
 
 def _now_iso() -> str:
@@ -98,47 +109,319 @@ class QueryTrace:
 class QueryTraceStore:
     """
     Lightweight append-only store for query traces captured during /cerebros runs.
+
+    Traces are appended to ``path``; each data file has a sidecar ``.idx`` file
+    with one ``offset<TAB>length<TAB>query_id`` line per trace, written on append.
+    The sidecars are loaded once into an in-memory ``query_id -> location`` map,
+    so ``get`` is a dict lookup plus one seek/read, and ``list_recent`` reads the
+    data file backwards in chunks instead of loading it whole.
+
+    When the active file reaches ``max_file_bytes`` it is renamed to
+    ``<stem>.<seq>.jsonl`` (with its sidecar) and a new one is started;
+    ``compact`` keeps the newest ``max_segments`` rotated files. Other store
+    instances (or processes) writing the same path are picked up on the next
+    call by tailing the active file from the last indexed offset; a rotation
+    elsewhere (seen as a directory mtime change) triggers a reload.
     """
 
-    def __init__(self, path: str | Path = DEFAULT_TRACE_STORE_PATH):
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_TRACE_STORE_PATH,
+        *,
+        max_file_bytes: int = DEFAULT_TRACE_MAX_FILE_BYTES,
+        max_segments: int = DEFAULT_TRACE_MAX_SEGMENTS,
+    ):
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_file_bytes = max(1024, int(max_file_bytes))
+        self.max_segments = max(0, int(max_segments))
+        self._lock = Lock()
+        self._loaded = False
+        self._index: Dict[str, Tuple[int, int, int]] = {}  # query_id -> (segment, offset, length)
+        self._rotated: List[int] = []  # rotated segment seqs, oldest first
+        self._active_ino: Optional[int] = None
+        self._active_end = 0  # bytes of the active file already indexed
+        self._dir_mtime_ns: Optional[int] = None
+        self._torn_tail = False
 
     def append(self, trace: QueryTrace) -> None:
         payload = _json_clone(trace.to_dict())
-        line = json.dumps(payload)
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(line + "\n")
+        data = (json.dumps(payload) + "\n").encode("utf-8")
+        with self._lock:
+            self._sync()
+            if self._torn_tail:
+                # Start on a fresh line after a crashed partial write.
+                data = b"\n" + data
+                self._torn_tail = False
+            with self.path.open("ab") as handle:
+                handle.write(data)
+                end = handle.tell()
+                stat = os.fstat(handle.fileno())
+            offset = end - len(data)
+            if data[:1] == b"\n":
+                offset, data = offset + 1, data[1:]
+            with self._index_path(self.path).open("a", encoding="utf-8") as handle:
+                handle.write(f"{offset}\t{len(data)}\t{trace.query_id}\n")
+            self._active_ino = stat.st_ino
+            self._index.setdefault(trace.query_id, (_ACTIVE, offset, len(data)))
+            if offset <= self._active_end:
+                # Only advance when contiguous; lines appended by other writers in
+                # between are picked up by the next _sync().
+                self._active_end = end
+            if end >= self.max_file_bytes:
+                self._rotate()
 
     def get(self, query_id: str) -> Optional[QueryTrace]:
-        if not self.path.exists():
+        with self._lock:
+            self._sync()
+            location = self._index.get(query_id)
+            payload = self._read_at(location) if location else None
+            if location and (payload is None or payload.get("query_id") != query_id):
+                # Files changed underneath us (rotation or compaction elsewhere).
+                self._loaded = False
+                self._sync()
+                location = self._index.get(query_id)
+                payload = self._read_at(location) if location else None
+        if not payload or payload.get("query_id") != query_id:
             return None
-        with self.path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                if not line.strip():
-                    continue
-                try:
-                    payload = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if payload.get("query_id") == query_id:
-                    return QueryTrace.from_dict(payload)
-        return None
+        return QueryTrace.from_dict(payload)
 
     def list_recent(self, limit: int = 10) -> List[QueryTrace]:
-        if not self.path.exists():
+        if limit <= 0:
             return []
-        lines = self.path.read_text(encoding="utf-8").splitlines()
-        entries = []
-        for raw in reversed(lines):
-            if not raw.strip():
-                continue
-            try:
-                payload = json.loads(raw)
-            except json.JSONDecodeError:
-                continue
-            entries.append(QueryTrace.from_dict(payload))
-            if len(entries) >= limit:
-                break
+        with self._lock:
+            self._sync()
+            paths = [self.path] + [self._segment_path(seq) for seq in reversed(self._rotated)]
+        entries: List[QueryTrace] = []
+        for path in paths:
+            for raw in _iter_lines_reversed(path):
+                try:
+                    payload = json.loads(raw)
+                    entries.append(QueryTrace.from_dict(payload))
+                except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+                    continue
+                if len(entries) >= limit:
+                    return list(reversed(entries))
         return list(reversed(entries))
 
+    def compact(self) -> int:
+        """Delete rotated segments beyond ``max_segments``; returns how many were removed."""
+        with self._lock:
+            self._sync()
+            return self._compact_locked()
+
+    def describe(self) -> Dict[str, Any]:
+        with self._lock:
+            self._sync()
+            return {
+                "path": str(self.path),
+                "traces_indexed": len(self._index),
+                "rotated_segments": len(self._rotated),
+                "active_bytes": self._active_end,
+                "max_file_bytes": self.max_file_bytes,
+                "max_segments": self.max_segments,
+            }
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+
+    def _segment_path(self, seq: int) -> Path:
+        return self.path.with_name(f"{self.path.stem}.{seq:06d}{self.path.suffix}")
+
+    def _data_path(self, segment: int) -> Path:
+        return self.path if segment == _ACTIVE else self._segment_path(segment)
+
+    @staticmethod
+    def _index_path(data_path: Path) -> Path:
+        return data_path.with_name(data_path.name + ".idx")
+
+    def _sync(self) -> None:
+        """Bring the in-memory index up to date with the files on disk."""
+        if not self._loaded:
+            self._load()
+            return
+        dir_mtime = _mtime_ns(self.path.parent)
+        if dir_mtime != self._dir_mtime_ns:
+            # Files were created, renamed or deleted; only rotation/compaction matters.
+            self._dir_mtime_ns = dir_mtime
+            if self._list_rotated() != self._rotated:
+                self._load()
+                return
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            if self._active_end:
+                self._load()
+            return
+        if self._active_ino is not None and stat.st_ino != self._active_ino:
+            self._load()
+        elif stat.st_size < self._active_end:
+            self._load()
+        elif stat.st_size > self._active_end:
+            self._active_ino = stat.st_ino
+            self._active_end, self._torn_tail = self._scan(
+                self.path, _ACTIVE, self._active_end, write_index=False
+            )
+
+    def _load(self) -> None:
+        self._loaded = True
+        self._index = {}
+        self._dir_mtime_ns = _mtime_ns(self.path.parent)
+        self._rotated = self._list_rotated()
+        for seq in self._rotated:
+            self._load_segment(seq)
+        self._active_ino = None
+        self._active_end, self._torn_tail = self._load_segment(_ACTIVE)
+        if self.path.exists():
+            self._active_ino = self.path.stat().st_ino
+
+    def _list_rotated(self) -> List[int]:
+        return sorted(
+            int(token)
+            for token in (
+                candidate.name[len(self.path.stem) + 1 : -len(self.path.suffix) or None]
+                for candidate in self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}")
+            )
+            if token.isdigit()
+        )
+
+    def _load_segment(self, segment: int) -> Tuple[int, bool]:
+        """Index one data file from its sidecar, scanning whatever the sidecar misses."""
+        data_path = self._data_path(segment)
+        try:
+            size = data_path.stat().st_size
+        except FileNotFoundError:
+            return 0, False
+        indexed_end = 0
+        index_path = self._index_path(data_path)
+        if index_path.exists():
+            with index_path.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    parts = line.rstrip("\n").split("\t", 2)
+                    if len(parts) != 3 or not line.endswith("\n"):
+                        continue
+                    try:
+                        offset, length = int(parts[0]), int(parts[1])
+                    except ValueError:
+                        continue
+                    if offset + length > size:
+                        continue  # sidecar written ahead of a lost data write
+                    self._index.setdefault(parts[2], (segment, offset, length))
+                    indexed_end = max(indexed_end, offset + length)
+        if indexed_end < size:
+            return self._scan(data_path, segment, indexed_end, write_index=True)
+        return indexed_end, False
+
+    def _scan(self, data_path: Path, segment: int, start: int, *, write_index: bool) -> Tuple[int, bool]:
+        """Index complete lines of ``data_path`` from ``start``; returns (end, torn_tail)."""
+        offset = start
+        torn = False
+        missing: List[str] = []
+        with data_path.open("rb") as handle:
+            handle.seek(start)
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    torn = True
+                    break
+                length = len(line)
+                if line.strip():
+                    try:
+                        query_id = json.loads(line).get("query_id")
+                    except (json.JSONDecodeError, AttributeError):
+                        query_id = None
+                    if query_id:
+                        self._index.setdefault(query_id, (segment, offset, length))
+                        missing.append(f"{offset}\t{length}\t{query_id}\n")
+                offset += length
+        if write_index and missing:
+            with self._index_path(data_path).open("a", encoding="utf-8") as handle:
+                handle.writelines(missing)
+            logger.info("[SEARCH][TRACE] Indexed %s traces missing from %s", len(missing), data_path.name)
+        return offset, torn
+
+    def _read_at(self, location: Tuple[int, int, int]) -> Optional[Dict[str, Any]]:
+        segment, offset, length = location
+        try:
+            with self._data_path(segment).open("rb") as handle:
+                handle.seek(offset)
+                payload = json.loads(handle.read(length))
+        except (OSError, json.JSONDecodeError):
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    def _rotate(self) -> None:
+        seq = (self._rotated[-1] + 1) if self._rotated else 1
+        target = self._segment_path(seq)
+        try:
+            os.replace(self.path, target)
+        except FileNotFoundError:
+            self._loaded = False  # another writer rotated first
+            return
+        try:
+            os.replace(self._index_path(self.path), self._index_path(target))
+        except FileNotFoundError:
+            pass
+        self._rotated.append(seq)
+        self._index = {
+            query_id: (seq if segment == _ACTIVE else segment, offset, length)
+            for query_id, (segment, offset, length) in self._index.items()
+        }
+        self._active_ino = None
+        self._active_end = 0
+        logger.info("[SEARCH][TRACE] Rotated %s to %s", self.path.name, target.name)
+        self._compact_locked()
+
+    def _compact_locked(self) -> int:
+        excess = len(self._rotated) - self.max_segments
+        if excess <= 0:
+            return 0
+        dropped = set(self._rotated[:excess])
+        self._rotated = self._rotated[excess:]
+        for seq in dropped:
+            data_path = self._segment_path(seq)
+            for path in (data_path, self._index_path(data_path)):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+        self._index = {query_id: loc for query_id, loc in self._index.items() if loc[0] not in dropped}
+        logger.info("[SEARCH][TRACE] Compacted %s rotated trace segments", len(dropped))
+        return len(dropped)
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _iter_lines_reversed(path: Path, chunk_size: int = _TAIL_CHUNK_BYTES) -> Iterator[bytes]:
+    """Yield the non-empty complete lines of ``path`` newest first, reading backwards in chunks."""
+    try:
+        handle = path.open("rb")
+    except FileNotFoundError:
+        return
+    with handle:
+        position = handle.seek(0, os.SEEK_END)
+        buffer = b""
+        tail_trimmed = False
+        while position > 0:
+            step = min(chunk_size, position)
+            position -= step
+            handle.seek(position)
+            buffer = handle.read(step) + buffer
+            if not tail_trimmed:
+                # Bytes after the last newline are a torn write, never a trace.
+                cut = buffer.rfind(b"\n")
+                if cut < 0:
+                    continue
+                buffer = buffer[: cut + 1]
+                tail_trimmed = True
+            lines = buffer.split(b"\n")
+            buffer = lines.pop(0)  # may be incomplete until we read further back
+            for line in reversed(lines):
+                if line.strip():
+                    yield line
+        if tail_trimmed and buffer.strip():
+            yield buffer
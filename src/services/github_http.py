@@ -0,0 +1,436 @@
+"""
+Shared transport for GitHub REST calls.
+
+`GitHubPRService` used to open a fresh ``httpx.Client`` per request and fetch
+commit/PR details one at a time. This module provides the pieces those calls
+now share:
+
+1. **Pooled** — One keep-alive ``httpx.Client`` per API base, reused by every
+   service instance and thread.
+2. **Bounded concurrency** — ``map_concurrent`` fans work out over at most
+   ``github.http.max_concurrency`` in-flight requests. The slot semaphore
+   belongs to the pool, so parallel ingests share the limit only when they
+   use the same pool (same API base and ``github.http`` settings).
+3. **Rate-limit aware** — ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` and
+   ``Retry-After`` are tracked from every response; when the budget is spent
+   callers wait for the reset (up to ``rate_limit_max_wait_seconds``) instead
+   of burning retries on 403s.
+4. **Conditional requests** — GET bodies are cached on disk with their
+   ``ETag``/``Last-Modified`` validators. Repeat requests send
+   ``If-None-Match``/``If-Modified-Since`` and a 304 (which GitHub does not
+   count against the quota) is answered from the cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_CACHE_PATH = "data/cache/github_http.sqlite"
+DEFAULT_CACHE_MAX_ENTRIES = 50000
+DEFAULT_RATE_LIMIT_MAX_WAIT_SECONDS = 60.0
+REQUEST_TIMEOUT_SECONDS = 30.0
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class GitHubAPIError(Exception):
+    """Exception raised for GitHub API errors."""
+    pass
+
+
+class GitHubRateLimiter:
+    """Tracks the primary rate-limit budget reported by GitHub response headers."""
+
+    def __init__(self, max_wait_seconds: float = DEFAULT_RATE_LIMIT_MAX_WAIT_SECONDS):
+        self.max_wait_seconds = float(max_wait_seconds)
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.waits = 0
+        self._lock = threading.Lock()
+
+    def update(self, headers: httpx.Headers) -> None:
+        limit = _int_header(headers, "X-RateLimit-Limit")
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        reset_at = _int_header(headers, "X-RateLimit-Reset")
+        with self._lock:
+            if limit is not None:
+                self.limit = limit
+            if remaining is not None:
+                self.remaining = remaining
+            if reset_at is not None:
+                self.reset_at = float(reset_at)
+
+    def seconds_until_available(self) -> float:
+        with self._lock:
+            if self.remaining is None or self.remaining > 0 or self.reset_at is None:
+                return 0.0
+            delay = self.reset_at - time.time()
+            if delay <= 0:
+                # The window rolled over; the next response will refresh the numbers.
+                self.remaining = None
+                return 0.0
+            return delay + 1.0
+
+    def wait_time(self) -> float:
+        """Seconds to sleep before the next request; raises when the wait would be too long."""
+        delay = self.seconds_until_available()
+        if delay > self.max_wait_seconds:
+            raise GitHubAPIError(
+                f"GitHub rate limit exhausted; resets in {int(delay)}s "
+                f"(limit={self.limit}, max wait={int(self.max_wait_seconds)}s)"
+            )
+        if delay > 0:
+            self.waits += 1
+        return delay
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "remaining": self.remaining,
+                "reset_at": self.reset_at,
+                "waits": self.waits,
+            }
+
+
+class ConditionalRequestCache:
+    """SQLite store of GET bodies keyed by request, with their ETag/Last-Modified validators."""
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE_PATH, *, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        self.path = Path(path)
+        self.max_entries = max(0, int(max_entries))
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes_since_trim = 0
+        try:
+            self._open()
+        except Exception as exc:
+            logger.warning("[GITHUB HTTP] Conditional cache disabled (failed to open %s: %s)", self.path, exc)
+            self.enabled = False
+
+    def get(self, key: str) -> Optional[Tuple[Optional[str], Optional[str], Any]]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if not row:
+            return None
+        etag, last_modified, body = row
+        try:
+            return etag, last_modified, json.loads(body)
+        except json.JSONDecodeError:
+            return None
+
+    def put(self, key: str, etag: Optional[str], last_modified: Optional[str], body: Any) -> None:
+        if not self.enabled or not (etag or last_modified):
+            return
+        payload = json.dumps(body, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, last_modified, body, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (key, etag, last_modified, payload, time.time()),
+            )
+            self._conn.commit()
+            self._writes_since_trim += 1
+            if self.max_entries and self._writes_since_trim >= 500:
+                self._trim()
+
+    def touch(self, key: str) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._conn.execute("UPDATE responses SET stored_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self.enabled = False
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body TEXT NOT NULL,
+                stored_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_stored_at ON responses(stored_at)")
+        self._conn.commit()
+
+    def _trim(self) -> None:
+        self._writes_since_trim = 0
+        count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        excess = count - self.max_entries
+        if excess <= 0:
+            return
+        self._conn.execute(
+            "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY stored_at ASC LIMIT ?)",
+            (excess,),
+        )
+        self._conn.commit()
+
+
+class GitHubHTTPPool:
+    """
+    Pooled, rate-limit aware GitHub transport shared by `GitHubPRService` instances.
+
+    ``get_json`` performs one request (conditional when cached); ``map_concurrent``
+    and ``amap_concurrent`` run many calls over the shared slots.
+    """
+
+    def __init__(
+        self,
+        api_base: str,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache: Optional[ConditionalRequestCache] = None,
+        rate_limiter: Optional[GitHubRateLimiter] = None,
+    ):
+        self.api_base = api_base.rstrip("/")
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.cache = cache
+        self.rate_limiter = rate_limiter or GitHubRateLimiter()
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._client = httpx.Client(
+            timeout=REQUEST_TIMEOUT_SECONDS,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.not_modified = 0
+
+    # ------------------------------------------------------------------ #
+    # Requests
+    # ------------------------------------------------------------------ #
+    def get_json(
+        self,
+        endpoint: str,
+        *,
+        method: str = "GET",
+        params: Optional[Dict[str, Any]] = None,
+        headers: Dict[str, str],
+        max_retries: int = 2,
+    ) -> Any:
+        url = f"{self.api_base}{endpoint}"
+        cache_key = self._cache_key(method, url, params, headers) if method == "GET" and self.cache else None
+        cached = self.cache.get(cache_key) if cache_key else None
+        request_headers = dict(headers)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                request_headers["If-None-Match"] = etag
+            if last_modified:
+                request_headers["If-Modified-Since"] = last_modified
+
+        backoff_seconds = 1.0
+        for attempt in range(max_retries + 1):
+            delay = self.rate_limiter.wait_time()
+            if delay:
+                logger.warning("[GITHUB HTTP] Rate limit exhausted; waiting %.1fs for reset", delay)
+                time.sleep(delay)
+
+            with self._slots:
+                response = self._client.request(method, url, headers=request_headers, params=params)
+            self.rate_limiter.update(response.headers)
+            with self._stats_lock:
+                self.requests += 1
+
+            if response.status_code == 304 and cached:
+                with self._stats_lock:
+                    self.not_modified += 1
+                self.cache.touch(cache_key)
+                return cached[2]
+
+            # Fast-path success
+            if response.status_code < 400:
+                data = response.json()
+                if cache_key:
+                    self.cache.put(
+                        cache_key,
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified"),
+                        data,
+                    )
+                return data
+
+            # Not found / auth errors are not retried.
+            if response.status_code == 404:
+                raise GitHubAPIError(f"Resource not found: {endpoint}")
+            if response.status_code == 401:
+                raise GitHubAPIError("Authentication failed. Check GITHUB_TOKEN.")
+
+            if response.status_code in {403, 429}:
+                remaining = response.headers.get("X-RateLimit-Remaining", "unknown")
+                reset_at = response.headers.get("X-RateLimit-Reset")
+                logger.warning(
+                    "[GITHUB HTTP] %s from GitHub (remaining=%s, reset_at=%s, attempt=%s)",
+                    response.status_code,
+                    remaining,
+                    reset_at,
+                    attempt,
+                )
+                if attempt >= max_retries:
+                    raise GitHubAPIError(
+                        f"Access forbidden. Rate limit remaining: {remaining or 'unknown'}"
+                    )
+                retry_after = _int_header(response.headers, "Retry-After")
+                if retry_after is not None:
+                    # Secondary rate limit: GitHub tells us exactly how long to back off.
+                    if retry_after > self.rate_limiter.max_wait_seconds:
+                        raise GitHubAPIError(f"GitHub secondary rate limit; retry after {retry_after}s")
+                    time.sleep(retry_after)
+                elif remaining in {"0", "0.0"}:
+                    # Primary budget spent: the next loop iteration waits for the reset.
+                    continue
+                else:
+                    time.sleep(backoff_seconds)
+                    backoff_seconds *= 2
+                continue
+
+            raise GitHubAPIError(f"GitHub API error {response.status_code}: {response.text}")
+
+        # Defensive fallback; loop should have returned or raised.
+        raise GitHubAPIError("Unexpected GitHub API failure after retries.")
+
+    async def aget_json(self, endpoint: str, **kwargs: Any) -> Any:
+        """Async variant of ``get_json``; runs on a worker thread over the shared pool."""
+        return await asyncio.to_thread(self.get_json, endpoint, **kwargs)
+
+    # ------------------------------------------------------------------ #
+    # Fan-out helpers
+    # ------------------------------------------------------------------ #
+    def map_concurrent(self, func: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """
+        Apply ``func`` to ``items`` with up to ``max_concurrency`` calls in flight.
+
+        Results keep input order. The first exception raised by ``func`` is
+        re-raised after in-flight calls finish.
+        """
+        items = list(items)
+        if len(items) <= 1 or self.max_concurrency == 1:
+            return [func(item) for item in items]
+        workers = min(self.max_concurrency, len(items))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="github-http") as executor:
+            return list(executor.map(func, items))
+
+    async def amap_concurrent(self, func: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """Async variant of ``map_concurrent`` for callers already on an event loop."""
+        items = list(items)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(item: T) -> R:
+            async with semaphore:
+                return await asyncio.to_thread(func, item)
+
+        return list(await asyncio.gather(*(run(item) for item in items)))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            requests = self.requests
+            not_modified = self.not_modified
+        return {
+            "api_base": self.api_base,
+            "max_concurrency": self.max_concurrency,
+            "requests": requests,
+            "not_modified": not_modified,
+            "rate_limit": self.rate_limiter.snapshot(),
+        }
+
+    def close(self) -> None:
+        self._client.close()
+        if self.cache:
+            self.cache.close()
+
+    @staticmethod
+    def _cache_key(method: str, url: str, params: Optional[Dict[str, Any]], headers: Dict[str, str]) -> str:
+        # Scope entries by credential and media type so tokens never share private bodies.
+        auth = hashlib.sha256((headers.get("Authorization") or "").encode("utf-8")).hexdigest()[:16]
+        canonical = json.dumps(
+            [method, url, sorted((params or {}).items()), headers.get("Accept"), auth],
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _int_header(headers: httpx.Headers, name: str) -> Optional[int]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+_pools: Dict[Tuple[str, int, Optional[str], float], GitHubHTTPPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_github_http_pool(api_base: str, config: Optional[Dict[str, Any]] = None) -> GitHubHTTPPool:
+    """
+    Return the shared pool for ``api_base``.
+
+    Settings come from ``github.http``: ``max_concurrency``,
+    ``rate_limit_max_wait_seconds``, ``conditional_cache`` (bool),
+    ``cache_path`` and ``cache_max_entries``. Services with the same settings
+    share one pool (and one connection pool, slot semaphore and cache).
+    """
+    http_cfg = (((config or {}).get("github") or {}).get("http")) or {}
+    max_concurrency = int(http_cfg.get("max_concurrency", DEFAULT_MAX_CONCURRENCY))
+    max_wait = float(http_cfg.get("rate_limit_max_wait_seconds", DEFAULT_RATE_LIMIT_MAX_WAIT_SECONDS))
+    cache_path: Optional[str] = None
+    if http_cfg.get("conditional_cache", True):
+        cache_path = str(Path(http_cfg.get("cache_path") or DEFAULT_CACHE_PATH).expanduser())
+    key = (api_base.rstrip("/"), max_concurrency, cache_path, max_wait)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            cache = None
+            if cache_path:
+                cache = ConditionalRequestCache(
+                    cache_path,
+                    max_entries=int(http_cfg.get("cache_max_entries", DEFAULT_CACHE_MAX_ENTRIES)),
+                )
+            pool = GitHubHTTPPool(
+                api_base,
+                max_concurrency=max_concurrency,
+                cache=cache,
+                rate_limiter=GitHubRateLimiter(max_wait),
+            )
+            _pools[key] = pool
+        return pool
@@ -8,11 +8,10 @@ Used by the Oqoqo self-evolving docs system to detect when monitored files
 import os
 import logging
 import base64
-import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
-import httpx
+from .github_http import GitHubAPIError, GitHubHTTPPool, get_github_http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +100,9 @@ class GitHubPRService:
         }
         if self.token:
             self.headers["Authorization"] = f"Bearer {self.token}"
+
+        self.api_base = github_config.get("api_url") or GITHUB_API_BASE
+        self._http: GitHubHTTPPool = get_github_http_pool(self.api_base, config)
         
         logger.info(f"[GITHUB PR SERVICE] Initialized for {self.owner}/{self.repo}")
         logger.info(f"[GITHUB PR SERVICE] Monitoring file: {self.monitored_file}")
@@ -130,53 +132,21 @@ class GitHubPRService:
                 "GitHub token not configured. Set GITHUB_TOKEN to enable Git features."
             )
 
-        url = f"{GITHUB_API_BASE}{endpoint}"
         request_headers = self.headers.copy()
         if headers:
             request_headers.update(headers)
 
-        backoff_seconds = 1.0
-        with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-            for attempt in range(max_retries + 1):
-                response = client.request(method, url, headers=request_headers, params=params)
-
-                # Fast-path success
-                if response.status_code < 400:
-                    return response.json()
-
-                # Not found / auth errors are not retried.
-                if response.status_code == 404:
-                    raise GitHubAPIError(f"Resource not found: {endpoint}")
-                if response.status_code == 401:
-                    raise GitHubAPIError("Authentication failed. Check GITHUB_TOKEN.")
-
-                # Handle rate limiting with a small exponential backoff for demos.
-                if response.status_code == 403:
-                    remaining = response.headers.get("X-RateLimit-Remaining", "unknown")
-                    reset_at = response.headers.get("X-RateLimit-Reset")
-                    logger.warning(
-                        "[GITHUB PR SERVICE] 403 from GitHub (remaining=%s, reset_at=%s, attempt=%s)",
-                        remaining,
-                        reset_at,
-                        attempt,
-                    )
-                    # If we still have attempts left and remaining is not explicitly zero,
-                    # backoff briefly and retry; otherwise surface a clear error.
-                    if attempt < max_retries and remaining not in {"0", "0.0"}:
-                        time.sleep(backoff_seconds)
-                        backoff_seconds *= 2
-                        continue
-                    raise GitHubAPIError(
-                        f"Access forbidden. Rate limit remaining: {remaining or 'unknown'}"
-                    )
-
-                if response.status_code >= 400:
-                    raise GitHubAPIError(
-                        f"GitHub API error {response.status_code}: {response.text}"
-                    )
-
-            # Defensive fallback; loop should have returned or raised.
-            raise GitHubAPIError("Unexpected GitHub API failure after retries.")
+        return self._http.get_json(
+            endpoint,
+            method=method,
+            params=params,
+            headers=request_headers,
+            max_retries=max_retries,
+        )
+
+    def _fetch_many(self, endpoints: Sequence[str]) -> List[Any]:
+        """GET several endpoints concurrently (bounded by ``github.http.max_concurrency``), in order."""
+        return self._http.map_concurrent(self._make_request, endpoints)
 
     def _repo_endpoint(self, suffix: str) -> str:
         """Helper to build repo-scoped endpoints."""
@@ -546,6 +516,39 @@ class GitHubPRService:
 
         return diff_summary
 
+    def fetch_pr_snapshots(
+        self,
+        pr_numbers: Sequence[int],
+        *,
+        skip_errors: bool = False,
+    ) -> List[Optional[Tuple[Dict[str, Any], Dict[str, Any]]]]:
+        """
+        Fetch ``(fetch_pr_details, fetch_pr_diff_summary)`` for several PRs concurrently.
+
+        Results are returned in the order of ``pr_numbers``. With ``skip_errors``
+        a PR whose details or diff cannot be fetched yields None instead of
+        failing the whole batch.
+        """
+        jobs = [(kind, number) for number in pr_numbers for kind in ("details", "diff")]
+
+        def _run(job: Tuple[str, int]) -> Optional[Dict[str, Any]]:
+            kind, number = job
+            try:
+                if kind == "details":
+                    return self.fetch_pr_details(number)
+                return self.fetch_pr_diff_summary(number)
+            except Exception as exc:
+                if not skip_errors:
+                    raise
+                logger.warning("[GITHUB PR SERVICE] Skipping PR #%s (%s): %s", number, kind, exc)
+                return None
+
+        results = self._http.map_concurrent(_run, jobs)
+        return [
+            (results[idx], results[idx + 1]) if results[idx] is not None and results[idx + 1] is not None else None
+            for idx in range(0, len(results), 2)
+        ]
+
     def list_commits(
         self,
         branch: Optional[str] = None,
@@ -589,6 +592,22 @@ class GitHubPRService:
         commits_data = self._make_request(endpoint, params=params)
         commits: List[Dict[str, Any]] = []
 
+        def _message(commit_data: Dict[str, Any]) -> str:
+            return ((commit_data.get("commit", {}) or {}).get("message", "") or "")
+
+        if message_query:
+            commits_data = [
+                commit_data for commit_data in commits_data
+                if message_query.lower() in _message(commit_data).lower()
+            ]
+
+        # Per-commit file lists need one request each; fetch them concurrently.
+        files_by_sha: Dict[str, List[Dict[str, Any]]] = {}
+        if include_files:
+            shas = [commit_data.get("sha") for commit_data in commits_data if commit_data.get("sha")]
+            details = self._fetch_many([self._repo_endpoint(f"/commits/{sha}") for sha in shas])
+            files_by_sha = {sha: (detail.get("files", []) or []) for sha, detail in zip(shas, details)}
+
         for commit_data in commits_data:
             sha = commit_data.get("sha")
             commit_info = commit_data.get("commit", {}) or {}
@@ -596,14 +615,8 @@ class GitHubPRService:
             committer_info = commit_info.get("committer") or {}
             author_login = commit_data.get("author", {}) or {}
 
-            message = commit_info.get("message", "") or ""
-            if message_query and message_query.lower() not in message.lower():
-                continue
-
-            files: List[Dict[str, Any]] = []
-            if include_files and sha:
-                detail = self._make_request(self._repo_endpoint(f"/commits/{sha}"))
-                files = detail.get("files", []) or []
+            message = _message(commit_data)
+            files: List[Dict[str, Any]] = files_by_sha.get(sha, []) if sha else []
 
             commits.append(
                 {
@@ -872,6 +885,13 @@ class GitHubPRService:
 
         return result
 
+    def get_commits(self, shas: Sequence[str], include_files: bool = True) -> List[Dict[str, Any]]:
+        """Fetch several commits concurrently (same shape as `get_commit`), in order."""
+        return self._http.map_concurrent(
+            lambda sha: self.get_commit(sha, include_files=include_files),
+            shas,
+        )
+
     def list_file_history(
         self,
         path: str,
@@ -1031,11 +1051,6 @@ class GitHubPRService:
         return issues
 
 
-class GitHubAPIError(Exception):
-    """Exception raised for GitHub API errors."""
-    pass
-
-
 # Singleton instance
 _github_service_instance: Optional[GitHubPRService] = None
 
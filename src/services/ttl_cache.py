@@ -6,8 +6,11 @@ from __future__ import annotations
 
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+TTLPolicy = Union[float, Callable[[Any], float]]
 
 
 @dataclass(frozen=True)
@@ -79,3 +82,160 @@ class TTLCache:
             return len(self._store)
 
 
+class _Flight:
+    """A load in progress; followers wait on ``done`` instead of loading again."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ReadThroughCache:
+    """
+    Bounded TTL cache that loads misses itself and coalesces concurrent loads.
+
+    Callers pass a loader alongside the key; the first caller for a missing key
+    runs it while concurrent callers for the same key wait for that result
+    instead of issuing the same request. The TTL may be a callable of the
+    loaded value (e.g. long for merged PRs, short for open ones); a TTL of 0
+    means "do not cache", which is how failed or partial loads are kept out.
+    Loader exceptions propagate to every waiting caller and are not cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 4096,
+        label: str = "read_through",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.label = label
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._store: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, _Flight] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._loads = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], *, ttl_seconds: TTLPolicy) -> Any:
+        """Return the cached value for ``key``, loading (once) on a miss."""
+        return self.get_many_or_load(
+            [key],
+            lambda keys: {key: loader()},
+            ttl_seconds=ttl_seconds,
+        )[key]
+
+    def get_many_or_load(
+        self,
+        keys: Iterable[Hashable],
+        loader: Callable[[List[Hashable]], Dict[Hashable, Any]],
+        *,
+        ttl_seconds: TTLPolicy,
+    ) -> Dict[Hashable, Any]:
+        """
+        Return values for ``keys``; misses not already in flight elsewhere are
+        loaded with a single ``loader(missing_keys)`` call.
+
+        Keys the loader leaves out of its result map to None (and are not cached).
+        """
+        found: Dict[Hashable, Any] = {}
+        owned: Dict[Hashable, _Flight] = {}
+        waiting: Dict[Hashable, _Flight] = {}
+        with self._lock:
+            now = self._clock()
+            for key in keys:
+                if key in found or key in owned or key in waiting:
+                    continue
+                entry = self._store.get(key)
+                if entry is not None and entry[0] > now:
+                    self._store.move_to_end(key)
+                    found[key] = entry[1]
+                    self._hits += 1
+                    continue
+                if entry is not None:
+                    del self._store[key]
+                flight = self._inflight.get(key)
+                if flight is not None:
+                    waiting[key] = flight
+                    self._coalesced += 1
+                    continue
+                flight = _Flight()
+                self._inflight[key] = flight
+                owned[key] = flight
+                self._misses += 1
+
+        if owned:
+            self._load(owned, loader, ttl_seconds)
+            for key, flight in owned.items():
+                if flight.error is not None:
+                    raise flight.error
+                found[key] = flight.value
+        for key, flight in waiting.items():
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            found[key] = flight.value
+        return found
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._store.clear()
+            else:
+                self._store.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "label": self.label,
+                "size": len(self._store),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced": self._coalesced,
+                "loads": self._loads,
+                "in_flight": len(self._inflight),
+                "hit_rate": self._hits / total if total else 0.0,
+            }
+
+    def __len__(self) -> int:  # pragma: no cover - trivial wrapper
+        with self._lock:
+            return len(self._store)
+
+    def _load(
+        self,
+        owned: Dict[Hashable, _Flight],
+        loader: Callable[[List[Hashable]], Dict[Hashable, Any]],
+        ttl_seconds: TTLPolicy,
+    ) -> None:
+        error: Optional[BaseException] = None
+        values: Dict[Hashable, Any] = {}
+        try:
+            values = loader(list(owned)) or {}
+        except BaseException as exc:  # propagate to followers too
+            error = exc
+        with self._lock:
+            self._loads += 1
+            now = self._clock()
+            for key, flight in owned.items():
+                self._inflight.pop(key, None)
+                if error is not None:
+                    flight.error = error
+                    continue
+                value = values.get(key)
+                flight.value = value
+                ttl = ttl_seconds(value) if callable(ttl_seconds) else ttl_seconds
+                if value is not None and ttl and ttl > 0:
+                    self._store[key] = (now + float(ttl), value)
+                    self._store.move_to_end(key)
+            while len(self._store) > self.max_entries:
+                self._store.popitem(last=False)
+        for flight in owned.values():
+            flight.done.set()
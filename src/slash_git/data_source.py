@@ -4,20 +4,32 @@ Data source that feeds the Slash Git executor from synthetic fixtures.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import math
+import re
+import threading
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from fnmatch import fnmatch
+from datetime import datetime, timedelta, timezone
+from fnmatch import fnmatch, translate
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import AbstractSet, Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
 
 from ..graph.service import GraphService
 from ..services.github_pr_service import GitHubPRService
+from ..services.ttl_cache import ReadThroughCache
 from .models import GitTargetComponent, GitTargetRepo, TimeWindow
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_LIVE_MUTABLE_TTL_SECONDS = 60.0
+DEFAULT_LIVE_IMMUTABLE_TTL_SECONDS = 6 * 3600.0
+DEFAULT_LIVE_WINDOW_BUCKET_SECONDS = 60.0
+DEFAULT_LIVE_CACHE_MAX_ENTRIES = 4096
+
 
 def _load_json(path: Path) -> List[Dict[str, Any]]:
     if not path.exists():
@@ -67,6 +79,169 @@ def _within_window(timestamp: Optional[str], window: Optional[TimeWindow]) -> bo
     return True
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_us(value: datetime) -> int:
+    """Microseconds since the epoch; naive datetimes are treated as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+@lru_cache(maxsize=1024)
+def _compile_glob(pattern: str) -> "re.Pattern[str]":
+    return re.compile(translate(pattern))
+
+
+class _GitRecordIndex:
+    """
+    Load-time indexes over synthetic commits or PRs.
+
+    Per repo, dated records are kept sorted by epoch so a time window is two
+    bisects; records without a parseable timestamp always pass the window (as
+    `_within_window` does). Author and label filters are set lookups. Changed
+    files are indexed per repo as a sorted list of distinct paths, so a
+    component's prefix patterns resolve with a bisect (globs scan distinct
+    paths once) and the matching records are memoized per pattern set. Each
+    query walks its smallest candidate set and checks the other filters per
+    record; results come back in file order, like the original linear scan.
+    """
+
+    def __init__(self, records: List[Dict[str, Any]]):
+        self.records = records
+        self._repo: List[Any] = []
+        self._epoch: List[Optional[int]] = []
+        self._by_repo: Dict[Any, List[int]] = {}
+        self._dated: Dict[Any, Tuple[List[int], List[int]]] = {}
+        self._undated: Dict[Any, List[int]] = {}
+        self._files: Dict[Any, Tuple[List[str], Dict[str, List[int]]]] = {}
+        self._by_author: Dict[str, Set[int]] = {}
+        self._by_label: Dict[str, Set[int]] = {}
+        self._by_pr_number: Dict[Tuple[Any, Any], List[int]] = {}
+        self._path_hits: Dict[Tuple[Any, Tuple[str, ...]], FrozenSet[int]] = {}
+
+        dated: Dict[Any, List[Tuple[int, int]]] = {}
+        postings: Dict[Any, Dict[str, List[int]]] = {}
+        for position, record in enumerate(records):
+            repo_id = record.get("repo")
+            self._repo.append(repo_id)
+            self._by_repo.setdefault(repo_id, []).append(position)
+            repo_files = postings.setdefault(repo_id, {})
+            for path in {str(path).lower() for path in record.get("files_changed") or []}:
+                repo_files.setdefault(path, []).append(position)
+            timestamp = _parse_timestamp(record.get("timestamp"))
+            epoch = _epoch_us(timestamp) if timestamp is not None else None
+            self._epoch.append(epoch)
+            if epoch is None:
+                self._undated.setdefault(repo_id, []).append(position)
+            else:
+                dated.setdefault(repo_id, []).append((epoch, position))
+            author = record.get("author")
+            if author:
+                self._by_author.setdefault(author.lower(), set()).add(position)
+            for label in record.get("labels") or []:
+                self._by_label.setdefault(label.lower(), set()).add(position)
+            if "pr_number" in record:
+                self._by_pr_number.setdefault((repo_id, record.get("pr_number")), []).append(position)
+        for repo_id, entries in dated.items():
+            entries.sort()
+            self._dated[repo_id] = ([epoch for epoch, _ in entries], [position for _, position in entries])
+        for repo_id, repo_files in postings.items():
+            self._files[repo_id] = (sorted(repo_files), repo_files)
+
+    def select(
+        self,
+        repo_id: Any,
+        window: Optional[TimeWindow],
+        *,
+        paths: Optional[Sequence[str]] = None,
+        authors: Sequence[str] = (),
+        labels: Sequence[str] = (),
+        pr_number: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        filters: List[AbstractSet[int]] = []
+        if authors:
+            filters.append(set().union(*(self._by_author.get(author.lower(), ()) for author in authors)))
+        if labels:
+            filters.append(set.intersection(*(self._by_label.get(label.lower(), set()) for label in labels)))
+        if paths:
+            filters.append(self._path_positions(repo_id, tuple(paths)))
+        filters.sort(key=len)
+
+        low = high = None
+        if pr_number is not None:
+            candidates: Sequence[int] = self._by_pr_number.get((repo_id, pr_number), [])
+        else:
+            if window:
+                low = _epoch_us(window.start) if window.start else None
+                high = _epoch_us(window.end) if window.end else None
+            window_positions = self._window_positions(repo_id, low, high)
+            if filters and len(filters[0]) < len(window_positions):
+                candidates = sorted(filters.pop(0))
+            else:
+                candidates = sorted(window_positions) if window else window_positions
+
+        lower = low if low is not None else float("-inf")
+        upper = high if high is not None else float("inf")
+        repos, epochs, records = self._repo, self._epoch, self.records
+        results: List[Dict[str, Any]] = []
+        for position in candidates:
+            if repos[position] != repo_id:
+                continue
+            epoch = epochs[position]
+            if epoch is not None and not lower <= epoch <= upper:
+                continue
+            for allowed in filters:
+                if position not in allowed:
+                    break
+            else:
+                results.append(records[position])
+                if pr_number is not None:
+                    break
+        return results
+
+    def _window_positions(self, repo_id: Any, low: Optional[int], high: Optional[int]) -> List[int]:
+        if low is None and high is None:
+            return self._by_repo.get(repo_id, [])
+        epochs, positions = self._dated.get(repo_id, ([], []))
+        start = bisect_left(epochs, low) if low is not None else 0
+        end = bisect_right(epochs, high) if high is not None else len(epochs)
+        return positions[start:end] + self._undated.get(repo_id, [])
+
+    def _path_positions(self, repo_id: Any, patterns: Tuple[str, ...]) -> FrozenSet[int]:
+        key = (repo_id, patterns)
+        hits = self._path_hits.get(key)
+        if hits is not None:
+            return hits
+        files, postings = self._files.get(repo_id, ([], {}))
+        matched: Set[int] = set()
+        for pattern in patterns:
+            normalized = pattern.lower()
+            if "*" in normalized or "?" in normalized:
+                glob = _compile_glob(normalized)
+                for path in files:
+                    if glob.match(path):
+                        matched.update(postings[path])
+                continue
+            index = bisect_left(files, normalized)
+            while index < len(files) and files[index].startswith(normalized):
+                matched.update(postings[files[index]])
+                index += 1
+        hits = frozenset(matched)
+        self._path_hits[key] = hits
+        return hits
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 def _matches_authors(author: Optional[str], authors: Sequence[str]) -> bool:
     if not authors:
         return True
@@ -110,7 +285,13 @@ class BaseGitDataSource:
 
 @dataclass
 class SyntheticGitDataSource(BaseGitDataSource):
-    """Reads synthetic git commits and PRs from disk and provides filtered views."""
+    """
+    Reads synthetic git commits and PRs from disk and provides filtered views.
+
+    Queries are answered from `_GitRecordIndex` structures built at load time.
+    The fixture files are re-read (and re-indexed) whenever their mtime or
+    size changes, so regenerated datasets are picked up without a restart.
+    """
 
     events_path: Path
     prs_path: Path
@@ -123,8 +304,30 @@ class SyntheticGitDataSource(BaseGitDataSource):
         prs_path = synthetic_cfg.get("prs_path", "data/synthetic_git/git_prs.json")
         self.events_path = Path(events_path)
         self.prs_path = Path(prs_path)
-        self._events = _load_json(self.events_path)
-        self._prs = _load_json(self.prs_path)
+        self._reload_lock = threading.Lock()
+        self._signature: Optional[Tuple[Any, Any]] = None
+        self._reload_if_changed()
+
+    def _reload_if_changed(self) -> None:
+        signature = (_file_signature(self.events_path), _file_signature(self.prs_path))
+        if signature == self._signature:
+            return
+        with self._reload_lock:
+            if signature == self._signature:
+                return
+            events = _load_json(self.events_path)
+            prs = _load_json(self.prs_path)
+            self._event_index = _GitRecordIndex(events)
+            self._pr_index = _GitRecordIndex(prs)
+            self._events = events
+            self._prs = prs
+            if self._signature is not None:
+                logger.info(
+                    "[SLASH_GIT] Reloaded synthetic git data (%s events, %s PRs)",
+                    len(events),
+                    len(prs),
+                )
+            self._signature = signature
 
     def get_commits(
         self,
@@ -135,25 +338,14 @@ class SyntheticGitDataSource(BaseGitDataSource):
         authors: Optional[Sequence[str]] = None,
         labels: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
-        paths = component.paths if component else None
-        authors = authors or []
-        labels = labels or []
-        commits: List[Dict[str, Any]] = []
-        for event in self._events:
-            if event.get("repo") != repo.id:
-                continue
-            if not _within_window(event.get("timestamp"), window):
-                continue
-            if authors and not _matches_authors(event.get("author"), authors):
-                continue
-            if labels and not _matches_labels(event.get("labels", []), labels):
-                continue
-            if paths:
-                files = event.get("files_changed") or []
-                if not _matches_paths(files, paths):
-                    continue
-            commits.append(event)
-        return commits
+        self._reload_if_changed()
+        return self._event_index.select(
+            repo.id,
+            window,
+            paths=component.paths if component else None,
+            authors=authors or [],
+            labels=labels or [],
+        )
 
     def get_prs(
         self,
@@ -165,44 +357,58 @@ class SyntheticGitDataSource(BaseGitDataSource):
         authors: Optional[Sequence[str]] = None,
         labels: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
-        paths = component.paths if component else None
-        authors = authors or []
-        labels = labels or []
-        prs: List[Dict[str, Any]] = []
-        for pr in self._prs:
-            if pr.get("repo") != repo.id:
-                continue
-            if pr_number is not None and pr.get("pr_number") != pr_number:
-                continue
-            if pr_number is None and not _within_window(pr.get("timestamp"), window):
-                continue
-            if authors and not _matches_authors(pr.get("author"), authors):
-                continue
-            if labels and not _matches_labels(pr.get("labels", []), labels):
-                continue
-            if paths:
-                files = pr.get("files_changed") or []
-                if not _matches_paths(files, paths):
-                    continue
-            prs.append(pr)
-            if pr_number is not None:
-                break
-        return prs
+        self._reload_if_changed()
+        return self._pr_index.select(
+            repo.id,
+            window,
+            paths=component.paths if component else None,
+            authors=authors or [],
+            labels=labels or [],
+            pr_number=pr_number,
+        )
 
 
 class LiveGitDataSource(BaseGitDataSource):
-    """Fetches git activity directly from GitHub via GitHubPRService."""
+    """
+    Fetches git activity directly from GitHub via GitHubPRService.
+
+    Responses go through a process-wide `ReadThroughCache` keyed by
+    (credential, repo, resource, params): commit file lists and merged PRs are
+    immutable and kept for ``immutable_ttl_seconds``; commit/PR listings and
+    open PRs use ``mutable_ttl_seconds``. Identical concurrent requests share
+    one in-flight fetch, and uncached PR details/diffs are fetched concurrently
+    over the shared GitHub HTTP pool. Window bounds are widened to
+    ``window_bucket_seconds`` boundaries so relative windows ("last 7 days")
+    issued seconds apart reuse the same listing; results are still filtered
+    to the exact window.
+    """
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, *, cache: Optional[ReadThroughCache] = None):
         self.config = config or {}
+        cache_cfg = ((self.config.get("slash_git") or {}).get("live_cache")) or {}
+        self.cache_enabled = bool(cache_cfg.get("enabled", True))
+        self.mutable_ttl_seconds = float(cache_cfg.get("mutable_ttl_seconds", DEFAULT_LIVE_MUTABLE_TTL_SECONDS))
+        self.immutable_ttl_seconds = float(cache_cfg.get("immutable_ttl_seconds", DEFAULT_LIVE_IMMUTABLE_TTL_SECONDS))
+        self.window_bucket_seconds = float(cache_cfg.get("window_bucket_seconds", DEFAULT_LIVE_WINDOW_BUCKET_SECONDS))
+        if cache is None:
+            cache = get_live_git_cache(int(cache_cfg.get("max_entries", DEFAULT_LIVE_CACHE_MAX_ENTRIES)))
+        self._cache = cache
+        self._services: Dict[Tuple[str, str, str], GitHubPRService] = {}
+        self._services_lock = threading.Lock()
 
     def _service(self, repo: GitTargetRepo) -> GitHubPRService:
-        return GitHubPRService(
-            config=self.config,
-            owner=repo.repo_owner,
-            repo=repo.repo_name,
-            base_branch=repo.default_branch,
-        )
+        key = (repo.repo_owner, repo.repo_name, repo.default_branch)
+        with self._services_lock:
+            service = self._services.get(key)
+            if service is None:
+                service = GitHubPRService(
+                    config=self.config,
+                    owner=repo.repo_owner,
+                    repo=repo.repo_name,
+                    base_branch=repo.default_branch,
+                )
+                self._services[key] = service
+        return service
 
     def get_commits(
         self,
@@ -214,20 +420,31 @@ class LiveGitDataSource(BaseGitDataSource):
         labels: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
         service = self._service(repo)
-        since = window.start.isoformat() if window and window.start else None
-        until = window.end.isoformat() if window and window.end else None
-        commits_data = service.list_commits(
-            branch=repo.default_branch,
-            since=since,
-            until=until,
-            include_files=True,
-            per_page=50,
+        scope = self._scope(service)
+        since = self._window_bound(window.start if window else None, round_up=False)
+        until = self._window_bound(window.end if window else None, round_up=True)
+        commits_data = self._cached(
+            scope + ("commits", repo.default_branch, since, until),
+            lambda: service.list_commits(
+                branch=repo.default_branch,
+                since=since,
+                until=until,
+                include_files=False,
+                per_page=50,
+            ),
+            self.mutable_ttl_seconds,
+        )
+        files_by_sha = self._commit_files(
+            service,
+            scope,
+            [commit.get("sha") for commit in commits_data if commit.get("sha")],
         )
         authors = authors or []
         paths = component.paths if component else None
         commits: List[Dict[str, Any]] = []
         for commit in commits_data:
-            files = [file.get("filename") for file in commit.get("files", []) if file.get("filename")]
+            raw_files = files_by_sha.get(commit.get("sha")) or []
+            files = [file.get("filename") for file in raw_files if file.get("filename")]
             repo_url = f"https://github.com/{repo.repo_owner}/{repo.repo_name}"
             record = {
                 "repo": repo.id,
@@ -264,24 +481,35 @@ class LiveGitDataSource(BaseGitDataSource):
         labels: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
         service = self._service(repo)
+        scope = self._scope(service)
         authors = authors or []
         paths = component.paths if component else None
         if pr_number is not None:
-            pr_payload = self._fetch_single_pr(service, repo.id, pr_number, paths)
+            snapshots = self._pr_snapshots(service, scope, [pr_number])
+            pr_payload = self._build_pr_payload(service, repo.id, snapshots.get(pr_number), paths)
             return [pr_payload] if pr_payload else []
 
-        prs_payload: List[Dict[str, Any]] = []
         try:
-            prs = service.list_prs(state="all", base_branch=repo.default_branch, limit=15)
+            prs = self._cached(
+                scope + ("prs", repo.default_branch, 15),
+                lambda: service.list_prs(state="all", base_branch=repo.default_branch, limit=15),
+                self.mutable_ttl_seconds,
+            )
         except Exception:
             prs = []
+        candidates = []
         for pr in prs:
             timestamp = pr.get("merged_at") or pr.get("updated_at") or pr.get("created_at")
             if window and not _within_window(timestamp, window):
                 continue
             if authors and not _matches_authors(pr.get("author"), authors):
                 continue
-            payload = self._fetch_single_pr(service, repo.id, pr.get("number"), paths)
+            candidates.append(pr.get("number"))
+
+        snapshots = self._pr_snapshots(service, scope, candidates)
+        prs_payload: List[Dict[str, Any]] = []
+        for number in candidates:
+            payload = self._build_pr_payload(service, repo.id, snapshots.get(number), paths)
             if not payload:
                 continue
             if labels and not _matches_labels(payload.get("labels", []), labels):
@@ -289,20 +517,95 @@ class LiveGitDataSource(BaseGitDataSource):
             prs_payload.append(payload)
         return prs_payload
 
-    def _fetch_single_pr(
+    # ------------------------------------------------------------------
+    # Cache helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _scope(service: GitHubPRService) -> Tuple[str, str, str]:
+        # Scope entries by credential so tokens never share private results.
+        auth = hashlib.sha256((service.token or "").encode("utf-8")).hexdigest()[:16]
+        return (auth, service.owner, service.repo)
+
+    def _cached(self, key: Tuple[Any, ...], loader: Callable[[], Any], ttl_seconds: float) -> Any:
+        if not self.cache_enabled:
+            return loader()
+        return self._cache.get_or_load(key, loader, ttl_seconds=ttl_seconds)
+
+    def _cached_many(
+        self,
+        keys: Dict[Tuple[Any, ...], Any],
+        loader: Callable[[List[Any]], List[Any]],
+        ttl_seconds: Any,
+    ) -> Dict[Any, Any]:
+        """Resolve ``{cache_key: id}`` to ``{id: value}``, loading misses in one batch."""
+
+        def _load(missing: List[Tuple[Any, ...]]) -> Dict[Tuple[Any, ...], Any]:
+            return dict(zip(missing, loader([keys[key] for key in missing])))
+
+        if not self.cache_enabled:
+            values = _load(list(keys))
+        else:
+            values = self._cache.get_many_or_load(keys, _load, ttl_seconds=ttl_seconds)
+        return {keys[key]: value for key, value in values.items()}
+
+    def _commit_files(
+        self,
+        service: GitHubPRService,
+        scope: Tuple[str, str, str],
+        shas: List[str],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        if not shas:
+            return {}
+        return self._cached_many(
+            {scope + ("commit_files", sha): sha for sha in shas},
+            lambda missing: [detail.get("files") or [] for detail in service.get_commits(missing)],
+            self.immutable_ttl_seconds,
+        )
+
+    def _pr_snapshots(
+        self,
+        service: GitHubPRService,
+        scope: Tuple[str, str, str],
+        pr_numbers: Sequence[Optional[int]],
+    ) -> Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]]:
+        numbers = [int(number) for number in pr_numbers if number]
+        if not numbers:
+            return {}
+
+        def _ttl(snapshot: Optional[Tuple[Dict[str, Any], Dict[str, Any]]]) -> float:
+            if not snapshot:
+                return 0
+            details, _ = snapshot
+            return self.immutable_ttl_seconds if details.get("merged_at") else self.mutable_ttl_seconds
+
+        return self._cached_many(
+            {scope + ("pr_snapshot", number): number for number in numbers},
+            lambda missing: service.fetch_pr_snapshots(missing, skip_errors=True),
+            _ttl,
+        )
+
+    def _window_bound(self, value: Optional[datetime], *, round_up: bool) -> Optional[str]:
+        if not value:
+            return None
+        step = self.window_bucket_seconds if self.cache_enabled else 0
+        if step <= 0:
+            return value.isoformat()
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        ticks = value.timestamp() / step
+        bucket = (math.ceil(ticks) if round_up else math.floor(ticks)) * step
+        return datetime.fromtimestamp(bucket, tz=timezone.utc).isoformat()
+
+    def _build_pr_payload(
         self,
         service: GitHubPRService,
         repo_id: str,
-        pr_number: Optional[int],
+        snapshot: Optional[Tuple[Dict[str, Any], Dict[str, Any]]],
         paths: Optional[Sequence[str]],
     ) -> Optional[Dict[str, Any]]:
-        if not pr_number:
-            return None
-        try:
-            details = service.fetch_pr_details(int(pr_number))
-            diff = service.fetch_pr_diff_summary(int(pr_number))
-        except Exception:
+        if not snapshot:
             return None
+        details, diff = snapshot
         files = [file.get("filename") for file in diff.get("files", []) if file.get("filename")]
         if paths and not _matches_paths(files, paths):
             return None
@@ -325,6 +628,19 @@ class LiveGitDataSource(BaseGitDataSource):
         return payload
 
 
+_live_git_cache: Optional[ReadThroughCache] = None
+_live_git_cache_lock = threading.Lock()
+
+
+def get_live_git_cache(max_entries: int = DEFAULT_LIVE_CACHE_MAX_ENTRIES) -> ReadThroughCache:
+    """Process-wide cache shared by every `LiveGitDataSource`."""
+    global _live_git_cache
+    with _live_git_cache_lock:
+        if _live_git_cache is None:
+            _live_git_cache = ReadThroughCache(max_entries=max_entries, label="live_git")
+        return _live_git_cache
+
+
 class GraphGitDataSource(BaseGitDataSource):
     """Fetches git activity from Neo4j/Qdrant ingested data."""
 
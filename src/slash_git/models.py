@@ -14,6 +14,7 @@ from typing import Any, Dict, Iterable, List, Optional, Sequence
 import yaml
 
 from ..utils import _expand_env_vars
+from ..utils.alias_matcher import AliasMatcher
 
 
 def _normalize_alias(value: str) -> str:
@@ -175,6 +176,7 @@ class GitTargetCatalog:
     repos: Dict[str, GitTargetRepo] = field(default_factory=dict)
     repo_aliases: Dict[str, str] = field(default_factory=dict)
     component_aliases: Dict[str, str] = field(default_factory=dict)
+    _component_matcher: Optional[AliasMatcher[str]] = field(default=None, repr=False, compare=False)
 
     _PLACEHOLDER_PATTERN = re.compile(r"\$\{[^}]+\}")
 
@@ -230,6 +232,22 @@ class GitTargetCatalog:
                 return component
         return None
 
+    def mentioned_component_aliases(self, text: Optional[str]) -> set[str]:
+        """
+        Component alias keys (and raw component ids) occurring in ``text``.
+
+        One Aho–Corasick pass over the lowercased and the alias-normalized
+        text; the matcher is compiled once per catalog.
+        """
+        if not text:
+            return set()
+        if self._component_matcher is None:
+            self._component_matcher = AliasMatcher(
+                (alias, component_id) for alias, component_id in self.component_aliases.items()
+            )
+        matcher = self._component_matcher
+        return matcher.find_aliases(text) | matcher.find_aliases(_normalize_alias(text))
+
     def iter_repos(self) -> Iterable[GitTargetRepo]:
         return self.repos.values()
 
@@ -1,24 +1,78 @@
 """
-Simple JSON-backed store for investigation records.
+Append-only, segmented JSONL store for investigation records.
+
+Layout next to the configured ``investigations_path`` (e.g. ``investigations.jsonl``):
+
+- ``investigations.<seq>.jsonl``   one record per line; ``seq`` increases, the
+                                   highest segment is the one being appended to
+
+- ``investigations.lock``          writer lock shared by every process using the store
+
+Appending writes one line to the active segment, so the cost of a write no
+longer depends on how many investigations are stored. An in-memory index maps
+each id to its (segment, offset, length), making ``get`` a single seek/read,
+and ``list`` reads only the newest lines. Before serving, reads re-stat the
+segments and pick up lines appended (or segments replaced) by other processes.
+
+Reads never change the disk. Writes take the writer lock and then do the
+maintenance: a legacy JSON array at ``investigations_path`` is imported and
+renamed to ``*.migrated``, a torn trailing line left by an interrupted write is
+truncated, and retention (``max_entries``, ``retention_days``, ``max_bytes``)
+drops whole segments from the old end instead of rewriting the file. Until the
+first write, a legacy array is served read-only from memory.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import math
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: writers are only serialized in-process
+    fcntl = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Segments per retention budget: the store may briefly hold up to 1/N over
+# ``max_entries``/``max_bytes`` before the oldest segment is dropped.
+SEGMENTS_PER_BUDGET = 8
+
+
+# Sequence number of the in-memory segment holding a not-yet-migrated legacy array.
+_LEGACY_SEQ = 0
+
+
+@dataclass
+class _Segment:
+    seq: int
+    path: Path
+    # Bytes of complete lines tracked (a torn tail beyond this is not indexed)
+    size: int = 0
+    # (offset, length) of each line, in append order
+    entries: List[Tuple[int, int]] = field(default_factory=list)
+    # (id, offset, length) of each line carrying an id
+    ids: List[Tuple[str, int, int]] = field(default_factory=list)
+    newest_at: Optional[datetime] = None
+    # (inode, size, mtime_ns) of the file when it was last read
+    stamp: Optional[Tuple[int, int, int]] = None
+    # Legacy records served from memory (entries are list indexes, not offsets)
+    records: Optional[List[Dict[str, Any]]] = None
+
 
 class TraceabilityStore:
     """
     Persistence helper for investigations + evidence metadata.
 
-    Stores a capped list of records in JSON (not JSONL) to keep things easy to inspect.
+    Records are appended to segmented JSONL files; see the module docstring.
     """
 
     SCHEMA_VERSION = 1
@@ -35,15 +89,21 @@ class TraceabilityStore:
         self.max_entries = max(1, max_entries)
         self.retention_days = max(0, retention_days)
         self.max_bytes = max(64 * 1024, max_bytes)  # Minimum 64KB to avoid thrashing
+        self.segment_max_entries = max(1, math.ceil(self.max_entries / SEGMENTS_PER_BUDGET))
+        self.segment_max_bytes = max(8 * 1024, self.max_bytes // SEGMENTS_PER_BUDGET)
         self._lock = Lock()
         self.enabled = bool(self.path)
         self._last_error: Optional[Dict[str, Any]] = None
         self._last_write_at: Optional[str] = None
         self._last_count: int = 0
+        self._segments: List[_Segment] = []
+        # id -> (segment seq, offset, length) of the latest record with that id
+        self._index: Dict[str, Tuple[int, int, int]] = {}
+        self._lock_path = self.path.with_name(f"{self.path.stem}.lock") if self.path else None
 
     def append(self, record: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Append a record to the store (trimmed to `max_entries`).
+        Append a record to the store (older segments are dropped by retention).
         """
         if not self.enabled:
             return record
@@ -52,15 +112,14 @@ class TraceabilityStore:
         record.setdefault("schema_version", self.SCHEMA_VERSION)
         record.setdefault("created_at", datetime.now(timezone.utc).isoformat())
 
-        with self._lock:
+        with self._write_lock():
             try:
-                records = self._load()
-                records.append(record)
-                records = self._apply_retention(records)
-                self._write(records)
+                self._prepare_write()
+                self._append_locked(record)
+                self._apply_retention()
                 self._last_error = None
                 self._last_write_at = datetime.now(timezone.utc).isoformat()
-                self._last_count = len(records)
+                self._last_count = self._live_count()
             except Exception as exc:
                 self._last_error = {
                     "message": str(exc),
@@ -77,9 +136,15 @@ class TraceabilityStore:
         if not self.enabled:
             return []
         limit = max(1, min(limit, self.max_entries))
-        records = self._load()
-        subset = records[-limit:]
-        return list(reversed(subset))
+        records: List[Dict[str, Any]] = []
+        with self._lock:
+            self._refresh()
+            for segment in reversed(self._segments):
+                if len(records) >= limit:
+                    break
+                wanted = segment.entries[-(limit - len(records)):]
+                records.extend(reversed(self._read_entries(segment, wanted)))
+        return records
 
     def get(self, investigation_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -89,10 +154,45 @@ class TraceabilityStore:
             return None
         if not investigation_id:
             return None
-        for record in reversed(self._load()):
-            if record.get("id") == investigation_id:
-                return record
-        return None
+        with self._lock:
+            self._refresh()
+            location = self._index.get(investigation_id)
+            if location is None:
+                return None
+            seq, offset, length = location
+            segment = next((seg for seg in self._segments if seg.seq == seq), None)
+            if segment is None:
+                return None
+            found = self._read_entries(segment, [(offset, length)])
+        return found[0] if found else None
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Return every retained record, oldest first (for maintenance scripts)."""
+        if not self.enabled:
+            return []
+        with self._lock:
+            self._refresh()
+            return [record for segment in self._segments for record in self._read_entries(segment, segment.entries)]
+
+    def rewrite(self, records: List[Dict[str, Any]]) -> None:
+        """Replace the stored records (oldest first) with ``records`` in fresh segments."""
+        if not self.enabled:
+            return
+        with self._write_lock():
+            self._prepare_write()
+            old_segments = self._segments
+            self._segments = []
+            self._index = {}
+            next_seq = (old_segments[-1].seq + 1) if old_segments else 1
+            self._segments.append(self._new_segment(next_seq))
+            for record in records:
+                normalized = self._apply_defaults(record)
+                if normalized:
+                    self._append_locked(normalized)
+            for segment in old_segments:
+                self._unlink(segment)
+            self._apply_retention()
+            self._last_count = self._live_count()
 
     def describe(self) -> Dict[str, Any]:
         """
@@ -103,70 +203,250 @@ class TraceabilityStore:
             "path": str(self.path),
             "max_entries": self.max_entries,
             "retention_days": self.retention_days,
-             "max_file_bytes": self.max_bytes,
+            "max_file_bytes": self.max_bytes,
             "schema_version": self.SCHEMA_VERSION,
             "last_write_at": self._last_write_at,
             "last_error": self._last_error,
             "records_cached": self._last_count,
+            "segments": len(self._segments),
+            "bytes": sum(segment.size for segment in self._segments),
         }
 
     # ------------------------------------------------------------------
     # Internal helpers
 
-    def _load(self) -> List[Dict[str, Any]]:
-        if not self.enabled or not self.path.exists():
-            return []
+    def _segment_path(self, seq: int) -> Path:
+        return self.path.with_name(f"{self.path.stem}.{seq:06d}.jsonl")
+
+    def _new_segment(self, seq: int) -> _Segment:
+        return _Segment(seq=seq, path=self._segment_path(seq))
+
+    def _live_count(self) -> int:
+        return sum(len(segment.entries) for segment in self._segments)
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """Serialize writers within this process and, where supported, across processes."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._lock_path, "a+b") as handle:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _refresh(self) -> None:
+        """
+        Bring the in-memory index up to date with the segments on disk (read-only).
+
+        Segments whose size/mtime changed are re-scanned from where the last scan
+        stopped (or from the start if the file was replaced or shrank); segments
+        that disappeared are dropped. A torn trailing line is left in place.
+        """
+        known = {segment.seq: segment for segment in self._segments if segment.records is None}
+        segments: List[_Segment] = []
+        changed = False
+        prefix = f"{self.path.stem}."
+        for candidate in sorted(self.path.parent.glob(f"{self.path.stem}.*.jsonl")):
+            seq_token = candidate.name[len(prefix) : -len(".jsonl")]
+            if not seq_token.isdigit():
+                continue
+            seq = int(seq_token)
+            try:
+                stat = candidate.stat()
+            except FileNotFoundError:
+                continue
+            stamp = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            segment = known.pop(seq, None)
+            if segment is None or segment.stamp != stamp:
+                if segment is None or segment.stamp is None or segment.stamp[0] != stat.st_ino or stat.st_size < segment.size:
+                    segment = _Segment(seq=seq, path=candidate)
+                if not self._scan_segment(segment, stamp):
+                    continue
+                changed = True
+            segments.append(segment)
+        segments.sort(key=lambda segment: segment.seq)
+        changed = changed or bool(known)
+
+        legacy = next((segment for segment in self._segments if segment.records is not None), None)
+        legacy_stamp = self._legacy_stamp()
+        if legacy_stamp is not None:
+            if legacy is None or legacy.stamp != legacy_stamp:
+                legacy = self._read_legacy(legacy_stamp)
+                changed = True
+            if legacy is not None:
+                segments.append(legacy)
+        elif legacy is not None:
+            changed = True
+
+        if changed or len(segments) != len(self._segments):
+            self._segments = segments
+            self._rebuild_index()
+            self._last_count = self._live_count()
+
+    def _scan_segment(self, segment: _Segment, stamp: Tuple[int, int, int]) -> bool:
+        """Index complete lines past ``segment.size``; returns False if the file vanished."""
+        offset = segment.size
+        try:
+            with segment.path.open("rb") as handle:
+                handle.seek(offset)
+                for line in handle:
+                    if not line.endswith(b"\n"):
+                        break  # torn or still-being-written trailing line
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning("[TRACEABILITY] Skipping corrupt line in %s at offset %s", segment.path, offset)
+                        offset += len(line)
+                        continue
+                    self._track(segment, record, offset, len(line))
+                    offset += len(line)
+        except FileNotFoundError:
+            return False
+        segment.size = offset
+        segment.stamp = stamp
+        return True
+
+    def _legacy_stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        if not self.path.is_file():
+            return None
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _read_legacy(self, stamp: Tuple[int, int, int]) -> Optional[_Segment]:
         try:
-            payload = json.loads(self.path.read_text(encoding="utf-8")) or []
-            normalized: List[Dict[str, Any]] = []
-            for entry in payload:
-                normalized_entry = self._apply_defaults(entry)
-                if normalized_entry:
-                    normalized.append(normalized_entry)
-            return normalized
-        except json.JSONDecodeError as exc:
+            text = self.path.read_text(encoding="utf-8")
+            payload = json.loads(text) if text.strip() else []
+        except (OSError, json.JSONDecodeError) as exc:
             logger.warning("[TRACEABILITY] Corrupted investigations file %s: %s", self.path, exc)
-            return []
+            return None
+        if not isinstance(payload, list):
+            return None
+        segment = _Segment(seq=_LEGACY_SEQ, path=self.path, stamp=stamp, records=[])
+        for entry in payload:
+            normalized = self._apply_defaults(entry)
+            if normalized:
+                self._track(segment, normalized, len(segment.records), 0)
+                segment.records.append(normalized)
+        return segment
 
-    def _write(self, records: List[Dict[str, Any]]) -> None:
-        if not self.enabled:
-            return
+    def _rebuild_index(self) -> None:
+        self._index = {}
+        for segment in self._segments:
+            for record_id, offset, length in segment.ids:
+                self._index[record_id] = (segment.seq, offset, length)
+
+    def _prepare_write(self) -> None:
+        """Refresh, then migrate a legacy array and repair torn tails (writer lock held)."""
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        # Ensure max_entries guard even after retention
-        if len(records) > self.max_entries:
-            records = records[-self.max_entries :]
-        self.path.write_text(json.dumps(records, indent=2, ensure_ascii=False))
-        self._enforce_file_size(records)
-
-    def _apply_retention(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        if self.retention_days <= 0:
-            return records
-        cutoff = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
-        pruned: List[Dict[str, Any]] = []
-        for record in records:
-            created_at = record.get("created_at")
-            keep = True
-            if isinstance(created_at, str):
-                try:
-                    keep = datetime.fromisoformat(created_at.replace("Z", "+00:00")) >= cutoff
-                except ValueError:
-                    keep = True
-            if keep:
-                pruned.append(record)
-        return pruned
-
-    def _enforce_file_size(self, records: List[Dict[str, Any]]) -> None:
-        if self.max_bytes <= 0 or not self.path.exists():
-            return
-        size = self.path.stat().st_size
-        if size <= self.max_bytes:
+        self._refresh()
+        legacy = next((segment for segment in self._segments if segment.records is not None), None)
+        if legacy is not None:
+            self._migrate_legacy(legacy)
+        for segment in self._segments:
+            if segment.stamp is not None and segment.stamp[1] > segment.size:
+                # Only a writer may cut the tail: no other append can be in flight.
+                logger.warning("[TRACEABILITY] Truncating torn trailing line in %s", segment.path)
+                with segment.path.open("r+b") as handle:
+                    handle.truncate(segment.size)
+                self._restamp(segment)
+        if not self._segments:
+            self._segments.append(self._new_segment(1))
+
+    def _migrate_legacy(self, legacy: _Segment) -> None:
+        self._segments.remove(legacy)
+        next_seq = (self._segments[-1].seq + 1) if self._segments else 1
+        self._segments.append(self._new_segment(next_seq))
+        for record in legacy.records or []:
+            self._append_locked(record)
+        os.replace(self.path, self.path.with_name(self.path.name + ".migrated"))
+        self._rebuild_index()
+        logger.info("[TRACEABILITY] Migrated %s legacy investigations from %s", len(legacy.records or []), self.path)
+
+    def _restamp(self, segment: _Segment) -> None:
+        try:
+            stat = segment.path.stat()
+        except FileNotFoundError:
+            segment.stamp = None
             return
-        trimmed = records
-        while trimmed and size > self.max_bytes:
-            trimmed = trimmed[1:]
-            self.path.write_text(json.dumps(trimmed, indent=2, ensure_ascii=False))
-            size = self.path.stat().st_size
-        self._last_count = len(trimmed)
+        segment.stamp = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _append_locked(self, record: Dict[str, Any]) -> None:
+        segment = self._segments[-1] if self._segments else None
+        if segment is None or (
+            segment.entries
+            and (len(segment.entries) >= self.segment_max_entries or segment.size >= self.segment_max_bytes)
+        ):
+            segment = self._new_segment((segment.seq + 1) if segment else 1)
+            self._segments.append(segment)
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        segment.path.parent.mkdir(parents=True, exist_ok=True)
+        with segment.path.open("ab") as handle:
+            handle.write(line)
+        self._track(segment, record, segment.size, len(line))
+        segment.size += len(line)
+        self._restamp(segment)
+
+    def _track(self, segment: _Segment, record: Dict[str, Any], offset: int, length: int) -> None:
+        segment.entries.append((offset, length))
+        record_id = record.get("id")
+        if record_id:
+            self._index[str(record_id)] = (segment.seq, offset, length)
+            segment.ids.append((str(record_id), offset, length))
+        created_at = _parse_created_at(record.get("created_at"))
+        if created_at and (segment.newest_at is None or created_at > segment.newest_at):
+            segment.newest_at = created_at
+
+    def _apply_retention(self) -> None:
+        """Drop whole segments from the old end until every budget is met."""
+        cutoff = (
+            datetime.now(timezone.utc) - timedelta(days=self.retention_days) if self.retention_days > 0 else None
+        )
+        while len(self._segments) > 1:
+            oldest = self._segments[0]
+            total = self._live_count()
+            total_bytes = sum(segment.size for segment in self._segments)
+            expired = cutoff is not None and oldest.newest_at is not None and oldest.newest_at < cutoff
+            over_entries = total - len(oldest.entries) >= self.max_entries
+            over_bytes = total_bytes > self.max_bytes
+            if not (expired or over_entries or over_bytes):
+                break
+            self._segments.pop(0)
+            self._unlink(oldest)
+            self._rebuild_index()
+
+    def _unlink(self, segment: _Segment) -> None:
+        try:
+            segment.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _read_entries(self, segment: _Segment, entries: List[Tuple[int, int]]) -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = []
+        if not entries:
+            return records
+        if segment.records is not None:
+            return [dict(segment.records[offset]) for offset, _ in entries]
+        try:
+            with segment.path.open("rb") as handle:
+                for offset, length in entries:
+                    handle.seek(offset)
+                    try:
+                        normalized = self._apply_defaults(json.loads(handle.read(length)))
+                    except json.JSONDecodeError:
+                        continue
+                    if normalized:
+                        records.append(normalized)
+        except FileNotFoundError:
+            return []
+        return records
 
     def _apply_defaults(self, record: Any) -> Dict[str, Any]:
         if not isinstance(record, dict):
@@ -195,3 +475,12 @@ class TraceabilityStore:
 
         return normalized
 
+
+def _parse_created_at(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
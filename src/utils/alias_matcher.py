@@ -0,0 +1,90 @@
+"""
+Aho–Corasick multi-pattern matcher for entity aliases.
+
+Component, service and API inference used to loop over every entity and run
+``alias in text`` per alias, which is O(entities × aliases × text length) per
+message. `AliasMatcher` compiles all aliases once and reports every occurrence
+in a single pass over the text, independent of how many aliases are loaded.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Generic, Iterable, Iterator, List, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class AliasMatcher(Generic[T]):
+    """
+    Case-insensitive substring matcher mapping aliases to values.
+
+    >>> matcher = AliasMatcher([("core api", "comp:core-api"), ("billing", "comp:billing")])
+    >>> matcher.find_values("Core API errors after the billing deploy")
+    {'comp:core-api', 'comp:billing'}
+
+    Matching is plain substring matching (like ``alias in text.lower()``); an
+    alias mapped to several values reports all of them.
+    """
+
+    def __init__(self, aliases: Iterable[Tuple[str, T]] = ()):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, T]]] = [[]]
+        self._size = 0
+        for alias, value in aliases:
+            self._insert(alias, value)
+        self._link()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, str, T]]:
+        """Yield ``(end_index, alias, value)`` for every occurrence in ``text``."""
+        if not text or not self._size:
+            return
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for index, char in enumerate(text.lower()):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for alias, value in out[state]:
+                yield index + 1, alias, value
+
+    def find_values(self, text: str) -> Set[T]:
+        return {value for _, _, value in self.finditer(text)}
+
+    def find_aliases(self, text: str) -> Set[str]:
+        return {alias for _, alias, _ in self.finditer(text)}
+
+    def _insert(self, alias: str, value: T) -> None:
+        key = (alias or "").lower()
+        if not key:
+            return
+        state = 0
+        for char in key:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        if (key, value) not in self._out[state]:
+            self._out[state].append((key, value))
+            self._size += 1
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
@@ -37,7 +37,9 @@ class PerformanceConfigDefaults:
     
     caching_tool_catalog: bool = True
     caching_prompt_templates: bool = True
-    caching_embeddings: bool = True
+    caching_embeddings: bool = False
+    caching_embeddings_path: str = "~/.cache/cerebros/embeddings.sqlite"
+    caching_embeddings_max_mb: int = 512
     
     background_tasks_verification: bool = True
     background_tasks_memory_updates: bool = True
@@ -48,6 +50,10 @@ class PerformanceConfigDefaults:
     session_serialization_write_behind_interval: int = 30
     session_serialization_compression_threshold: int = 100_000
 
+    offload_loop_lag_enabled: bool = True
+    offload_loop_lag_interval_ms: int = 100
+    offload_loop_lag_threshold_ms: int = 250
+
 
 class ConfigValidator:
     """
@@ -100,6 +106,9 @@ class ConfigValidator:
             ),
             "session_serialization": self._validate_session_serialization(
                 perf_config.get("session_serialization", {})
+            ),
+            "offload": self._validate_offload(
+                perf_config.get("offload", {})
             )
         }
         
@@ -149,7 +158,9 @@ class ConfigValidator:
         return {
             "tool_catalog": config.get("tool_catalog", self.defaults.caching_tool_catalog),
             "prompt_templates": config.get("prompt_templates", self.defaults.caching_prompt_templates),
-            "embeddings": config.get("embeddings", self.defaults.caching_embeddings)
+            "embeddings": config.get("embeddings", self.defaults.caching_embeddings),
+            "embeddings_path": config.get("embeddings_path", self.defaults.caching_embeddings_path),
+            "embeddings_max_mb": config.get("embeddings_max_mb", self.defaults.caching_embeddings_max_mb)
         }
     
     def _validate_background_tasks(self, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -169,6 +180,18 @@ class ConfigValidator:
             "compression_threshold": config.get("compression_threshold", self.defaults.session_serialization_compression_threshold)
         }
     
+    def _validate_offload(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate executor offload config (pool specs are passed through)."""
+        loop_lag = config.get("loop_lag", {}) or {}
+        return {
+            "pools": dict(config.get("pools") or {}),
+            "loop_lag": {
+                "enabled": loop_lag.get("enabled", self.defaults.offload_loop_lag_enabled),
+                "interval_ms": loop_lag.get("interval_ms", self.defaults.offload_loop_lag_interval_ms),
+                "threshold_ms": loop_lag.get("threshold_ms", self.defaults.offload_loop_lag_threshold_ms)
+            }
+        }
+    
     def _log_disabled_optimizations(self, validated: Dict[str, Any]):
         """Log warnings for disabled optimizations."""
         warnings = []
@@ -0,0 +1,398 @@
+"""
+Executor offload for blocking work inside async API handlers.
+
+Async FastAPI handlers run on the event loop, so any synchronous call they
+make (graph rollups, Cypher queries, disk I/O, image processing) stalls every
+other request and WebSocket until it returns. This module provides:
+
+- ``OffloadPool``: a named thread or process pool with a bounded queue.
+  Admission happens on the event loop, so a pool never holds more than
+  ``max_workers`` running plus ``max_queue`` waiting calls; beyond that
+  ``OffloadRejected`` is raised instead of queueing unbounded work.
+- ``OffloadRegistry`` / ``offload``: pools configured under
+  ``performance.offload.pools`` and a decorator that turns a synchronous
+  handler into an async one running on a named pool.
+- ``EventLoopLagMonitor``: measures how late the loop wakes up and, when it
+  is blocked past a threshold, captures the loop thread's stack from a
+  watchdog thread to report which handler was holding it.
+
+Usage:
+    @app.get("/activity/quadrant")
+    @offload("activity")
+    def get_activity_quadrant(...):
+        ...
+
+    result = await run_in_pool("graph", run_cerebros_reasoner, config=config, query=query)
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL = "default"
+DEFAULT_POOLS: Dict[str, Dict[str, Any]] = {
+    "default": {"kind": "thread", "max_workers": 8, "max_queue": 256},
+}
+POOL_KINDS = ("thread", "process")
+MAX_SAMPLES = 1024
+
+
+class OffloadRejected(RuntimeError):
+    """Raised when a pool's queue is full."""
+
+
+def _percentile(samples: Iterable[float], pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _summarize(samples: Deque[float]) -> Dict[str, float]:
+    return {
+        "p50": round(_percentile(samples, 50), 3),
+        "p95": round(_percentile(samples, 95), 3),
+        "p99": round(_percentile(samples, 99), 3),
+        "max": round(max(samples), 3) if samples else 0.0,
+    }
+
+
+class OffloadPool:
+    """A named executor with bounded admission and queue/wait metrics."""
+
+    def __init__(self, name: str, kind: str = "thread", max_workers: int = 4, max_queue: int = 64):
+        if kind not in POOL_KINDS:
+            raise ValueError(f"pool kind must be one of {POOL_KINDS}, got {kind!r}")
+        self.name = name
+        self.kind = kind
+        self.max_workers = max(1, int(max_workers))
+        self.max_queue = max(0, int(max_queue))
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+        # Admission state; only touched from the event loop thread.
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.max_queue_depth = 0
+        self._wait_ms: Deque[float] = deque(maxlen=MAX_SAMPLES)
+        self._run_ms: Deque[float] = deque(maxlen=MAX_SAMPLES)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def _get_executor(self) -> Executor:
+        # Created lazily: process pools are expensive and most pools sit idle.
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    if self.kind == "process":
+                        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.max_workers, thread_name_prefix=f"offload-{self.name}"
+                        )
+        return self._executor
+
+    async def _acquire(self) -> None:
+        if self._active < self.max_workers and not self._waiters:
+            self._active += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise OffloadRejected(f"offload pool '{self.name}' is full ({self.max_queue} queued)")
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release()  # the slot was handed over just before cancellation
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)  # hand the slot over; _active is unchanged
+                return
+        self._active -= 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``fn(*args, **kwargs)`` on this pool and return its result."""
+        loop = asyncio.get_running_loop()
+        queued_at = time.perf_counter()
+        await self._acquire()
+        started_at = time.perf_counter()
+        self._wait_ms.append((started_at - queued_at) * 1000)
+        self.submitted += 1
+        call = functools.partial(fn, *args, **kwargs) if args or kwargs else fn
+        try:
+            future = self._get_executor().submit(call)
+        except BaseException:
+            self._release()
+            raise
+
+        def _on_done(_future) -> None:
+            # Free the slot only when the worker is actually done, even if the caller was cancelled.
+            try:
+                loop.call_soon_threadsafe(self._release)
+            except RuntimeError:
+                pass  # loop already closed
+
+        future.add_done_callback(_on_done)
+        try:
+            result = await asyncio.wrap_future(future)
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self._run_ms.append((time.perf_counter() - started_at) * 1000)
+        self.completed += 1
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "active": self._active,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "wait_ms": _summarize(self._wait_ms),
+            "run_ms": _summarize(self._run_ms),
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+class OffloadRegistry:
+    """Named offload pools built from ``performance.offload.pools``."""
+
+    def __init__(self, pools: Optional[Dict[str, Dict[str, Any]]] = None):
+        self._pools: Dict[str, OffloadPool] = {}
+        for name, spec in {**DEFAULT_POOLS, **(pools or {})}.items():
+            self._pools[name] = OffloadPool(name, **(spec or {}))
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "OffloadRegistry":
+        offload_config = ((config or {}).get("performance") or {}).get("offload") or {}
+        return cls(offload_config.get("pools"))
+
+    def pool(self, name: str) -> OffloadPool:
+        pool = self._pools.get(name)
+        if pool is None:
+            logger.warning("[OFFLOAD] Unknown pool %r, using %r", name, DEFAULT_POOL)
+            pool = self._pools[DEFAULT_POOL]
+            self._pools[name] = pool
+        return pool
+
+    async def run(self, pool: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return await self.pool(pool).run(fn, *args, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        return {name: pool.stats() for name, pool in self._pools.items() if pool.name == name}
+
+    def shutdown(self, wait: bool = False) -> None:
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait)
+
+
+_registry: Optional[OffloadRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def configure_offload(config: Optional[Dict[str, Any]]) -> OffloadRegistry:
+    """(Re)build the global registry from config, shutting down the previous pools."""
+    global _registry
+    registry = OffloadRegistry.from_config(config)
+    with _registry_lock:
+        previous, _registry = _registry, registry
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return registry
+
+
+def get_offload_registry() -> OffloadRegistry:
+    """Get the global registry (default pools until ``configure_offload`` is called)."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = OffloadRegistry()
+    return _registry
+
+
+async def run_in_pool(pool: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call on a named pool of the global registry."""
+    return await get_offload_registry().run(pool, fn, *args, **kwargs)
+
+
+def offload(pool: str = DEFAULT_POOL) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorate a synchronous handler so it runs on ``pool`` when awaited.
+
+    The wrapper keeps the handler's signature (via ``functools.wraps``), so it
+    can sit directly under a FastAPI route decorator.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(fn):
+            raise TypeError(f"offload() expects a synchronous function, got coroutine {fn.__qualname__}")
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await get_offload_registry().run(pool, fn, *args, **kwargs)
+
+        wrapper.offload_pool = pool
+        return wrapper
+
+    return decorator
+
+
+class EventLoopLagMonitor:
+    """
+    Measures event-loop lag and reports which handler blocked the loop.
+
+    A coroutine sleeps ``interval_ms`` at a time and records how late it wakes
+    up. A watchdog thread checks the coroutine's heartbeat; when the loop has
+    been stuck for ``threshold_ms`` it snapshots the loop thread's stack, and
+    the handler is resolved from the route endpoints passed to
+    ``register_routes``.
+    """
+
+    def __init__(self, interval_ms: float = 100, threshold_ms: float = 250, max_events: int = 50):
+        self.interval = max(0.001, float(interval_ms) / 1000.0)
+        self.threshold = max(0.001, float(threshold_ms) / 1000.0)
+        self._handlers: Dict[Any, str] = {}
+        self._lag_ms: Deque[float] = deque(maxlen=MAX_SAMPLES)
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=max(1, max_events))
+        self.stalls = 0
+        self._heartbeat = 0.0
+        self._captured: Optional[Tuple[float, Optional[str], List[str]]] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def register_routes(self, routes: Iterable[Any]) -> None:
+        """Map route endpoint code objects to ``"METHOD /path"`` labels."""
+        for route in routes:
+            endpoint = getattr(route, "endpoint", None)
+            path = getattr(route, "path", None)
+            if endpoint is None or path is None:
+                continue
+            methods = ",".join(sorted(getattr(route, "methods", None) or {"WS"}))
+            label = f"{methods} {path}"
+            for candidate in (endpoint, inspect.unwrap(endpoint)):
+                code = getattr(candidate, "__code__", None)
+                if code is not None:
+                    self._handlers.setdefault(code, label)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.perf_counter()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._run())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    async def _run(self) -> None:
+        while True:
+            beat = time.perf_counter()
+            self._heartbeat = beat
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - beat - self.interval)
+            self._lag_ms.append(lag * 1000)
+            if lag >= self.threshold:
+                captured = self._captured
+                handler, stack = (captured[1], captured[2]) if captured and captured[0] == beat else (None, [])
+                self._record_stall(lag, handler, stack)
+
+    def _watch(self) -> None:
+        poll = min(self.interval, self.threshold) / 2
+        while not self._stop.wait(poll):
+            beat = self._heartbeat
+            overdue = time.perf_counter() - beat - self.interval
+            if overdue < self.threshold or (self._captured and self._captured[0] == beat):
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                handler, stack = self._describe(frame)
+                self._captured = (beat, handler, stack)
+
+    def _describe(self, frame) -> Tuple[Optional[str], List[str]]:
+        handler = None
+        cursor = frame
+        while cursor is not None:
+            handler = self._handlers.get(cursor.f_code)
+            if handler is not None:
+                break
+            cursor = cursor.f_back
+        stack = [
+            f"{entry.filename}:{entry.lineno} {entry.name}"
+            for entry in traceback.extract_stack(frame, limit=8)
+        ]
+        return handler, stack
+
+    def _record_stall(self, lag: float, handler: Optional[str], stack: List[str]) -> None:
+        self.stalls += 1
+        lag_ms = round(lag * 1000, 1)
+        self.events.append({
+            "at": datetime.now(timezone.utc).isoformat(),
+            "lag_ms": lag_ms,
+            "handler": handler,
+            "stack": stack,
+        })
+        logger.warning("[LOOP LAG] Event loop blocked for %.0fms by %s", lag_ms, handler or "unknown code")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None,
+            "interval_ms": self.interval * 1000,
+            "threshold_ms": self.threshold * 1000,
+            "lag_ms": _summarize(self._lag_ms),
+            "stalls": self.stalls,
+            "recent_stalls": list(self.events),
+        }
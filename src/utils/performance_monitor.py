@@ -136,13 +136,13 @@ class PerformanceMonitor:
         else:
             self.metrics.connection_pool_new_connections += 1
     
-    def record_cache_hit(self, cache_name: str):
-        """Record a cache hit."""
-        self.metrics.cache_hits[cache_name] += 1
+    def record_cache_hit(self, cache_name: str, count: int = 1):
+        """Record one or more cache hits."""
+        self.metrics.cache_hits[cache_name] += count
     
-    def record_cache_miss(self, cache_name: str):
-        """Record a cache miss."""
-        self.metrics.cache_misses[cache_name] += 1
+    def record_cache_miss(self, cache_name: str, count: int = 1):
+        """Record one or more cache misses."""
+        self.metrics.cache_misses[cache_name] += count
     
     def record_parallel_execution(self, sequential_time: float, parallel_time: float, 
                                   session_id: Optional[str] = None, interaction_id: Optional[str] = None):
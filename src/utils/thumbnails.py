@@ -0,0 +1,325 @@
+"""
+Content-addressed, size-bounded thumbnail cache.
+
+Thumbnails are keyed by the source's resolved path, mtime, size and the
+requested dimension, so an edited image gets a new thumbnail rather than the
+stale one. The cache directory is bounded by an LRU byte budget, concurrent
+requests for the same thumbnail share one render (single-flight), and the
+async path decodes in the ``cpu`` offload pool (a process pool by default).
+
+``render_thumbnail`` is the worker function; this module only imports the
+standard library and ``src.utils.offload`` at module level so process-pool
+workers stay cheap to start.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set, Tuple, Union
+
+from src.utils.offload import OffloadRegistry, get_offload_registry
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+DEFAULT_CACHE_DIR = "data/cache/thumbnails"
+DEFAULT_MAX_SIZE = 256
+DEFAULT_QUALITY = 85
+DEFAULT_MAX_CACHE_MB = 512
+DEFAULT_POOL = "cpu"
+
+
+def render_thumbnail(source: PathLike, destination: PathLike, max_size: int, quality: int = DEFAULT_QUALITY) -> int:
+    """
+    Render ``source`` into a JPEG no larger than ``max_size`` on either side.
+
+    Returns the size in bytes of the written thumbnail.
+    """
+    from PIL import Image
+
+    destination = Path(destination)
+    tmp_path = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+    with Image.open(source) as img:
+        # For JPEGs, let the decoder downscale by 1/2..1/8 instead of decoding every pixel.
+        img.draft("RGB", (max_size, max_size))
+        img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        img.save(tmp_path, "JPEG", quality=quality)
+    # Atomic publish so concurrent requests never serve a half-written file.
+    tmp_path.replace(destination)
+    return destination.stat().st_size
+
+
+class ThumbnailService:
+    """Shared thumbnail cache used by the file API and the image indexer."""
+
+    def __init__(
+        self,
+        cache_dir: PathLike = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_CACHE_MB * 1024 * 1024,
+        quality: int = DEFAULT_QUALITY,
+        default_size: int = DEFAULT_MAX_SIZE,
+        pool: str = DEFAULT_POOL,
+        registry: Optional[OffloadRegistry] = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max(0, int(max_bytes))
+        self.quality = int(quality)
+        self.default_size = int(default_size)
+        self.pool = pool
+        self._registry = registry
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # file name -> bytes, oldest first
+        self._bytes = 0
+        self._inflight: Dict[str, Future] = {}
+        self._render_tasks: Set[asyncio.Future] = set()
+        self._pins: Dict[str, int] = {}  # file name -> responses still reading it
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self._load_entries()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]], registry: Optional[OffloadRegistry] = None) -> "ThumbnailService":
+        thumbnail_config = ((config or {}).get("images") or {}).get("thumbnail") or {}
+        return cls(
+            cache_dir=thumbnail_config.get("cache_dir", DEFAULT_CACHE_DIR),
+            max_bytes=int(float(thumbnail_config.get("max_cache_mb", DEFAULT_MAX_CACHE_MB)) * 1024 * 1024),
+            quality=thumbnail_config.get("quality", DEFAULT_QUALITY),
+            default_size=thumbnail_config.get("max_size", DEFAULT_MAX_SIZE),
+            pool=thumbnail_config.get("pool", DEFAULT_POOL),
+            registry=registry,
+        )
+
+    # ------------------------------------------------------------------
+    # Public API
+
+    def cache_key(self, source: PathLike, max_size: Optional[int] = None) -> Tuple[Path, str]:
+        """Return the resolved source path and the cache file name for it."""
+        source = Path(source).resolve()
+        stat = source.stat()
+        size = int(max_size or self.default_size)
+        digest = hashlib.sha256(f"{source}\0{stat.st_mtime_ns}\0{stat.st_size}\0{size}".encode()).hexdigest()[:32]
+        return source, f"{digest}_{size}.jpg"
+
+    async def get(self, source: PathLike, max_size: Optional[int] = None, *, pin: bool = False) -> Path:
+        """
+        Return the thumbnail for ``source``, rendering it in the offload pool on a miss.
+
+        With ``pin=True`` the file is protected from LRU eviction until
+        ``release`` is called (e.g. once the response streaming it has been sent).
+        """
+        while True:
+            path = await self._get(source, max_size)
+            if not pin or self._pin(path.name):
+                return path
+            # Evicted between rendering and pinning; render it again.
+
+    def release(self, path: PathLike) -> None:
+        """Drop a pin taken by ``get(..., pin=True)``."""
+        name = Path(path).name
+        with self._lock:
+            count = self._pins.get(name, 0) - 1
+            if count > 0:
+                self._pins[name] = count
+                return
+            self._pins.pop(name, None)
+            self._evict_locked()
+
+    async def _get(self, source: PathLike, max_size: Optional[int]) -> Path:
+        source, name = self.cache_key(source, max_size)
+        cached = self._lookup(name)
+        if cached is not None:
+            return cached
+        future, leader = self._join_flight(name)
+        if leader:
+            # Render in a task of its own, so cancelling the request that started
+            # it does not fail every other request waiting on the same thumbnail.
+            task = asyncio.ensure_future(self._render(future, source, name, max_size or self.default_size))
+            self._render_tasks.add(task)
+            task.add_done_callback(self._render_tasks.discard)
+        # shield: a cancelled waiter must not cancel the shared future.
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    async def _render(self, future: Future, source: Path, name: str, max_size: int) -> None:
+        try:
+            registry = self._registry or get_offload_registry()
+            size = await registry.run(
+                self.pool, render_thumbnail, str(source), str(self.cache_dir / name), max_size, self.quality
+            )
+            path = self._store(name, size)
+        except Exception as exc:
+            self._finish_flight(name, future, error=exc)
+            return
+        except BaseException as exc:
+            self._finish_flight(name, future, error=exc)
+            raise
+        self._finish_flight(name, future, result=path)
+
+    def get_sync(self, source: PathLike, max_size: Optional[int] = None) -> Path:
+        """Blocking variant for callers already off the event loop (indexer, pre-generation)."""
+        source, name = self.cache_key(source, max_size)
+        cached = self._lookup(name)
+        if cached is not None:
+            return cached
+        future, leader = self._join_flight(name)
+        if not leader:
+            return future.result()
+        try:
+            size = render_thumbnail(source, self.cache_dir / name, max_size or self.default_size, self.quality)
+            path = self._store(name, size)
+        except BaseException as exc:
+            self._finish_flight(name, future, error=exc)
+            raise
+        self._finish_flight(name, future, result=path)
+        return path
+
+    def pregenerate(self, sources: Iterable[PathLike], max_size: Optional[int] = None) -> int:
+        """Render missing thumbnails for ``sources``; returns how many were generated."""
+        generated = 0
+        for source in sources:
+            try:
+                before = self.misses
+                self.get_sync(source, max_size)
+                generated += self.misses - before
+            except Exception as exc:
+                logger.debug("[THUMBNAILS] Pre-generation failed for %s: %s", source, exc)
+        return generated
+
+    def pregenerate_in_background(self, sources: Iterable[PathLike], max_size: Optional[int] = None) -> threading.Thread:
+        """Run ``pregenerate`` on a daemon thread (used after folders are indexed)."""
+        sources = list(sources)
+
+        def _run() -> None:
+            started = time.perf_counter()
+            generated = self.pregenerate(sources, max_size)
+            logger.info(
+                "[THUMBNAILS] Pre-generated %s/%s thumbnails in %.1fs",
+                generated, len(sources), time.perf_counter() - started,
+            )
+
+        thread = threading.Thread(target=_run, name="thumbnail-pregenerate", daemon=True)
+        thread.start()
+        return thread
+
+    def describe(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "cache_dir": str(self.cache_dir),
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "inflight": len(self._inflight),
+                "pinned": len(self._pins),
+            }
+
+    # ------------------------------------------------------------------
+    # LRU index / single-flight
+
+    def _load_entries(self) -> None:
+        files = []
+        for path in self.cache_dir.glob("*.jpg"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, path.name, stat.st_size))
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._bytes += size
+        with self._lock:
+            self._evict_locked()
+
+    def _lookup(self, name: str) -> Optional[Path]:
+        with self._lock:
+            if name not in self._entries:
+                return None
+            self._entries.move_to_end(name)
+            self.hits += 1
+        path = self.cache_dir / name
+        try:
+            os.utime(path)  # keep recency across restarts
+        except FileNotFoundError:
+            with self._lock:
+                self._bytes -= self._entries.pop(name, 0)
+            return None
+        return path
+
+    def _join_flight(self, name: str) -> Tuple[Future, bool]:
+        with self._lock:
+            future = self._inflight.get(name)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            self._inflight[name] = future
+            self.misses += 1
+            return future, True
+
+    def _finish_flight(self, name: str, future: Future, result: Optional[Path] = None, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            self._inflight.pop(name, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _store(self, name: str, size: int) -> Path:
+        with self._lock:
+            self._bytes -= self._entries.pop(name, 0)
+            self._entries[name] = size
+            self._bytes += size
+            self._evict_locked(keep=name)
+        return self.cache_dir / name
+
+    def _pin(self, name: str) -> bool:
+        with self._lock:
+            if name not in self._entries:
+                return False
+            self._pins[name] = self._pins.get(name, 0) + 1
+            return True
+
+    def _evict_locked(self, keep: Optional[str] = None) -> None:
+        """Evict least recently used entries until under budget, skipping pinned ones."""
+        if self._bytes <= self.max_bytes:
+            return
+        for name in list(self._entries):
+            if self._bytes <= self.max_bytes:
+                break
+            if name == keep or name in self._pins:
+                continue
+            self._bytes -= self._entries.pop(name)
+            self.evictions += 1
+            try:
+                (self.cache_dir / name).unlink()
+            except FileNotFoundError:
+                pass
+
+_services: Dict[str, ThumbnailService] = {}
+_services_lock = threading.Lock()
+
+
+def get_thumbnail_service(config: Optional[Dict[str, Any]] = None) -> ThumbnailService:
+    """Return the process-wide service for the configured cache directory."""
+    thumbnail_config = ((config or {}).get("images") or {}).get("thumbnail") or {}
+    cache_dir = str(Path(thumbnail_config.get("cache_dir", DEFAULT_CACHE_DIR)).resolve())
+    with _services_lock:
+        service = _services.get(cache_dir)
+        if service is None:
+            service = ThumbnailService.from_config(config)
+            _services[cache_dir] = service
+        return service
@@ -4,16 +4,31 @@ Trajectory logging for LLM orchestration decisions.
 Logs all LLM orchestration trajectories in JSONL format for revisitable decision tracking.
 """
 
+import atexit
 import json
 import logging
+import os
+import queue
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
-from threading import Lock
+from threading import Event, Lock, Thread
 import uuid
 
+from .trajectory_store import IndexedLine, TrajectoryStore
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_FLUSH_INTERVAL_MS = 200
+DEFAULT_BLOCK_TIMEOUT_MS = 50
+MAX_OPEN_FILES = 64
+
+_STOP = object()
+
 
 class TrajectoryLogger:
     """
@@ -24,6 +39,13 @@ class TrajectoryLogger:
     - Execution decisions (step execution, parameter resolution)
     - Routing decisions (strategy selection, route selection)
     - Error and retry decisions
+
+    ``log_trajectory`` only builds the entry and puts it on a bounded queue; a
+    background writer thread group-commits batches (one flush/fsync per batch
+    per file) and indexes them in `TrajectoryStore`. When the queue is full the
+    entry is dropped (``overflow: drop``, the default) or the caller waits up to
+    ``block_timeout_ms`` first (``overflow: block``). Configured under
+    ``trajectories.writer``; ``enabled: false`` writes synchronously instead.
     """
     
     def __init__(self, base_dir: str = "data/trajectories", config: Optional[Dict[str, Any]] = None):
@@ -37,9 +59,11 @@ class TrajectoryLogger:
         self.base_dir = Path(base_dir)
         self.config = config or {}
         self._lock = Lock()
-        self._current_file: Optional[Path] = None
-        self._current_session_id: Optional[str] = None
-        self._file_handle = None
+        # session_id -> (file path, handle, store file id), least recently used first
+        self._files: "OrderedDict[str, Tuple[Path, Any, Optional[int]]]" = OrderedDict()
+        # session_id -> (file path, store file id) for every session seen, so a session whose
+        # handle was evicted from ``_files`` reopens the same file instead of starting a new one
+        self._session_files: Dict[str, Tuple[Path, Optional[int]]] = {}
         
         # Create directories
         self.base_dir.mkdir(parents=True, exist_ok=True)
@@ -48,6 +72,32 @@ class TrajectoryLogger:
         # Index file for metadata
         self.index_file = self.base_dir / "index.json"
         self._load_index()
+
+        traj_cfg = self.config.get("trajectories") or {}
+        writer_cfg = traj_cfg.get("writer") or {}
+        self.fsync = bool(writer_cfg.get("fsync", True))
+        self.batch_size = max(1, int(writer_cfg.get("batch_size", DEFAULT_BATCH_SIZE)))
+        self.flush_interval = max(0.0, float(writer_cfg.get("flush_interval_ms", DEFAULT_FLUSH_INTERVAL_MS)) / 1000.0)
+        self.block_on_overflow = str(writer_cfg.get("overflow", "drop")).lower() == "block"
+        self.block_timeout = max(0.0, float(writer_cfg.get("block_timeout_ms", DEFAULT_BLOCK_TIMEOUT_MS)) / 1000.0)
+        self.dropped = 0
+        self.written = 0
+        self.indexed = 0
+        self._index_dirty = False
+
+        try:
+            self.store: Optional[TrajectoryStore] = TrajectoryStore(self.base_dir, traj_cfg.get("index_path"))
+        except Exception as e:
+            logger.warning(f"[TRAJECTORY] Index store unavailable, writing JSONL only: {e}")
+            self.store = None
+
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[Thread] = None
+        if writer_cfg.get("enabled", True):
+            self._queue = queue.Queue(maxsize=max(1, int(writer_cfg.get("queue_size", DEFAULT_QUEUE_SIZE))))
+            self._thread = Thread(target=self._run_writer, name="trajectory-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
     
     def _load_index(self):
         """Load or create index file."""
@@ -69,37 +119,117 @@ class TrajectoryLogger:
         except Exception as e:
             logger.warning(f"[TRAJECTORY] Failed to save index: {e}")
     
-    def _get_trajectory_file(self, session_id: str) -> Path:
-        """Get or create trajectory file for session."""
-        if self._current_session_id != session_id or self._current_file is None:
-            # Close previous file if different session
-            if self._file_handle:
-                self._file_handle.close()
-                self._file_handle = None
-            
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            filename = f"{session_id}_{timestamp}.jsonl"
-            self._current_file = self.base_dir / filename
-            self._current_session_id = session_id
-            
+    def _open_session_file(self, session_id: str) -> Tuple[Path, Any, Optional[int]]:
+        """Get the open file for a session, creating and indexing it on first use."""
+        cached = self._files.get(session_id)
+        if cached is not None:
+            self._files.move_to_end(session_id)
+            return cached
+
+        known = self._session_files.get(session_id)
+        if known is not None:
+            file_path, file_id = known
+            return self._cache_handle(session_id, (file_path, open(file_path, 'ab'), file_id))
+
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        filename = f"{session_id}_{timestamp}.jsonl"
+        file_path = self.base_dir / filename
+        if not file_path.exists():
             # Add to index
-            entry = {
+            self._index["trajectories"].append({
                 "session_id": session_id,
                 "filename": filename,
                 "created_at": datetime.utcnow().isoformat() + "Z",
-                "path": str(self._current_file.relative_to(self.base_dir.parent))
-            }
-            self._index["trajectories"].append(entry)
+                "path": str(file_path.relative_to(self.base_dir.parent))
+            })
+            self._index_dirty = True
+        file_id = self.store.register_file(filename, session_id) if self.store else None
+        self._session_files[session_id] = (file_path, file_id)
+        return self._cache_handle(session_id, (file_path, open(file_path, 'ab'), file_id))
+
+    def _cache_handle(
+        self, session_id: str, opened: Tuple[Path, Any, Optional[int]]
+    ) -> Tuple[Path, Any, Optional[int]]:
+        """Keep ``opened`` as the session's handle, closing the least recently used beyond ``MAX_OPEN_FILES``."""
+        self._files[session_id] = opened
+        while len(self._files) > MAX_OPEN_FILES:
+            _, (_, handle, _) = self._files.popitem(last=False)
+            handle.close()
+        return opened
+
+    def _write_batch(self, batch: List[Tuple[str, Dict[str, Any]]]):
+        """Append a batch of entries, flush/fsync once per file, then index it."""
+        self._index_dirty = False
+        touched: Dict[str, Tuple[Any, Optional[int]]] = {}
+        indexed: Dict[int, List[IndexedLine]] = {}
+        written = 0
+        for session_id, entry in batch:
+            try:
+                _, handle, file_id = self._open_session_file(session_id)
+                data = (json.dumps(entry, default=str) + "\n").encode("utf-8")
+                offset = handle.tell()
+                handle.write(data)
+            except Exception as e:
+                logger.error(f"[TRAJECTORY] Failed to write trajectory entry: {e}", exc_info=True)
+                continue
+            written += 1
+            touched[session_id] = (handle, file_id)
+            if file_id is not None:
+                indexed.setdefault(file_id, []).append((offset, len(data), entry))
+        for handle, _ in touched.values():
+            try:
+                handle.flush()
+                if self.fsync:
+                    os.fsync(handle.fileno())
+            except Exception as e:
+                logger.error(f"[TRAJECTORY] Failed to flush trajectory file: {e}")
+        self.written += written
+        if self._index_dirty:
             self._save_index()
-        
-        return self._current_file
-    
-    def _get_file_handle(self, session_id: str):
-        """Get file handle for writing (creates if needed)."""
-        if self._file_handle is None or self._current_session_id != session_id:
-            file_path = self._get_trajectory_file(session_id)
-            self._file_handle = open(file_path, 'a', encoding='utf-8')
-        return self._file_handle
+        if self.store and indexed:
+            try:
+                self.store.index_lines(indexed)
+                self.indexed += sum(len(lines) for lines in indexed.values())
+            except Exception as e:
+                logger.warning(f"[TRAJECTORY] Failed to index trajectory batch: {e}")
+
+    def _run_writer(self):
+        """Writer thread: drain the queue in batches of up to ``batch_size`` entries."""
+        pending = self._queue
+        assert pending is not None
+        while True:
+            item = pending.get()
+            batch: List[Tuple[str, Dict[str, Any]]] = []
+            markers: List[Any] = []
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is _STOP or isinstance(item, Event):
+                    markers.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    item = pending.get(timeout=remaining) if remaining > 0 else pending.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                with self._lock:
+                    self._write_batch(batch)
+            for marker in markers:
+                if marker is _STOP:
+                    return
+                marker.set()
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until every entry queued before this call has been written."""
+        pending = self._queue
+        if pending is None or self._thread is None or not self._thread.is_alive():
+            return True
+        done = Event()
+        pending.put(done)
+        return done.wait(timeout)
     
     def log_trajectory(
         self,
@@ -167,14 +297,20 @@ class TrajectoryLogger:
         # Add extra fields
         entry.update(extra_fields)
         
-        # Write to file
-        with self._lock:
-            try:
-                f = self._get_file_handle(session_id)
-                f.write(json.dumps(entry, default=str) + "\n")
-                f.flush()  # Ensure immediate write
-            except Exception as e:
-                logger.error(f"[TRAJECTORY] Failed to write trajectory entry: {e}", exc_info=True)
+        pending = self._queue
+        if pending is None:
+            with self._lock:
+                self._write_batch([(session_id, entry)])
+            return
+        try:
+            if self.block_on_overflow:
+                pending.put((session_id, entry), timeout=self.block_timeout)
+            else:
+                pending.put_nowait((session_id, entry))
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(f"[TRAJECTORY] Writer queue full; dropped {self.dropped} entries so far")
     
     def _sanitize_data(self, data: Any) -> Any:
         """Sanitize data for logging (remove sensitive info, truncate large values)."""
@@ -198,13 +334,16 @@ class TrajectoryLogger:
             return data
     
     def close(self):
-        """Close file handles."""
+        """Drain the writer, then close file handles."""
+        pending, self._queue = self._queue, None
+        # Anything logged after close() is written synchronously.
+        if pending is not None and self._thread is not None and self._thread.is_alive():
+            pending.put(_STOP)
+            self._thread.join(timeout=10)
         with self._lock:
-            if self._file_handle:
-                self._file_handle.close()
-                self._file_handle = None
-            self._current_file = None
-            self._current_session_id = None
+            for _, handle, _ in self._files.values():
+                handle.close()
+            self._files.clear()
 
 
 # Global trajectory logger instance
@@ -7,25 +7,34 @@ Provides functions to query and analyze trajectory logs.
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence
 from datetime import datetime
-import re
+
+from .trajectory_store import DEFAULT_PERCENTILES, TrajectoryStore
 
 logger = logging.getLogger(__name__)
 
 
 class TrajectoryQuery:
-    """Query interface for trajectory logs."""
+    """
+    Query interface for trajectory logs.
+
+    Filters and aggregations run against the `TrajectoryStore` index; only the
+    matching lines are read back from the JSONL files. Each query first indexes
+    whatever was appended since the last one.
+    """
     
-    def __init__(self, base_dir: str = "data/trajectories"):
+    def __init__(self, base_dir: str = "data/trajectories", index_path: Optional[str] = None):
         """
         Initialize trajectory query.
         
         Args:
             base_dir: Base directory for trajectory logs
+            index_path: SQLite index location (defaults to ``<base_dir>/index.sqlite``)
         """
         self.base_dir = Path(base_dir)
         self.index_file = self.base_dir / "index.json"
+        self.store = TrajectoryStore(self.base_dir, index_path)
     
     def _load_index(self) -> Dict[str, Any]:
         """Load index file."""
@@ -37,6 +46,14 @@ class TrajectoryQuery:
         except Exception as e:
             logger.warning(f"[TRAJECTORY QUERY] Failed to load index: {e}")
             return {"trajectories": []}
+
+    def _store(self) -> TrajectoryStore:
+        """Return the index store, caught up with the JSONL files."""
+        try:
+            self.store.sync()
+        except Exception as e:
+            logger.warning(f"[TRAJECTORY QUERY] Failed to sync index: {e}")
+        return self.store
     
     def list_sessions(self) -> List[Dict[str, Any]]:
         """List all sessions with trajectory logs."""
@@ -68,54 +85,15 @@ class TrajectoryQuery:
         Returns:
             List of trajectory entries matching criteria
         """
-        # Find trajectory files for this session
-        index = self._load_index()
-        session_files = [
-            entry for entry in index.get("trajectories", [])
-            if entry.get("session_id") == session_id
-        ]
-        
-        if not session_files:
-            return []
-        
-        results = []
-        for entry in session_files:
-            file_path = self.base_dir / entry["filename"]
-            if not file_path.exists():
-                continue
-            
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        trajectory = json.loads(line)
-                        
-                        # Apply filters
-                        if decision_type and trajectory.get("decision_type") != decision_type:
-                            continue
-                        if phase and trajectory.get("phase") != phase:
-                            continue
-                        if component and trajectory.get("component") != component:
-                            continue
-                        if success is not None and trajectory.get("success") != success:
-                            continue
-                        
-                        # Time filter
-                        if start_time or end_time:
-                            traj_time = datetime.fromisoformat(
-                                trajectory["timestamp"].replace("Z", "+00:00")
-                            )
-                            if start_time and traj_time < start_time:
-                                continue
-                            if end_time and traj_time > end_time:
-                                continue
-                        
-                        results.append(trajectory)
-            except Exception as e:
-                logger.warning(f"[TRAJECTORY QUERY] Failed to read {file_path}: {e}")
-        
-        return results
+        return self._store().find(
+            session_id=session_id,
+            decision_type=decision_type,
+            phase=phase,
+            component=component,
+            success=success,
+            start_time=start_time,
+            end_time=end_time,
+        )
     
     def query_by_decision_type(
         self,
@@ -134,39 +112,7 @@ class TrajectoryQuery:
         Returns:
             List of trajectory entries matching criteria
         """
-        index = self._load_index()
-        results = []
-        
-        for entry in index.get("trajectories", []):
-            file_path = self.base_dir / entry["filename"]
-            if not file_path.exists():
-                continue
-            
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        trajectory = json.loads(line)
-                        
-                        if trajectory.get("decision_type") != decision_type:
-                            continue
-                        
-                        # Time filter
-                        if start_time or end_time:
-                            traj_time = datetime.fromisoformat(
-                                trajectory["timestamp"].replace("Z", "+00:00")
-                            )
-                            if start_time and traj_time < start_time:
-                                continue
-                            if end_time and traj_time > end_time:
-                                continue
-                        
-                        results.append(trajectory)
-            except Exception as e:
-                logger.warning(f"[TRAJECTORY QUERY] Failed to read {file_path}: {e}")
-        
-        return results
+        return self._store().find(decision_type=decision_type, start_time=start_time, end_time=end_time)
     
     def query_by_model(
         self,
@@ -185,39 +131,7 @@ class TrajectoryQuery:
         Returns:
             List of trajectory entries matching criteria
         """
-        index = self._load_index()
-        results = []
-        
-        for entry in index.get("trajectories", []):
-            file_path = self.base_dir / entry["filename"]
-            if not file_path.exists():
-                continue
-            
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        trajectory = json.loads(line)
-                        
-                        if trajectory.get("model_used") != model_used:
-                            continue
-                        
-                        # Time filter
-                        if start_time or end_time:
-                            traj_time = datetime.fromisoformat(
-                                trajectory["timestamp"].replace("Z", "+00:00")
-                            )
-                            if start_time and traj_time < start_time:
-                                continue
-                            if end_time and traj_time > end_time:
-                                continue
-                        
-                        results.append(trajectory)
-            except Exception as e:
-                logger.warning(f"[TRAJECTORY QUERY] Failed to read {file_path}: {e}")
-        
-        return results
+        return self._store().find(model_used=model_used, start_time=start_time, end_time=end_time)
     
     def get_statistics(self, session_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -229,82 +143,43 @@ class TrajectoryQuery:
         Returns:
             Statistics dictionary
         """
-        if session_id:
-            trajectories = self.query_by_session(session_id)
-        else:
-            # Load all trajectories
-            index = self._load_index()
-            trajectories = []
-            for entry in index.get("trajectories", []):
-                file_path = self.base_dir / entry["filename"]
-                if not file_path.exists():
-                    continue
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            if line.strip():
-                                trajectories.append(json.loads(line))
-                except Exception as e:
-                    logger.warning(f"[TRAJECTORY QUERY] Failed to read {file_path}: {e}")
-        
-        if not trajectories:
-            return {
-                "total": 0,
-                "by_phase": {},
-                "by_component": {},
-                "by_decision_type": {},
-                "by_model": {},
-                "success_rate": 0.0,
-                "avg_confidence": 0.0,
-                "total_tokens": 0
-            }
-        
-        # Calculate statistics
-        total = len(trajectories)
-        by_phase = {}
-        by_component = {}
-        by_decision_type = {}
-        by_model = {}
-        success_count = 0
-        confidence_sum = 0.0
-        confidence_count = 0
-        total_tokens = 0
+        return self._store().statistics(session_id=session_id)
+
+    def latency_percentiles(
+        self,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        decision_type: Optional[str] = None,
+        model_used: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Latency percentiles (``p50``, ``p90``, ...) over entries that recorded ``latency_ms``.
         
-        for traj in trajectories:
-            phase = traj.get("phase", "unknown")
-            by_phase[phase] = by_phase.get(phase, 0) + 1
-            
-            component = traj.get("component", "unknown")
-            by_component[component] = by_component.get(component, 0) + 1
-            
-            decision_type = traj.get("decision_type", "unknown")
-            by_decision_type[decision_type] = by_decision_type.get(decision_type, 0) + 1
-            
-            model = traj.get("model_used", "unknown")
-            by_model[model] = by_model.get(model, 0) + 1
-            
-            if traj.get("success", False):
-                success_count += 1
-            
-            if "confidence" in traj:
-                confidence_sum += traj["confidence"]
-                confidence_count += 1
-            
-            if "tokens_used" in traj:
-                tokens = traj["tokens_used"]
-                if isinstance(tokens, dict):
-                    total_tokens += tokens.get("total", 0)
+        Returns:
+            Dictionary with ``count`` and one key per percentile (None when empty)
+        """
+        return self._store().latency_percentiles(
+            percentiles,
+            decision_type=decision_type,
+            model_used=model_used,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    def aggregate_by_model(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Dict[str, Any]:
+        """
+        Per-model call counts, success rate, token usage and latency percentiles.
         
-        return {
-            "total": total,
-            "by_phase": by_phase,
-            "by_component": by_component,
-            "by_decision_type": by_decision_type,
-            "by_model": by_model,
-            "success_rate": success_count / total if total > 0 else 0.0,
-            "avg_confidence": confidence_sum / confidence_count if confidence_count > 0 else 0.0,
-            "total_tokens": total_tokens
-        }
+        Returns:
+            Dictionary keyed by model name (``unknown`` when not recorded)
+        """
+        return self._store().aggregate_by_model(percentiles, start_time=start_time, end_time=end_time)
 
 
 def query_trajectories(
@@ -0,0 +1,399 @@
+"""
+Indexed analytics store for trajectory logs.
+
+The JSONL files under ``data/trajectories`` stay the source of truth. This
+module keeps a SQLite (WAL) index next to them with one row per entry: the
+columns analytics filter and aggregate on (session, decision type, model,
+phase, component, success, time, latency, confidence, tokens) plus the
+entry's location (file, byte offset, length).
+
+- Filtering (`find`) uses the index and only reads the matching lines back
+  from the JSONL files.
+- Aggregations (`statistics`, `latency_percentiles`, `aggregate_by_model`)
+  never parse JSON at all.
+- `TrajectoryLogger`'s writer indexes each batch as it is written, and
+  `sync()` indexes anything it missed (older files, other processes), reading
+  each file only from the last indexed byte.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_FILENAME = "index.sqlite"
+DEFAULT_PERCENTILES = (50.0, 90.0, 95.0, 99.0)
+
+# (offset, length, entry) for one JSONL line
+IndexedLine = Tuple[int, int, Dict[str, Any]]
+
+_COLUMNS = (
+    "ts_us",
+    "session_id",
+    "phase",
+    "component",
+    "decision_type",
+    "model_used",
+    "success",
+    "latency_ms",
+    "confidence",
+    "prompt_tokens",
+    "completion_tokens",
+    "total_tokens",
+)
+
+
+class TrajectoryStore:
+    """SQLite index over trajectory JSONL files."""
+
+    def __init__(self, base_dir: str | Path = "data/trajectories", index_path: Optional[str | Path] = None):
+        self.base_dir = Path(base_dir)
+        self.index_path = Path(index_path) if index_path else self.base_dir / DEFAULT_INDEX_FILENAME
+        self._lock = threading.Lock()
+        self._file_ids: Dict[str, int] = {}
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                file_id INTEGER PRIMARY KEY,
+                filename TEXT NOT NULL UNIQUE,
+                session_id TEXT,
+                indexed_bytes INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS entries (
+                file_id INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                ts_us INTEGER,
+                session_id TEXT,
+                phase TEXT,
+                component TEXT,
+                decision_type TEXT,
+                model_used TEXT,
+                success INTEGER,
+                latency_ms REAL,
+                confidence REAL,
+                prompt_tokens INTEGER,
+                completion_tokens INTEGER,
+                total_tokens INTEGER,
+                PRIMARY KEY (file_id, offset)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_entries_session ON entries(session_id, ts_us);
+            CREATE INDEX IF NOT EXISTS idx_entries_decision ON entries(decision_type, ts_us);
+            CREATE INDEX IF NOT EXISTS idx_entries_model ON entries(model_used, ts_us);
+            CREATE INDEX IF NOT EXISTS idx_entries_ts ON entries(ts_us);
+            """
+        )
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Writing
+
+    def register_file(self, filename: str, session_id: Optional[str]) -> int:
+        """Return the file id for ``filename`` (relative to ``base_dir``), creating it if needed."""
+        with self._lock:
+            return self._file_id(filename, session_id)
+
+    def index_lines(self, batches: Dict[int, Sequence[IndexedLine]]) -> None:
+        """Index freshly written lines, grouped by file id, in one transaction."""
+        with self._lock:
+            self._insert(batches)
+            self._conn.commit()
+
+    def sync(self) -> int:
+        """Index lines appended to any JSONL file since it was last indexed; returns rows added."""
+        added = 0
+        with self._lock:
+            indexed = dict(self._conn.execute("SELECT filename, indexed_bytes FROM files"))
+            for path in sorted(self.base_dir.glob("*.jsonl")):
+                try:
+                    size = path.stat().st_size
+                except OSError:
+                    continue
+                start = indexed.get(path.name, 0)
+                if size <= start:
+                    continue
+                lines = list(_read_lines(path, start))
+                if not lines:
+                    continue
+                file_id = self._file_id(path.name, _session_from_filename(path.name))
+                self._insert({file_id: lines})
+                added += len(lines)
+            self._conn.commit()
+        if added:
+            logger.info(f"[TRAJECTORY STORE] Indexed {added} trajectory entries")
+        return added
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Querying
+
+    def find(self, **filters: Any) -> List[Dict[str, Any]]:
+        """Return full entries matching ``filters``, in file and line order."""
+        where, params = _where(**filters)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT f.filename, e.offset, e.length FROM entries e JOIN files f USING (file_id)"
+                f"{where} ORDER BY e.file_id, e.offset",
+                params,
+            ).fetchall()
+        return _read_entries(self.base_dir, rows)
+
+    def statistics(self, **filters: Any) -> Dict[str, Any]:
+        where, params = _where(**filters)
+        with self._lock:
+            total, successes, avg_confidence, total_tokens = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(success), 0), AVG(confidence), COALESCE(SUM(total_tokens), 0)"
+                f" FROM entries e{where}",
+                params,
+            ).fetchone()
+            breakdowns = {
+                key: dict(
+                    self._conn.execute(
+                        f"SELECT COALESCE({column}, 'unknown') AS value, COUNT(*) FROM entries e{where}"
+                        " GROUP BY value ORDER BY MIN(ts_us)",
+                        params,
+                    ).fetchall()
+                )
+                for key, column in (
+                    ("by_phase", "phase"),
+                    ("by_component", "component"),
+                    ("by_decision_type", "decision_type"),
+                    ("by_model", "model_used"),
+                )
+            }
+        return {
+            "total": total,
+            **breakdowns,
+            "success_rate": successes / total if total else 0.0,
+            "avg_confidence": avg_confidence or 0.0,
+            "total_tokens": total_tokens,
+        }
+
+    def latency_percentiles(
+        self, percentiles: Sequence[float] = DEFAULT_PERCENTILES, **filters: Any
+    ) -> Dict[str, Any]:
+        where, params = _where(**filters)
+        where += (" AND" if where else " WHERE") + " e.latency_ms IS NOT NULL"
+        with self._lock:
+            values = [
+                row[0]
+                for row in self._conn.execute(f"SELECT latency_ms FROM entries e{where} ORDER BY latency_ms", params)
+            ]
+        return {"count": len(values), **_percentiles(values, percentiles)}
+
+    def aggregate_by_model(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES, **filters: Any) -> Dict[str, Any]:
+        """Per-model counts, success rate, token totals and latency percentiles."""
+        where, params = _where(**filters)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT COALESCE(model_used, 'unknown') AS model, COUNT(*), COALESCE(SUM(success), 0),"
+                " COALESCE(SUM(prompt_tokens), 0), COALESCE(SUM(completion_tokens), 0),"
+                f" COALESCE(SUM(total_tokens), 0), AVG(latency_ms) FROM entries e{where} GROUP BY model",
+                params,
+            ).fetchall()
+            latencies: Dict[str, List[float]] = {}
+            latency_where = where + (" AND" if where else " WHERE") + " e.latency_ms IS NOT NULL"
+            for model, latency in self._conn.execute(
+                f"SELECT COALESCE(model_used, 'unknown'), latency_ms FROM entries e{latency_where}"
+                " ORDER BY latency_ms",
+                params,
+            ):
+                latencies.setdefault(model, []).append(latency)
+        return {
+            model: {
+                "count": count,
+                "success_rate": successes / count if count else 0.0,
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": total_tokens,
+                "avg_latency_ms": avg_latency,
+                "latency_ms": _percentiles(latencies.get(model, []), percentiles),
+            }
+            for model, count, successes, prompt_tokens, completion_tokens, total_tokens, avg_latency in rows
+        }
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+
+    def _file_id(self, filename: str, session_id: Optional[str]) -> int:
+        file_id = self._file_ids.get(filename)
+        if file_id is None:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO files (filename, session_id) VALUES (?, ?)", (filename, session_id)
+            )
+            file_id = self._conn.execute("SELECT file_id FROM files WHERE filename = ?", (filename,)).fetchone()[0]
+            self._file_ids[filename] = file_id
+        return file_id
+
+    def _insert(self, batches: Dict[int, Sequence[IndexedLine]]) -> None:
+        for file_id, lines in batches.items():
+            if not lines:
+                continue
+            # INSERT OR IGNORE: the writer and sync() may both see the same line.
+            self._conn.executemany(
+                f"INSERT OR IGNORE INTO entries (file_id, offset, length, {', '.join(_COLUMNS)})"
+                f" VALUES (?, ?, ?, {', '.join('?' for _ in _COLUMNS)})",
+                [(file_id, offset, length, *_columns(entry)) for offset, length, entry in lines],
+            )
+            end = max(offset + length for offset, length, _ in lines)
+            self._conn.execute(
+                "UPDATE files SET indexed_bytes = MAX(indexed_bytes, ?) WHERE file_id = ?", (end, file_id)
+            )
+
+
+def _columns(entry: Dict[str, Any]) -> Tuple[Any, ...]:
+    tokens = entry.get("tokens_used") if isinstance(entry.get("tokens_used"), dict) else {}
+    success = entry.get("success")
+    return (
+        _timestamp_us(entry.get("timestamp")),
+        entry.get("session_id"),
+        entry.get("phase"),
+        entry.get("component"),
+        entry.get("decision_type"),
+        entry.get("model_used"),
+        None if success is None else int(bool(success)),
+        _number(entry.get("latency_ms")),
+        _number(entry.get("confidence")),
+        _number(tokens.get("prompt")),
+        _number(tokens.get("completion")),
+        _number(tokens.get("total")),
+    )
+
+
+def _where(
+    *,
+    session_id: Optional[str] = None,
+    decision_type: Optional[str] = None,
+    model_used: Optional[str] = None,
+    phase: Optional[str] = None,
+    component: Optional[str] = None,
+    success: Optional[bool] = None,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+) -> Tuple[str, List[Any]]:
+    clauses: List[str] = []
+    params: List[Any] = []
+    for column, value in (
+        ("session_id", session_id),
+        ("decision_type", decision_type),
+        ("model_used", model_used),
+        ("phase", phase),
+        ("component", component),
+    ):
+        if value:
+            clauses.append(f"e.{column} = ?")
+            params.append(value)
+    if success is not None:
+        clauses.append("e.success = ?")
+        params.append(int(success))
+    if start_time:
+        clauses.append("e.ts_us >= ?")
+        params.append(_datetime_us(start_time))
+    if end_time:
+        clauses.append("e.ts_us <= ?")
+        params.append(_datetime_us(end_time))
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def _read_lines(path: Path, start: int) -> Iterable[IndexedLine]:
+    """Yield complete JSON lines of ``path`` from byte ``start``."""
+    offset = start
+    with path.open("rb") as handle:
+        handle.seek(start)
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break  # still being written
+            length = len(line)
+            if line.strip():
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    entry = None
+                if isinstance(entry, dict):
+                    yield offset, length, entry
+            offset += length
+
+
+def _read_entries(base_dir: Path, rows: Sequence[Tuple[str, int, int]]) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    handle = None
+    current = None
+    try:
+        for filename, offset, length in rows:
+            if filename != current:
+                if handle:
+                    handle.close()
+                current = filename
+                try:
+                    handle = (base_dir / filename).open("rb")
+                except OSError as exc:
+                    logger.warning(f"[TRAJECTORY STORE] Failed to read {filename}: {exc}")
+                    handle = None
+            if handle is None:
+                continue
+            handle.seek(offset)
+            try:
+                results.append(json.loads(handle.read(length)))
+            except json.JSONDecodeError:
+                continue
+    finally:
+        if handle:
+            handle.close()
+    return results
+
+
+def _percentiles(sorted_values: Sequence[float], percentiles: Sequence[float]) -> Dict[str, Optional[float]]:
+    """Linearly interpolated percentiles of an ascending sequence."""
+    result: Dict[str, Optional[float]] = {}
+    for pct in percentiles:
+        key = f"p{pct:g}"
+        if not sorted_values:
+            result[key] = None
+            continue
+        rank = (len(sorted_values) - 1) * pct / 100.0
+        low = int(rank)
+        high = min(low + 1, len(sorted_values) - 1)
+        result[key] = sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+    return result
+
+
+def _session_from_filename(filename: str) -> Optional[str]:
+    # "<session_id>_<YYYYmmdd>_<HHMMSS>.jsonl"
+    parts = filename[: -len(".jsonl")].rsplit("_", 2)
+    return parts[0] if len(parts) == 3 else None
+
+
+def _timestamp_us(value: Any) -> Optional[int]:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return _datetime_us(parsed)
+
+
+def _datetime_us(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1_000_000)
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return value
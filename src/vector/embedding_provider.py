@@ -4,15 +4,16 @@ import logging
 import math
 from typing import List, Optional, Sequence
 
+from ..cache.embedding_cache import get_embedding_cache
 from ..utils.openai_client import PooledOpenAIClient
 
 logger = logging.getLogger(__name__)
 
 
 class EmbeddingProvider:
-    """Thin wrapper around OpenAI embeddings with batching + normalization."""
+    """Thin wrapper around OpenAI embeddings with batching, caching + normalization."""
 
-    def __init__(self, config, *, client=None):
+    def __init__(self, config, *, client=None, cache=None):
         self.config = config
         self.embedding_model = (
             config.get("vectordb", {}).get("embedding_model")
@@ -20,34 +21,42 @@ class EmbeddingProvider:
             or "text-embedding-3-small"
         )
         self.client = client or PooledOpenAIClient.get_client(config)
+        self.cache = cache or get_embedding_cache(config)
 
     def embed(self, text: str) -> Optional[List[float]]:
         embeddings = self.embed_batch([text])
         return embeddings[0] if embeddings else None
 
     def embed_batch(self, texts: Sequence[str], batch_size: int = 32) -> List[Optional[List[float]]]:
-        cleaned = [(text or "").strip() for text in texts]
-        results: List[Optional[List[float]]] = [None] * len(cleaned)
+        max_chars = 8000
+        cleaned = [(text or "").strip()[:max_chars] for text in texts]
         if not cleaned:
-            return results
+            return []
 
-        max_chars = 8000
-        for start in range(0, len(cleaned), batch_size):
-            batch = cleaned[start : start + batch_size]
+        vectors = self.cache.embed(
+            self.embedding_model,
+            cleaned,
+            lambda missing: self._request_batches(missing, batch_size),
+        )
+        return [self._normalize(vector.tolist()) if vector is not None else None for vector in vectors]
+
+    def _request_batches(self, texts: List[str], batch_size: int) -> List[Optional[List[float]]]:
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start : start + batch_size]
             try:
                 response = self.client.embeddings.create(
                     model=self.embedding_model,
-                    input=[text[:max_chars] for text in batch],
+                    input=batch,
                 )
             except Exception as exc:
                 logger.warning("[EMBEDDINGS] Batch generation failed (%s); falling back per-text", exc)
                 for idx, text in enumerate(batch, start=start):
-                    results[idx] = self._embed_single(text[:max_chars])
+                    results[idx] = self._embed_single(text)
                 continue
 
             for offset, item in enumerate(response.data):
-                normalized = self._normalize(item.embedding)
-                results[start + offset] = normalized
+                results[start + offset] = item.embedding
 
         return results
 
@@ -56,7 +65,7 @@ class EmbeddingProvider:
             return None
         try:
             resp = self.client.embeddings.create(model=self.embedding_model, input=text)
-            return self._normalize(resp.data[0].embedding)
+            return resp.data[0].embedding
         except Exception as exc:
             logger.error("[EMBEDDINGS] Failed to embed text: %s", exc)
             return None
@@ -2,47 +2,81 @@ from __future__ import annotations
 
 import json
 import logging
-import math
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
 
 from .embedding_provider import EmbeddingProvider
 from .vector_event import VectorEvent
 
 logger = logging.getLogger(__name__)
 
+STORE_FORMAT = "local-mmap"
+STORE_VERSION = 1
+
+# Record fields that get an inverted row index for filter pre-masking.
+INDEXED_FIELDS = ("service_ids", "component_ids", "apis", "labels")
+
 
 class LocalVectorStore:
-    """Simple JSON-backed vector store for synthetic data experiments."""
+    """
+    File-backed vector store for local/synthetic indexes.
+
+    Layout for ``path`` (e.g. ``slack_index.json``):
+
+    - ``slack_index.json``            manifest (format, dimension)
+    - ``slack_index.vectors.f32``     contiguous float32 matrix of unit vectors, memory-mapped
+    - ``slack_index.payloads.jsonl``  one record per matrix row (without the embedding)
+
+    Upserts append rows; a re-upserted ``event_id`` supersedes its previous row,
+    which is dropped on the next compaction. Search is a single matmul over the
+    live rows plus ``argpartition``; ``filters`` and ``since`` are pre-masked from
+    precomputed per-row columns. Legacy JSON list-of-floats indexes are migrated
+    on first load.
+    """
 
     def __init__(self, path: Path):
-        self.path = path
+        self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._records: List[Dict] = []
-        self._load()
+        self.vectors_path = self.path.with_suffix(".vectors.f32")
+        self.payloads_path = self.path.with_suffix(".payloads.jsonl")
 
-    def _load(self) -> None:
-        if self.path.exists():
-            try:
-                self._records = json.loads(self.path.read_text())
-            except json.JSONDecodeError:
-                logger.warning("[LOCAL VECTOR STORE] Corrupt index at %s, reinitializing", self.path)
-                self._records = []
+        self._lock = threading.RLock()
+        self.dimension: Optional[int] = None
+        self._payloads: List[Dict[str, Any]] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._timestamps = np.zeros(0, dtype=np.float64)
+        self._live = np.zeros(0, dtype=bool)
+        self._field_rows: Dict[str, Dict[str, List[int]]] = {field: {} for field in INDEXED_FIELDS}
+        self._matrix: Optional[np.ndarray] = None
+        self._load()
 
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
     def upsert(self, events: Iterable[VectorEvent]) -> None:
-        index = {record["event_id"]: record for record in self._records}
-        inserted = 0
+        records = []
+        vectors = []
         for event in events:
             record = event.to_record()
-            if not record.get("embedding"):
+            embedding = record.pop("embedding", None)
+            if embedding is None or len(embedding) == 0:
                 raise ValueError(f"Event {event.event_id} missing embedding payload")
-            index[event.event_id] = record
-            inserted += 1
+            records.append(record)
+            vectors.append(embedding)
+
+        if not records:
+            return
+
+        with self._lock:
+            self._append(records, self._normalize_rows(vectors))
+            if self.dead_rows > max(1024, self.live_rows):
+                self.compact()
 
-        self._records = list(index.values())
-        self.path.write_text(json.dumps(self._records, indent=2))
-        logger.info("[LOCAL VECTOR STORE] Upserted %s events (total=%s)", inserted, len(self._records))
+        logger.info("[LOCAL VECTOR STORE] Upserted %s events (total=%s)", len(records), self.live_rows)
 
     def search(
         self,
@@ -53,45 +87,238 @@ class LocalVectorStore:
         filters: Optional[Dict[str, Iterable[str]]] = None,
         since: Optional[datetime] = None,
     ) -> List[Dict]:
-        if not self._records:
+        """Return the ``top_k`` best matches as ``{"score", "record"}``, each record with its embedding."""
+        if not self.live_rows or top_k <= 0:
             return []
 
         embedding = embedding_provider.embed(query)
         if not embedding:
             return []
 
-        filters = filters or {}
-        results: List[Dict] = []
-        for record in self._records:
-            if since and datetime.fromisoformat(record["timestamp"]) < since:
-                continue
-            if not self._passes_filters(record, filters):
-                continue
-            similarity = self._cosine_similarity(record["embedding"], embedding)
-            results.append({"score": similarity, "record": record})
+        with self._lock:
+            candidates = np.flatnonzero(self._candidate_mask(filters or {}, since))
+            if not candidates.size:
+                return []
 
-        results.sort(key=lambda item: item["score"], reverse=True)
-        return results[:top_k]
+            matrix = self._get_matrix()
+            query_vector = self._normalize_rows([embedding])[0]
+            length = min(matrix.shape[1], query_vector.shape[0])
+            if len(candidates) == len(self._payloads):
+                scores = matrix[:, :length] @ query_vector[:length]
+            elif len(candidates) * 4 >= len(self._payloads):
+                # Dense mask: a full matmul beats gathering most of the matrix
+                scores = (matrix[:, :length] @ query_vector[:length])[candidates]
+            else:
+                scores = matrix[candidates, :length] @ query_vector[:length]
 
-    @staticmethod
-    def _passes_filters(record: Dict, filters: Dict[str, Iterable[str]]) -> bool:
+            k = min(top_k, len(candidates))
+            top = np.argpartition(-scores, k - 1)[:k] if k < len(candidates) else np.arange(len(candidates))
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [
+                {"score": float(scores[idx]), "record": self._record_with_embedding(candidates[idx])}
+                for idx in top
+            ]
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Iterate live records (without embeddings) in insertion order."""
+        for row in np.flatnonzero(self._live):
+            yield dict(self._payloads[row])
+
+    def get(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """Return a live record with its (unit-normalized) embedding."""
+        row = self._row_by_id.get(event_id)
+        if row is None:
+            return None
+        return self._record_with_embedding(row)
+
+    def _record_with_embedding(self, row: int) -> Dict[str, Any]:
+        record = dict(self._payloads[row])
+        record["embedding"] = self._get_matrix()[row].tolist()
+        return record
+
+    @property
+    def live_rows(self) -> int:
+        return len(self._row_by_id)
+
+    @property
+    def dead_rows(self) -> int:
+        return len(self._payloads) - len(self._row_by_id)
+
+    def compact(self) -> None:
+        """Rewrite the vector matrix and payload table with only live rows."""
+        with self._lock:
+            live = np.flatnonzero(self._live)
+            if len(live) == len(self._payloads):
+                return
+            vectors = np.array(self._get_matrix()[live]) if len(live) else np.zeros((0, self.dimension or 0), np.float32)
+            records = [self._payloads[row] for row in live]
+
+            tmp_vectors = self.vectors_path.with_suffix(".f32.tmp")
+            tmp_payloads = self.payloads_path.with_suffix(".jsonl.tmp")
+            vectors.astype(np.float32).tofile(tmp_vectors)
+            with tmp_payloads.open("w", encoding="utf-8") as handle:
+                for record in records:
+                    handle.write(json.dumps(record) + "\n")
+            self._matrix = None
+            tmp_vectors.replace(self.vectors_path)
+            tmp_payloads.replace(self.payloads_path)
+
+            self._reset_columns()
+            self._index_rows(records)
+            logger.info("[LOCAL VECTOR STORE] Compacted %s to %s rows", self.path.name, len(records))
+
+    # ------------------------------------------------------------------
+    # Loading / persistence
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        legacy_records: Optional[List[Dict]] = None
+        if self.path.exists():
+            try:
+                manifest = json.loads(self.path.read_text() or "null")
+            except json.JSONDecodeError:
+                logger.warning("[LOCAL VECTOR STORE] Corrupt index at %s, reinitializing", self.path)
+                manifest = None
+            if isinstance(manifest, list):
+                legacy_records = manifest
+            elif isinstance(manifest, dict):
+                self.dimension = manifest.get("dimension")
+
+        if legacy_records is not None:
+            self._migrate_legacy(legacy_records)
+            return
+
+        if not self.payloads_path.exists() or not self.vectors_path.exists() or not self.dimension:
+            return
+
+        records: List[Dict[str, Any]] = []
+        with self.payloads_path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+
+        # Rows are appended vectors-first; drop any torn tail from an interrupted write.
+        row_bytes = self.dimension * 4
+        vector_rows = self.vectors_path.stat().st_size // row_bytes
+        rows = min(len(records), vector_rows)
+        if rows != len(records) or rows * row_bytes != self.vectors_path.stat().st_size:
+            logger.warning("[LOCAL VECTOR STORE] Truncating %s to %s consistent rows", self.path.name, rows)
+            with self.vectors_path.open("r+b") as handle:
+                handle.truncate(rows * row_bytes)
+            records = records[:rows]
+            with self.payloads_path.open("w", encoding="utf-8") as handle:
+                for record in records:
+                    handle.write(json.dumps(record) + "\n")
+
+        self._index_rows(records)
+
+    def _migrate_legacy(self, legacy_records: List[Dict]) -> None:
+        records = []
+        vectors = []
+        for record in legacy_records:
+            record = dict(record)
+            embedding = record.pop("embedding", None)
+            if embedding:
+                records.append(record)
+                vectors.append(embedding)
+        logger.info("[LOCAL VECTOR STORE] Migrating %s legacy JSON records in %s", len(records), self.path.name)
+        for stale in (self.vectors_path, self.payloads_path):
+            if stale.exists():
+                stale.unlink()
+        if records:
+            self._append(records, self._normalize_rows(vectors))
+        else:
+            self.path.unlink()
+
+    def _append(self, records: List[Dict[str, Any]], vectors: np.ndarray) -> None:
+        if self.dimension is None:
+            self.dimension = int(vectors.shape[1])
+            self.path.write_text(json.dumps({"format": STORE_FORMAT, "version": STORE_VERSION, "dimension": self.dimension}))
+        elif vectors.shape[1] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension {vectors.shape[1]} does not match store dimension {self.dimension}"
+            )
+
+        with self.vectors_path.open("ab") as handle:
+            handle.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+        with self.payloads_path.open("a", encoding="utf-8") as handle:
+            handle.write("".join(json.dumps(record) + "\n" for record in records))
+
+        self._matrix = None
+        self._index_rows(records)
+
+    def _get_matrix(self) -> np.ndarray:
+        if self._matrix is None or self._matrix.shape[0] != len(self._payloads):
+            rows = len(self._payloads)
+            if rows == 0:
+                self._matrix = np.zeros((0, self.dimension or 0), dtype=np.float32)
+            else:
+                self._matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(rows, self.dimension))
+        return self._matrix
+
+    # ------------------------------------------------------------------
+    # Columns / masks
+    # ------------------------------------------------------------------
+    def _reset_columns(self) -> None:
+        self._payloads = []
+        self._row_by_id = {}
+        self._timestamps = np.zeros(0, dtype=np.float64)
+        self._live = np.zeros(0, dtype=bool)
+        self._field_rows = {field: {} for field in INDEXED_FIELDS}
+
+    def _index_rows(self, records: List[Dict[str, Any]]) -> None:
+        start = len(self._payloads)
+        self._payloads.extend(records)
+        self._timestamps = np.concatenate(
+            [self._timestamps, np.array([self._timestamp_epoch(r.get("timestamp")) for r in records], dtype=np.float64)]
+        )
+        self._live = np.concatenate([self._live, np.ones(len(records), dtype=bool)])
+        for row, record in enumerate(records, start=start):
+            previous = self._row_by_id.get(record["event_id"])
+            if previous is not None:
+                self._live[previous] = False
+            self._row_by_id[record["event_id"]] = row
+            for field in INDEXED_FIELDS:
+                for value in record.get(field) or []:
+                    self._field_rows[field].setdefault(value, []).append(row)
+
+    def _candidate_mask(self, filters: Dict[str, Iterable[str]], since: Optional[datetime]) -> np.ndarray:
+        mask = self._live.copy()
+        if since is not None:
+            mask &= self._timestamps >= since.timestamp()
         for key, expected_values in filters.items():
             if not expected_values:
                 continue
-            record_values = set(record.get(key) or [])
-            if not record_values.intersection(set(expected_values)):
-                return False
-        return True
+            key_mask = np.zeros(len(self._payloads), dtype=bool)
+            if key in self._field_rows:
+                for value in expected_values:
+                    rows = self._field_rows[key].get(value)
+                    if rows:
+                        key_mask[rows] = True
+            else:
+                expected = set(expected_values)
+                for row in np.flatnonzero(mask):
+                    if expected.intersection(self._payloads[row].get(key) or []):
+                        key_mask[row] = True
+            mask &= key_mask
+        return mask
 
     @staticmethod
-    def _cosine_similarity(vec_a: List[float], vec_b: List[float]) -> float:
-        if not vec_a or not vec_b:
-            return 0.0
-        length = min(len(vec_a), len(vec_b))
-        dot = sum(vec_a[idx] * vec_b[idx] for idx in range(length))
-        norm_a = math.sqrt(sum(v * v for v in vec_a[:length]))
-        norm_b = math.sqrt(sum(v * v for v in vec_b[:length]))
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return dot / (norm_a * norm_b)
+    def _normalize_rows(vectors: List[List[float]]) -> np.ndarray:
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
 
+    @staticmethod
+    def _timestamp_epoch(value: Optional[str]) -> float:
+        if not value:
+            return float("-inf")
+        try:
+            return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return float("-inf")
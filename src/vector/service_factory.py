@@ -134,6 +134,14 @@ def validate_vectordb_config(config: Dict[str, Any]) -> Dict[str, Any]:
 
     dimension = _validate_dimension(vectordb_config.get("dimension", 1536))
 
+    upsert_page_size = vectordb_config.get("upsert_page_size", 256)
+    try:
+        upsert_page_size = int(upsert_page_size)
+    except (TypeError, ValueError):
+        raise VectorServiceConfigError("vectordb.upsert_page_size must be an integer")
+    if upsert_page_size <= 0:
+        raise VectorServiceConfigError("vectordb.upsert_page_size must be greater than zero")
+
     return {
         **vectordb_config,
         "enabled": True,
@@ -145,6 +153,7 @@ def validate_vectordb_config(config: Dict[str, Any]) -> Dict[str, Any]:
         "default_top_k": default_top_k,
         "min_score": min_score,
         "dimension": dimension,
+        "upsert_page_size": upsert_page_size,
     }
 
 
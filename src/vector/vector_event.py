@@ -38,7 +38,7 @@ class VectorEvent:
         return chunk
 
     def to_record(self) -> Dict[str, Any]:
-        """Serialize to dict for LocalVectorStore."""
+        """Serialize to dict (embedding included) for the vector stores."""
         return {
             "event_id": self.event_id,
             "source_type": self.source_type,
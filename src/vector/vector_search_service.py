@@ -9,15 +9,16 @@ from __future__ import annotations
 
 import json
 import logging
-import math
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import UUID, NAMESPACE_URL, uuid4, uuid5
 
 import httpx
+import numpy as np
 
 from ..config.qdrant import get_qdrant_collection_name
 from .context_chunk import ContextChunk
@@ -50,6 +51,32 @@ class VectorSearchOptions:
     metadata_filters: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class IndexingStats:
+    """
+    Per-stage report for one ``index_chunks`` call.
+
+    ``embed_ms`` is summed across embedding batches (which may overlap), while
+    ``embed_wall_ms`` is the elapsed time until the last batch finished.
+    """
+
+    chunks: int = 0
+    indexed: int = 0
+    skipped: int = 0
+    embed_batches: int = 0
+    upsert_pages: int = 0
+    failed_pages: int = 0
+    truncated_chars: int = 0
+    payload_bytes: int = 0
+    embed_ms: float = 0.0
+    embed_wall_ms: float = 0.0
+    upsert_ms: float = 0.0
+    total_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: round(value, 1) if isinstance(value, float) else value for key, value in self.__dict__.items()}
+
+
 class VectorSearchService(ABC):
     """Abstract interface for vector search implementations."""
 
@@ -63,6 +90,7 @@ class VectorSearchService(ABC):
             openai_config.get("embedding_model", "text-embedding-3-small"),
         )
         self._openai_client = None
+        self._embedding_cache = None
 
     @abstractmethod
     def is_configured(self) -> bool:
@@ -80,6 +108,27 @@ class VectorSearchService(ABC):
     ) -> List[ContextChunk]:
         """Run a semantic search query."""
 
+    def semantic_search_vector(
+        self,
+        embedding: List[float],
+        options: Optional[VectorSearchOptions] = None,
+        *,
+        query_label: str = "",
+    ) -> List[ContextChunk]:
+        """
+        Run a semantic search with a precomputed query embedding.
+
+        Lets callers that fan one text out over several filtered searches
+        embed it once (see `embed_queries`). Backends that cannot search by
+        vector raise NotImplementedError; callers fall back to
+        `semantic_search`.
+        """
+        raise NotImplementedError
+
+    def embed_queries(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Normalized query embeddings for texts (None for empty/failed entries)."""
+        return self._embed_texts(texts)
+
     # Shared helpers -----------------------------------------------------
 
     def _get_openai_client(self):
@@ -90,30 +139,63 @@ class VectorSearchService(ABC):
             self._openai_client = PooledOpenAIClient.get_client(self.config)
         return self._openai_client
 
+    def _get_embedding_cache(self):
+        """Lazy-load the shared embedding cache."""
+        if self._embedding_cache is None:
+            from ..cache.embedding_cache import get_embedding_cache
+
+            self._embedding_cache = get_embedding_cache(self.config)
+        return self._embedding_cache
+
+    def _request_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Call the embeddings API for texts that missed the cache."""
+        client = self._get_openai_client()
+        response = client.embeddings.create(
+            model=self.embedding_model,
+            input=texts[0] if len(texts) == 1 else texts,
+        )
+        return [item.embedding for item in response.data]
+
     def _embed_text(self, text: str) -> Optional[List[float]]:
         """Generate normalized embedding vector for text."""
-        text = (text or "").strip()
-        if not text:
+        if not (text or "").strip():
             logger.debug("[VECTOR SEARCH] Skipping embedding generation for empty text payload")
             return None
+        return self._embed_texts([text])[0]
+
+    def _embed_texts(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Generate normalized embedding vectors for a batch of texts.
+
+        Cache misses are sent in a single embeddings request. Entries are None
+        for empty texts or when the request fails.
+        """
+        cleaned = [(text or "").strip()[:8000] for text in texts]  # Guardrail for extremely long docs
+        results: List[Optional[List[float]]] = [None] * len(cleaned)
+        wanted = [idx for idx, text in enumerate(cleaned) if text]
+        if not wanted:
+            return results
 
-        client = self._get_openai_client()
         try:
-            response = client.embeddings.create(
-                model=self.embedding_model,
-                input=text[:8000],  # Guardrail for extremely long docs
+            vectors = self._get_embedding_cache().embed(
+                self.embedding_model,
+                [cleaned[idx] for idx in wanted],
+                self._request_embeddings,
             )
-            embedding = response.data[0].embedding
+        except Exception as exc:
+            logger.error(f"[VECTOR SEARCH] Failed to generate embedding: {exc}")
+            return results
 
+        for idx, vector in zip(wanted, vectors):
+            if vector is None:
+                continue
             # Normalize vector for cosine similarity
-            norm = math.sqrt(sum(v * v for v in embedding))
+            vector = np.asarray(vector, dtype=np.float64)
+            norm = float(np.linalg.norm(vector))
             if norm > 0:
-                embedding = [v / norm for v in embedding]
-
-            return embedding
-        except Exception as exc:
-            logger.error(f"[VECTOR SEARCH] Failed to generate embedding: {exc}")
-            return None
+                vector = vector / norm
+            results[idx] = vector.tolist()
+        return results
 
 
 class QdrantVectorSearchService(VectorSearchService):
@@ -131,9 +213,11 @@ class QdrantVectorSearchService(VectorSearchService):
         self.default_top_k = vectordb_config.get("default_top_k", 12)
         self.default_min_score = vectordb_config.get("min_score", 0.35)
         self.dimension = vectordb_config.get("dimension", 1536)
+        self.upsert_page_size = max(1, int(vectordb_config.get("upsert_page_size", 256)))
 
         self._http_client: Optional[httpx.Client] = None
         self._collection_ready = False
+        self.last_index_stats: Optional[IndexingStats] = None
 
         if self.is_configured():
             headers = {"Content-Type": "application/json"}
@@ -163,6 +247,16 @@ class QdrantVectorSearchService(VectorSearchService):
         )
 
     def index_chunks(self, chunks: List[ContextChunk]) -> bool:
+        """
+        Embed and upsert chunks as a pipeline.
+
+        Chunks are embedded in batches of ``performance.batch_embeddings.batch_size``
+        with up to ``max_concurrent_batches`` batches in flight; finished points are
+        streamed to Qdrant in pages of ``vectordb.upsert_page_size`` while later
+        batches are still embedding. Per-stage timings are logged and kept on
+        ``last_index_stats``. Returns True only if points were written and every
+        page succeeded.
+        """
         if not self.is_configured() or not chunks or not self._http_client:
             return False
 
@@ -173,65 +267,130 @@ class QdrantVectorSearchService(VectorSearchService):
                 logger.error("[VECTOR SEARCH] %s", exc)
                 return False
 
+        stats = IndexingStats(chunks=len(chunks))
+        self.last_index_stats = stats
+        started = time.perf_counter()
+
+        batch_size, max_concurrent = self._embedding_batch_settings()
+        batches = [chunks[start : start + batch_size] for start in range(0, len(chunks), batch_size)]
+        stats.embed_batches = len(batches)
+
+        pending_points: List[Dict[str, Any]] = []
+        in_flight: Set[Future] = set()
+        batch_size_of: Dict[Future, int] = {}
+        next_batch = 0
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrent, len(batches)),
+            thread_name_prefix="qdrant-embed",
+        ) as executor:
+            while next_batch < len(batches) or in_flight:
+                # Keep one batch queued beyond the worker count so workers never idle,
+                # without holding every embedded batch in memory at once.
+                while next_batch < len(batches) and len(in_flight) <= max_concurrent:
+                    future = executor.submit(self._embed_batch, batches[next_batch])
+                    batch_size_of[future] = len(batches[next_batch])
+                    in_flight.add(future)
+                    next_batch += 1
+
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    points, embed_ms, truncated = future.result()
+                    stats.skipped += batch_size_of.pop(future) - len(points)
+                    stats.embed_ms += embed_ms
+                    stats.truncated_chars += truncated
+                    pending_points.extend(points)
+
+                if not in_flight and next_batch >= len(batches):
+                    stats.embed_wall_ms = (time.perf_counter() - started) * 1000
+
+                while len(pending_points) >= self.upsert_page_size:
+                    page = pending_points[: self.upsert_page_size]
+                    pending_points = pending_points[self.upsert_page_size :]
+                    self._upsert_page(page, stats)
+
+        if pending_points:
+            self._upsert_page(pending_points, stats)
+
+        stats.total_ms = (time.perf_counter() - started) * 1000
+        if not stats.upsert_pages:
+            logger.warning(
+                "[VECTOR SEARCH] No points to index (embeddings missing=%s/%s)",
+                stats.skipped,
+                stats.chunks,
+            )
+            return False
+
+        logger.info(
+            "[VECTOR SEARCH] Indexed %s/%s chunks into collection '%s' "
+            "(skipped=%s batches=%s pages=%s failed_pages=%s truncated_chars=%s payload_kb=%.1f "
+            "embed_ms=%.1f embed_wall_ms=%.1f upsert_ms=%.1f total_ms=%.1f)",
+            stats.indexed,
+            stats.chunks,
+            self.collection,
+            stats.skipped,
+            stats.embed_batches,
+            stats.upsert_pages,
+            stats.failed_pages,
+            stats.truncated_chars,
+            stats.payload_bytes / 1024.0,
+            stats.embed_ms,
+            stats.embed_wall_ms,
+            stats.upsert_ms,
+            stats.total_ms,
+        )
+        return stats.failed_pages == 0
+
+    def _embedding_batch_settings(self) -> Tuple[int, int]:
+        batch_config = (self.config.get("performance") or {}).get("batch_embeddings") or {}
+        if batch_config.get("enabled", True) is False:
+            return 1, 1
+        batch_size = max(1, int(batch_config.get("batch_size", 100)))
+        max_concurrent = max(1, int(batch_config.get("max_concurrent_batches", 2)))
+        return batch_size, max_concurrent
+
+    def _embed_batch(self, batch: List[ContextChunk]) -> Tuple[List[Dict[str, Any]], float, int]:
+        """Embed one batch of chunks and return (points, embed_ms, truncated_chars)."""
+        start = time.perf_counter()
+        embeddings = self._embed_texts([chunk.text for chunk in batch])
+        embed_ms = (time.perf_counter() - start) * 1000
+
         points = []
-        total_chars = 0
         truncated_chars = 0
-        embedding_failures = 0
-        for chunk in chunks:
+        for chunk, embedding in zip(batch, embeddings):
             raw_text = chunk.text or ""
-            total_chars += len(raw_text)
             safe_text = ContextChunk.clamp_text(raw_text)
             if len(raw_text) > len(safe_text):
                 truncated_chars += len(raw_text) - len(safe_text)
-
-            embedding = self._embed_text(chunk.text)
             if not embedding:
-                embedding_failures += 1
                 logger.debug(
                     "[VECTOR SEARCH] Skipping chunk %s (%s) due to missing embedding",
                     chunk.chunk_id,
                     chunk.entity_id,
                 )
                 continue
-            point_id = self._normalize_point_id(chunk)
             points.append(
                 {
-                    "id": point_id,
+                    "id": self._normalize_point_id(chunk),
                     "vector": embedding,
                     "payload": self._chunk_to_payload(chunk, text_override=safe_text),
                 }
             )
+        return points, embed_ms, truncated_chars
 
-        if not points:
-            logger.warning(
-                "[VECTOR SEARCH] No points to index (embeddings missing=%s/%s)",
-                embedding_failures,
-                len(chunks),
-            )
-            return False
-
+    def _upsert_page(self, points: List[Dict[str, Any]], stats: IndexingStats) -> bool:
         payload = {"points": points}
         payload_bytes = len(json.dumps(payload).encode("utf-8"))
+        stats.upsert_pages += 1
+        stats.payload_bytes += payload_bytes
 
+        start = time.perf_counter()
         try:
-            start = time.perf_counter()
             response = self._http_client.put(
                 f"/collections/{self.collection}/points?wait=true",
                 json=payload,
             )
             response.raise_for_status()
-            latency_ms = (time.perf_counter() - start) * 1000
-            logger.info(
-                "[VECTOR SEARCH] Indexed %s chunks into collection '%s' "
-                "(skipped=%s truncated_chars=%s payload_kb=%.1f status=%s latency_ms=%.1f)",
-                len(points),
-                self.collection,
-                len(chunks) - len(points),
-                truncated_chars,
-                payload_bytes / 1024.0,
-                response.status_code,
-                latency_ms,
-            )
+            stats.indexed += len(points)
             return True
         except httpx.HTTPStatusError as exc:
             sample_point = points[0] if points else {}
@@ -245,10 +404,12 @@ class QdrantVectorSearchService(VectorSearchService):
                 len(sample_point.get("vector") or []),
                 exc.response.text,
             )
-            return False
         except Exception as exc:
             logger.error(f"[VECTOR SEARCH] Failed to index chunks: {exc}")
-            return False
+        finally:
+            stats.upsert_ms += (time.perf_counter() - start) * 1000
+        stats.failed_pages += 1
+        return False
 
     def semantic_search(
         self,
@@ -275,6 +436,26 @@ class QdrantVectorSearchService(VectorSearchService):
             logger.debug("[VECTOR SEARCH] Failed to generate embedding for query '%s'", query)
             return []
 
+        return self.semantic_search_vector(embedding, options, query_label=query)
+
+    def semantic_search_vector(
+        self,
+        embedding: List[float],
+        options: Optional[VectorSearchOptions] = None,
+        *,
+        query_label: str = "",
+    ) -> List[ContextChunk]:
+        if not embedding or not self.is_configured() or not self._http_client:
+            return []
+
+        if not self._collection_ready:
+            try:
+                self._ensure_collection()
+            except RuntimeError as exc:
+                logger.error("[VECTOR SEARCH] %s", exc)
+                return []
+
+        query = query_label
         options = options or VectorSearchOptions()
         limit = options.top_k or self.default_top_k
         min_score = options.min_score or self.default_min_score
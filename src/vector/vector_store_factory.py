@@ -24,7 +24,7 @@ def create_vector_store(
 
     Args:
         domain: Logical data source (e.g., "slack", "git").
-        local_path: JSON path used when VECTOR_BACKEND=local.
+        local_path: Manifest path for the memory-mapped store used when VECTOR_BACKEND=local.
         config: Optional config dict for pulling vectordb defaults.
     """
     backend = _vector_backend()
@@ -49,7 +49,7 @@ def create_vector_store(
             dimension=dimension,
         )
 
-    # Default to local JSON-backed store
+    # Default to the local memory-mapped store
     if not local_path:
         raise ValueError("Local vector store requires a path to persist embeddings.")
     return LocalVectorStore(local_path)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import pytest
+
+from src.activity_graph import severity
+from src.vector.context_chunk import ContextChunk
+
+NOW = datetime(2026, 10, 1, 12, tzinfo=timezone.utc)
+
+
+class FakeGraphService:
+    """Answers the severity queries from an in-memory issue table, counting round trips."""
+
+    def __init__(self, issues: Dict[str, Dict[str, Any]]):
+        self.issues = issues
+        self.queries: List[str] = []
+
+    def is_available(self) -> bool:
+        return True
+
+    def run_query(self, query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        self.queries.append(query)
+        if "$issues" in query:
+            key = next(
+                name
+                for name in ("slack_count", "git_count", "support_count", "downstream_count")
+                if name in query
+            )
+            return [
+                {"issue_id": item["issue_id"], key: self.issues[item["issue_id"]][key]}
+                for item in params["issues"]
+            ]
+        rows = []
+        for issue_id in params["issue_ids"]:
+            issue = self.issues.get(issue_id)
+            if "count(DISTINCT sig) AS msg_count" in query:
+                rows.append({"issue_id": issue_id, **(issue or {}).get("slack", {})})
+            elif "AS pr_count" in query:
+                rows.append({"issue_id": issue_id, **(issue or {}).get("git", {})})
+            elif issue is None:
+                continue
+            elif "AS impact_level" in query:
+                rows.append({"issue_id": issue_id, "severity": issue["severity"], "updated_at": issue["updated_at"]})
+            elif "num_related_doc_issues" in query:
+                rows.append({"issue_id": issue_id, "component_ids": issue["components"], "num_components": len(issue["components"])})
+            elif "direct_api_ids" in query:
+                rows.append({"issue_id": issue_id, "title": issue["title"], "component_ids": issue["components"]})
+        return rows
+
+
+class FakeVectorService:
+    def __init__(self):
+        self.embedded: List[str] = []
+        self.searches = 0
+        self._lock = threading.Lock()
+
+    def embed_queries(self, texts):
+        self.embedded.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def semantic_search_vector(self, embedding, options, *, query_label=""):
+        with self._lock:
+            self.searches += 1
+        score = 0.5 if "doc" in options.source_types else 0.8
+        return [ContextChunk(chunk_id="c", entity_id="e", source_type="doc", text="", metadata={"_score": score})]
+
+    def semantic_search(self, query, options=None):  # pragma: no cover - must not be used
+        raise AssertionError("query text should not be re-embedded per pair")
+
+
+def _issues(count: int) -> Dict[str, Dict[str, Any]]:
+    return {
+        f"issue-{idx}": {
+            "title": f"Doc drift {idx}",
+            "severity": ["low", "medium", "high"][idx % 3],
+            "updated_at": (NOW - timedelta(days=idx % 10)).isoformat(),
+            "components": [f"comp:{idx % 4}"],
+            "slack": {"msg_count": idx % 5, "author_count": idx % 3, "max_weight": 0.5},
+            "git": {"pr_count": idx % 2, "commit_count": idx % 7},
+            "slack_count": idx % 5,
+            "git_count": idx % 7,
+            "support_count": idx % 2,
+            "downstream_count": idx % 3,
+        }
+        for idx in range(count)
+    }
+
+
+@pytest.fixture
+def vector_service(monkeypatch):
+    service = FakeVectorService()
+    monkeypatch.setattr(severity, "_get_vector_service", lambda: service)
+    return service
+
+
+def test_query_count_is_constant_in_issue_count(vector_service):
+    small = FakeGraphService(_issues(1))
+    severity.compute_issue_severities(list(small.issues), graph_service=small, now=NOW)
+    large = FakeGraphService(_issues(50))
+    results = severity.compute_issue_severities(list(large.issues), graph_service=large, now=NOW)
+
+    assert len(results) == 50
+    assert len(large.queries) == len(small.queries) == 9
+    assert all("UNWIND" in query for query in large.queries)
+    # Each issue text embedded once, searched once per semantic pair.
+    assert len(vector_service.embedded) == 51
+    assert vector_service.searches == 51 * len(severity.SEMANTIC_PAIR_WEIGHTS)
+
+
+def test_batch_results_match_single_issue_results(vector_service):
+    graph = FakeGraphService(_issues(12))
+    batch = severity.compute_issue_severities(
+        list(graph.issues) + ["issue-3", "missing"], graph_service=graph, now=NOW
+    )
+
+    assert list(batch) == list(graph.issues) + ["missing"]
+    for issue_id, result in batch.items():
+        assert result == severity.compute_issue_severity(issue_id, graph_service=graph, now=NOW)
+    assert batch["issue-5"]["details"]["semantic"]["pairs"]["doc_vs_slack"]["cosine"] == 0.8
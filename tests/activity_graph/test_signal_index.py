@@ -0,0 +1,164 @@
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from src.activity_graph.models import TimeWindow
+from src.activity_graph.signals import DocIssueSignalsExtractor, GitSignalsExtractor, SlackSignalsExtractor
+from src.slash_git.models import GitTargetComponent, GitTargetRepo
+
+
+def _ts(age_hours: float) -> str:
+    return (datetime.now(timezone.utc) - timedelta(hours=age_hours)).isoformat()
+
+
+def _append(path, entries, trailing_newline: bool = True) -> None:
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("\n".join(json.dumps(entry) for entry in entries))
+        if trailing_newline:
+            handle.write("\n")
+
+
+def _slack_event(component_id: str, age_hours: float, *, complaint: bool = False, text: str = "hi"):
+    return {
+        "component_ids": [component_id],
+        "properties": {
+            "timestamp": _ts(age_hours),
+            "labels": ["complaint"] if complaint else [],
+            "channel_id": "C1",
+            "text": text,
+        },
+    }
+
+
+def _repo_and_component():
+    repo = GitTargetRepo(
+        id="core",
+        name="Core",
+        repo_owner="acme",
+        repo_name="core",
+        default_branch="main",
+        aliases=[],
+        synthetic_root=None,
+        components={},
+    )
+    component = GitTargetComponent(
+        id="comp:docs",
+        name="Docs",
+        repo_id="core",
+        aliases=[],
+        paths=[],
+        topics=[],
+        topic_aliases=[],
+        metadata={},
+    )
+    repo.components[component.id] = component
+    return repo, component
+
+
+def test_slack_signals_answer_current_and_previous_window(tmp_path):
+    path = tmp_path / "slack_graph.jsonl"
+    _append(
+        path,
+        [
+            _slack_event("comp:docs", 1, text="first"),
+            _slack_event("comp:docs", 2, complaint=True),
+            _slack_event("comp:docs", 24 * 10),
+            _slack_event("comp:other", 1),
+        ],
+    )
+    extractor = SlackSignalsExtractor(path)
+    window = TimeWindow.last_days(7)
+
+    current = extractor.count("comp:docs", window)
+    previous = extractor.count("comp:docs", window.previous())
+
+    assert (current.conversations, current.complaints) == (2, 1)
+    assert sum(event.count for event in current.events) == 2
+    assert current.recent_events[0].metadata["text"] == "first"
+    assert (previous.conversations, previous.complaints) == (1, 0)
+    assert extractor._index.lines_indexed == 4
+
+
+def test_slack_signals_tail_appended_lines_only(tmp_path):
+    path = tmp_path / "slack_graph.jsonl"
+    _append(path, [_slack_event("comp:docs", 1)])
+    extractor = SlackSignalsExtractor(path)
+    window = TimeWindow.last_days(7)
+    assert extractor.count("comp:docs", window).conversations == 1
+
+    _append(path, [_slack_event("comp:docs", 1), _slack_event("comp:docs", 1, complaint=True)])
+    counts = extractor.count("comp:docs", window)
+
+    assert (counts.conversations, counts.complaints) == (3, 1)
+    assert extractor._index.lines_indexed == 3
+
+
+def test_slack_signals_rebuild_after_truncation(tmp_path):
+    path = tmp_path / "slack_graph.jsonl"
+    _append(path, [_slack_event("comp:docs", 1) for _ in range(5)])
+    extractor = SlackSignalsExtractor(path)
+    window = TimeWindow.last_days(7)
+    assert extractor.count("comp:docs", window).conversations == 5
+
+    path.write_text("")
+    _append(path, [_slack_event("comp:docs", 1, complaint=True)])
+
+    counts = extractor.count("comp:docs", window)
+    assert (counts.conversations, counts.complaints) == (1, 1)
+
+
+def test_git_signals_wait_for_partial_trailing_line(tmp_path):
+    path = tmp_path / "git_graph.jsonl"
+    repo, component = _repo_and_component()
+    _append(path, [{"component_ids": ["comp:docs"], "event_type": "commit", "timestamp": _ts(1)}])
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"component_ids": ["comp:docs"], "event_ty')
+    extractor = GitSignalsExtractor(MagicMock(), log_path=path)
+
+    counts = extractor.count_events(repo, component, TimeWindow.last_days(7))
+    assert (counts.commits, counts.prs) == (1, 0)
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(f'pe": "pr", "timestamp": "{_ts(2)}"}}\n')
+
+    counts = extractor.count_events(repo, component, TimeWindow.last_days(7))
+    assert (counts.commits, counts.prs) == (1, 1)
+
+
+def test_git_signals_bucket_events_within_window(tmp_path):
+    path = tmp_path / "git_graph.jsonl"
+    repo, component = _repo_and_component()
+    base = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) - timedelta(hours=3)
+    entries = [
+        {"component_ids": ["comp:docs"], "event_type": "commit", "timestamp": (base + timedelta(seconds=idx)).isoformat()}
+        for idx in range(50)
+    ]
+    _append(path, entries)
+    extractor = GitSignalsExtractor(MagicMock(), log_path=path, bucket_seconds=3600)
+
+    counts = extractor.count_events(repo, component, TimeWindow.last_days(1))
+
+    assert counts.commits == 50
+    assert [(event.kind, event.count) for event in counts.events] == [("commit", 50)]
+    assert counts.recency_buckets["24h"] == 50
+
+
+def test_doc_issue_counts_reaggregate_when_file_changes(tmp_path):
+    path = tmp_path / "doc_issues.json"
+    path.write_text(
+        json.dumps(
+            [
+                {"component_ids": ["comp:docs"], "state": "open", "severity": "high"},
+                {"component_ids": ["comp:docs"], "state": "closed", "severity": "high"},
+            ]
+        )
+    )
+    extractor = DocIssueSignalsExtractor(path)
+    counts = extractor.count("comp:docs")
+    assert (counts.open_issues, counts.severity_weight) == (1, 1.5)
+
+    path.write_text(json.dumps([{"component_ids": ["comp:docs"], "state": "open", "severity": "critical"}] * 3))
+    counts = extractor.count("comp:docs")
+    assert counts.open_issues == 3
+    assert counts.severity_breakdown["critical"] == 3
+    assert extractor.count("comp:missing").open_issues == 0
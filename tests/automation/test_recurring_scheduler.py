@@ -0,0 +1,216 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+from src.automation.recurring_scheduler import (
+    MAX_SLEEP_SECONDS,
+    ActionSpec,
+    RecurringTaskScheduler,
+    RecurringTaskStore,
+    ScheduleSpec,
+)
+
+UTC = ZoneInfo("UTC")
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += timedelta(seconds=seconds)
+
+    def advance_to(self, timestamp):
+        self.now = datetime.fromtimestamp(timestamp, UTC)
+
+
+class MemoryStore(RecurringTaskStore):
+    """Store without the per-update JSON rewrite, so thousands of runs stay fast."""
+
+    def __init__(self):
+        self._tasks = {}
+
+    async def load_tasks(self):
+        return list(self._tasks.values())
+
+    async def save_tasks(self, tasks):
+        self._tasks = {task.id: task for task in tasks}
+
+    async def add_task(self, task):
+        self._tasks[task.id] = task
+
+    async def update_task(self, task):
+        if task.id in self._tasks:
+            self._tasks[task.id] = task
+
+    async def remove_task(self, task_id):
+        self._tasks.pop(task_id, None)
+
+    async def get_task(self, task_id):
+        return self._tasks.get(task_id)
+
+
+def _scheduler(clock, runner, **kwargs):
+    scheduler = RecurringTaskScheduler(
+        agent_registry=None,
+        agent=SimpleNamespace(config={}),
+        session_manager=None,
+        store=MemoryStore(),
+        clock=clock,
+        **kwargs,
+    )
+    scheduler._execute_screen_time_report = runner
+    return scheduler
+
+
+async def _register(scheduler, name, time="09:00"):
+    return await scheduler.register_task(
+        name=name,
+        command_text=name,
+        schedule=ScheduleSpec(type="daily", time=time, tz="UTC"),
+        action=ActionSpec(kind="screen_time_report"),
+    )
+
+
+def test_thousands_of_tasks_run_once_at_their_deadline_in_order():
+    async def scenario():
+        clock = FakeClock(datetime(2026, 1, 5, 0, 0, 30, tzinfo=UTC))
+        runs, running = [], {"now": 0, "max": 0}
+
+        async def runner(task):
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            runs.append((clock(), task.id, datetime.fromisoformat(task.next_run_at)))
+            await asyncio.sleep(0)
+            running["now"] -= 1
+
+        scheduler = _scheduler(clock, runner)
+        for idx in range(3000):
+            await _register(scheduler, f"t{idx}", f"{(idx * 7) % 24:02d}:{idx % 60:02d}")
+        await scheduler._load_schedule()
+
+        end = clock() + timedelta(days=1)
+        while True:
+            clock.advance_to(scheduler._peek_deadline())
+            if clock() >= end:
+                break
+            scheduler._dispatch_due()
+            await asyncio.gather(*scheduler._executions)
+        return scheduler, runs, running["max"]
+
+    scheduler, runs, max_running = asyncio.run(scenario())
+
+    assert len(runs) == 3000
+    assert len({task_id for _, task_id, _ in runs}) == 3000
+    assert all(ran_at == due_at for ran_at, _, due_at in runs)
+    assert [ran_at for ran_at, _, _ in runs] == sorted(ran_at for ran_at, _, _ in runs)
+    assert max_running == 3
+    # Every task is queued exactly once more, a day after the run it just had.
+    assert len(scheduler._heap) == 3000
+    due = {task_id: due_at for _, task_id, due_at in runs}
+    assert all(
+        datetime.fromisoformat(task.next_run_at) == due[task.id] + timedelta(days=1)
+        for task in scheduler._tasks.values()
+    )
+
+
+def test_running_task_is_not_dispatched_twice():
+    async def scenario():
+        clock = FakeClock(datetime(2026, 1, 5, 8, 59, tzinfo=UTC))
+        release, calls = asyncio.Event(), []
+
+        async def runner(task):
+            calls.append(task.id)
+            await release.wait()
+
+        scheduler = _scheduler(clock, runner)
+        task = await _register(scheduler, "slow")
+        clock.advance(60)
+        assert scheduler._dispatch_due() == [task.id]
+        await asyncio.sleep(0)
+
+        # Days pass while the first run is still going; resuming does not requeue it.
+        clock.advance(3 * 86400)
+        await scheduler.resume_task(task.id)
+        assert scheduler._dispatch_due() == []
+
+        release.set()
+        await asyncio.gather(*scheduler._executions)
+        assert calls == [task.id]
+        assert task.next_run_at == "2026-01-09T09:00:00+00:00"
+        assert scheduler._dispatch_due() == []
+        clock.advance_to(scheduler._peek_deadline())
+        assert scheduler._dispatch_due() == [task.id]
+
+    asyncio.run(scenario())
+
+
+def test_pause_and_delete_invalidate_queued_runs():
+    async def scenario():
+        clock = FakeClock(datetime(2026, 1, 5, 8, 0, tzinfo=UTC))
+        calls = []
+
+        async def runner(task):
+            calls.append(task.name)
+
+        scheduler = _scheduler(clock, runner)
+        paused = await _register(scheduler, "paused")
+        deleted = await _register(scheduler, "deleted")
+        later = await _register(scheduler, "later", "10:00")
+        later_deadline = datetime(2026, 1, 5, 10, 0, tzinfo=UTC).timestamp()
+
+        await scheduler.pause_task(paused.id)
+        await scheduler.delete_task(deleted.id)
+        assert scheduler._peek_deadline() == later_deadline
+        # Sleeps are capped so wall-clock jumps are noticed.
+        assert scheduler._seconds_until_next_run() == MAX_SLEEP_SECONDS
+
+        clock.advance_to(later_deadline - 1)
+        assert scheduler._seconds_until_next_run() == 1
+        assert scheduler._dispatch_due() == []
+        clock.advance(1)
+        assert scheduler._dispatch_due() == [later.id]
+        await asyncio.gather(*scheduler._executions)
+        assert calls == ["later"]
+
+        await scheduler.resume_task(paused.id)
+        assert scheduler._dispatch_due() == [paused.id]
+        await asyncio.gather(*scheduler._executions)
+        assert calls == ["later", "paused"]
+        assert await scheduler.store.get_task(deleted.id) is None
+
+    asyncio.run(scenario())
+
+
+def test_loop_wakes_on_changes_and_respects_concurrency_cap():
+    async def scenario():
+        clock = FakeClock(datetime(2026, 1, 5, 8, 0, tzinfo=UTC))
+        started, release = asyncio.Queue(), asyncio.Event()
+
+        async def runner(task):
+            await started.put(task.name)
+            await release.wait()
+
+        scheduler = _scheduler(clock, runner, max_concurrent=2)
+        tasks = [await _register(scheduler, f"t{idx}") for idx in range(3)]
+        await scheduler.start()
+        await asyncio.sleep(0)
+
+        # The deadline is an hour away; moving the clock and resuming wakes the loop now.
+        clock.advance(3600)
+        await scheduler.resume_task(tasks[0].id)
+        names = {await asyncio.wait_for(started.get(), 1) for _ in range(2)}
+        await asyncio.sleep(0.05)
+        assert started.empty()
+        assert len(scheduler._in_flight) == 2
+
+        release.set()
+        remaining = {task.name for task in tasks} - names
+        assert {await asyncio.wait_for(started.get(), 1)} == remaining
+        await scheduler.stop()
+
+    asyncio.run(scenario())
@@ -1,7 +1,10 @@
+from datetime import datetime, timezone
 from pathlib import Path
 
 from src.demo.graph_summary import GraphNeighborhoodSummarizer
 from src.demo.scenario_classifier import PAYMENTS_SCENARIO
+from src.vector.local_vector_store import LocalVectorStore
+from src.vector.vector_event import VectorEvent
 from tests.demo.test_vector_retriever import FakeEmbeddingProvider, _build_indexes
 
 
@@ -16,3 +19,26 @@ def test_graph_summary_falls_back_to_local_indexes(tmp_path):
     assert summary.git_events
     assert summary.slack_events
 
+
+
+def test_graph_summary_reads_event_ids_from_mmap_stores(tmp_path):
+    store_paths = {}
+    for source in ("git", "slack"):
+        store_paths[source] = tmp_path / f"{source}_index.json"
+        LocalVectorStore(store_paths[source]).upsert(
+            VectorEvent(
+                event_id=f"{source}:{idx}",
+                source_type=source,
+                text=f"{source} event {idx}",
+                timestamp=datetime(2025, 12, 6, tzinfo=timezone.utc),
+                apis=[PAYMENTS_SCENARIO.api] if idx % 2 == 0 else ["/v1/other"],
+                embedding=[1.0, float(idx)],
+            )
+            for idx in range(6)
+        )
+
+    summarizer = GraphNeighborhoodSummarizer({}, store_paths=store_paths)
+    summary = summarizer.summarize(PAYMENTS_SCENARIO, max_events=2)
+
+    assert summary.git_events == ["git:0", "git:2"]
+    assert summary.slack_events == ["slack:0", "slack:2"]
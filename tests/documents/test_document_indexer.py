@@ -0,0 +1,110 @@
+import hashlib
+import os
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.documents import indexer as indexer_module
+from src.documents.indexer import DocumentIndexer
+from src.documents.search import SemanticSearch
+
+DIMENSION = 1536
+
+
+class FakeEmbeddingClient:
+    """Deterministic stand-in for the OpenAI client that counts embedded texts."""
+
+    def __init__(self):
+        self.embedded_texts = []
+        self.embeddings = SimpleNamespace(create=self._create)
+
+    def _create(self, model, input):
+        texts = [input] if isinstance(input, str) else list(input)
+        self.embedded_texts.extend(texts)
+        return SimpleNamespace(data=[SimpleNamespace(embedding=_vector(text)) for text in texts])
+
+
+def _vector(text):
+    seed = int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+    return np.random.default_rng(seed).standard_normal(DIMENSION).astype(np.float32).tolist()
+
+
+def _build_indexer(tmp_path, monkeypatch, docs_dir):
+    client = FakeEmbeddingClient()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(indexer_module.PooledOpenAIClient, "get_client", classmethod(lambda cls, config: client))
+    config = {
+        "openai": {"api_key": "test", "embedding_model": "text-embedding-3-small"},
+        "documents": {"folders": [str(docs_dir)], "supported_types": [".txt"]},
+        "search": {"top_k": 5, "similarity_threshold": 0.0},
+    }
+    return DocumentIndexer(config), client
+
+
+def _write_docs(docs_dir, count):
+    docs_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        (docs_dir / f"doc_{i}.txt").write_text(f"Document {i} talks about topic {i}.")
+
+
+def test_modified_file_only_reembeds_its_own_chunks(tmp_path, monkeypatch):
+    docs_dir = tmp_path / "docs"
+    _write_docs(docs_dir, 5)
+    indexer, client = _build_indexer(tmp_path, monkeypatch, docs_dir)
+
+    assert indexer.index_documents() == 5
+    assert len(client.embedded_texts) == 5
+
+    client.embedded_texts.clear()
+    changed = docs_dir / "doc_2.txt"
+    changed.write_text("Document 2 now talks about invoices.")
+    mtime = changed.stat().st_mtime + 10
+    os.utime(changed, (mtime, mtime))
+
+    assert indexer.index_documents() == 1
+    assert len(client.embedded_texts) == 1
+    assert "invoices" in client.embedded_texts[0]
+    assert indexer.index.ntotal == len(indexer.documents) == 5
+
+    search = SemanticSearch(indexer, indexer.config)
+    results = search.search("Document: doc_2\n\nDocument 2 now talks about invoices.", top_k=1)
+    assert results[0]["file_name"] == "doc_2.txt"
+    assert "invoices" in results[0]["full_content"]
+
+
+def test_deleted_file_is_dropped_without_reembedding(tmp_path, monkeypatch):
+    docs_dir = tmp_path / "docs"
+    _write_docs(docs_dir, 3)
+    indexer, client = _build_indexer(tmp_path, monkeypatch, docs_dir)
+    indexer.index_documents()
+    client.embedded_texts.clear()
+
+    (docs_dir / "doc_0.txt").unlink()
+    indexer.index_documents()
+
+    assert client.embedded_texts == []
+    assert indexer.index.ntotal == 2
+    assert {doc["file_name"] for doc in indexer.documents} == {"doc_1.txt", "doc_2.txt"}
+
+
+def test_legacy_positional_index_is_migrated_without_reembedding(tmp_path, monkeypatch):
+    docs_dir = tmp_path / "docs"
+    _write_docs(docs_dir, 3)
+    indexer, client = _build_indexer(tmp_path, monkeypatch, docs_dir)
+    indexer.index_documents()
+
+    # Simulate an index written before chunk IDs existed
+    legacy = indexer_module.faiss.IndexFlatIP(DIMENSION)
+    legacy.add(indexer.index.reconstruct_n(0, indexer.index.ntotal))
+    for doc in indexer.documents:
+        doc.pop("chunk_id")
+    indexer.index = legacy
+    indexer.save_index()
+    client.embedded_texts.clear()
+
+    reloaded, _ = _build_indexer(tmp_path, monkeypatch, docs_dir)
+    reloaded.client = client
+    assert isinstance(reloaded.index, indexer_module.faiss.IndexIDMap2)
+    assert [doc["chunk_id"] for doc in reloaded.documents] == [0, 1, 2]
+    assert reloaded.index_documents() == 0
+    assert client.embedded_texts == []
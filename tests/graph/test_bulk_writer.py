@@ -0,0 +1,240 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+from src.graph import GraphIngestor, GraphService
+from src.graph.bulk_writer import active_write_buffer
+from src.graph.universal_nodes import UniversalNodeWriter
+from src.vector.context_chunk import ContextChunk
+
+
+class FakeResult:
+    def consume(self):
+        return None
+
+
+class FakeTransaction:
+    def __init__(self, driver: "FakeDriver"):
+        self.driver = driver
+        self.statements: List[Dict[str, Any]] = []
+        self.committed = False
+
+    def run(self, query: str, params: Optional[Dict[str, Any]] = None) -> FakeResult:
+        if self.driver.fail_next:
+            self.driver.fail_next = False
+            raise RuntimeError("write conflict")
+        self.statements.append({"query": query, "params": params or {}})
+        return FakeResult()
+
+    def commit(self) -> None:
+        self.committed = True
+        self.driver.transactions.append(self.statements)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, driver: "FakeDriver"):
+        self.driver = driver
+
+    def run(self, query: str, params: Optional[Dict[str, Any]] = None) -> FakeResult:
+        self.driver.autocommit.append({"query": query, "params": params or {}})
+        return FakeResult()
+
+    def begin_transaction(self) -> FakeTransaction:
+        return FakeTransaction(self.driver)
+
+    def __enter__(self):
+        self.driver.sessions += 1
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeDriver:
+    def __init__(self):
+        self.sessions = 0
+        self.transactions: List[List[Dict[str, Any]]] = []
+        self.autocommit: List[Dict[str, Any]] = []
+        self.fail_next = False
+
+    def session(self, database=None) -> FakeSession:
+        return FakeSession(self)
+
+    def close(self) -> None:
+        return None
+
+
+def _service(batch_size: int = 100, flush_interval: float = 60.0) -> GraphService:
+    service = GraphService(
+        {
+            "graph": {
+                "enabled": False,
+                "ingest_batch_size": batch_size,
+                "ingest_flush_interval_seconds": flush_interval,
+            }
+        }
+    )
+    service.enabled = True
+    service.uri = "bolt://fake"
+    service.username = "neo4j"
+    service.password = "secret"
+    service._driver = FakeDriver()
+    return service
+
+
+def _normalized(query: str) -> str:
+    return " ".join(query.split())
+
+
+def test_bulk_write_groups_upserts_into_unwind_statements():
+    service = _service()
+    ingestor = GraphIngestor(service)
+
+    with service.bulk_write():
+        ingestor.upsert_git_event("git:1", component_ids=["comp:a", "comp:b"], properties={"sha": "1"})
+        ingestor.upsert_git_event("git:2", component_ids=["comp:a"], properties={"sha": "2"})
+        ingestor.upsert_component("comp:a", {"name": "A"})
+        assert service._driver.sessions == 0
+
+    driver = service._driver
+    assert driver.autocommit == []
+    assert len(driver.transactions) == 1
+    statements = driver.transactions[0]
+    queries = [_normalized(entry["query"]) for entry in statements]
+    assert queries == [
+        "UNWIND $rows AS row MERGE (n:GitEvent {id: row.id}) SET n += row.props",
+        "UNWIND $rows AS row MERGE (n:Component {id: row.id}) SET n += row.props",
+        "UNWIND $rows AS row MERGE (source:GitEvent {id: row.source_id}) "
+        "MERGE (target:Component {id: row.target_id}) "
+        "MERGE (source)-[rel:TOUCHES_COMPONENT]->(target) SET rel += row.props",
+    ]
+    assert [row["id"] for row in statements[0]["params"]["rows"]] == ["git:1", "git:2"]
+    assert [(row["source_id"], row["target_id"]) for row in statements[2]["params"]["rows"]] == [
+        ("git:1", "comp:a"),
+        ("git:1", "comp:b"),
+        ("git:2", "comp:a"),
+    ]
+
+
+def test_bulk_write_flushes_by_size_and_merges_duplicate_rows():
+    service = _service(batch_size=3)
+    ingestor = GraphIngestor(service)
+
+    with service.bulk_write() as buffer:
+        ingestor.upsert_component("comp:a", {"name": "A"})
+        ingestor.upsert_component("comp:a", {"owner": "docs"})
+        ingestor.upsert_component("comp:b")
+        assert len(service._driver.transactions) == 0
+        ingestor.upsert_component("comp:c")
+        assert len(service._driver.transactions) == 1
+        assert buffer.pending == 0
+        ingestor.upsert_component("comp:d")
+
+    transactions = service._driver.transactions
+    assert len(transactions) == 2
+    first_rows = transactions[0][0]["params"]["rows"]
+    assert first_rows[0] == {"id": "comp:a", "props": {"name": "A", "owner": "docs"}}
+    assert [row["id"] for row in transactions[1][0]["params"]["rows"]] == ["comp:d"]
+
+
+def test_bulk_write_flushes_on_interval():
+    service = _service(flush_interval=0.0001)
+    ingestor = GraphIngestor(service)
+
+    with service.bulk_write(flush_interval_seconds=0.0):
+        ingestor.upsert_component("comp:a")
+    assert len(service._driver.transactions) == 1
+
+    with service.bulk_write() as buffer:
+        buffer._last_flush -= 1
+        ingestor.upsert_component("comp:b")
+        assert len(service._driver.transactions) == 2
+
+
+def test_nested_bulk_write_shares_outer_buffer():
+    service = _service()
+    ingestor = GraphIngestor(service)
+
+    with service.bulk_write() as outer:
+        with service.bulk_write() as inner:
+            assert inner is outer
+            ingestor.upsert_component("comp:a")
+        assert service._driver.transactions == []
+    assert len(service._driver.transactions) == 1
+    assert active_write_buffer(service) is None
+
+
+def test_concurrent_bulk_writes_keep_separate_buffers():
+    service = _service()
+    ingestor = GraphIngestor(service)
+    opened = threading.Barrier(2)
+    buffers = {}
+
+    def ingest(name):
+        with service.bulk_write() as buffer:
+            buffers[name] = buffer
+            opened.wait(5)
+            ingestor.upsert_component(f"comp:{name}")
+            opened.wait(5)
+
+    threads = [threading.Thread(target=ingest, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert buffers["a"] is not buffers["b"]
+    flushed = sorted(row["id"] for (statement,) in service._driver.transactions for row in statement["params"]["rows"])
+    assert flushed == ["comp:a", "comp:b"]
+    assert len(service._driver.transactions) == 2
+
+
+def test_failed_batch_is_reported_and_later_batches_continue():
+    service = _service(batch_size=1)
+    ingestor = GraphIngestor(service)
+    service._driver.fail_next = True
+
+    with service.bulk_write() as buffer:
+        ingestor.upsert_component("comp:a")
+        ingestor.upsert_component("comp:b")
+
+    assert buffer.failed_batches == 1
+    assert buffer.rows_written == 1
+    assert service.last_query_metadata()["error"] is None
+    assert service._driver.transactions[0][0]["params"]["rows"][0]["id"] == "comp:b"
+
+
+def test_universal_chunks_are_batched_with_created_at():
+    service = _service()
+    writer = UniversalNodeWriter(service)
+    chunks = [
+        ContextChunk(
+            chunk_id=f"chunk-{idx}",
+            entity_id="slack:C1",
+            source_type="slack",
+            text="hello",
+            metadata={"source_id": "slack:C1"},
+        )
+        for idx in range(3)
+    ]
+
+    writer.ingest_chunks(chunks)
+
+    transactions = service._driver.transactions
+    assert len(transactions) == 1
+    queries = [_normalized(entry["query"]) for entry in transactions[0]]
+    assert "ON CREATE SET n.created_at = timestamp()" in queries[0]
+    assert [len(entry["params"]["rows"]) for entry in transactions[0]] == [1, 3, 3]
+
+
+def test_writes_outside_bulk_block_stay_per_statement():
+    service = _service()
+    GraphIngestor(service).upsert_component("comp:a")
+
+    assert service._driver.transactions == []
+    assert len(service._driver.autocommit) == 1
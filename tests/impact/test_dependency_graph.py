@@ -1,4 +1,4 @@
-from src.graph.dependency_graph import DependencyGraphBuilder
+from src.graph.dependency_graph import DependencyGraph, DependencyGraphBuilder
 
 
 def test_dependency_graph_resolves_components(tmp_path, impact_test_config, dependency_map_file):
@@ -12,3 +12,86 @@ def test_dependency_graph_resolves_components(tmp_path, impact_test_config, depe
     assert graph.components_for_file("repo-alpha", "src/alpha/service.py") == {"comp:alpha"}
     assert graph.component_dependencies["comp:alpha"] == {"comp:beta"}
 
+
+
+def test_file_resolution_uses_longest_path_prefix():
+    graph = DependencyGraph(settings=None)
+    graph.register_file_mapping("acme/web", "src", "comp:web")
+    graph.register_file_mapping("acme/web", "src/payments/", "comp:payments")
+    graph.register_file_mapping("web", "src/payments", "comp:billing")
+    graph.register_file_mapping("acme/web", "README.md", "comp:docs")
+    graph.finalize()
+
+    assert graph.components_for_file("acme/web", "src/payments/api.py") == {"comp:payments"}
+    # A trailing-slash pattern only covers files below it.
+    assert graph.components_for_file("acme/web", "./src/payments") == {"comp:billing"}
+    assert graph.components_for_file("acme/web", "src/paymentsx/api.py") == {"comp:web"}
+    assert graph.components_for_file("acme/web", "README.md") == {"comp:docs"}
+    assert graph.components_for_file("other/repo", "src/app.py") == set()
+
+    graph.register_file_mapping("acme/web", "src/payments/api.py", "comp:api")
+    assert graph.components_for_files("acme/web", ["src/payments/api.py", "src/x.py", ""]) == {
+        "src/payments/api.py": {"comp:api"},
+        "src/x.py": {"comp:web"},
+        "": set(),
+    }
+
+
+def _reference_dependents(graph, seeds, max_depth):
+    """Exhaustive simple-path walk (the previous traversal) for comparison."""
+    found = {}
+
+    def walk(component_id, depth, chain):
+        if depth >= max_depth:
+            return
+        for dependent in graph.reverse_component_dependencies.get(component_id, set()):
+            if dependent in seeds or dependent in chain:
+                continue
+            if dependent in found and found[dependent] <= depth + 1:
+                continue
+            found[dependent] = depth + 1
+            walk(dependent, depth + 1, chain | {dependent})
+
+    for seed in seeds:
+        walk(seed, 0, {seed})
+    return found
+
+
+def test_dependent_closures_match_path_walk_and_reset_on_finalize():
+    import random
+
+    rng = random.Random(3)
+    graph = DependencyGraph(settings=None)
+    components = [f"comp:{idx}" for idx in range(60)]
+    for component in components:
+        for dependency in rng.sample(components, 3):
+            if dependency != component:
+                graph.component_dependencies[component].add(dependency)
+    graph.finalize()
+
+    for depth in (1, 2, 4):
+        for _ in range(10):
+            seeds = set(rng.sample(components, rng.randint(1, 4)))
+            assert graph.dependents_of(seeds, depth) == _reference_dependents(graph, seeds, depth)
+
+    closure = graph.dependent_closure("comp:0", 2)
+    assert graph.dependent_closure("comp:0", 2) is closure
+    graph.component_dependencies["comp:59"].add("comp:0")
+    graph.finalize()
+    assert graph.dependent_closure("comp:0", 2) is not closure
+    assert graph.dependent_closure("comp:0", 1)["comp:59"] == 1
+
+
+def test_entity_matcher_covers_components_services_and_apis(impact_test_config, dependency_map_file):
+    impact_test_config["context_resolution"]["dependency_files"] = [str(dependency_map_file)]
+    graph = DependencyGraphBuilder(impact_test_config).build(write_to_graph=False)
+
+    found = graph.entity_matcher().find_values("Alpha is returning 500s on /foo")
+    assert ("component", "comp:alpha") in found
+    assert ("api", "api:alpha:/foo") in found
+
+    matcher = graph.entity_matcher()
+    assert graph.entity_matcher() is matcher
+    graph.components["comp:gamma"] = {"name": "Gamma"}
+    graph.finalize()
+    assert ("component", "comp:gamma") in graph.entity_matcher().find_values("gamma is down")
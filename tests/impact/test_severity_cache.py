@@ -0,0 +1,84 @@
+from typing import List
+
+from src.cache.impact_cache import notify_activity
+from src.impact import service as service_module
+from src.impact.models import GitChangePayload, GitFileChange
+from src.impact.service import ImpactService
+
+
+class FakeGitIntegration:
+    def recent_component_changes(self, repo_full, components, graph, limit, branch=None, *, since=None):
+        return []
+
+
+class FakeDocIssueService:
+    def __init__(self, issues):
+        self._issues = issues
+
+    def list(self):
+        return self._issues
+
+    def create_from_impact(self, report, graph):
+        return []
+
+
+class AvailableGraph:
+    def is_available(self):
+        return True
+
+
+def _service(impact_config_context, dependency_map_file, monkeypatch, computed: List[List[str]]):
+    impact_config_context.data["context_resolution"]["dependency_files"] = [str(dependency_map_file)]
+    service = ImpactService(impact_config_context, git_integration=FakeGitIntegration())
+    service.doc_issue_service = FakeDocIssueService(
+        [
+            {"id": "issue-alpha", "component_ids": ["comp:alpha"]},
+            {"id": "issue-beta", "component_ids": ["comp:beta"]},
+        ]
+    )
+    service.graph_service = AvailableGraph()
+
+    def fake_compute(issue_ids, *, graph_service):
+        computed.append(list(issue_ids))
+        return {issue_id: {"score": 50.0, "score_0_10": 5.0, "label": "medium"} for issue_id in issue_ids}
+
+    monkeypatch.setattr(service_module, "compute_issue_severities", fake_compute)
+    return service
+
+
+def test_doc_issue_severities_are_cached_until_activity(impact_config_context, dependency_map_file, monkeypatch):
+    computed: List[List[str]] = []
+    service = _service(impact_config_context, dependency_map_file, monkeypatch, computed)
+
+    first = service.list_doc_issues()
+    assert [issue["severity_score"] for issue in first] == [5.0, 5.0]
+    service.list_doc_issues()
+    assert computed == [["issue-alpha", "issue-beta"]]
+
+    notify_activity(component_ids=["comp:beta"])
+    service.list_doc_issues()
+    assert computed[-1] == ["issue-beta"]
+
+    stats = service.get_impact_health()["severity_cache"]
+    assert stats["hits"] == 3
+    assert stats["misses"] == 3
+    assert stats["invalidations"] == 1
+
+
+def test_git_event_invalidates_changed_components(impact_config_context, dependency_map_file, monkeypatch):
+    computed: List[List[str]] = []
+    service = _service(impact_config_context, dependency_map_file, monkeypatch, computed)
+    service.pipeline.doc_issue_service = service.doc_issue_service
+    service.list_doc_issues()
+
+    service.pipeline.process_git_event(
+        GitChangePayload(
+            identifier="repo-alpha@manual",
+            title="Manual change",
+            repo="repo-alpha",
+            files=[GitFileChange(path="src/alpha/service.py", repo="repo-alpha")],
+        )
+    )
+    service.list_doc_issues()
+
+    assert computed[-1] == ["issue-alpha"]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, List
+
+import pytest
+
+from src.ingestion import ActivityIngestState, GitActivityIngestor
+from src.ingestion.scheduler import IngestionScheduler, IngestUnit
+
+
+def _sleeping_unit(source: str, key: str, seconds: float, items: int = 1) -> IngestUnit:
+    def run() -> Dict[str, int]:
+        time.sleep(seconds)
+        return {"items": items}
+
+    return IngestUnit(source, key, run)
+
+
+def _scheduler(tmp_path, **kwargs) -> IngestionScheduler:
+    return IngestionScheduler(ActivityIngestState(str(tmp_path / "state")), **kwargs)
+
+
+def test_wall_time_tracks_slowest_unit(tmp_path):
+    units = [_sleeping_unit("git", f"acme/repo{idx}", 0.1) for idx in range(8)]
+    units += [_sleeping_unit("slack", f"C{idx}", 0.1) for idx in range(4)]
+    units.append(_sleeping_unit("git", "acme/monorepo", 0.3, items=10))
+
+    report = _scheduler(tmp_path, workers={"git": 16, "slack": 4}).run(units)
+
+    assert len(report.results) == 13
+    assert all(result.status == "ok" for result in report.results)
+    # Serial execution would take 1.5s.
+    assert 0.3 <= report.wall_seconds < 0.8
+    summary = report.to_dict()
+    assert summary["sources"]["git"]["items"] == {"items": 18}
+    assert summary["sources"]["git"]["slowest"]["key"] == "acme/monorepo"
+    assert summary["sources"]["slack"]["ok"] == 4
+
+
+def test_per_source_pool_limits_concurrency(tmp_path):
+    lock = threading.Lock()
+    running = {"now": 0, "max": 0}
+
+    def run() -> Dict[str, int]:
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        time.sleep(0.02)
+        with lock:
+            running["now"] -= 1
+        return {}
+
+    units = [IngestUnit("slack", f"C{idx}", run) for idx in range(10)]
+    _scheduler(tmp_path, workers={"slack": 3}).run(units)
+
+    assert running["max"] == 3
+
+
+def test_failures_are_isolated_and_backed_off(tmp_path):
+    now = [1_000.0]
+    calls: List[str] = []
+
+    def broken() -> Dict[str, int]:
+        calls.append("broken")
+        raise RuntimeError("GitHub is down")
+
+    units = [IngestUnit("git", "acme/broken", broken), _sleeping_unit("git", "acme/ok", 0)]
+    scheduler = _scheduler(tmp_path, backoff_base_seconds=60, backoff_max_seconds=100, clock=lambda: now[0])
+
+    first = scheduler.run(units)
+    statuses = {result.key: result.status for result in first.results}
+    assert statuses == {"acme/broken": "failed", "acme/ok": "ok"}
+    failed = next(result for result in first.results if result.key == "acme/broken")
+    assert failed.error == "GitHub is down"
+    assert failed.retry_at == 1_060.0
+
+    now[0] = 1_030.0
+    second = scheduler.run(units)
+    assert {result.key: result.status for result in second.results}["acme/broken"] == "backoff"
+    assert calls == ["broken"]
+
+    # Second failure doubles the delay, capped at backoff_max_seconds.
+    now[0] = 1_061.0
+    scheduler.run(units)
+    state = scheduler.state_store.load("scheduler_git_acme/broken")
+    assert state["consecutive_failures"] == 2
+    assert state["next_attempt_at"] == 1_161.0
+
+    scheduler.run(units, force=True)
+    assert calls == ["broken"] * 3
+
+
+def test_least_recently_successful_units_start_first(tmp_path):
+    order: List[str] = []
+    scheduler = _scheduler(tmp_path, workers={"git": 1})
+    scheduler.state_store.save("scheduler_git_fresh", {"last_success_at": 2_000.0})
+    scheduler.state_store.save("scheduler_git_stale", {"last_success_at": 1_000.0})
+
+    def unit(key: str) -> IngestUnit:
+        return IngestUnit("git", key, lambda: order.append(key) or {})
+
+    progress: List[int] = []
+    scheduler.run(
+        [unit("fresh"), unit("stale"), unit("new")],
+        on_progress=lambda result, done, total: progress.append(done),
+    )
+
+    assert order == ["new", "stale", "fresh"]
+    assert progress == [1, 2, 3]
+
+
+def test_git_ingest_runs_repos_through_scheduler(tmp_path, monkeypatch):
+    config = {
+        "activity_ingest": {
+            "state_dir": str(tmp_path / "state"),
+            "scheduler": {"workers": {"git": 3}},
+            "git": {
+                "enabled": True,
+                "repos": [{"owner": "acme", "name": f"repo{idx}"} for idx in range(3)],
+            },
+        },
+        "activity_graph": {"git_graph_path": str(tmp_path / "git_graph.jsonl")},
+        "graph": {"enabled": False},
+    }
+    ingestor = GitActivityIngestor(config, vector_service=None)
+
+    def fake_ingest_repo(repo_cfg):
+        time.sleep(0.2)
+        if repo_cfg["name"] == "repo2":
+            raise RuntimeError("boom")
+        return {"prs": 1, "commits": 2, "issues": 0}
+
+    monkeypatch.setattr(ingestor, "_ingest_repo", fake_ingest_repo)
+
+    started = time.perf_counter()
+    result = ingestor.ingest()
+
+    assert result == {"prs": 2, "commits": 4, "issues": 0}
+    assert time.perf_counter() - started < 0.5
+    assert ingestor.state_store.load("scheduler_git_acme/repo2")["consecutive_failures"] == 1
+
+
+@pytest.mark.parametrize("workers", [0, -2])
+def test_worker_counts_are_clamped(tmp_path, workers):
+    report = _scheduler(tmp_path, workers={"git": workers}).run([_sleeping_unit("git", "acme/a", 0)])
+    assert report.results[0].status == "ok"
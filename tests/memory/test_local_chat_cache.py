@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
 
 from src.memory.local_chat_cache import LocalChatCache
@@ -51,3 +52,87 @@ def test_disk_persistence_creates_jsonl(tmp_path):
     assert payload["text"] == "persist"
     assert payload["session_id"] == "disk"
 
+
+
+def test_write_behind_batches_and_rehydrates_from_tail_index(tmp_path):
+    cache = LocalChatCache(
+        max_messages_per_session=3,
+        disk_path=str(tmp_path),
+        write_behind=True,
+        flush_interval_ms=10_000,
+    )
+    for idx in range(5):
+        cache.append_message(_make_message(f"a{idx}", session="a", idx=idx))
+    cache.append_message(_make_message("b0", session="b"))
+    assert not (Path(tmp_path) / "a.jsonl").exists()
+
+    assert cache.flush()
+    assert len((Path(tmp_path) / "a.jsonl").read_text().splitlines()) == 5
+    cache.close()
+    tail_index = json.loads((Path(tmp_path) / "tail_index.json").read_text())
+    assert tail_index["a"][0] == (Path(tmp_path) / "a.jsonl").stat().st_size
+
+    # A torn trailing write is skipped on restart and only cut off before the next append.
+    b_path = Path(tmp_path) / "b.jsonl"
+    with b_path.open("a") as handle:
+        handle.write('{"session_id": "b", "te')
+    torn_size = b_path.stat().st_size
+    restarted = LocalChatCache(max_messages_per_session=3, disk_path=str(tmp_path), rehydrate=True)
+    assert [msg["text"] for msg in restarted.list_recent("a", limit=10)] == ["a2", "a3", "a4"]
+    assert [msg["text"] for msg in restarted.list_recent("b", limit=10)] == ["b0"]
+    assert restarted.describe()["rehydrated_sessions"] == 2
+    assert restarted.pop_flush_batch() == []
+    assert b_path.stat().st_size == torn_size
+
+    restarted.append_message(_make_message("b1", session="b"))
+    assert [json.loads(line)["text"] for line in b_path.read_text().splitlines()] == ["b0", "b1"]
+
+
+def test_rehydration_is_off_by_default_and_never_writes(tmp_path):
+    log_path = Path(tmp_path) / "s.jsonl"
+    complete = json.dumps(_make_message("one", idx=1))
+    log_path.write_text(complete)  # complete record, missing only its newline
+
+    assert LocalChatCache(disk_path=str(tmp_path)).list_recent("s") == []
+    cache = LocalChatCache(disk_path=str(tmp_path), rehydrate=True)
+    assert [msg["text"] for msg in cache.list_recent("s")] == ["one"]
+    assert log_path.read_text() == complete
+    assert not (Path(tmp_path) / "tail_index.json").exists()
+
+    # The unterminated record is kept and terminated before the next append.
+    cache.append_message(_make_message("two", idx=2))
+    assert [json.loads(line)["text"] for line in log_path.read_text().splitlines()] == ["one", "two"]
+
+
+def test_tail_changed_after_rehydration_is_left_alone(tmp_path):
+    log_path = Path(tmp_path) / "s.jsonl"
+    log_path.write_text(json.dumps(_make_message("one", idx=1)) + "\n" + '{"session_id": "s", "te')
+    cache = LocalChatCache(disk_path=str(tmp_path), rehydrate=True)
+
+    # Another writer completed the line after this instance scanned the file.
+    with log_path.open("a") as handle:
+        handle.write('xt": "two"}\n')
+    cache.append_message(_make_message("three", idx=3))
+
+    lines = log_path.read_text().splitlines()
+    assert [json.loads(line)["text"] for line in lines] == ["one", "two", "three"]
+
+
+def test_write_behind_flushes_on_size_and_fsync_waits(tmp_path):
+    cache = LocalChatCache(
+        disk_path=str(tmp_path), write_behind=True, flush_max_messages=2, flush_interval_ms=10_000
+    )
+    cache.append_message(_make_message("one", session="s", idx=1))
+    cache.append_message(_make_message("two", session="s", idx=2))
+    log_path = Path(tmp_path) / "s.jsonl"
+    for _ in range(200):
+        if log_path.exists() and len(log_path.read_text().splitlines()) == 2:
+            break
+        time.sleep(0.01)
+    assert len(log_path.read_text().splitlines()) == 2
+    cache.close()
+
+    durable = LocalChatCache(disk_path=str(tmp_path), write_behind=True, durability="fsync")
+    durable.append_message(_make_message("three", session="s", idx=3))
+    assert json.loads(log_path.read_text().splitlines()[-1])["text"] == "three"
+    durable.close()
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from typing import List, Optional
+
+import numpy as np
+import pytest
+
+from src.memory import user_memory_store as ums
+from src.memory.memory_log import MemoryLog
+from src.memory.user_memory_store import UserMemoryStore
+
+DIMENSION = 16
+
+
+def _embed(text: str) -> List[float]:
+    seed = int(hashlib.sha1(text.encode("utf-8")).hexdigest()[:8], 16)
+    return np.random.default_rng(seed).standard_normal(DIMENSION).astype(np.float32).tolist()
+
+
+class DeterministicStore(UserMemoryStore):
+    """UserMemoryStore with a local hash embedding instead of the OpenAI API."""
+
+    def _get_embedding(self, text: str) -> Optional[List[float]]:
+        return _embed(text)
+
+    def _get_embeddings_batch(self, texts, batch_size=None):
+        return [_embed(text) for text in texts]
+
+
+def _store(tmp_path) -> DeterministicStore:
+    return DeterministicStore("alice", storage_dir=str(tmp_path), openai_client=object())
+
+
+def _log_lines(store: UserMemoryStore) -> List[dict]:
+    path = store._memory_log.log_path()
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+pytestmark = pytest.mark.skipif(not ums.FAISS_AVAILABLE, reason="faiss not installed")
+
+
+def test_memories_round_trip_through_append_only_log(tmp_path):
+    store = _store(tmp_path)
+    first = store.add_memory("prefers dark mode", category="preferences", tags=["ui"])
+    store.add_memories_batch([{"content": f"fact {idx}", "category": "facts"} for idx in range(5)])
+
+    lines = _log_lines(store)
+    assert len(lines) == 6
+    assert all("embedding" not in line["memory"] for line in lines)
+    assert not (store.storage_dir / "memories.json").exists()
+
+    reloaded = _store(tmp_path)
+    assert [m.memory_id for m in reloaded.memories] == [m.memory_id for m in store.memories]
+    assert reloaded.faiss_index.ntotal == 6
+    np.testing.assert_allclose(reloaded.memories[0].embedding, _embed("prefers dark mode"), rtol=1e-6)
+    hits = reloaded.query_memories("prefers dark mode", top_k=1, min_score=0.99)
+    assert hits[0][0].memory_id == first.memory_id
+    assert hits[0][0].tags == ["ui"]
+
+
+def test_updates_and_deletes_are_appended_and_replayed(tmp_path):
+    store = _store(tmp_path)
+    keep = store.add_memory("keep me")
+    drop = store.add_memory("drop me")
+    store.update_memory(keep.memory_id, salience_score=0.4)
+    store.delete_memory(drop.memory_id)
+
+    assert [line["op"] for line in _log_lines(store)] == ["put", "put", "put", "del"]
+
+    reloaded = _store(tmp_path)
+    assert [m.memory_id for m in reloaded.memories] == [keep.memory_id]
+    assert reloaded.memories[0].salience_score == 0.4
+    # The metadata-only update kept the original embedding row.
+    np.testing.assert_allclose(reloaded.memories[0].embedding, _embed("keep me"), rtol=1e-6)
+    assert reloaded.faiss_index.ntotal == 1
+
+
+def test_background_compaction_drops_dead_lines_and_keeps_concurrent_writes(tmp_path):
+    store = _store(tmp_path)
+    store._memory_log.compact_min_dead = 4
+    memories = [store.add_memory(f"memory {idx}") for idx in range(4)]
+    for memory in memories:
+        store.update_memory(memory.memory_id, salience_score=0.5)
+    store._memory_log.wait_for_compaction()
+    late = store.add_memory("written after compaction")
+    store._memory_log.wait_for_compaction()
+
+    assert store._memory_log.generation >= 1
+    assert len(_log_lines(store)) == 5
+    assert sorted(p.name for p in store.storage_dir.glob("memories.[0-9]*")) == [
+        f"memories.{store._memory_log.generation}.f32",
+        f"memories.{store._memory_log.generation}.jsonl",
+    ]
+
+    reloaded = _store(tmp_path)
+    assert len(reloaded.memories) == 5
+    assert reloaded.memories[-1].memory_id == late.memory_id
+    assert all(m.salience_score == 0.5 for m in reloaded.memories[:4])
+    assert reloaded.query_memories("written after compaction", top_k=1, min_score=0.99)[0][0].memory_id == late.memory_id
+
+
+def test_operations_during_compaction_are_carried_into_next_generation(tmp_path):
+    log = MemoryLog(tmp_path)
+    log.put({"memory_id": "a", "content": "a"}, [1.0, 0.0])
+    log.put({"memory_id": "b", "content": "b"}, [0.0, 1.0])
+    snapshot = [({"memory_id": "a", "content": "a"}, [1.0, 0.0]), ({"memory_id": "b", "content": "b"}, [0.0, 1.0])]
+
+    # Writes that land between the snapshot and the generation switch.
+    log._carry_over = []
+    log.put({"memory_id": "c", "content": "c"}, [0.5, 0.5])
+    log.put({"memory_id": "a", "content": "a2"})
+    log.delete_many(["b"])
+    log._compact(snapshot)
+
+    records, matrix = MemoryLog(tmp_path).load()
+    by_id = {record["memory_id"]: (record, row) for record, row in records}
+    assert list(by_id) == ["a", "c"]
+    assert by_id["a"][0]["content"] == "a2"
+    np.testing.assert_allclose(matrix[by_id["a"][1]], [1.0, 0.0])
+    np.testing.assert_allclose(matrix[by_id["c"][1]], [0.5, 0.5])
+
+
+def test_legacy_json_memories_are_migrated(tmp_path):
+    legacy_dir = tmp_path / "alice"
+    legacy_dir.mkdir()
+    legacy = [
+        {"memory_id": "m1", "content": "likes tea", "embedding": _embed("likes tea"), "tags": ["drinks"]},
+        {"memory_id": "m2", "content": "no embedding", "embedding": None},
+    ]
+    (legacy_dir / "memories.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    store = _store(tmp_path)
+
+    assert [m.memory_id for m in store.memories] == ["m1", "m2"]
+    assert not (legacy_dir / "memories.json").exists()
+    assert (legacy_dir / "memories.json.migrated").exists()
+    assert store.faiss_index.ntotal == 1
+
+    reloaded = _store(tmp_path)
+    assert [m.memory_id for m in reloaded.memories] == ["m1", "m2"]
+    assert reloaded.memories[1].embedding is None
+
+
+def test_torn_trailing_line_is_ignored(tmp_path):
+    store = _store(tmp_path)
+    store.add_memory("complete")
+    with store._memory_log.log_path().open("a", encoding="utf-8") as handle:
+        handle.write('{"op": "put", "row": 1, "memo')
+
+    with store._memory_log.vectors_path().open("ab") as handle:
+        handle.write(b"\x00\x01")
+
+    reloaded = _store(tmp_path)
+    assert [m.content for m in reloaded.memories] == ["complete"]
+    reloaded.add_memory("after recovery")
+    again = _store(tmp_path)
+    assert [m.content for m in again.memories] == ["complete", "after recovery"]
+    np.testing.assert_allclose(again.memories[1].embedding, _embed("after recovery"), rtol=1e-6)
+
+
+def test_filtered_query_returns_full_top_k_from_prefiltered_rows(tmp_path):
+    store = _store(tmp_path)
+    store.add_memories_batch(
+        [{"content": f"general note {idx}", "category": "general"} for idx in range(200)]
+        + [{"content": f"tea preference {idx}", "category": "preferences", "tags": ["drinks"]} for idx in range(6)]
+    )
+
+    # The nearest neighbours overall are "general" memories; filtering after an
+    # over-fetch of top_k * 2 would come back short.
+    hits = store.query_memories("general note 3", top_k=5, min_score=-1.0, category="preferences")
+    assert len(hits) == 5
+    assert all(memory.category == "preferences" for memory, _ in hits)
+    assert [score for _, score in hits] == sorted((score for _, score in hits), reverse=True)
+
+    tagged = store.query_memories("general note 3", top_k=10, min_score=-1.0, tags=["drinks", "missing"])
+    assert len(tagged) == 6
+    assert store.query_memories("anything", top_k=3, min_score=-1.0, category="unknown") == []
+
+
+def test_index_tracks_updates_deletes_and_expiry(tmp_path):
+    store = _store(tmp_path)
+    a = store.add_memory("alpha", category="facts")
+    b = store.add_memory("beta", category="facts")
+    c = store.add_memory("gamma", category="facts", ttl_days=1)
+    faiss_index = store.faiss_index
+
+    assert store.get_memory(b.memory_id) is b
+    store.update_memory(a.memory_id, category="preferences")
+    store.delete_memory(b.memory_id)
+    store.update_memory(c.memory_id, created_at="2000-01-01T00:00:00")
+
+    # Deletes mask FAISS rows instead of rebuilding the index.
+    assert store.faiss_index is faiss_index
+    assert store.get_memory(b.memory_id) is None
+    assert store.query_memories("beta", top_k=5, min_score=-1.0, category="facts") == []
+    hits = store.query_memories("alpha", top_k=5, min_score=-1.0)
+    assert [memory.memory_id for memory, _ in hits] == [a.memory_id]
+
+    assert store.cleanup_expired_memories() == 1
+    assert [m.memory_id for m in store.memories] == [a.memory_id]
+
+
+def test_text_fallback_uses_cached_tokens(tmp_path):
+    store = _store(tmp_path)
+    store.faiss_index = None
+    memory = store.add_memory("Prefers dark mode in editors", category="preferences")
+    store.faiss_index = None
+
+    assert store.query_memories("dark mode", top_k=3)[0] == (memory, 0.9)
+    assert memory.memory_id in store._index._tokens
+
+    store.update_memory(memory.memory_id, content="Prefers light themes")
+    assert store.query_memories("dark mode", top_k=3) == []
+    assert store.query_memories("light themes everywhere", top_k=3, min_score=0.5)[0][0] is memory
+
+
+def test_text_fallback_matches_full_scan_via_inverted_index(tmp_path):
+    store = _store(tmp_path)
+    store.faiss_index = None
+    contents = ["prefers dark mode", "dark chocolate fan", "darkmode everywhere", "uses vim", "vim and dark themes"]
+    memories = [store.add_memory(content) for content in contents]
+    store.faiss_index = None
+
+    def full_scan(query):
+        query_lower = query.lower()
+        return [
+            m for m in store.memories
+            if query_lower in m.content.lower() or set(query_lower.split()) & set(m.content.lower().split())
+        ]
+
+    for query in ["dark", "ark mo", "k mode", "mode", "vim and dark", "themes", "nothing here", "dark vim"]:
+        assert store._index.text_candidates(query.lower()) == full_scan(query), query
+
+    assert [m for m, _ in store.query_memories("ark mo", top_k=5)] == [memories[0]]
+    store.delete_memory(memories[0].memory_id)
+    assert store._index.text_candidates("prefers") == []
+
+
+def test_query_embedding_is_computed_outside_the_lock(tmp_path):
+    store = _store(tmp_path)
+    memory = store.add_memory("likes tea")
+    blocked = []
+
+    def embedding(text):
+        reader = threading.Thread(target=lambda: store.get_memory(memory.memory_id))
+        reader.start()
+        reader.join(2)
+        blocked.append(reader.is_alive())
+        return _embed(text)
+
+    store._get_embedding = embedding
+    assert store.query_memories("likes tea", top_k=1, min_score=0.99)[0][0] is memory
+    assert blocked == [False]
@@ -0,0 +1,70 @@
+import json
+
+from src.search import query_trace
+from src.search.query_trace import QueryTrace, QueryTraceStore
+
+
+def _trace(idx):
+    return QueryTrace(query_id=f"q-{idx}", question=f"question {idx}", modalities_used=["slack"])
+
+
+def test_get_and_list_recent_across_instances(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    writer = QueryTraceStore(path)
+    reader = QueryTraceStore(path)
+    assert reader.get("q-0") is None
+
+    for idx in range(20):
+        writer.append(_trace(idx))
+
+    assert reader.get("q-7").question == "question 7"
+    assert reader.get("missing") is None
+    assert [trace.query_id for trace in reader.list_recent(limit=3)] == ["q-17", "q-18", "q-19"]
+    assert len(path.with_name("traces.jsonl.idx").read_text().splitlines()) == 20
+
+
+def test_index_is_rebuilt_for_files_without_sidecar(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    lines = [json.dumps(_trace(idx).to_dict()) for idx in range(5)]
+    path.write_text("\n".join(lines) + "\n" + "not json\n" + lines[0][:20])
+
+    store = QueryTraceStore(path)
+    assert store.get("q-3").question == "question 3"
+    assert [trace.query_id for trace in store.list_recent(limit=10)] == [f"q-{idx}" for idx in range(5)]
+
+    # The torn tail is skipped and the next trace starts on its own line.
+    store.append(_trace(99))
+    assert QueryTraceStore(path).get("q-99").question == "question 99"
+    assert QueryTraceStore(path).describe()["traces_indexed"] == 6
+
+
+def test_rotation_and_compaction(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    store = QueryTraceStore(path, max_file_bytes=1024, max_segments=2)
+    other = QueryTraceStore(path, max_file_bytes=1024, max_segments=2)
+    other.get("q-0")
+
+    for idx in range(60):
+        store.append(_trace(idx))
+
+    rotated = sorted(p.name for p in tmp_path.glob("traces.*.jsonl"))
+    assert len(rotated) == 2
+    assert store.get("q-0") is None
+    assert store.get("q-59").question == "question 59"
+    # A stale instance notices the rotation and reloads.
+    assert other.get("q-59").question == "question 59"
+    kept = [trace.query_id for trace in store.list_recent(limit=1000)]
+    assert kept == [f"q-{idx}" for idx in range(60 - len(kept), 60)]
+    assert other.get(kept[0]) is not None
+    assert [trace.query_id for trace in other.list_recent(limit=5)] == kept[-5:]
+
+    store.max_segments = 0
+    assert store.compact() == 2
+    assert not list(tmp_path.glob("traces.*.jsonl*"))
+
+
+def test_reverse_line_reader_handles_small_chunks(tmp_path):
+    path = tmp_path / "lines.jsonl"
+    path.write_bytes(b"one\n\ntwo\nthree\npartial")
+    lines = list(query_trace._iter_lines_reversed(path, chunk_size=3))
+    assert lines == [b"three", b"two", b"one"]
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import pytest
+
+from src.services.github_http import GitHubAPIError
+from src.services.github_pr_service import GitHubPRService
+
+
+class MockGitHub:
+    """State for a stub server speaking the slice of the GitHub REST API the ingestors use."""
+
+    def __init__(self, commit_count: int = 0, detail_delay: float = 0.0):
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.commits = [
+            {
+                "sha": f"{idx:040x}",
+                "html_url": f"https://github.com/acme/core/commit/{idx:040x}",
+                "commit": {
+                    "message": f"commit {idx}",
+                    "author": {"name": "dev", "date": (base + timedelta(minutes=idx)).isoformat()},
+                },
+                "author": {"login": "dev"},
+                "parents": [],
+            }
+            for idx in range(commit_count)
+        ]
+        self.detail_delay = detail_delay
+        self.rate_limit_remaining = 5000
+        self.rate_limit_reset = int(time.time()) + 3600
+        self.requests: List[str] = []
+        self.not_modified = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def route(self, path: str) -> Optional[Any]:
+        if path == "/repos/acme/core/commits":
+            return self.commits
+        if path.startswith("/repos/acme/core/commits/"):
+            sha = path.rsplit("/", 1)[-1]
+            time.sleep(self.detail_delay)
+            return {"sha": sha, "files": [{"filename": f"src/{sha[-4:]}.py", "status": "modified"}]}
+        if path.startswith("/repos/acme/core/pulls/") and path.endswith("/files"):
+            return [{"filename": "docs/api.md", "status": "modified", "additions": 3, "deletions": 1, "changes": 4}]
+        if path.startswith("/repos/acme/core/pulls/"):
+            number = int(path.rsplit("/", 1)[-1])
+            return {"number": number, "title": f"PR {number}", "user": {"login": "dev"}}
+        return None
+
+
+def _make_handler(github: MockGitHub):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):  # keep pytest output quiet
+            return
+
+        def do_GET(self):
+            path = urlparse(self.path).path
+            with github.lock:
+                github.requests.append(path)
+                github.in_flight += 1
+                github.max_in_flight = max(github.max_in_flight, github.in_flight)
+            try:
+                body = github.route(path)
+            finally:
+                with github.lock:
+                    github.in_flight -= 1
+            headers = {
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": str(github.rate_limit_remaining),
+                "X-RateLimit-Reset": str(github.rate_limit_reset),
+            }
+            if body is None:
+                self._send(404, {"message": "Not Found"}, headers)
+                return
+            data = json.dumps(body).encode("utf-8")
+            etag = f'"{hash(data) & 0xFFFFFFFF:x}"'
+            headers["ETag"] = etag
+            if self.headers.get("If-None-Match") == etag:
+                with github.lock:
+                    github.not_modified += 1
+                self._send(304, None, headers)
+                return
+            self._send(200, body, headers)
+
+        def _send(self, status: int, body: Optional[Any], headers: Dict[str, str]) -> None:
+            data = b"" if body is None else json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
+
+
+@pytest.fixture
+def mock_github():
+    servers = []
+
+    def start(**kwargs) -> tuple[str, MockGitHub]:
+        github = MockGitHub(**kwargs)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(github))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}", github
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _config(api_url: str, tmp_path, *, max_concurrency: int = 8, max_wait: float = 60.0) -> Dict[str, Any]:
+    return {
+        "github": {
+            "api_url": api_url,
+            "http": {
+                "max_concurrency": max_concurrency,
+                "rate_limit_max_wait_seconds": max_wait,
+                "cache_path": str(tmp_path / "github_http.sqlite"),
+            },
+        }
+    }
+
+
+def _service(config: Dict[str, Any]) -> GitHubPRService:
+    return GitHubPRService(config=config, token="ghp_test", owner="acme", repo="core", base_branch="main")
+
+
+def test_list_commits_fetches_details_concurrently(mock_github, tmp_path):
+    url, github = mock_github(commit_count=100, detail_delay=0.05)
+    service = _service(_config(url, tmp_path, max_concurrency=10))
+
+    started = time.perf_counter()
+    commits = service.list_commits(per_page=100, include_files=True)
+    elapsed = time.perf_counter() - started
+
+    assert len(commits) == 100
+    assert len(github.requests) == 101
+    sha = commits[7]["sha"]
+    assert commits[7]["files"][0]["filename"] == f"src/{sha[-4:]}.py"
+    assert 1 < github.max_in_flight <= 10
+    # 100 serial detail fetches would take >= 5s; ten slots need about ten round trips.
+    assert elapsed < 100 * 0.05 / 2
+
+
+def test_unchanged_resources_are_served_from_conditional_cache(mock_github, tmp_path):
+    url, github = mock_github(commit_count=5)
+    config = _config(url, tmp_path)
+    first = _service(config).list_commits(per_page=5, include_files=True)
+
+    # A new pool with the same cache file still revalidates instead of refetching.
+    config["github"]["http"]["max_concurrency"] = 3
+    service = _service(config)
+    second = service.list_commits(per_page=5, include_files=True)
+
+    assert second == first
+    assert github.not_modified == 6
+    assert service._http.stats()["not_modified"] == 6
+
+
+def test_exhausted_rate_limit_fails_fast_when_reset_is_too_far(mock_github, tmp_path):
+    url, github = mock_github(commit_count=3)
+    github.rate_limit_remaining = 0
+    service = _service(_config(url, tmp_path, max_wait=5))
+
+    service.list_commits(per_page=3, include_files=False)
+    with pytest.raises(GitHubAPIError, match="rate limit exhausted"):
+        service.list_commits(per_page=3, include_files=False)
+
+    assert len(github.requests) == 1
+
+
+def test_exhausted_rate_limit_waits_for_reset(mock_github, tmp_path):
+    url, github = mock_github(commit_count=1)
+    github.rate_limit_remaining = 0
+    github.rate_limit_reset = int(time.time())
+    service = _service(_config(url, tmp_path, max_wait=5))
+
+    service.list_commits(per_page=1, include_files=False)
+    github.rate_limit_remaining = 4999
+    service.list_commits(per_page=1, include_files=False)
+
+    assert len(github.requests) == 2
+    assert service._http.rate_limiter.remaining == 4999
+
+
+def test_fetch_pr_snapshots_keeps_order(mock_github, tmp_path):
+    url, github = mock_github()
+    service = _service(_config(url, tmp_path, max_concurrency=4))
+
+    snapshots = service.fetch_pr_snapshots([3, 1, 2])
+
+    assert [details["number"] for details, _ in snapshots] == [3, 1, 2]
+    assert all(diff["total_files"] == 1 for _, diff in snapshots)
+    assert len(github.requests) == 6
@@ -1,5 +1,11 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 from src.services import ttl_cache
-from src.services.ttl_cache import TTLCache
+from src.services.ttl_cache import ReadThroughCache, TTLCache
 
 
 def test_cache_set_get_and_expire(monkeypatch):
@@ -36,3 +42,58 @@ def test_cache_invalidate():
     cache.invalidate()
     assert cache.describe().size == 0
 
+
+
+def test_read_through_cache_coalesces_concurrent_loads():
+    cache = ReadThroughCache(label="test")
+    calls = []
+    release = threading.Event()
+
+    def loader():
+        calls.append(1)
+        release.wait(5)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(cache.get_or_load, "key", loader, ttl_seconds=60) for _ in range(4)]
+        while cache.stats()["coalesced"] < 3:
+            time.sleep(0.01)
+        release.set()
+        assert [future.result() for future in futures] == ["value"] * 4
+
+    assert len(calls) == 1
+    assert cache.get_or_load("key", loader, ttl_seconds=60) == "value"
+    stats = cache.stats()
+    assert (stats["loads"], stats["hits"], stats["coalesced"]) == (1, 1, 3)
+
+
+def test_read_through_cache_batches_misses_and_applies_ttl_policy():
+    now = {"value": 0.0}
+    cache = ReadThroughCache(max_entries=3, clock=lambda: now["value"])
+    batches = []
+
+    def loader(keys):
+        batches.append(list(keys))
+        return {key: {"merged": key % 2 == 0} for key in keys if key != 5}
+
+    def ttl(value):
+        return 100 if value and value["merged"] else 10
+
+    assert cache.get_many_or_load([1, 2, 5], loader, ttl_seconds=ttl) == {1: {"merged": False}, 2: {"merged": True}, 5: None}
+    assert cache.get_many_or_load([1, 2, 3], loader, ttl_seconds=ttl)[3] == {"merged": False}
+    assert batches == [[1, 2, 5], [3]]
+
+    now["value"] = 50
+    cache.get_many_or_load([1, 2, 3], loader, ttl_seconds=ttl)
+    assert batches[-1] == [1, 3]  # open entries expired; merged one still cached
+
+
+def test_read_through_cache_propagates_errors_without_caching():
+    cache = ReadThroughCache()
+
+    def failing():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load("key", failing, ttl_seconds=60)
+    assert cache.get_or_load("key", lambda: "ok", ttl_seconds=60) == "ok"
@@ -0,0 +1,186 @@
+import json
+import os
+import random
+from datetime import datetime, timedelta, timezone
+
+from src.slash_git import data_source as ds
+from src.slash_git.data_source import SyntheticGitDataSource
+from src.slash_git.models import GitTargetComponent, GitTargetRepo, TimeWindow
+
+START = datetime(2025, 11, 1, tzinfo=timezone.utc)
+REPOS = ["core-api", "billing", "web"]
+AUTHORS = ["alice", "Bob", "carol"]
+LABELS = ["bug", "docs", "breaking"]
+PATHS = ["src/payments.py", "src/auth/login.py", "docs/api.md", "openapi/spec.yaml", "web/app.tsx"]
+
+
+def _records(rng, count, *, prs=False):
+    records = []
+    for idx in range(count):
+        timestamp = (START + timedelta(hours=rng.randint(0, 24 * 30))).isoformat()
+        record = {
+            "repo": rng.choice(REPOS),
+            "author": rng.choice(AUTHORS),
+            "timestamp": timestamp if idx % 17 else rng.choice([None, "not-a-date"]),
+            "labels": rng.sample(LABELS, rng.randint(0, 2)),
+            "files_changed": rng.sample(PATHS, rng.randint(0, 3)),
+        }
+        if prs:
+            record["pr_number"] = idx % 40
+        else:
+            record["commit_sha"] = f"sha{idx}"
+        records.append(record)
+    return records
+
+
+def _linear_commits(events, repo, component, window, authors, labels):
+    paths = component.paths if component else None
+    return [
+        event
+        for event in events
+        if event.get("repo") == repo.id
+        and ds._within_window(event.get("timestamp"), window)
+        and (not authors or ds._matches_authors(event.get("author"), authors))
+        and (not labels or ds._matches_labels(event.get("labels", []), labels))
+        and (not paths or ds._matches_paths(event.get("files_changed") or [], paths))
+    ]
+
+
+def _source(tmp_path, events, prs):
+    events_path = tmp_path / "events.json"
+    prs_path = tmp_path / "prs.json"
+    events_path.write_text(json.dumps(events))
+    prs_path.write_text(json.dumps(prs))
+    return SyntheticGitDataSource(
+        {"slash_git": {"synthetic_data": {"events_path": str(events_path), "prs_path": str(prs_path)}}}
+    )
+
+
+def _component(patterns):
+    return GitTargetComponent(id="comp", name="comp", repo_id="repo", paths=patterns) if patterns is not None else None
+
+
+def test_indexed_queries_match_linear_scan(tmp_path):
+    rng = random.Random(11)
+    events = _records(rng, 600)
+    prs = _records(rng, 200, prs=True)
+    source = _source(tmp_path, events, prs)
+
+    for _ in range(200):
+        repo = GitTargetRepo(id=rng.choice(REPOS), name="repo", repo_owner="acme", repo_name="repo", default_branch="main")
+        component = _component(rng.choice([None, ["src/"], ["SRC/AUTH", "*.md"], ["openapi/*.yaml"], ["missing/"]]))
+        begin = START + timedelta(days=rng.randint(0, 30))
+        window = rng.choice([None, TimeWindow(start=begin, end=begin + timedelta(days=rng.randint(0, 10))), TimeWindow(start=begin)])
+        authors = rng.choice([[], ["ALICE"], ["bob", "carol"]])
+        labels = rng.choice([[], ["bug"], ["docs", "BREAKING"]])
+
+        expected = _linear_commits(events, repo, component, window, authors, labels)
+        assert source.get_commits(repo, component, window, authors=authors, labels=labels) == expected
+        expected_prs = _linear_commits(prs, repo, component, window, authors, labels)
+        assert source.get_prs(repo, component, window, authors=authors, labels=labels) == expected_prs
+
+        pr_number = rng.randint(0, 45)
+        by_number = [
+            pr
+            for pr in _linear_commits(prs, repo, component, None, authors, labels)
+            if pr["pr_number"] == pr_number
+        ][:1]
+        assert source.get_prs(repo, component, window, pr_number=pr_number, authors=authors, labels=labels) == by_number
+
+
+def test_source_reloads_when_fixture_files_change(tmp_path):
+    repo = GitTargetRepo(id="core-api", name="Core API", repo_owner="acme", repo_name="core-api", default_branch="main")
+    first = {"repo": "core-api", "commit_sha": "a", "timestamp": "2025-11-02T00:00:00Z", "files_changed": []}
+    source = _source(tmp_path, [first], [])
+    assert [c["commit_sha"] for c in source.get_commits(repo, None, None)] == ["a"]
+
+    second = dict(first, commit_sha="b")
+    events_path = tmp_path / "events.json"
+    events_path.write_text(json.dumps([first, second]))
+    stat = events_path.stat()
+    os.utime(events_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert [c["commit_sha"] for c in source.get_commits(repo, None, None)] == ["a", "b"]
+
+
+class FakeGitHubService:
+    """Stands in for GitHubPRService; counts the calls that would hit the API."""
+
+    instances = []
+
+    def __init__(self, config=None, owner=None, repo=None, base_branch=None):
+        self.owner, self.repo, self.token = owner, repo, "token"
+        self.calls = []
+        FakeGitHubService.instances.append(self)
+
+    def list_commits(self, **kwargs):
+        self.calls.append(("list_commits", kwargs["since"], kwargs["until"]))
+        return [
+            {"sha": "c1", "author": "alice", "date": "2025-11-24T10:00:00Z", "message": "fix auth"},
+            {"sha": "c2", "author": "bob", "date": "2025-11-24T11:00:00Z", "message": "docs"},
+        ]
+
+    def get_commits(self, shas):
+        self.calls.append(("get_commits", tuple(shas)))
+        files = {"c1": [{"filename": "src/auth.py"}], "c2": [{"filename": "docs/readme.md"}]}
+        return [{"sha": sha, "files": files[sha]} for sha in shas]
+
+    def list_prs(self, **_):
+        self.calls.append(("list_prs",))
+        return [
+            {"number": 1, "author": "alice", "merged_at": "2025-11-24T12:00:00Z"},
+            {"number": 2, "author": "bob", "updated_at": "2025-11-24T13:00:00Z"},
+        ]
+
+    def fetch_pr_snapshots(self, numbers, skip_errors=False):
+        self.calls.append(("fetch_pr_snapshots", tuple(numbers)))
+        return [
+            (
+                {"number": number, "merged_at": "2025-11-24T12:00:00Z" if number == 1 else None},
+                {"files": [{"filename": "src/auth.py"}]},
+            )
+            for number in numbers
+        ]
+
+
+def _live_source(monkeypatch, now):
+    FakeGitHubService.instances = []
+    monkeypatch.setattr(ds, "GitHubPRService", FakeGitHubService)
+    cache = ds.ReadThroughCache(clock=lambda: now["value"])
+    return ds.LiveGitDataSource({}, cache=cache)
+
+
+def test_live_source_serves_repeated_queries_from_cache(monkeypatch):
+    now = {"value": 0.0}
+    source = _live_source(monkeypatch, now)
+    repo = GitTargetRepo(id="core-api", name="Core API", repo_owner="acme", repo_name="core-api", default_branch="main")
+    component = _component(["src/"])
+    end = datetime(2025, 11, 25, 8, 30, 15, tzinfo=timezone.utc)
+
+    first = source.get_commits(repo, component, TimeWindow(start=end - timedelta(days=7), end=end))
+    # A relative window issued seconds later lands in the same listing bucket.
+    later = end + timedelta(seconds=20)
+    second = source.get_commits(repo, component, TimeWindow(start=later - timedelta(days=7), end=later))
+    prs = source.get_prs(repo, component, None)
+    source.get_prs(repo, component, None)
+
+    service = FakeGitHubService.instances[0]
+    assert len(FakeGitHubService.instances) == 1
+    assert [c["commit_sha"] for c in first] == [c["commit_sha"] for c in second] == ["c1"]
+    assert service.calls == [
+        ("list_commits", "2025-11-18T08:30:00+00:00", "2025-11-25T08:31:00+00:00"),
+        ("get_commits", ("c1", "c2")),
+        ("list_prs",),
+        ("fetch_pr_snapshots", (1, 2)),
+    ]
+    assert [pr["pr_number"] for pr in prs] == [1, 2]
+
+    # Mutable listings and the open PR expire; commit files and the merged PR do not.
+    now["value"] = ds.DEFAULT_LIVE_MUTABLE_TTL_SECONDS + 1
+    source.get_commits(repo, component, TimeWindow(start=end - timedelta(days=7), end=end))
+    source.get_prs(repo, component, None)
+    assert service.calls[4:] == [
+        ("list_commits", "2025-11-18T08:30:00+00:00", "2025-11-25T08:31:00+00:00"),
+        ("list_prs",),
+        ("fetch_pr_snapshots", (2,)),
+    ]
@@ -1,3 +1,5 @@
+import threading
+import time
 from typing import Any, Dict
 
 import pytest
@@ -85,3 +87,198 @@ def test_infer_sources_defaults_include_docs(monkeypatch):
 
     assert "docs" in sources
 
+
+
+class _SlowRetriever:
+    def __init__(self, source: str, delay: float):
+        self.source = source
+        self.delay = delay
+
+    def retrieve(self, query: str, **_: Any) -> EvidenceCollection:
+        time.sleep(self.delay)
+        collection = EvidenceCollection(query=query)
+        collection.add(
+            Evidence(
+                source_type=self.source,
+                source_name=f"{self.source} entry",
+                content=f"{self.source} notes about billing checkout",
+            )
+        )
+        return collection
+
+
+class _BarrierLLM:
+    """Conflict and gap prompts only return once both are in flight."""
+
+    def __init__(self):
+        self.barrier = threading.Barrier(2, timeout=5)
+        self.prompts = []
+
+    def invoke(self, prompt: str):
+        self.prompts.append(prompt)
+        if prompt.startswith("You are analyzing evidence"):
+            self.barrier.wait()
+
+        class _Resp:
+            content = "[]"
+
+        return _Resp()
+
+
+def _concurrent_reasoner(monkeypatch, delays: Dict[str, float], **reasoner_cfg: Any) -> MultiSourceReasoner:
+    monkeypatch.setattr(
+        "src.agent.multi_source_reasoner.get_retriever",
+        lambda source, _config: _SlowRetriever(source, delays[source]),
+    )
+    config = {
+        "search": {"modalities": {source: {"enabled": True} for source in delays}},
+        "activity_ingest": {"git": {"include_issues": False}},
+        "activity": {"reasoner": reasoner_cfg},
+    }
+    return MultiSourceReasoner(config, llm_client=_BarrierLLM())
+
+
+def test_query_fans_out_retrievers_and_streams_evidence(monkeypatch):
+    reasoner = _concurrent_reasoner(monkeypatch, {"git": 0.3, "slack": 0.1, "docs": 0.2})
+    streamed = []
+
+    started = time.perf_counter()
+    result = reasoner.query(
+        "billing checkout",
+        sources=["git", "slack", "docs"],
+        on_evidence=lambda source, evidence: streamed.append((source, len(evidence))),
+    )
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.55
+    assert streamed == [("slack", 1), ("docs", 1), ("git", 1)]
+    # Merged evidence keeps the requested source order.
+    assert [item["source_type"] for item in result["evidence"]["evidence"]] == ["git", "slack", "docs"]
+    timings = result["timings"]
+    assert set(timings["retrievers_ms"]) == {"git", "slack", "docs"}
+    assert timings["retrieval_ms"] < sum(timings["retrievers_ms"].values())
+    for key in ("analysis_ms", "conflicts_ms", "gaps_ms", "summary_ms", "total_ms"):
+        assert key in timings
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        with self._lock:
+            self.now += seconds
+
+
+class _GatedRetriever(_SlowRetriever):
+    """Advances the fake clock by ``runtime``, then blocks until ``release`` is set (if given)."""
+
+    def __init__(self, source: str, clock: _FakeClock, runtime: float, release: threading.Event = None):
+        super().__init__(source, 0.0)
+        self.clock = clock
+        self.runtime = runtime
+        self.release = release
+
+    def retrieve(self, query: str, **kwargs: Any) -> EvidenceCollection:
+        self.clock.advance(self.runtime)
+        if self.release is not None:
+            assert self.release.wait(timeout=5)
+        return super().retrieve(query, **kwargs)
+
+
+def _clocked_reasoner(monkeypatch, runtimes: Dict[str, float], gates: Dict[str, threading.Event] = None, **reasoner_cfg):
+    clock = _FakeClock()
+    gates = gates or {}
+    monkeypatch.setattr(
+        "src.agent.multi_source_reasoner.get_retriever",
+        lambda source, _config: _GatedRetriever(source, clock, runtimes[source], gates.get(source)),
+    )
+    config = {
+        "search": {"modalities": {source: {"enabled": True} for source in runtimes}},
+        "activity_ingest": {"git": {"include_issues": False}},
+        "activity": {"reasoner": reasoner_cfg},
+    }
+    return MultiSourceReasoner(config, llm_client=_FakeLLM(), clock=clock)
+
+
+def test_retrievers_have_no_deadline_by_default(monkeypatch):
+    reasoner = _clocked_reasoner(monkeypatch, {"git": 3600.0, "slack": 0.0})
+
+    result = reasoner.query("billing checkout", sources=["git", "slack"])
+
+    assert reasoner.retriever_timeout_seconds == 0
+    assert result["dropped_sources"] == []
+    assert result["evidence_count"] == 2
+
+
+def test_slow_retriever_misses_deadline_without_blocking_query(monkeypatch):
+    release = threading.Event()
+    reasoner = _clocked_reasoner(
+        monkeypatch,
+        {"git": 2.0, "slack": 0.05},
+        {"git": release},
+        retriever_timeout_seconds=5,
+        retriever_timeouts={"git": 0.2},
+    )
+
+    try:
+        # git is still blocked when the query returns.
+        result = reasoner.query("billing checkout", sources=["git", "slack"])
+    finally:
+        release.set()
+
+    assert result["timings"]["timed_out_sources"] == ["git"]
+    assert result["dropped_sources"] == [{"source": "git", "reason": "missed its 0.2s deadline"}]
+    assert result["sources_without_evidence"] == ["git"]
+    assert result["evidence_count"] == 1
+
+
+def test_queued_retriever_deadline_starts_when_it_runs(monkeypatch):
+    reasoner = _clocked_reasoner(
+        monkeypatch, {"git": 0.3, "slack": 0.3}, max_workers=1, retriever_timeout_seconds=0.45
+    )
+
+    result = reasoner.query("billing checkout", sources=["git", "slack"])
+
+    # slack waited 0.3s for the single worker, but its own run fits the deadline.
+    assert result["dropped_sources"] == []
+    assert result["evidence_count"] == 2
+
+
+def test_queued_sources_are_dropped_when_workers_are_stuck(monkeypatch, caplog):
+    release = threading.Event()
+    reasoner = _clocked_reasoner(
+        monkeypatch, {"git": 1.0, "slack": 0.05}, {"git": release}, max_workers=1, retriever_timeouts={"git": 0.1}
+    )
+
+    try:
+        with caplog.at_level("WARNING", logger="src.agent.multi_source_reasoner"):
+            result = reasoner.query("billing checkout", sources=["git", "slack"])
+    finally:
+        release.set()
+
+    assert [entry["source"] for entry in result["dropped_sources"]] == ["git", "slack"]
+    assert result["dropped_sources"][1]["reason"] == "no free worker after earlier sources timed out"
+    assert result["evidence_count"] == 0
+    dropped = [record.getMessage() for record in caplog.records if "Dropping" in record.getMessage()]
+    assert len(dropped) == 2 and "git" in dropped[0] and "slack" in dropped[1]
+
+
+def test_sequential_mode_runs_sources_in_order(monkeypatch):
+    reasoner = _concurrent_reasoner(monkeypatch, {"git": 0.0, "slack": 0.0}, concurrent=False)
+    reasoner.llm_client = _FakeLLM()
+    streamed = []
+
+    result = reasoner.query(
+        "billing checkout",
+        sources=["slack", "git"],
+        on_evidence=lambda source, _evidence: streamed.append(source),
+    )
+
+    assert streamed == ["slack", "git"]
+    assert result["timings"]["timed_out_sources"] == []
+    assert result["summary"] == "Mock summary"
@@ -0,0 +1,123 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from src.traceability.store import TraceabilityStore
+
+
+def _segments(tmp_path):
+    return sorted(path.name for path in tmp_path.glob("investigations.*.jsonl"))
+
+
+def test_append_get_and_list_from_tail(tmp_path):
+    store = TraceabilityStore(tmp_path / "investigations.jsonl", max_entries=40)
+    for idx in range(30):
+        store.append({"id": f"inv-{idx}", "question": f"question {idx}"})
+    store.append({"id": "inv-3", "question": "updated"})
+
+    assert [record["id"] for record in store.list(limit=3)] == ["inv-3", "inv-29", "inv-28"]
+    assert store.get("inv-3")["summary"] == "updated"
+    assert store.get("inv-10")["summary"] == "question 10"
+    assert store.get("missing") is None
+    assert len(_segments(tmp_path)) > 1
+
+    reloaded = TraceabilityStore(tmp_path / "investigations.jsonl", max_entries=40)
+    assert reloaded.get("inv-3")["summary"] == "updated"
+    assert [record["id"] for record in reloaded.list(limit=2)] == ["inv-3", "inv-29"]
+
+
+def test_retention_drops_whole_segments(tmp_path):
+    store = TraceabilityStore(tmp_path / "investigations.jsonl", max_entries=16)
+    for idx in range(100):
+        store.append({"id": f"inv-{idx}"})
+
+    kept = store.records()
+    assert 16 <= len(kept) <= 16 + store.segment_max_entries
+    assert kept[-1]["id"] == "inv-99"
+    assert [record["id"] for record in kept] == [f"inv-{idx}" for idx in range(100 - len(kept), 100)]
+    assert store.get("inv-0") is None
+    assert len(_segments(tmp_path)) == len(store._segments)
+
+    old = (datetime.now(timezone.utc) - timedelta(days=40)).isoformat()
+    aged = TraceabilityStore(tmp_path / "aged.jsonl", max_entries=16, retention_days=30)
+    for idx in range(4):
+        aged.append({"id": f"old-{idx}", "created_at": old})
+    aged.append({"id": "new"})
+    assert [record["id"] for record in aged.records()] == ["new"]
+
+
+def test_legacy_json_array_is_served_read_only_and_migrated_on_write(tmp_path):
+    path = tmp_path / "investigations.json"
+    path.write_text(json.dumps([{"id": "a", "question": "legacy"}, {"id": "b", "type": "incident"}]))
+
+    store = TraceabilityStore(path, max_entries=10)
+
+    assert [record["id"] for record in store.list(limit=5)] == ["b", "a"]
+    assert store.get("b")["status"] == "open"
+    assert path.exists() and _segments(tmp_path) == []
+
+    store.append({"id": "c"})
+    assert [record["id"] for record in store.records()] == ["a", "b", "c"]
+    assert not path.exists()
+    assert (tmp_path / "investigations.json.migrated").exists()
+
+
+def test_reads_leave_disk_untouched(tmp_path):
+    path = tmp_path / "investigations.jsonl"
+    writer = TraceabilityStore(path, max_entries=100)
+    for idx in range(40):
+        writer.append({"id": f"inv-{idx}"})
+    segment = tmp_path / _segments(tmp_path)[-1]
+    with segment.open("a", encoding="utf-8") as handle:
+        handle.write('{"id": "in-flight", "quest')
+    before = {p.name: p.read_bytes() for p in tmp_path.iterdir()}
+
+    # A reader with a tighter budget (like an eval script) neither truncates nor drops segments.
+    reader = TraceabilityStore(path, max_entries=8)
+    assert len(reader.records()) == 40
+    assert reader.get("inv-0")["id"] == "inv-0"
+    assert reader.list(limit=1)[0]["id"] == "inv-39"
+    assert {p.name: p.read_bytes() for p in tmp_path.iterdir()} == before
+
+    with segment.open("a", encoding="utf-8") as handle:
+        handle.write('ion": "done"}\n')
+    assert reader.list(limit=1)[0]["id"] == "in-flight"
+
+
+def test_torn_trailing_line_is_dropped_by_the_next_write(tmp_path):
+    store = TraceabilityStore(tmp_path / "investigations.jsonl", max_entries=10)
+    store.append({"id": "complete"})
+    segment = tmp_path / _segments(tmp_path)[-1]
+    with segment.open("a", encoding="utf-8") as handle:
+        handle.write('{"id": "torn", "quest')
+
+    reloaded = TraceabilityStore(tmp_path / "investigations.jsonl", max_entries=10)
+    reloaded.append({"id": "after"})
+    assert [record["id"] for record in reloaded.records()] == ["complete", "after"]
+
+
+def test_instances_see_each_others_appends_and_rewrites(tmp_path):
+    path = tmp_path / "investigations.jsonl"
+    server = TraceabilityStore(path, max_entries=40)
+    script = TraceabilityStore(path, max_entries=40)
+    server.append({"id": "inv-1", "question": "first"})
+    assert server.get("inv-1")["summary"] == "first"
+
+    for idx in range(2, 20):
+        script.append({"id": f"inv-{idx}"})
+    assert server.list(limit=1)[0]["id"] == "inv-19"
+    assert server.get("inv-12")["id"] == "inv-12"
+
+    server.append({"id": "inv-20"})
+    records = script.records()
+    assert [record["id"] for record in records][-2:] == ["inv-19", "inv-20"]
+
+    for record in records:
+        record["question"] = f"backfilled {record['id']}"
+    script.rewrite(records)
+    assert server.get("inv-1")["question"] == "backfilled inv-1"
+    assert len(server.records()) == 20
+    assert len(_segments(tmp_path)) == len(server._segments)
+
+    script.rewrite(records[:3])
+    assert server.get("inv-12") is None
+    assert [record["id"] for record in server.list(limit=5)] == ["inv-3", "inv-2", "inv-1"]
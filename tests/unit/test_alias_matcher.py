@@ -0,0 +1,34 @@
+import random
+
+from src.slash_git.models import GitTargetCatalog
+from src.utils.alias_matcher import AliasMatcher
+
+
+def test_matches_overlapping_and_nested_aliases():
+    matcher = AliasMatcher(
+        [("he", 1), ("she", 2), ("his", 3), ("hers", 4), ("core api", "core"), ("api", "api"), ("he", 5)]
+    )
+
+    assert sorted(matcher.finditer("USHERS")) == [(4, "he", 1), (4, "he", 5), (4, "she", 2), (6, "hers", 4)]
+    assert matcher.find_values("Core API down") == {"core", "api"}
+    assert matcher.find_aliases("nothing here") == {"he"}
+    assert len(matcher) == 7
+    assert AliasMatcher([]).find_values("anything") == set()
+
+
+def test_agrees_with_substring_scan():
+    rng = random.Random(11)
+    alphabet = "abc -"
+    aliases = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5))) for _ in range(300)}
+    matcher = AliasMatcher((alias, alias) for alias in aliases)
+    for _ in range(50):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert matcher.find_values(text) == {alias for alias in aliases if alias in text}
+
+
+def test_catalog_reports_mentioned_component_aliases():
+    catalog = GitTargetCatalog(component_aliases={"comp:core-api": "comp:core-api", "core api": "comp:core-api", "billing": "comp:billing"})
+
+    mentioned = catalog.mentioned_component_aliases("Is comp:core-api or the Core-API docs stale?")
+    assert mentioned == {"comp:core-api", "core api"}
+    assert catalog.mentioned_component_aliases("") == set()
@@ -0,0 +1,133 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.cache.embedding_cache import EmbeddingCache, get_embedding_cache
+from src.utils.performance_monitor import get_performance_monitor
+from src.vector.embedding_provider import EmbeddingProvider
+
+
+class CountingClient:
+    def __init__(self):
+        self.inputs = []
+        self.embeddings = SimpleNamespace(create=self._create)
+
+    def _create(self, model, input):
+        texts = [input] if isinstance(input, str) else list(input)
+        self.inputs.extend(texts)
+        return SimpleNamespace(
+            data=[SimpleNamespace(embedding=[float(len(text)), 1.0, 0.0]) for text in texts]
+        )
+
+
+def _cache_config(tmp_path, **overrides):
+    caching = {"embeddings": True, "embeddings_path": str(tmp_path / "embeddings.sqlite")}
+    caching.update(overrides)
+    return {"performance": {"caching": caching}}
+
+
+def test_embed_only_fetches_misses_and_persists(tmp_path):
+    path = tmp_path / "embeddings.sqlite"
+    cache = EmbeddingCache(path)
+    fetched = []
+
+    def fetch(texts):
+        fetched.extend(texts)
+        return [[1.0, float(len(text))] for text in texts]
+
+    first = cache.embed("model-a", ["alpha", "beta", "alpha"], fetch)
+    assert fetched == ["alpha", "beta"]
+    assert np.allclose(first[2], [1.0, 5.0])
+
+    fetched.clear()
+    reopened = EmbeddingCache(path)
+    second = reopened.embed("model-a", ["beta", "alpha"], fetch)
+    assert fetched == []
+    assert np.allclose(second[0], [1.0, 4.0])
+
+    # Same text under a different model is a separate entry
+    reopened.embed("model-b", ["alpha"], fetch)
+    assert fetched == ["alpha"]
+
+
+def test_failed_embeddings_are_not_cached(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite")
+    assert cache.embed("m", ["x"], lambda texts: [None]) == [None]
+    assert cache.get_many("m", ["x"]) == [None]
+
+
+def test_lru_eviction_respects_byte_budget(tmp_path):
+    # Each vector is 4 floats = 16 bytes; budget fits three entries
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite", max_bytes=48)
+    fetch = lambda texts: [[1.0, 2.0, 3.0, 4.0] for _ in texts]
+    cache.embed("m", ["a", "b", "c"], fetch)
+    cache.get_many("m", ["a"])  # refresh "a"
+    cache.embed("m", ["d"], fetch)
+
+    cached = cache.get_many("m", ["a", "b", "c", "d"])
+    assert cached[0] is not None and cached[3] is not None
+    assert cached[1] is None
+    assert cache.stats()["bytes"] <= 48
+
+
+def test_overwriting_a_key_keeps_the_byte_total(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite", max_bytes=48)
+    for value in range(10):
+        cache.put_many("m", ["a", "a"], [[float(value)] * 4, [float(value)] * 4])
+    assert cache.stats()["bytes"] == 16
+    assert cache.evictions == 0
+    assert np.allclose(cache.get_many("m", ["a"])[0], [9.0] * 4)
+
+    cache.put_many("m", ["a"], [[1.0] * 8])
+    assert cache.stats()["bytes"] == 32 == EmbeddingCache(tmp_path / "embeddings.sqlite").stats()["bytes"]
+
+
+def test_disabled_cache_is_pass_through():
+    cache = get_embedding_cache({})
+    assert not cache.enabled
+    calls = []
+    cache.embed("m", ["a"], lambda texts: calls.append(texts) or [[1.0]])
+    cache.embed("m", ["a"], lambda texts: calls.append(texts) or [[1.0]])
+    assert len(calls) == 2
+
+
+def test_embedding_provider_reindex_makes_no_api_calls(tmp_path):
+    config = _cache_config(tmp_path)
+    monitor = get_performance_monitor()
+    hits_before = monitor.metrics.cache_hits["embeddings"]
+
+    client = CountingClient()
+    provider = EmbeddingProvider(config, client=client)
+    first = provider.embed_batch(["slack message", "git commit"])
+    assert client.inputs == ["slack message", "git commit"]
+
+    client.inputs.clear()
+    rerun = EmbeddingProvider(config, client=client).embed_batch(["slack message", "git commit"])
+    assert client.inputs == []
+    assert np.allclose(rerun, first)
+    assert monitor.metrics.cache_hits["embeddings"] - hits_before == 2
+
+
+def test_single_and_batch_calls_count_hits_and_misses_per_text(tmp_path):
+    fetch = lambda texts: [[1.0, 2.0] for _ in texts]
+    batched = EmbeddingCache(tmp_path / "batched.sqlite")
+    batched.embed("m", ["a", "b", "a"], fetch)
+    batched.embed("m", ["a", "b", "a"], fetch)
+
+    single = EmbeddingCache(tmp_path / "single.sqlite")
+    for _ in range(2):
+        for text in ["a", "b", "a"]:
+            single.embed("m", [text], fetch)
+
+    assert (batched.hits, batched.misses) == (3, 3)
+    # Single-text calls see the repeated "a" as a hit once it is stored.
+    assert (single.hits, single.misses) == (4, 2)
+    assert batched.hits + batched.misses == single.hits + single.misses == 6
+
+
+def test_default_cache_location_is_outside_the_repo():
+    from src.utils.config_validator import PerformanceConfigDefaults
+
+    defaults = PerformanceConfigDefaults()
+    assert not defaults.caching_embeddings
+    assert defaults.caching_embeddings_path.startswith("~")
@@ -0,0 +1,54 @@
+from src.cache.impact_cache import ImpactResultCache, notify_activity
+from src.ingestion.loggers import SignalLogWriter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_bound_and_ttl_expiry():
+    clock = FakeClock()
+    cache = ImpactResultCache(max_entries=2, ttl_seconds=60, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)  # evicts "b", the least recently used
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+    clock.now += 60
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["expirations"] == 1
+    assert stats["entries"] == 1
+    assert stats["hits"] == 3 and stats["misses"] == 2
+    assert stats["hit_rate"] == 0.6
+
+
+def test_invalidation_by_issue_and_component():
+    cache = ImpactResultCache()
+    cache.put("issue-1", "one", component_ids=["comp:alpha"])
+    cache.put("issue-2", "two", component_ids=["comp:alpha", "comp:beta"])
+    cache.put("issue-3", "three", component_ids=["comp:gamma"])
+
+    assert cache.invalidate_components(["COMP:BETA"]) == 1
+    assert cache.get_many(["issue-1", "issue-2", "issue-3"]) == {"issue-1": "one", "issue-3": "three"}
+    assert notify_activity(issue_ids=["issue-3"], component_ids=["comp:alpha"]) >= 2
+    assert cache.get_many(["issue-1", "issue-3"]) == {}
+    assert cache.stats()["invalidations"] == 3
+
+
+def test_signal_writer_invalidates_components(tmp_path):
+    cache = ImpactResultCache()
+    cache.put("issue-1", "one", component_ids=["comp:payments"])
+    cache.put("issue-2", "two", component_ids=["comp:search"])
+
+    SignalLogWriter(tmp_path / "signals.jsonl").write({"source": "slack", "component_ids": ["comp:payments"]})
+    SignalLogWriter(None).write({"source": "git", "component_ids": "comp:search"})
+
+    assert cache.get_many(["issue-1", "issue-2"]) == {}
@@ -0,0 +1,148 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.utils import offload as offload_module
+from src.utils.offload import (
+    EventLoopLagMonitor,
+    OffloadPool,
+    OffloadRegistry,
+    OffloadRejected,
+    configure_offload,
+    offload,
+)
+
+
+@pytest.fixture
+def heavy_pool():
+    registry = configure_offload(
+        {"performance": {"offload": {"pools": {"heavy": {"kind": "thread", "max_workers": 16, "max_queue": 64}}}}}
+    )
+    yield registry
+    registry.shutdown(wait=True)
+    offload_module._registry = None
+
+
+def test_pool_bounds_queue_and_reports_wait_times():
+    async def scenario():
+        pool = OffloadPool("test", max_workers=2, max_queue=2)
+        calls = [asyncio.create_task(pool.run(time.sleep, 0.05)) for _ in range(4)]
+        await asyncio.sleep(0.01)
+        assert pool.stats()["active"] == 2
+        assert pool.queue_depth == 2
+        with pytest.raises(OffloadRejected):
+            await pool.run(time.sleep, 0)
+
+        # A cancelled waiter gives its place back without leaking a slot.
+        calls[-1].cancel()
+        await asyncio.gather(*calls, return_exceptions=True)
+        assert await pool.run(sum, [1, 2, 3]) == 6
+        with pytest.raises(ZeroDivisionError):
+            await pool.run(divmod, 1, 0)
+        stats = pool.stats()
+        pool.shutdown(wait=True)
+        return stats
+
+    stats = asyncio.run(scenario())
+    assert stats["active"] == 0 and stats["queue_depth"] == 0
+    assert (stats["submitted"], stats["completed"], stats["failed"], stats["rejected"]) == (5, 4, 1, 1)
+    assert stats["max_queue_depth"] == 2
+    assert stats["wait_ms"]["max"] >= 40  # the queued call waited for a worker
+
+
+def test_process_pool_and_unknown_pool_fallback():
+    async def scenario():
+        registry = OffloadRegistry({"cpu": {"kind": "process", "max_workers": 1, "max_queue": 4}})
+        try:
+            return await registry.run("cpu", pow, 3, 4), await registry.run("missing", pow, 2, 5), registry.stats()
+        finally:
+            registry.shutdown(wait=True)
+
+    cpu_result, fallback_result, stats = asyncio.run(scenario())
+    assert (cpu_result, fallback_result) == (81, 32)
+    assert sorted(stats) == ["cpu", "default"]
+    assert stats["default"]["completed"] == 1
+
+
+def _load_test_app(monitor):
+    app = FastAPI()
+
+    @app.get("/cheap")
+    async def cheap():
+        return {"ok": True}
+
+    @app.get("/heavy/blocking")
+    async def heavy_blocking():
+        time.sleep(0.05)
+        return {"ok": True}
+
+    @app.get("/heavy/offloaded")
+    @offload("heavy")
+    def heavy_offloaded(delay: float = 0.05):
+        time.sleep(delay)
+        return {"ok": True, "delay": delay}
+
+    monitor.register_routes(app.routes)
+    return app
+
+
+async def _cheap_p99_under_load(app, heavy_path, duration=0.6, heavy_concurrency=4):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        stop = asyncio.Event()
+
+        async def hammer():
+            while not stop.is_set():
+                await client.get(heavy_path)
+                await asyncio.sleep(0.1)
+
+        heavy = [asyncio.create_task(hammer()) for _ in range(heavy_concurrency)]
+        # Open-loop: latency is measured from when each request was due, so time
+        # spent waiting for a blocked loop counts against it.
+        latencies = []
+        start = time.perf_counter()
+        for idx in range(int(duration / 0.005)):
+            due = start + idx * 0.005
+            if time.perf_counter() - start > duration:
+                break
+            await asyncio.sleep(max(0.0, due - time.perf_counter()))
+            response = await client.get("/cheap")
+            latencies.append((time.perf_counter() - due) * 1000)
+            assert response.status_code == 200
+        stop.set()
+        await asyncio.gather(*heavy)
+    latencies.sort()
+    return latencies[int(0.99 * (len(latencies) - 1))]
+
+
+def test_load_cheap_endpoint_p99_stays_flat_with_offloaded_heavy_handlers(heavy_pool):
+    async def scenario():
+        monitor = EventLoopLagMonitor(interval_ms=10, threshold_ms=30)
+        app = _load_test_app(monitor)
+        await monitor.start()
+        try:
+            idle = await _cheap_p99_under_load(app, "/cheap", heavy_concurrency=0)
+            offloaded = await _cheap_p99_under_load(app, "/heavy/offloaded")
+            offloaded_stalls = monitor.stalls
+            blocking = await _cheap_p99_under_load(app, "/heavy/blocking")
+        finally:
+            await monitor.stop()
+        return idle, offloaded, offloaded_stalls, blocking, monitor.stats()
+
+    idle, offloaded, offloaded_stalls, blocking, loop_stats = asyncio.run(scenario())
+
+    # With heavy work offloaded the cheap endpoint stays within a few ms of idle ...
+    assert offloaded < idle + 20, (idle, offloaded)
+    assert offloaded_stalls == 0
+    # ... while the same work on the loop makes it wait behind every heavy request.
+    assert blocking > 45, blocking
+    assert blocking > 3 * offloaded, (offloaded, blocking)
+
+    pool_stats = heavy_pool.stats()["heavy"]
+    assert pool_stats["completed"] > 0 and pool_stats["rejected"] == 0
+    assert loop_stats["stalls"] > 0
+    handlers = {event["handler"] for event in loop_stats["recent_stalls"]}
+    assert "GET /heavy/blocking" in handlers
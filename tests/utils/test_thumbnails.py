@@ -0,0 +1,125 @@
+import asyncio
+import os
+
+import pytest
+from PIL import Image
+
+from src.utils.offload import OffloadRegistry
+from src.utils.thumbnails import ThumbnailService, render_thumbnail
+
+
+@pytest.fixture
+def registry():
+    registry = OffloadRegistry({"cpu": {"kind": "thread", "max_workers": 2, "max_queue": 64}})
+    yield registry
+    registry.shutdown(wait=True)
+
+
+def _image(path, size=(640, 480), color=(200, 30, 30)):
+    Image.new("RGB", size, color).save(path, "JPEG")
+    return path
+
+
+def test_edited_image_gets_a_new_thumbnail(tmp_path, registry):
+    source = _image(tmp_path / "photo.jpg")
+    service = ThumbnailService(cache_dir=tmp_path / "cache", registry=registry)
+
+    first = asyncio.run(service.get(source, 64))
+    assert asyncio.run(service.get(source, 64)) == first
+    with Image.open(first) as thumb:
+        assert max(thumb.size) == 64
+
+    _image(source, size=(300, 600), color=(0, 0, 255))
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = asyncio.run(service.get(source, 64))
+    assert second != first
+    with Image.open(second) as thumb:
+        assert thumb.size == (32, 64)
+    assert asyncio.run(service.get(source, 128)) not in (first, second)
+    assert (service.hits, service.misses) == (1, 3)
+
+
+def test_concurrent_requests_share_one_render(tmp_path, registry):
+    source = _image(tmp_path / "photo.jpg", size=(2000, 1500))
+    service = ThumbnailService(cache_dir=tmp_path / "cache", registry=registry)
+
+    async def scenario():
+        return await asyncio.gather(*(service.get(source, 96) for _ in range(20)))
+
+    paths = asyncio.run(scenario())
+    assert len(set(paths)) == 1
+    assert (service.misses, service.coalesced) == (1, 19)
+    assert registry.stats()["cpu"]["completed"] == 1
+    assert len(list((tmp_path / "cache").glob("*.jpg"))) == 1
+
+
+def test_cancelled_leader_does_not_fail_waiting_requests(tmp_path, registry):
+    source = _image(tmp_path / "photo.jpg", size=(2000, 1500))
+    service = ThumbnailService(cache_dir=tmp_path / "cache", registry=registry)
+
+    async def scenario():
+        leader = asyncio.ensure_future(service.get(source, 96))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(service.get(source, 96)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        followers[0].cancel()
+        return await asyncio.gather(leader, *followers, return_exceptions=True)
+
+    leader, cancelled, *paths = asyncio.run(scenario())
+    assert isinstance(leader, asyncio.CancelledError) and isinstance(cancelled, asyncio.CancelledError)
+    assert len(set(paths)) == 1 and paths[0].exists()
+    assert service.misses == 1
+
+
+def test_pinned_thumbnails_survive_eviction_until_released(tmp_path):
+    sources = [_image(tmp_path / f"img{idx}.jpg", color=(idx * 40, 0, 0)) for idx in range(3)]
+    service = ThumbnailService(cache_dir=tmp_path / "cache")
+    service.max_bytes = service.get_sync(sources[0], 64).stat().st_size + 10
+
+    pinned = asyncio.run(service.get(sources[0], 64, pin=True))
+    service.get_sync(sources[1], 64)
+    service.get_sync(sources[2], 64)
+    assert pinned.exists()
+    assert service.describe()["pinned"] == 1
+
+    service.release(pinned)
+    assert not pinned.exists()
+    assert service.describe()["bytes"] <= service.max_bytes
+
+
+def test_lru_byte_budget_evicts_least_recently_used(tmp_path):
+    sources = [_image(tmp_path / f"img{idx}.jpg", color=(idx * 40, 0, 0)) for idx in range(4)]
+    service = ThumbnailService(cache_dir=tmp_path / "cache")
+    sizes = [service.get_sync(source, 64).stat().st_size for source in sources[:2]]
+    service.max_bytes = sum(sizes) + 10
+
+    service.get_sync(sources[0], 64)  # touch: img1 is now the oldest
+    service.get_sync(sources[2], 64)
+    cached = {path.name for path in (tmp_path / "cache").glob("*.jpg")}
+    assert service.cache_key(sources[1], 64)[1] not in cached
+    assert service.cache_key(sources[0], 64)[1] in cached
+    assert service.evictions >= 1
+    assert service.describe()["bytes"] <= service.max_bytes
+
+    # A new instance rebuilds the index from disk and keeps the budget.
+    reloaded = ThumbnailService(cache_dir=tmp_path / "cache", max_bytes=service.max_bytes)
+    assert reloaded.describe()["entries"] == len(cached)
+    assert reloaded.get_sync(sources[2], 64) == service.cache_dir / service.cache_key(sources[2], 64)[1]
+    assert reloaded.hits == 1
+
+
+def test_pregenerate_and_draft_decode(tmp_path):
+    sources = [_image(tmp_path / f"big{idx}.jpg", size=(4000, 3000)) for idx in range(3)]
+    service = ThumbnailService(cache_dir=tmp_path / "cache", default_size=128)
+
+    service.pregenerate_in_background(sources).join(30)
+    assert service.misses == 3
+    assert service.pregenerate(sources) == 0
+    assert service.hits == 3
+
+    size = render_thumbnail(sources[0], tmp_path / "out.jpg", 100)
+    with Image.open(tmp_path / "out.jpg") as thumb:
+        assert thumb.size == (100, 75)
+    assert size == (tmp_path / "out.jpg").stat().st_size
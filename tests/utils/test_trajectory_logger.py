@@ -0,0 +1,147 @@
+import json
+from datetime import datetime, timedelta, timezone
+from threading import Event
+
+from src.utils.trajectory_logger import TrajectoryLogger
+from src.utils.trajectory_query import TrajectoryQuery
+
+
+def _logger(tmp_path, **writer):
+    return TrajectoryLogger(base_dir=str(tmp_path), config={"trajectories": {"writer": {"fsync": False, **writer}}})
+
+
+def _log(traj_logger, session_id, idx, **fields):
+    traj_logger.log_trajectory(
+        session_id=session_id,
+        interaction_id=f"i-{idx}",
+        phase="planning",
+        component="planner",
+        decision_type="model_selection" if idx % 2 else "tool_selection",
+        input_data={"api_key": "secret", "idx": idx},
+        output_data={"ok": True},
+        **fields,
+    )
+
+
+def test_background_writer_batches_and_indexes(tmp_path):
+    traj_logger = _logger(tmp_path)
+    for idx in range(40):
+        _log(
+            traj_logger,
+            f"s{idx % 2}",
+            idx,
+            model_used="gpt-a" if idx < 30 else "gpt-b",
+            latency_ms=float(idx),
+            tokens_used={"prompt": 2, "completion": 1, "total": 3},
+            success=idx != 5,
+        )
+    assert traj_logger.flush()
+    traj_logger.close()
+    assert (traj_logger.written, traj_logger.indexed) == (40, 40)
+
+    files = sorted(tmp_path.glob("*.jsonl"))
+    assert [path.name.split("_")[0] for path in files] == ["s0", "s1"]
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert sorted(entry["session_id"] for entry in index["trajectories"]) == ["s0", "s1"]
+
+    query = TrajectoryQuery(str(tmp_path))
+    session = query.query_by_session("s1", decision_type="model_selection")
+    assert [entry["input"]["idx"] for entry in session] == list(range(1, 40, 2))
+    assert session[0]["input"]["api_key"] == "[REDACTED]"
+    assert len(query.query_by_model("gpt-b")) == 10
+    assert [e["input"]["idx"] for e in query.query_by_session("s1", success=False)] == [5]
+
+    stats = query.get_statistics()
+    assert stats["total"] == 40
+    assert stats["by_decision_type"] == {"tool_selection": 20, "model_selection": 20}
+    assert stats["success_rate"] == 39 / 40
+    assert stats["total_tokens"] == 120
+
+    latency = query.latency_percentiles(percentiles=(50, 100), model_used="gpt-a")
+    assert latency == {"count": 30, "p50": 14.5, "p100": 29.0}
+    by_model = query.aggregate_by_model()
+    assert by_model["gpt-b"]["count"] == 10
+    assert by_model["gpt-b"]["prompt_tokens"] == 20
+    assert by_model["gpt-b"]["latency_ms"]["p50"] == 34.5
+
+    future = datetime.now(timezone.utc) + timedelta(hours=1)
+    assert query.query_by_decision_type("tool_selection", start_time=future) == []
+
+
+def test_query_indexes_files_written_without_the_store(tmp_path):
+    line = {"timestamp": "2025-11-15T01:00:00Z", "session_id": "legacy", "decision_type": "route_selection"}
+    (tmp_path / "legacy_20251115_010000.jsonl").write_text(json.dumps(line) + "\n" + '{"partial": ')
+
+    query = TrajectoryQuery(str(tmp_path))
+    assert query.query_by_decision_type("route_selection") == [line]
+    assert query.query_by_session("legacy", end_time=datetime(2025, 11, 14)) == []
+    # Re-syncing does not duplicate rows.
+    assert TrajectoryQuery(str(tmp_path)).get_statistics()["total"] == 1
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path, monkeypatch):
+    traj_logger = _logger(tmp_path, queue_size=2, flush_interval_ms=0)
+    entered, gate = Event(), Event()
+    original = traj_logger._write_batch
+
+    def slow_write(batch):
+        entered.set()
+        gate.wait(5)
+        original(batch)
+
+    monkeypatch.setattr(traj_logger, "_write_batch", slow_write)
+    _log(traj_logger, "s", 0)
+    assert entered.wait(5)
+    for idx in range(1, 10):
+        _log(traj_logger, "s", idx)
+    gate.set()
+    traj_logger.close()
+
+    assert traj_logger.dropped == 7
+    assert len(next(tmp_path.glob("*.jsonl")).read_text().splitlines()) == 3
+
+
+def test_synchronous_mode_writes_immediately(tmp_path):
+    traj_logger = _logger(tmp_path, enabled=False)
+    _log(traj_logger, "s", 1)
+    assert len(next(tmp_path.glob("*.jsonl")).read_text().splitlines()) == 1
+    assert TrajectoryQuery(str(tmp_path)).get_statistics()["total"] == 1
+
+
+def test_written_counts_lines_even_without_the_index(tmp_path):
+    traj_logger = _logger(tmp_path, enabled=False)
+    traj_logger.store.close()
+    traj_logger.store = None
+    for idx in range(3):
+        _log(traj_logger, "s", idx)
+    assert (traj_logger.written, traj_logger.indexed) == (3, 0)
+    assert len(next(tmp_path.glob("*.jsonl")).read_text().splitlines()) == 3
+
+
+def test_evicted_sessions_reopen_their_original_file(tmp_path, monkeypatch):
+    import src.utils.trajectory_logger as trajectory_logger
+
+    class _TickingDatetime(datetime):
+        now_at = datetime(2026, 1, 1)
+
+        @classmethod
+        def utcnow(cls):
+            # Every call is a new second, so a reopened session would get a new file name.
+            cls.now_at += timedelta(seconds=1)
+            return cls.now_at
+
+    monkeypatch.setattr(trajectory_logger, "datetime", _TickingDatetime)
+    sessions = [f"s{idx:03d}" for idx in range(trajectory_logger.MAX_OPEN_FILES + 6)]
+    traj_logger = _logger(tmp_path, batch_size=1)
+    for round_idx in range(3):
+        for session_id in sessions:
+            _log(traj_logger, session_id, round_idx)
+    assert traj_logger.flush()
+    traj_logger.close()
+
+    files = sorted(tmp_path.glob("*.jsonl"))
+    assert [path.name.split("_")[0] for path in files] == sessions
+    assert all(len(path.read_text().splitlines()) == 3 for path in files)
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert sorted(entry["session_id"] for entry in index["trajectories"]) == sessions
+    assert traj_logger.indexed == 3 * len(sessions)
@@ -22,6 +22,5 @@ def test_doc_indexer_builds_embeddings(tmp_path, monkeypatch):
     result = indexer.build()
     assert result["indexed"] >= 1
 
-    records = store_path.read_text()
-    assert "doc:docs/payments_api.md" in records
+    assert LocalVectorStore(store_path).get("doc:docs/payments_api.md") is not None
 
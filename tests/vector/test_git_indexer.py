@@ -87,7 +87,7 @@ def test_git_indexer_builds_records(tmp_path, canonical_registry):
 
     result = indexer.build()
     assert result["indexed"] == 2
-    records = json.loads(store_path.read_text())
+    records = list(LocalVectorStore(store_path).records())
     assert len(records) == 2
     assert records[0]["service_ids"][0] in canonical_registry.services
 
@@ -0,0 +1,119 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.vector.local_vector_store import LocalVectorStore
+from src.vector.vector_event import VectorEvent
+
+BASE_TIME = datetime(2025, 11, 20, tzinfo=timezone.utc)
+
+
+class StaticEmbeddingProvider:
+    def __init__(self, vector):
+        self.vector = vector
+
+    def embed(self, text):
+        return self.vector
+
+
+def _event(event_id, embedding, *, days=0, apis=None, components=None):
+    return VectorEvent(
+        event_id=event_id,
+        source_type="slack_message",
+        text=f"text for {event_id}",
+        timestamp=BASE_TIME + timedelta(days=days),
+        apis=apis or [],
+        component_ids=components or [],
+        embedding=embedding,
+    )
+
+
+def test_upsert_appends_and_search_ranks_by_cosine(tmp_path):
+    store = LocalVectorStore(tmp_path / "index.json")
+    store.upsert([_event("a", [1.0, 0.0, 0.0]), _event("b", [0.0, 1.0, 0.0])])
+    store.upsert([_event("c", [0.7, 0.7, 0.0])])
+
+    results = store.search("q", embedding_provider=StaticEmbeddingProvider([1.0, 0.1, 0.0]), top_k=2)
+    assert [item["record"]["event_id"] for item in results] == ["a", "c"]
+    assert results[0]["score"] == pytest.approx(1.0 / np.sqrt(1.01), rel=1e-5)
+    assert results[0]["record"]["embedding"] == pytest.approx([1.0, 0.0, 0.0])
+    assert results[1]["record"]["embedding"] == pytest.approx([np.sqrt(0.5), np.sqrt(0.5), 0.0])
+
+    reloaded = LocalVectorStore(tmp_path / "index.json")
+    assert reloaded.live_rows == 3
+    assert reloaded.get("b")["embedding"] == pytest.approx([0.0, 1.0, 0.0])
+
+
+def test_reupsert_supersedes_previous_row_and_compacts(tmp_path):
+    store = LocalVectorStore(tmp_path / "index.json")
+    store.upsert([_event("a", [1.0, 0.0]), _event("b", [0.0, 1.0])])
+    store.upsert([_event("a", [0.0, 1.0])])
+
+    assert store.live_rows == 2
+    assert store.dead_rows == 1
+    results = store.search("q", embedding_provider=StaticEmbeddingProvider([0.0, 1.0]), top_k=5)
+    assert len(results) == 2
+    assert all(item["score"] == pytest.approx(1.0) for item in results)
+
+    store.compact()
+    assert store.dead_rows == 0
+    reloaded = LocalVectorStore(tmp_path / "index.json")
+    assert sorted(record["event_id"] for record in reloaded.records()) == ["a", "b"]
+    assert reloaded.get("a")["embedding"] == pytest.approx([0.0, 1.0])
+
+
+def test_filters_and_since_are_premasked(tmp_path):
+    store = LocalVectorStore(tmp_path / "index.json")
+    store.upsert(
+        [
+            _event("old", [1.0, 0.0], days=0, apis=["/v1/payments"]),
+            _event("new", [0.5, 0.5], days=5, apis=["/v1/payments"], components=["core.payments"]),
+            _event("other", [1.0, 0.0], days=5, apis=["/v1/notify"]),
+        ]
+    )
+    provider = StaticEmbeddingProvider([1.0, 0.0])
+
+    results = store.search("q", embedding_provider=provider, filters={"apis": ["/v1/payments"]}, top_k=5)
+    assert [item["record"]["event_id"] for item in results] == ["old", "new"]
+
+    results = store.search(
+        "q",
+        embedding_provider=provider,
+        filters={"apis": ["/v1/payments"]},
+        since=BASE_TIME + timedelta(days=1),
+        top_k=5,
+    )
+    assert [item["record"]["event_id"] for item in results] == ["new"]
+
+    results = store.search("q", embedding_provider=provider, filters={"component_ids": ["missing"]})
+    assert results == []
+
+
+def test_legacy_json_index_is_migrated(tmp_path):
+    path = tmp_path / "index.json"
+    legacy = [
+        {"event_id": "a", "timestamp": BASE_TIME.isoformat(), "apis": ["/v1/x"], "embedding": [2.0, 0.0]},
+        {"event_id": "b", "timestamp": BASE_TIME.isoformat(), "apis": [], "embedding": [0.0, 3.0]},
+    ]
+    path.write_text(json.dumps(legacy))
+
+    store = LocalVectorStore(path)
+    assert store.live_rows == 2
+    assert json.loads(path.read_text())["dimension"] == 2
+    results = store.search("q", embedding_provider=StaticEmbeddingProvider([0.0, 1.0]), top_k=1)
+    assert results[0]["record"]["event_id"] == "b"
+
+
+def test_torn_append_is_truncated_on_load(tmp_path):
+    path = tmp_path / "index.json"
+    store = LocalVectorStore(path)
+    store.upsert([_event("a", [1.0, 0.0]), _event("b", [0.0, 1.0])])
+    # Simulate a crash after the vector write but before the payload write
+    with store.vectors_path.open("ab") as handle:
+        handle.write(np.ones(2, dtype=np.float32).tobytes())
+
+    reloaded = LocalVectorStore(path)
+    assert reloaded.live_rows == 2
+    assert reloaded.vectors_path.stat().st_size == 2 * 2 * 4
@@ -81,6 +81,7 @@ class StubQdrantService(QdrantVectorSearchService):
         self.default_top_k = vectordb_config.get("default_top_k", 12)
         self.default_min_score = vectordb_config.get("min_score", 0.35)
         self.dimension = vectordb_config.get("dimension", 1536)
+        self.upsert_page_size = vectordb_config.get("upsert_page_size", 256)
         self._http_client = DummyHTTPClient()
         self._collection_ready = True
 
@@ -90,6 +91,9 @@ class StubQdrantService(QdrantVectorSearchService):
     def _embed_text(self, text: str) -> List[float]:
         return [0.5, 0.5, 0.5, 0.5]
 
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        return [[0.5, 0.5, 0.5, 0.5] for _ in texts]
+
 
 def test_validate_vectordb_config_legacy_env(monkeypatch):
     monkeypatch.setenv("VECTORDB_URL", "http://legacy:6333")
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+import pytest
+from openai import OpenAI
+
+from src.vector import ContextChunk, QdrantVectorSearchService
+
+
+class StubBackend:
+    """Shared state for a stub server speaking just enough Qdrant and OpenAI."""
+
+    def __init__(self, embed_delay: float = 0.0, fail_pages: tuple = ()):
+        self.embed_delay = embed_delay
+        self.fail_pages = set(fail_pages)
+        self.embedding_batches: List[List[str]] = []
+        self.pages: List[List[Dict[str, Any]]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+
+def _make_handler(backend: StubBackend):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):  # keep pytest output quiet
+            return
+
+        def _send(self, status: int, body: Dict[str, Any]) -> None:
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _body(self) -> Dict[str, Any]:
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length) or b"{}")
+
+        def do_GET(self):
+            self._send(200, {"result": {"status": "green"}})
+
+        def do_POST(self):
+            body = self._body()
+            inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+            with backend.lock:
+                backend.in_flight += 1
+                backend.max_in_flight = max(backend.max_in_flight, backend.in_flight)
+                backend.embedding_batches.append(inputs)
+            time.sleep(backend.embed_delay)
+            with backend.lock:
+                backend.in_flight -= 1
+            self._send(
+                200,
+                {
+                    "object": "list",
+                    "model": body.get("model"),
+                    "data": [
+                        {"object": "embedding", "index": idx, "embedding": [float(len(text)), 1.0, 0.0, 0.0]}
+                        for idx, text in enumerate(inputs)
+                    ],
+                    "usage": {"prompt_tokens": 0, "total_tokens": 0},
+                },
+            )
+
+        def do_PUT(self):
+            points = self._body().get("points", [])
+            with backend.lock:
+                page_number = len(backend.pages)
+                backend.pages.append(points)
+            if page_number in backend.fail_pages:
+                self._send(500, {"status": {"error": "boom"}})
+            else:
+                self._send(200, {"result": {"status": "completed"}})
+
+    return Handler
+
+
+@pytest.fixture
+def stub_server():
+    servers = []
+
+    def start(**kwargs) -> tuple[str, StubBackend]:
+        backend = StubBackend(**kwargs)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(backend))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}", backend
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _service(url: str, *, batch_size: int, max_concurrent: int, page_size: int) -> QdrantVectorSearchService:
+    config = {
+        "vectordb": {
+            "url": url,
+            "collection": "pipeline_test",
+            "dimension": 4,
+            "upsert_page_size": page_size,
+        },
+        "performance": {
+            "batch_embeddings": {
+                "enabled": True,
+                "batch_size": batch_size,
+                "max_concurrent_batches": max_concurrent,
+            }
+        },
+    }
+    service = QdrantVectorSearchService(config)
+    service._openai_client = OpenAI(api_key="sk-test", base_url=f"{url}/v1", max_retries=0)
+    return service
+
+
+def _chunks(count: int) -> List[ContextChunk]:
+    return [
+        ContextChunk(
+            chunk_id=f"chunk-{idx}",
+            entity_id=f"git:commit:{idx}",
+            source_type="git",
+            text=f"commit message {idx}",
+        )
+        for idx in range(count)
+    ]
+
+
+def test_index_chunks_batches_embeddings_and_pages_upserts(stub_server):
+    url, backend = stub_server()
+    service = _service(url, batch_size=4, max_concurrent=3, page_size=10)
+
+    assert service.index_chunks(_chunks(25)) is True
+
+    assert len(backend.embedding_batches) == 7
+    assert sorted(len(batch) for batch in backend.embedding_batches) == [1, 4, 4, 4, 4, 4, 4]
+    assert [len(page) for page in backend.pages] == [10, 10, 5]
+    written = {point["payload"]["chunk_id"] for page in backend.pages for point in page}
+    assert written == {f"chunk-{idx}" for idx in range(25)}
+
+    stats = service.last_index_stats
+    assert stats.indexed == 25
+    assert stats.embed_batches == 7
+    assert stats.upsert_pages == 3
+    assert stats.failed_pages == 0
+    assert stats.total_ms >= stats.upsert_ms
+    assert set(stats.to_dict()) >= {"embed_ms", "embed_wall_ms", "upsert_ms", "total_ms"}
+
+
+def test_index_chunks_caps_concurrent_embedding_batches(stub_server):
+    url, backend = stub_server(embed_delay=0.05)
+    service = _service(url, batch_size=2, max_concurrent=3, page_size=100)
+
+    assert service.index_chunks(_chunks(20)) is True
+
+    assert len(backend.embedding_batches) == 10
+    assert 1 < backend.max_in_flight <= 3
+    # Overlapping batches finish well before ten serial round trips would.
+    assert service.last_index_stats.embed_wall_ms < 10 * 50
+
+
+def test_index_chunks_keeps_streaming_after_failed_page(stub_server):
+    url, backend = stub_server(fail_pages=(1,))
+    service = _service(url, batch_size=5, max_concurrent=2, page_size=5)
+
+    assert service.index_chunks(_chunks(15)) is False
+
+    assert len(backend.pages) == 3
+    stats = service.last_index_stats
+    assert stats.failed_pages == 1
+    assert stats.indexed == 10
+
+
+def test_index_chunks_skips_chunks_without_text(stub_server):
+    url, backend = stub_server()
+    service = _service(url, batch_size=10, max_concurrent=2, page_size=10)
+    chunks = _chunks(3)
+    chunks[1].text = "   "
+
+    assert service.index_chunks(chunks) is True
+
+    assert backend.embedding_batches == [["commit message 0", "commit message 2"]]
+    assert service.last_index_stats.skipped == 1
+    assert [point["payload"]["chunk_id"] for point in backend.pages[0]] == ["chunk-0", "chunk-2"]
@@ -85,10 +85,10 @@ def test_slack_indexer_builds_local_index(tmp_path):
 
     result = indexer.build()
     assert result["indexed"] == 2
-    records = json.loads(store_path.read_text())
+    records = list(LocalVectorStore(store_path).records())
     assert len(records) == 2
     assert records[0]["service_ids"][0] in registry.services
-    assert records[0]["embedding"][0] == pytest.approx(1.0)
+    assert vector_store.get(records[0]["event_id"])["embedding"][0] == pytest.approx(1.0)
 
 
 def test_local_store_search_filters(tmp_path):